@@ -0,0 +1,83 @@
+"""Benchmark the overhead of publishing commands from decorated methods.
+
+Calls a method decorated with `@publish`, shaped like
+`InstrumentContext.aspirate`, with a cheap command creator and a method
+body that does nothing, so that only the cost of publishing is measured.
+Reports calls per second with nothing subscribed to the broker and with one
+subscriber.
+
+Usage:
+
+    python benchmarks/command_publishing.py --calls 200000
+"""
+import argparse
+import time
+from typing import Any, Optional
+
+from opentrons.commands.publisher import CommandPublisher, publish
+from opentrons.commands.types import CommandMessage
+
+
+def _aspirate(
+    instrument: Any, volume: Optional[float], location: Any, rate: float
+) -> Any:
+    return {
+        "name": "command.ASPIRATE",
+        "payload": {
+            "instrument": instrument,
+            "volume": volume,
+            "location": location,
+            "rate": rate,
+            "text": "Aspirating",
+        },
+    }
+
+
+class _Pipette(CommandPublisher):
+    def __init__(self) -> None:
+        super().__init__(None)
+
+    @publish(command=_aspirate)
+    def aspirate(
+        self,
+        volume: Optional[float] = None,
+        location: Any = None,
+        rate: float = 1.0,
+    ) -> "_Pipette":
+        return self
+
+
+def _run(calls: int, subscribed: bool) -> None:
+    pipette = _Pipette()
+    received = 0
+
+    def _on_message(message: CommandMessage) -> None:
+        nonlocal received
+        received += 1
+
+    if subscribed:
+        pipette.broker.subscribe("command", _on_message)
+
+    start = time.perf_counter()
+    for i in range(calls):
+        pipette.aspirate(10, location=None)
+    duration = time.perf_counter() - start
+
+    name = "1 subscriber" if subscribed else "no subscribers"
+    print(
+        f"{name:15} {calls / duration:10.0f} calls/s"
+        f"   {duration / calls * 1e6:6.2f} us/call"
+    )
+
+
+def _main(calls: int) -> None:
+    print(f"{calls} calls")
+    _run(calls, subscribed=False)
+    _run(calls, subscribed=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+    _main(calls=args.calls)
@@ -0,0 +1,94 @@
+"""Benchmark loading the labware definitions a protocol references.
+
+Each protocol load does what loading a protocol with many labware does:
+
+- verify every custom definition in the protocol's labware directory, with
+  `labware_from_paths`, like `opentrons_simulate -L` and `opentrons_execute -L`.
+- look up every standard definition it loads, with `get_labware_definition`.
+
+The first load starts with empty caches, which costs about what every load
+used to. Later loads, like running a protocol after analyzing it, reuse the
+compiled schema validator, the verified-definition hashes, and the standard
+labware index and definition files.
+
+Usage:
+
+    python benchmarks/labware_loading.py --labware 24 --loads 5
+"""
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+
+from opentrons_shared_data.labware import load_definition
+
+from opentrons.protocols.labware import definition
+from opentrons.util.entrypoint_util import labware_from_paths
+
+
+def _clear_caches() -> None:
+    definition._get_labware_schema_validator.cache_clear()
+    definition._get_standard_labware_index.cache_clear()
+    definition._verified_definition_hashes.clear()
+    definition._definition_file_cache.clear()
+
+
+def _write_custom_definitions(load_names: List[str], directory: Path) -> None:
+    for load_name in load_names:
+        custom_def = load_definition(load_name, 1)
+        custom_def["namespace"] = "custom_beta"
+        custom_def["parameters"]["loadName"] = f"custom_{load_name}"
+        (directory / f"custom_{load_name}.json").write_text(json.dumps(custom_def))
+
+
+def _load_protocol_labware(directory: Path, load_names: List[str]) -> None:
+    labware_from_paths([directory])
+    for load_name in load_names:
+        definition.get_labware_definition(load_name)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--labware", type=int, default=24, help="labware the protocol references"
+    )
+    parser.add_argument("--loads", type=int, default=5, help="protocol loads to time")
+    args = parser.parse_args()
+
+    _clear_caches()
+    load_names = sorted(
+        {path.parent.name for path in definition._get_standard_labware_index()}
+    )
+    load_names = load_names[: args.labware]
+
+    with TemporaryDirectory() as tmp_dir:
+        directory = Path(tmp_dir)
+        _write_custom_definitions(load_names, directory)
+
+        cold = []
+        for _ in range(args.loads):
+            _clear_caches()
+            start = time.perf_counter()
+            _load_protocol_labware(directory, load_names)
+            cold.append(time.perf_counter() - start)
+
+        warm = []
+        for _ in range(args.loads):
+            start = time.perf_counter()
+            _load_protocol_labware(directory, load_names)
+            warm.append(time.perf_counter() - start)
+
+    print(
+        f"{len(load_names)} custom + {len(load_names)} standard labware,"
+        f" {args.loads} loads each"
+    )
+    print(f"first load (empty caches)  median {statistics.median(cold):8.3f} s")
+    print(f"repeat load                median {statistics.median(warm):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Benchmark module serial connections against the temperature module emulator.
+
+Serves a temperature module emulator on a local socket from its own thread,
+then, over a `SerialConnection` to it, runs several tasks that each send
+set-temperature commands back to back while another task polls the
+temperature, like a protocol and the robot server's module status polling
+do at the same time. Reports commands per second and poll latency for an
+`AsyncSerial` connection and for `SerialTransport` connections with
+different windows of commands in flight.
+
+`--latency` delays every response, without holding up the emulator, to
+model the round trip over a real USB serial link.
+
+Usage:
+
+    python benchmarks/module_serial.py --commands 2000 --latency 0.001
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import List, Optional
+
+from opentrons.drivers.asyncio.communication import SerialConnection
+from opentrons.drivers.command_builder import CommandBuilder
+from opentrons.drivers.temp_deck.driver import (
+    GCODE,
+    TEMP_DECK_ACK,
+    TEMP_DECK_BAUDRATE,
+    TEMP_DECK_COMMAND_TERMINATOR,
+)
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.tempdeck import TempDeckEmulator
+
+_SET_TEMP = CommandBuilder(terminator=TEMP_DECK_COMMAND_TERMINATOR).add_gcode(
+    gcode=GCODE.SET_TEMP
+)
+_SET_TEMP.add_float(prefix="S", value=40, precision=2)
+_GET_TEMP = CommandBuilder(terminator=TEMP_DECK_COMMAND_TERMINATOR).add_gcode(
+    gcode=GCODE.GET_TEMP
+)
+
+
+def _serve_emulator(latency: float, port: List[int], ready: threading.Event) -> None:
+    emulator = TempDeckEmulator(parser=Parser(), settings=Settings().tempdeck)
+    terminator = emulator.get_terminator()
+    ack = emulator.get_ack()
+
+    async def _handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                line = await reader.readuntil(terminator)
+            except asyncio.IncompleteReadError:
+                break
+            response = emulator.handle(line.decode().strip())
+            data = (f"{response}\r\n".encode() if response else b"") + ack
+            if latency > 0:
+                loop.call_later(latency, writer.write, data)
+            else:
+                writer.write(data)
+
+    async def _serve() -> None:
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+        assert server.sockets is not None
+        port.append(server.sockets[0].getsockname()[1])
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(_serve())
+
+
+async def _run(
+    url: str, max_in_flight: Optional[int], commands: int, controllers: int
+) -> None:
+    connection = await SerialConnection.create(
+        port=url,
+        baud_rate=TEMP_DECK_BAUDRATE,
+        timeout=5,
+        ack=TEMP_DECK_ACK,
+        name="tempdeck",
+        max_in_flight=max_in_flight,
+    )
+    remaining = commands
+    done = False
+    poll_latencies: List[float] = []
+
+    async def _control() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await connection.send_command(command=_SET_TEMP)
+
+    async def _poll() -> None:
+        while not done:
+            start = time.perf_counter()
+            await connection.send_command(command=_GET_TEMP)
+            poll_latencies.append(time.perf_counter() - start)
+
+    poller = asyncio.ensure_future(_poll())
+    start = time.perf_counter()
+    await asyncio.gather(*(_control() for _ in range(controllers)))
+    duration = time.perf_counter() - start
+    done = True
+    await poller
+    await connection.close()
+
+    name = "AsyncSerial" if max_in_flight is None else f"window {max_in_flight}"
+    sent = commands + len(poll_latencies)
+    poll_latencies.sort()
+    print(
+        f"{name:12} {sent / duration:8.0f} commands/s"
+        f"   poll p50 {statistics.median(poll_latencies) * 1e3:6.2f} ms"
+        f"   p95 {poll_latencies[int(len(poll_latencies) * 0.95)] * 1e3:6.2f} ms"
+    )
+
+
+def _main(commands: int, controllers: int, latency: float, window: int) -> None:
+    port: List[int] = []
+    ready = threading.Event()
+    threading.Thread(
+        target=_serve_emulator, args=(latency, port, ready), daemon=True
+    ).start()
+    ready.wait()
+    url = f"socket://127.0.0.1:{port[0]}"
+
+    print(
+        f"{commands} commands from {controllers} tasks, 1 poller,"
+        f" {latency * 1e3:.1f} ms latency"
+    )
+    for max_in_flight in (None, 1, window):
+        asyncio.run(_run(url, max_in_flight, commands, controllers))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=2000)
+    parser.add_argument("--controllers", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--window", type=int, default=4)
+    args = parser.parse_args()
+    _main(
+        commands=args.commands,
+        controllers=args.controllers,
+        latency=args.latency,
+        window=args.window,
+    )
@@ -0,0 +1,153 @@
+"""Benchmark ProtocolEngine movement planning on a full deck.
+
+Loads a thermocycler, a temperature module, and a magnetic module with a
+plate on each, fills the rest of the deck with plates, then plans moves from
+well to well, alternating between labware, with
+`MotionView.get_movement_waypoints`, like `moveToWell` and every pipetting
+command do. After the setup, nothing changes the deck.
+
+Usage:
+
+    python benchmarks/movement_waypoints.py --moves 20000
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.labware import load_definition
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import UpdateCommandAction
+from opentrons.protocol_engine.resources import ModuleDataProvider
+from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state.pipettes import CurrentWell
+from opentrons.protocol_engine.types import (
+    DeckSlotLocation,
+    LabwareLocation,
+    ModuleLocation,
+    ModuleModel,
+    WellLocation,
+)
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.types import DeckSlotName, Point
+
+_PLATE = LabwareDefinition.parse_obj(
+    load_definition("corning_96_wellplate_360ul_flat", 1)
+)
+_MODULES = [
+    (ModuleModel.THERMOCYCLER_MODULE_V1, DeckSlotName.SLOT_7),
+    (ModuleModel.TEMPERATURE_MODULE_V2, DeckSlotName.SLOT_3),
+    (ModuleModel.MAGNETIC_MODULE_V2, DeckSlotName.SLOT_1),
+]
+_PLATE_SLOTS = [DeckSlotName.from_primitive(slot) for slot in (2, 4, 5, 6, 9, 10, 11)]
+
+
+def _succeed(subject: StateStore, command: commands.Command) -> None:
+    subject.handle_action(UpdateCommandAction(command=command))
+
+
+def _load_labware(
+    subject: StateStore, labware_id: str, location: LabwareLocation
+) -> None:
+    _succeed(
+        subject,
+        commands.LoadLabware(
+            id=f"load-{labware_id}",
+            key=f"load-{labware_id}",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime.now(tz=timezone.utc),
+            params=commands.LoadLabwareParams(
+                loadName=_PLATE.parameters.loadName,
+                namespace=_PLATE.namespace,
+                version=_PLATE.version,
+                location=location,
+            ),
+            result=commands.LoadLabwareResult(
+                labwareId=labware_id, definition=_PLATE, offsetId=None
+            ),
+        ),
+    )
+
+
+def _load_module(
+    subject: StateStore, module_id: str, model: ModuleModel, slot: DeckSlotName
+) -> None:
+    _succeed(
+        subject,
+        commands.LoadModule(
+            id=f"load-{module_id}",
+            key=f"load-{module_id}",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime.now(tz=timezone.utc),
+            params=commands.LoadModuleParams(
+                model=model, location=DeckSlotLocation(slotName=slot)
+            ),
+            result=commands.LoadModuleResult(
+                moduleId=module_id,
+                definition=ModuleDataProvider.get_definition(model),
+                model=model,
+                serialNumber=f"{module_id}-serial",
+            ),
+        ),
+    )
+
+
+def _set_up_deck(subject: StateStore) -> List[str]:
+    labware_ids = []
+    for model, slot in _MODULES:
+        module_id = f"module-{slot.value}"
+        _load_module(subject, module_id, model, slot)
+        labware_ids.append(f"plate-{slot.value}")
+        _load_labware(subject, labware_ids[-1], ModuleLocation(moduleId=module_id))
+    for slot in _PLATE_SLOTS:
+        labware_ids.append(f"plate-{slot.value}")
+        _load_labware(subject, labware_ids[-1], DeckSlotLocation(slotName=slot))
+    return labware_ids
+
+
+def _main(moves: int) -> None:
+    subject = StateStore(
+        deck_definition=load_deck("ot2_standard", 3),
+        deck_fixed_labware=[],
+        is_door_blocking=False,
+    )
+    labware_ids = _set_up_deck(subject)
+    wells = subject.labware.get_wells(labware_ids[0])
+    targets: List[Tuple[str, str]] = [
+        (labware_ids[i % len(labware_ids)], wells[i % len(wells)]) for i in range(moves)
+    ]
+    well_location = WellLocation()
+    get_movement_waypoints = subject.motion.get_movement_waypoints
+
+    start = time.perf_counter()
+    current_well = None
+    for labware_id, well_name in targets:
+        get_movement_waypoints(
+            pipette_id="pipette-id",
+            labware_id=labware_id,
+            well_name=well_name,
+            well_location=well_location,
+            origin=Point(0, 0, 0),
+            origin_cp=None,
+            max_travel_z=200,
+            current_well=current_well,
+        )
+        current_well = CurrentWell(
+            pipette_id="pipette-id", labware_id=labware_id, well_name=well_name
+        )
+    duration = time.perf_counter() - start
+
+    print(f"{len(labware_ids)} labware, {len(_MODULES)} modules, {moves} moves")
+    print(
+        f"get_movement_waypoints {moves / duration:10.0f} moves/s"
+        f"   {duration / moves * 1e6:6.2f} us/move"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=20000)
+    args = parser.parse_args()
+    _main(moves=args.moves)
@@ -0,0 +1,123 @@
+"""Benchmark Smoothie moves against the Smoothie emulator.
+
+Serves a Smoothie emulator on a local socket from its own thread, connects a
+`SmoothieDriver` to it and homes, then alternates gantry moves with plunger
+moves, like a transfer made of many short moves, and reports moves per
+second and serial round trips per move.
+
+`--latency` delays every response, without holding up the emulator, to
+model the round trip over the real serial link. `--split` configures move
+splits for the plungers, like some pipettes need to unstick them.
+
+Usage:
+
+    python benchmarks/smoothie_moves.py --moves 500 --latency 0.002
+"""
+import argparse
+import asyncio
+import threading
+import time
+from typing import List
+
+from opentrons.config.robot_configs import build_config_ot2
+from opentrons.drivers.smoothie_drivers import SmoothieDriver
+from opentrons.drivers.types import MoveSplit
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.smoothie import SmoothieEmulator
+
+_SPLIT = MoveSplit(
+    split_distance=1,
+    split_current=1.75,
+    split_speed=1,
+    after_time=0,
+    fullstep=True,
+)
+
+
+def _serve_emulator(latency: float, port: List[int], ready: threading.Event) -> None:
+    emulator = SmoothieEmulator(parser=Parser(), settings=Settings().smoothie)
+    terminator = emulator.get_terminator()
+    ack = emulator.get_ack()
+
+    async def _handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                line = await reader.readuntil(terminator)
+            except asyncio.IncompleteReadError:
+                break
+            response = emulator.handle(line.decode().strip())
+            data = (f"{response}\r\n".encode() if response else b"") + ack
+            if latency > 0:
+                loop.call_later(latency, writer.write, data)
+            else:
+                writer.write(data)
+
+    async def _serve() -> None:
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+        assert server.sockets is not None
+        port.append(server.sockets[0].getsockname()[1])
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(_serve())
+
+
+async def _run(url: str, moves: int, split: bool) -> None:
+    driver = await SmoothieDriver.build(port=url, config=build_config_ot2({}))
+    await driver.home()
+    if split:
+        driver.configure_splits_for({"B": _SPLIT, "C": _SPLIT})
+
+    connection = driver._connection
+    assert connection is not None
+    send_data = connection.send_data
+    round_trips = 0
+
+    async def _counting_send_data(*args: object, **kwargs: object) -> str:
+        nonlocal round_trips
+        round_trips += 1
+        return await send_data(*args, **kwargs)  # type: ignore[arg-type]
+
+    connection.send_data = _counting_send_data  # type: ignore[assignment]
+
+    start = time.perf_counter()
+    for i in range(moves):
+        if i % 2:
+            await driver.move({"B": 2 + (i % 4), "C": 2 + (i % 4)})
+        else:
+            await driver.move({"X": 100 + (i % 8), "Y": 100 + (i % 8), "Z": 50})
+    duration = time.perf_counter() - start
+    await driver.disconnect()
+
+    print(
+        f"move {moves / duration:8.0f} moves/s   {duration / moves * 1e3:6.2f} ms/move"
+        f"   {round_trips / moves:4.1f} round trips/move"
+    )
+
+
+def _main(moves: int, latency: float, split: bool) -> None:
+    port: List[int] = []
+    ready = threading.Event()
+    threading.Thread(
+        target=_serve_emulator, args=(latency, port, ready), daemon=True
+    ).start()
+    ready.wait()
+
+    print(
+        f"{moves} moves, {latency * 1e3:.1f} ms latency,"
+        f" {'split' if split else 'unsplit'} plunger moves"
+    )
+    asyncio.run(_run(f"socket://127.0.0.1:{port[0]}", moves, split))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--split", action="store_true")
+    args = parser.parse_args()
+    _main(moves=args.moves, latency=args.latency, split=args.split)
@@ -0,0 +1,111 @@
+"""Benchmark ProtocolEngine action dispatch cost as the number of waiters grows.
+
+Each waiter waits for a different, never-completing command, like an HTTP
+long-poller would. We then dispatch command updates for an unrelated command
+and measure the time per action, including running any woken waiters.
+
+Waiters either use `StateStore.wait_for`, which re-checks every condition
+after every action, or `StateStore.wait_for_keys`, which only re-checks
+conditions whose keys changed.
+
+Usage:
+
+    python benchmarks/state_store_waiters.py --actions 2000
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import List
+
+from opentrons_shared_data.deck import load as load_deck
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import QueueCommandAction, UpdateCommandAction
+from opentrons.protocol_engine.state import StateStore, CommandKey
+
+
+def _queue(subject: StateStore, command_id: str) -> None:
+    subject.handle_action(
+        QueueCommandAction(
+            command_id=command_id,
+            command_key=command_id,
+            created_at=datetime.now(tz=timezone.utc),
+            request=commands.WaitForResumeCreate(params=commands.WaitForResumeParams()),
+        )
+    )
+
+
+async def _measure(waiter_count: int, action_count: int, keyed: bool) -> float:
+    subject = StateStore(
+        deck_definition=load_deck("ot2_standard", 3),
+        deck_fixed_labware=[],
+        is_door_blocking=False,
+    )
+    waiter_ids = [f"waiter-command-{i}" for i in range(waiter_count)]
+
+    for command_id in [*waiter_ids, "busy-command"]:
+        _queue(subject, command_id)
+
+    if keyed:
+        waiters = [
+            asyncio.create_task(
+                subject.wait_for_keys(
+                    [CommandKey(command_id)],
+                    subject.commands.get_is_complete,
+                    command_id=command_id,
+                )
+            )
+            for command_id in waiter_ids
+        ]
+    else:
+        waiters = [
+            asyncio.create_task(
+                subject.wait_for(
+                    subject.commands.get_is_complete, command_id=command_id
+                )
+            )
+            for command_id in waiter_ids
+        ]
+
+    await asyncio.sleep(0)
+
+    busy_command = commands.WaitForResume(
+        id="busy-command",
+        key="busy-command",
+        status=commands.CommandStatus.RUNNING,
+        createdAt=datetime.now(tz=timezone.utc),
+        params=commands.WaitForResumeParams(),
+    )
+
+    start = time.perf_counter()
+    for _ in range(action_count):
+        subject.handle_action(UpdateCommandAction(command=busy_command))
+        # Let any woken waiters re-check their conditions.
+        await asyncio.sleep(0)
+    duration = time.perf_counter() - start
+
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+
+    return duration / action_count
+
+
+async def _main(waiter_counts: List[int], action_count: int) -> None:
+    # Warm up imports, caches, and the event loop before measuring.
+    await _measure(0, action_count, keyed=True)
+
+    print(f"{'waiters':>8} {'wait_for (us/action)':>22} {'wait_for_keys':>16}")
+    for waiter_count in waiter_counts:
+        unkeyed = await _measure(waiter_count, action_count, keyed=False)
+        keyed = await _measure(waiter_count, action_count, keyed=True)
+        print(f"{waiter_count:>8} {unkeyed * 1e6:>22.1f} {keyed * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actions", type=int, default=2000)
+    parser.add_argument("--waiters", type=int, nargs="+", default=[0, 1, 10, 100, 1000])
+    args = parser.parse_args()
+    asyncio.run(_main(waiter_counts=args.waiters, action_count=args.actions))
@@ -0,0 +1,93 @@
+"""Benchmark ProtocolEngine well position lookups.
+
+Loads a 96-well plate into each deck slot, then repeatedly gets the position
+of every well with `GeometryView.get_well_position`, like planning a move to
+each well does, and reports calls per second.
+
+Usage:
+
+    python benchmarks/well_positions.py --passes 200
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.labware import load_definition
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import UpdateCommandAction
+from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.types import DeckSlotLocation, WellLocation
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.types import DeckSlotName
+
+_LOAD_NAME = "corning_96_wellplate_360ul_flat"
+_SLOTS = [DeckSlotName.from_primitive(slot) for slot in range(1, 12)]
+
+
+def _load_labware(
+    subject: StateStore,
+    labware_id: str,
+    slot: DeckSlotName,
+    definition: LabwareDefinition,
+) -> None:
+    subject.handle_action(
+        UpdateCommandAction(
+            command=commands.LoadLabware(
+                id=f"load-{labware_id}",
+                key=f"load-{labware_id}",
+                status=commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime.now(tz=timezone.utc),
+                params=commands.LoadLabwareParams(
+                    loadName=definition.parameters.loadName,
+                    namespace=definition.namespace,
+                    version=definition.version,
+                    location=DeckSlotLocation(slotName=slot),
+                ),
+                result=commands.LoadLabwareResult(
+                    labwareId=labware_id, definition=definition, offsetId=None
+                ),
+            )
+        )
+    )
+
+
+def _main(passes: int) -> None:
+    subject = StateStore(
+        deck_definition=load_deck("ot2_standard", 3),
+        deck_fixed_labware=[],
+        is_door_blocking=False,
+    )
+    definition = LabwareDefinition.parse_obj(load_definition(_LOAD_NAME, 1))
+    labware_ids = [f"plate-{slot.value}" for slot in _SLOTS]
+    for labware_id, slot in zip(labware_ids, _SLOTS):
+        _load_labware(subject, labware_id, slot, definition)
+
+    targets = [
+        (labware_id, well_name)
+        for labware_id in labware_ids
+        for well_name in subject.labware.get_wells(labware_id)
+    ]
+    well_location = WellLocation()
+    get_well_position = subject.geometry.get_well_position
+
+    start = time.perf_counter()
+    for _ in range(passes):
+        for labware_id, well_name in targets:
+            get_well_position(labware_id, well_name, well_location)
+    duration = time.perf_counter() - start
+
+    calls = passes * len(targets)
+    print(f"{len(labware_ids)} labware, {len(targets)} wells, {passes} passes")
+    print(
+        f"get_well_position {calls / duration:10.0f} calls/s"
+        f"   {duration / calls * 1e6:6.2f} us/call"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--passes", type=int, default=200)
+    args = parser.parse_args()
+    _main(passes=args.passes)
@@ -34,6 +34,9 @@ class Broker:
 
         return unsubscribe
 
+    def has_subscribers(self, topic: Literal["command"]) -> bool:
+        return bool(self.subscriptions.get(topic))
+
     def publish(self, topic: Literal["command"], message: types.CommandMessage) -> None:
         [handler(message) for handler in self.subscriptions.get(topic, [])]
 
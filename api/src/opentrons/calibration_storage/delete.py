@@ -6,7 +6,7 @@ file system.
 # add tests before making any additional changes
 from pathlib import Path
 
-from . import types as local_types, file_operators as io
+from . import types as local_types, file_operators as io, store
 
 from opentrons import config
 from opentrons.types import Mount
@@ -35,11 +35,11 @@ def _remove_offset_from_index(calibration_id: local_types.CalibrationID) -> None
     the specified id is not in the index file.
     """
     offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    index_path = offset_path / "index.json"
+    index_path = offset_path / store.INDEX_FILE_NAME
     blob = io.read_cal_file(str(index_path))
 
     del blob["data"][calibration_id]
-    io.save_to_file(index_path, blob)
+    store.save(offset_path, index_path, blob)
 
 
 def delete_offset_file(calibration_id: local_types.CalibrationID) -> None:
@@ -52,7 +52,7 @@ def delete_offset_file(calibration_id: local_types.CalibrationID) -> None:
     offset = offset_path / f"{calibration_id}.json"
     try:
         _remove_offset_from_index(calibration_id)
-        offset.unlink()
+        store.delete(offset_path, offset)
     except FileNotFoundError:
         pass
 
@@ -62,12 +62,12 @@ def _remove_tip_length_from_index(tiprack: str, pipette: str) -> None:
     Remove tip length data from the index file
     """
     tip_length_dir = config.get_tip_length_cal_path()
-    index_path = tip_length_dir / "index.json"
+    index_path = tip_length_dir / store.INDEX_FILE_NAME
     blob = io.read_cal_file(str(index_path))
 
     if tiprack in blob and pipette in blob[tiprack]:
         blob[tiprack].remove(pipette)
-        io.save_to_file(index_path, blob)
+        store.save(tip_length_dir, index_path, blob)
 
 
 def delete_tip_length_calibration(tiprack: str, pipette: str) -> None:
@@ -85,9 +85,9 @@ def delete_tip_length_calibration(tiprack: str, pipette: str) -> None:
     if tiprack in blob:
         del blob[tiprack]
         if blob:
-            io.save_to_file(tip_length_path, blob)
+            store.save(tip_length_dir, tip_length_path, blob)
         else:
-            tip_length_path.unlink()
+            store.delete(tip_length_dir, tip_length_path)
         _remove_tip_length_from_index(tiprack, pipette)
 
 
@@ -114,12 +114,12 @@ def _remove_pipette_offset_from_index(pipette: str, mount: Mount) -> None:
     the specified id is not in the index file.
     """
     offset_dir = config.get_opentrons_path("pipette_calibration_dir")
-    index_path = offset_dir / "index.json"
+    index_path = offset_dir / store.INDEX_FILE_NAME
     blob = io.read_cal_file(str(index_path))
 
     try:
         blob[mount.name.lower()].remove(pipette)
-        io.save_to_file(index_path, blob)
+        store.save(offset_dir, index_path, blob)
     except (KeyError, ValueError):
         # If the index file does not have a mount entry, you get
         # an error here
@@ -138,7 +138,7 @@ def delete_pipette_offset_file(pipette: str, mount: Mount) -> None:
 
     try:
         _remove_pipette_offset_from_index(pipette, mount)
-        offset_path.unlink()
+        store.delete(offset_dir, offset_path)
     except FileNotFoundError:
         pass
 
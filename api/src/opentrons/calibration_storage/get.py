@@ -12,7 +12,14 @@ from typing_extensions import Literal
 from opentrons import config
 from opentrons.types import Point, Mount
 
-from . import types as local_types, file_operators as io, helpers, migration, modify
+from . import (
+    types as local_types,
+    file_operators as io,
+    helpers,
+    migration,
+    modify,
+    store,
+)
 
 if typing.TYPE_CHECKING:
     from opentrons_shared_data.labware.dev_types import LabwareDefinition
@@ -57,23 +64,17 @@ def get_all_calibrations() -> typing.List[local_types.CalibrationInformation]:
     """
     all_calibrations: typing.List[local_types.CalibrationInformation] = []
     offset_path = config.get_opentrons_path("labware_calibration_offsets_dir_v2")
-    index_path = offset_path / "index.json"
-    if not index_path.exists():
+    index_path = offset_path / store.INDEX_FILE_NAME
+    if store.INDEX_FILE_NAME not in store.load(offset_path):
         return all_calibrations
 
     migration.check_index_version(index_path)
-    index_file = io.read_cal_file(str(index_path))
-    calibration_index = index_file.get("data", {})
+    calibration_files = store.load(offset_path)
+    calibration_index = calibration_files[store.INDEX_FILE_NAME].get("data", {})
     for key, data in calibration_index.items():
         cal_path = offset_path / f"{key}.json"
-        if cal_path.exists():
-            try:
-                cal_blob = io.read_cal_file(str(cal_path))
-            except json.JSONDecodeError:
-                log.error(
-                    f"Skipping corrupt calibration file (bad JSON): {str(cal_path)}"
-                )
-                continue
+        cal_blob = calibration_files.get(f"{key}.json")
+        if cal_blob is not None:
             calibration = _format_calibration_type(cal_blob)  # type: ignore
             try:
                 all_calibrations.append(
@@ -172,22 +173,15 @@ def get_all_tip_length_calibrations() -> typing.List[local_types.TipLengthCalibr
     """
     all_calibrations: typing.List[local_types.TipLengthCalibration] = []
     tip_length_dir = config.get_opentrons_path("tip_length_calibration_dir")
-    index_path = tip_length_dir / "index.json"
-    if not index_path.exists():
+    calibration_files = store.load(tip_length_dir)
+    index_file = calibration_files.get(store.INDEX_FILE_NAME)
+    if index_file is None:
         return all_calibrations
 
-    index_file = io.read_cal_file(str(index_path))
     unique_pips = set(itertools.chain(*index_file.values()))
     for pip in unique_pips:
-        cal_path = tip_length_dir / f"{pip}.json"
-        if cal_path.exists():
-            try:
-                data = io.read_cal_file(str(cal_path))
-            except json.JSONDecodeError:
-                log.error(
-                    f"Skipping corrupt calibration file (bad json): {str(cal_path)}"
-                )
-                continue
+        data = calibration_files.get(f"{pip}.json")
+        if data is not None:
             for tiprack, info in data.items():
                 all_calibrations.append(
                     local_types.TipLengthCalibration(
@@ -296,23 +290,16 @@ def get_all_pipette_offset_calibrations() -> typing.List[
     """
     all_calibrations: typing.List[local_types.PipetteOffsetCalibration] = []
     pip_dir = config.get_opentrons_path("pipette_calibration_dir")
-    index_path = pip_dir / "index.json"
-    if not index_path.exists():
+    calibration_files = store.load(pip_dir)
+    index_file = calibration_files.get(store.INDEX_FILE_NAME)
+    if index_file is None:
         return all_calibrations
 
-    index_file = io.read_cal_file(str(index_path))
     for mount_key, pips in index_file.items():
         for pip in pips:
             cal_path = pip_dir / mount_key / f"{pip}.json"
-            if cal_path.exists():
-                try:
-                    data = io.read_cal_file(str(cal_path))
-                except json.JSONDecodeError:
-                    log.error(
-                        "Skipping corrupt calibration file (bad json): "
-                        + f"{str(cal_path)}"
-                    )
-                    continue
+            data = calibration_files.get(f"{mount_key}/{pip}.json")
+            if data is not None:
                 try:
                     all_calibrations.append(
                         local_types.PipetteOffsetCalibration(
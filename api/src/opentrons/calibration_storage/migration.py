@@ -1,18 +1,17 @@
 import typing
-from . import file_operators as io, types as local_types
+from pathlib import Path
+
+from . import file_operators as io, types as local_types, store
 
 
 MAX_VERSION = 1
 
 
 def check_index_version(index_path: local_types.StrPath) -> None:
-    try:
-        index_file = io.read_cal_file(str(index_path))
-        version = index_file.get("version", 0)
-        if version == 0:
-            migrate_index_0_to_1(index_path)
-    except FileNotFoundError:
-        pass
+    index_path = Path(index_path)
+    index_file = store.load(index_path.parent).get(index_path.name)
+    if index_file is not None and index_file.get("version", 0) == 0:
+        migrate_index_0_to_1(index_path)
 
 
 def migrate_index_0_to_1(index_path: local_types.StrPath) -> None:
@@ -51,4 +50,4 @@ def migrate_index_0_to_1(index_path: local_types.StrPath) -> None:
             "module": module,
         }
     migrated_file = {"version": 1, "data": updated_entries}
-    io.save_to_file(index_path, migrated_file)
+    store.save(Path(index_path).parent, index_path, migrated_file)
@@ -14,7 +14,7 @@ from opentrons.types import Mount, Point
 from opentrons.protocols.api_support.constants import OPENTRONS_NAMESPACE
 from opentrons.util.helpers import utc_now
 
-from . import file_operators as io, types as local_types, helpers, migration
+from . import file_operators as io, types as local_types, helpers, migration, store
 
 if typing.TYPE_CHECKING:
     from .dev_types import (
@@ -60,7 +60,7 @@ def _add_to_index_offset_file(parent: str, slot: str, uri: str, lw_hash: str) ->
         else:
             blob["data"] = {full_id: new_index_data}
         blob["version"] = migration.MAX_VERSION
-        io.save_to_file(index_file, blob)
+        store.save(offset, index_file, blob)
 
 
 def add_existing_labware_to_index_file(
@@ -97,7 +97,7 @@ def save_labware_calibration(
     uri = helpers.uri_from_definition(definition)
     _add_to_index_offset_file(parent, slot, uri, labware_hash)
     calibration_data = _helper_offset_data_format(str(labware_offset_path), delta)
-    io.save_to_file(labware_offset_path, calibration_data)
+    store.save(offset_path, labware_offset_path, calibration_data)
 
 
 def create_tip_length_data(
@@ -168,7 +168,7 @@ def _helper_offset_data_format(
 
 
 def _append_to_index_tip_length_file(pip_id: str, lw_hash: str) -> None:
-    index_file = config.get_tip_length_cal_path() / "index.json"
+    index_file = config.get_tip_length_cal_path() / store.INDEX_FILE_NAME
     try:
         index_data = io.read_cal_file(str(index_file))
     except FileNotFoundError:
@@ -179,7 +179,7 @@ def _append_to_index_tip_length_file(pip_id: str, lw_hash: str) -> None:
     elif pip_id not in index_data[lw_hash]:
         index_data[lw_hash].append(pip_id)
 
-    io.save_to_file(index_file, index_data)
+    store.save(index_file.parent, index_file, index_data)
 
 
 def save_tip_length_calibration(
@@ -206,7 +206,7 @@ def save_tip_length_calibration(
 
     tip_length_data.update(tip_length_cal)
 
-    io.save_to_file(pip_tip_length_path, tip_length_data)
+    store.save(tip_length_dir_path, pip_tip_length_path, tip_length_data)
 
 
 def save_robot_deck_attitude(
@@ -239,7 +239,9 @@ def save_robot_deck_attitude(
 
 
 def _add_to_pipette_offset_index_file(pip_id: str, mount: Mount) -> None:
-    index_file = config.get_opentrons_path("pipette_calibration_dir") / "index.json"
+    index_file = (
+        config.get_opentrons_path("pipette_calibration_dir") / store.INDEX_FILE_NAME
+    )
     try:
         index_data = index_data = io.read_cal_file(str(index_file))
     except FileNotFoundError:
@@ -251,7 +253,7 @@ def _add_to_pipette_offset_index_file(pip_id: str, mount: Mount) -> None:
     elif pip_id not in index_data[mount_key]:
         index_data[mount_key].append(pip_id)
 
-    io.save_to_file(index_file, index_data)
+    store.save(index_file.parent, index_file, index_data)
 
 
 def save_pipette_calibration(
@@ -262,7 +264,8 @@ def save_pipette_calibration(
     tiprack_uri: str,
     cal_status: typing.Optional[local_types.CalibrationStatus] = None,
 ) -> None:
-    pip_dir = config.get_opentrons_path("pipette_calibration_dir") / mount.name.lower()
+    pip_base_dir = config.get_opentrons_path("pipette_calibration_dir")
+    pip_dir = pip_base_dir / mount.name.lower()
     pip_dir.mkdir(parents=True, exist_ok=True)
     if cal_status:
         status = cal_status
@@ -280,7 +283,7 @@ def save_pipette_calibration(
         "source": local_types.SourceType.user,
         "status": status_dict,
     }
-    io.save_to_file(offset_path, offset_dict)
+    store.save(pip_base_dir, offset_path, offset_dict)
     _add_to_pipette_offset_index_file(pip_id, mount)
 
 
@@ -0,0 +1,196 @@
+""" opentrons.calibration_storage.store: an indexed copy of a
+calibration directory.
+
+Listing every labware offset, tip length, or pipette offset calibration
+used to read the directory's index file and then one file per entry.
+Instead, each of those directories keeps a store file holding the decoded
+contents of every calibration file in it, keyed by path relative to the
+directory, so listing only reads that one file. The contents are also
+cached in memory until the store file or the index file changes on disk.
+
+The individual calibration files are still written, so looking up a single
+calibration and older software versions keep working. Writes to them
+must go through :func:`save` and :func:`delete` to keep the store in sync.
+
+If a directory has no store, or its index file was changed by something
+other than this module, the store is rebuilt from the individual files.
+"""
+import json
+import logging
+import threading
+import typing
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import file_operators as io
+from .encoder_decoder import DateTimeDecoder, DateTimeEncoder
+from .types import StrPath
+
+log = logging.getLogger(__name__)
+
+STORE_FILE_NAME = "store.json"
+INDEX_FILE_NAME = "index.json"
+STORE_VERSION = 1
+
+# Pipette offsets are kept in per-mount subdirectories. Deeper files, like
+# the custom tip rack definitions saved under the tip length directory,
+# are not calibrations and are left out of the store.
+_STORED_FILE_PATTERNS = ("*.json", "*/*.json")
+
+CalibrationFiles = typing.Dict[str, typing.Dict[str, typing.Any]]
+_Stat = typing.Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class _CachedStore:
+    store_stat: _Stat
+    index_stat: typing.Optional[_Stat]
+    files: CalibrationFiles
+
+
+_cache: typing.Dict[Path, _CachedStore] = {}
+_lock = threading.RLock()
+
+
+def _stat(path: Path) -> typing.Optional[_Stat]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _relative_key(directory: Path, path: StrPath) -> str:
+    return Path(path).relative_to(directory).as_posix()
+
+
+def _normalize(data: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    # Store exactly what reading the file back would return, like
+    # plain strings instead of enum members.
+    return typing.cast(
+        typing.Dict[str, typing.Any],
+        json.loads(json.dumps(data, cls=DateTimeEncoder), cls=DateTimeDecoder),
+    )
+
+
+def _read_calibration_files(directory: Path) -> CalibrationFiles:
+    files: CalibrationFiles = {}
+    for pattern in _STORED_FILE_PATTERNS:
+        for path in sorted(directory.glob(pattern)):
+            if path.name == STORE_FILE_NAME:
+                continue
+            try:
+                files[_relative_key(directory, path)] = io.read_cal_file(str(path))
+            except json.JSONDecodeError:
+                log.error(f"Skipping corrupt calibration file (bad JSON): {str(path)}")
+    return files
+
+
+def _write(directory: Path, files: CalibrationFiles) -> None:
+    store_path = directory / STORE_FILE_NAME
+    index_stat = _stat(directory / INDEX_FILE_NAME)
+    io.save_to_file(
+        store_path,
+        {
+            "version": STORE_VERSION,
+            "indexStat": index_stat,
+            "files": files,
+        },
+    )
+    store_stat = _stat(store_path)
+    assert store_stat is not None
+    _cache[directory] = _CachedStore(
+        store_stat=store_stat, index_stat=index_stat, files=files
+    )
+
+
+def _read_store(
+    store_path: Path, index_stat: typing.Optional[_Stat]
+) -> typing.Optional[CalibrationFiles]:
+    try:
+        blob = io.read_cal_file(str(store_path))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    stored_index_stat = blob.get("indexStat")
+    if blob.get("version") != STORE_VERSION or index_stat != (
+        tuple(stored_index_stat) if stored_index_stat is not None else None
+    ):
+        return None
+
+    return typing.cast(CalibrationFiles, blob["files"])
+
+
+def load(directory: Path) -> typing.Mapping[str, typing.Dict[str, typing.Any]]:
+    """
+    Get the contents of every calibration file in a directory.
+
+    Reads at most one file, and none if the cached copy is up to date.
+    The returned contents are shared with the cache and must not be modified.
+
+    :param directory: the calibration directory
+    :return: the decoded contents of each file, keyed by its path relative
+    to the directory, like "index.json" or "left/pipette-id.json"
+    """
+    with _lock:
+        store_path = directory / STORE_FILE_NAME
+        store_stat = _stat(store_path)
+        index_stat = _stat(directory / INDEX_FILE_NAME)
+        cached = _cache.get(directory)
+
+        if (
+            cached is not None
+            and store_stat is not None
+            and cached.store_stat == store_stat
+            and cached.index_stat == index_stat
+        ):
+            return cached.files
+
+        files = _read_store(store_path, index_stat) if store_stat else None
+
+        if files is not None:
+            assert store_stat is not None
+            _cache[directory] = _CachedStore(
+                store_stat=store_stat, index_stat=index_stat, files=files
+            )
+            return files
+
+        if not directory.is_dir():
+            return {}
+
+        log.info(f"Building calibration store for {str(directory)}")
+        files = _read_calibration_files(directory)
+        _write(directory, files)
+        return files
+
+
+def save(
+    directory: Path, filepath: StrPath, data: typing.Mapping[str, typing.Any]
+) -> None:
+    """
+    Save a calibration file and update the directory's store to match.
+
+    :param directory: the calibration directory the file is in
+    :param filepath: the calibration file to save
+    :param data: data to save
+    """
+    with _lock:
+        files = dict(load(directory))
+        io.save_to_file(filepath, data)
+        files[_relative_key(directory, filepath)] = _normalize(data)
+        _write(directory, files)
+
+
+def delete(directory: Path, filepath: StrPath) -> None:
+    """
+    Delete a calibration file and remove it from the directory's store.
+
+    :param directory: the calibration directory the file is in
+    :param filepath: the calibration file to delete
+    :raises FileNotFoundError: if the file does not exist
+    """
+    with _lock:
+        files = dict(load(directory))
+        Path(filepath).unlink()
+        files.pop(_relative_key(directory, filepath), None)
+        _write(directory, files)
@@ -83,7 +83,7 @@ async def _analyze(
                 else PythonConfig(apiVersion=protocol_source.config.api_version)
             ),
             metadata=protocol_source.metadata,
-            commands=analysis.commands,
+            commands=list(analysis.commands),
             errors=analysis.state_summary.errors,
         )
 
@@ -1,7 +1,20 @@
 import functools
 import inspect
+import logging
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Optional, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 from uuid import uuid4
 
 from opentrons.broker import Broker
@@ -43,18 +56,19 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
     """Publish messages before and after the decorated function has run."""
 
     def _decorator(func: FuncT) -> FuncT:
+        map_args = _ArgumentMapper(func=func, command=command)
+
         @functools.wraps(func)
         def _decorated(*args: Any, **kwargs: Any) -> Any:
             """Use the args passed to wrapped `func` to build the message payload.
 
-            1. Inspect signature of `func` and bind arguments to signature to map
-               argument names to called (and/or default) values.
-            2. Inspect signature of `command` and map values from `func` call to
-               argument names expected by `command`.
-            3. Map `self` argument of `func` to the `instrument` argument of `command`,
-               where applicable.
-            4. Construct the command payload and publish it using `publish_context`
-            5. Return the value of calling `func` with `*args` and `**kwargs`
+            1. If nothing would receive the messages, call `func` without
+               building them.
+            2. Map the values from the `func` call to the argument names expected
+               by `command`, using the mapping worked out when `func` was
+               decorated.
+            3. Construct the command payload and publish it using `publish_context`
+            4. Return the value of calling `func` with `*args` and `**kwargs`
             """
 
             broker = getattr(args[0], "broker", None)
@@ -63,33 +77,10 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, Broker
             ), "Only methods of CommandPublisher classes should be decorated."
 
-            func_sig = _inspect_signature(func)
-            bound_func_args = func_sig.bind(*args, **kwargs)
-            bound_func_args.apply_defaults()
-            func_args = bound_func_args.arguments
-
-            message_creator_sig = _inspect_signature(command)
-            message_creator_arg_names = set(message_creator_sig.parameters.keys())
-            message_creator_args = {
-                n: func_args[n] for n in message_creator_arg_names if n in func_args
-            }
-
-            # TODO (artyom, 20170927): we are doing this to be able to use
-            # the decorator in Instrument class methods, in which case
-            # self is effectively an instrument.
-            # To narrow the scope of this hack, we are checking if the
-            # command is expecting instrument first.
-            # We are also checking if call arguments have 'self' and
-            # don't have instruments specified, in which case
-            # instruments should take precedence.
-            if (
-                "instrument" in message_creator_arg_names
-                and "instrument" not in message_creator_args
-                and "self" in func_args
-            ):
-                message_creator_args["instrument"] = func_args["self"]
+            if not _should_publish(broker):
+                return func(*args, **kwargs)
 
-            command_message = command(**message_creator_args)
+            command_message = command(**map_args(args, kwargs))
 
             with publish_context(broker=broker, command=command_message):
                 return func(*args, **kwargs)
@@ -99,6 +90,95 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
     return _decorator
 
 
+class _ArgumentMapper:
+    """Map the arguments of a call to a decorated function to command arguments.
+
+    Which of the function's parameters the command creator takes is worked
+    out once, when the function is decorated, so that calls don't have to
+    bind the function's whole signature. Calls that don't fit the simple
+    mapping, including calls that would fail to bind, fall back to
+    `inspect.Signature.bind`.
+    """
+
+    def __init__(
+        self, func: Callable[..., Any], command: CommandPayloadCreator
+    ) -> None:
+        self._func_signature = inspect.signature(func)
+        func_params = self._func_signature.parameters
+        command_arg_names = inspect.signature(command).parameters.keys()
+
+        self._can_map = all(
+            p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+            for p in func_params.values()
+        )
+        self._positional_names: Sequence[str] = [
+            name for name, p in func_params.items() if p.kind == p.POSITIONAL_OR_KEYWORD
+        ]
+        self._names: FrozenSet[str] = frozenset(func_params)
+        self._defaults: Mapping[str, Any] = {
+            name: p.default
+            for name, p in func_params.items()
+            if p.default is not p.empty
+        }
+
+        # (command argument name, func argument name) pairs
+        mapping = [(name, name) for name in command_arg_names if name in func_params]
+
+        # TODO (artyom, 20170927): we are doing this to be able to use
+        # the decorator in Instrument class methods, in which case
+        # self is effectively an instrument.
+        # To narrow the scope of this hack, we are checking if the
+        # command is expecting instrument first.
+        # We are also checking if call arguments have 'self' and
+        # don't have instruments specified, in which case
+        # instruments should take precedence.
+        if (
+            "instrument" in command_arg_names
+            and "instrument" not in func_params
+            and "self" in func_params
+        ):
+            mapping.append(("instrument", "self"))
+
+        self._mapping: Sequence[Tuple[str, str]] = mapping
+
+    def __call__(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the command creator's arguments for a call to the function."""
+        func_args = self._map(args, kwargs) if self._can_map else None
+
+        if func_args is None:
+            bound_func_args = self._func_signature.bind(*args, **kwargs)
+            bound_func_args.apply_defaults()
+            func_args = bound_func_args.arguments
+
+        return {
+            command_name: func_args[func_name]
+            for command_name, func_name in self._mapping
+        }
+
+    def _map(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        if len(args) > len(self._positional_names):
+            return None
+
+        func_args = dict(zip(self._positional_names, args))
+
+        if kwargs:
+            if not self._names.issuperset(kwargs) or not func_args.keys().isdisjoint(
+                kwargs
+            ):
+                return None
+            func_args.update(kwargs)
+
+        if len(func_args) < len(self._names):
+            for name, default in self._defaults.items():
+                func_args.setdefault(name, default)
+            if len(func_args) < len(self._names):
+                return None
+
+        return func_args
+
+
 @contextmanager
 def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
     """Publish messages before and after the `with` block has run.
@@ -106,6 +186,10 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
     If an `error` is raised in the `with` block, it will be published in the "after"
     message and re-raised.
     """
+    if not _should_publish(broker):
+        yield
+        return
+
     message_id = str(uuid4())
     _do_publish(broker=broker, message_id=message_id, command=command, when="before")
 
@@ -124,10 +208,11 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
         _do_publish(broker=broker, message_id=message_id, command=command, when="after")
 
 
-@functools.lru_cache(maxsize=None)
-def _inspect_signature(func: Callable[..., Any]) -> inspect.Signature:
-    """Inspect function signatures, memoized because it is called very often."""
-    return inspect.signature(func)
+def _should_publish(broker: Broker) -> bool:
+    """Whether anything would receive a command's messages or log line."""
+    return broker.has_subscribers(COMMAND_TOPIC) or broker.logger.isEnabledFor(
+        logging.INFO
+    )
 
 
 def _do_publish(
@@ -148,7 +233,7 @@ def _do_publish(
         "error": error,
     }
 
-    if when == "before":
+    if when == "before" and broker.logger.isEnabledFor(logging.INFO):
         payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
         broker.logger.info(f"{name}: {payload_str}")
 
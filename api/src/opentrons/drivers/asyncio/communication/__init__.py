@@ -1,4 +1,4 @@
-from .serial_connection import SerialConnection
+from .serial_connection import SerialConnection, SerialPort, create_serial_port
 from opentrons.drivers.asyncio.communication.errors import (
     SerialException,
     NoResponse,
@@ -6,10 +6,14 @@ from opentrons.drivers.asyncio.communication.errors import (
     ErrorResponse,
 )
 from .async_serial import AsyncSerial
+from .serial_transport import SerialTransport
 
 __all__ = [
     "SerialConnection",
     "AsyncSerial",
+    "SerialTransport",
+    "SerialPort",
+    "create_serial_port",
     "SerialException",
     "NoResponse",
     "AlarmResponse",
@@ -2,15 +2,61 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+import sys
+from typing import Optional, Union
 
 from opentrons.drivers.command_builder import CommandBuilder
 
 from .errors import NoResponse, AlarmResponse, ErrorResponse
 from .async_serial import AsyncSerial
+from .serial_transport import SerialTransport
 
 log = logging.getLogger(__name__)
 
+SerialPort = Union[AsyncSerial, SerialTransport]
+
+
+async def create_serial_port(
+    port: str,
+    baud_rate: int,
+    timeout: float,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+    reset_buffer_before_write: bool = False,
+    max_in_flight: Optional[int] = None,
+) -> SerialPort:
+    """
+    Open a serial port.
+
+    Args:
+        port: url or port to connect to
+        baud_rate: baud rate
+        timeout: timeout in seconds
+        loop: optional event loop.
+        reset_buffer_before_write: whether to reset the read buffer before
+          every write
+        max_in_flight: if set, open a SerialTransport that allows this many
+          commands to await responses at once. Otherwise, or where the
+          event loop can't watch serial ports (Windows), open an AsyncSerial.
+
+    Returns: SerialTransport or AsyncSerial
+    """
+    if max_in_flight is not None and sys.platform != "win32":
+        return await SerialTransport.create(
+            port=port,
+            baud_rate=baud_rate,
+            timeout=timeout,
+            max_in_flight=max_in_flight,
+            loop=loop,
+            reset_buffer_before_write=reset_buffer_before_write,
+        )
+    return await AsyncSerial.create(
+        port=port,
+        baud_rate=baud_rate,
+        timeout=timeout,
+        loop=loop,
+        reset_buffer_before_write=reset_buffer_before_write,
+    )
+
 
 class SerialConnection:
     @classmethod
@@ -26,6 +72,7 @@ class SerialConnection:
         error_keyword: Optional[str] = None,
         alarm_keyword: Optional[str] = None,
         reset_buffer_before_write: bool = False,
+        max_in_flight: Optional[int] = None,
     ) -> SerialConnection:
         """
         Create a connection.
@@ -46,15 +93,18 @@ class SerialConnection:
                            (default: alarm)
             reset_buffer_before_write: whether to reset the read buffer before
               every write
+            max_in_flight: if set, send commands with a SerialTransport
+              that allows this many to await responses at once.
 
         Returns: SerialConnection
         """
-        serial = await AsyncSerial.create(
+        serial = await create_serial_port(
             port=port,
             baud_rate=baud_rate,
             timeout=timeout,
             loop=loop,
             reset_buffer_before_write=reset_buffer_before_write,
+            max_in_flight=max_in_flight,
         )
         name = name or port
         return cls(
@@ -69,7 +119,7 @@ class SerialConnection:
 
     def __init__(
         self,
-        serial: AsyncSerial,
+        serial: SerialPort,
         port: str,
         name: str,
         ack: str,
@@ -81,7 +131,7 @@ class SerialConnection:
         Constructor
 
         Args:
-            serial: AsyncSerial object
+            serial: AsyncSerial or SerialTransport object
             port: url or port to connect to
             ack: the command response ack
             name: the connection name
@@ -97,6 +147,8 @@ class SerialConnection:
         self._ack = ack.encode()
         self._retry_wait_time_seconds = retry_wait_time_seconds
         self._send_data_lock = asyncio.Lock()
+        self._reconnect_lock = asyncio.Lock()
+        self._connection_count = 0
         self._error_keyword = error_keyword.lower()
         self._alarm_keyword = alarm_keyword.lower()
 
@@ -134,18 +186,27 @@ class SerialConnection:
 
         Raises: SerialException
         """
+        if isinstance(self._serial, SerialTransport):
+            # The transport matches responses to commands itself,
+            # so it doesn't need each round trip to hold the lock
+            return await self._send_data(data=data, retries=retries, timeout=timeout)
+
         async with self._send_data_lock, self._serial.timeout_override(
             "timeout", timeout
         ):
             return await self._send_data(data=data, retries=retries)
 
-    async def _send_data(self, data: str, retries: int = 0) -> str:
+    async def _send_data(
+        self, data: str, retries: int = 0, timeout: Optional[float] = None
+    ) -> str:
         """
         Send data and return the response.
 
         Args:
             data: The data to send.
             retries: number of times to retry in case of timeout
+            timeout: optional override of default timeout in seconds,
+              if sending with a SerialTransport
 
         Returns: The command response
 
@@ -154,10 +215,15 @@ class SerialConnection:
         data_encode = data.encode()
 
         for retry in range(retries + 1):
+            connection = await self._wait_for_connection()
             log.debug(f"{self.name}: Write -> {data_encode!r}")
-            await self._serial.write(data=data_encode)
-
-            response = await self._serial.read_until(match=self._ack)
+            if isinstance(self._serial, SerialTransport):
+                response = await self._serial.request(
+                    data=data_encode, ack=self._ack, timeout=timeout
+                )
+            else:
+                await self._serial.write(data=data_encode)
+                response = await self._serial.read_until(match=self._ack)
             log.debug(f"{self.name}: Read <- {response!r}")
 
             if self._ack in response:
@@ -171,10 +237,37 @@ class SerialConnection:
 
             log.info(f"{self.name}: retry number {retry}/{retries}")
 
-            await self.on_retry()
+            await self._reconnect(connection=connection)
 
         raise NoResponse(port=self._port, command=data)
 
+    async def _wait_for_connection(self) -> int:
+        """
+        Wait for any reconnect in progress to finish.
+
+        Returns: The number of the connection that data is about to be sent on.
+        """
+        async with self._reconnect_lock:
+            return self._connection_count
+
+    async def _reconnect(self, connection: int) -> None:
+        """
+        Retry the connection, unless another caller already has.
+
+        With a SerialTransport, callers don't hold the send data lock, and a
+        timeout fails every command awaiting a response. Only the first of
+        them should close and reopen the port; the rest just send again.
+
+        Args:
+            connection: The number of the connection the failed data was sent on.
+
+        Returns: None
+        """
+        async with self._reconnect_lock:
+            if connection == self._connection_count:
+                await self.on_retry()
+                self._connection_count += 1
+
     async def open(self) -> None:
         """Open the connection."""
         await self._serial.open()
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import deque
+from functools import partial
+from typing import Deque, NamedTuple, Optional
+
+from serial import Serial, PortNotOpenError, serial_for_url  # type: ignore[import]
+
+log = logging.getLogger(__name__)
+
+READ_SIZE = 4096
+
+
+class _PendingResponse(NamedTuple):
+    ack: bytes
+    future: "asyncio.Future[bytes]"
+
+
+class SerialTransport:
+    """Event-loop-native serial transport that pipelines commands.
+
+    Unlike AsyncSerial, which runs every blocking read and write in an
+    executor thread, this reads the port's non-blocking file descriptor
+    when the event loop says it's readable, and writes to it directly.
+
+    Up to `max_in_flight` commands may be awaiting responses at once.
+    Responses are matched to commands in the order the commands were
+    sent, so only use a window larger than 1 with firmware that queues
+    the commands it receives while busy and answers them in order.
+    """
+
+    @classmethod
+    async def create(
+        cls,
+        port: str,
+        baud_rate: int,
+        timeout: Optional[float] = None,
+        max_in_flight: int = 1,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        reset_buffer_before_write: bool = False,
+    ) -> SerialTransport:
+        """
+        Create a SerialTransport instance.
+
+        Args:
+            port: url or port name
+            baud_rate: the baud rate
+            timeout: optional timeout in seconds to wait for each response
+            max_in_flight: how many commands may await responses at once
+            loop: optional event loop. if None get_running_loop will be used
+            reset_buffer_before_write: discard unsolicited input before
+             writing, if no command is awaiting a response
+        """
+        loop = loop or asyncio.get_running_loop()
+        # Opening the port may block, but only has to happen once
+        serial = await loop.run_in_executor(
+            None,
+            partial(serial_for_url, url=port, baudrate=baud_rate, timeout=0),
+        )
+        transport = cls(
+            serial=serial,
+            timeout=timeout,
+            max_in_flight=max_in_flight,
+            loop=loop,
+            reset_buffer_before_write=reset_buffer_before_write,
+        )
+        transport._start()
+        return transport
+
+    def __init__(
+        self,
+        serial: Serial,
+        timeout: Optional[float],
+        max_in_flight: int,
+        loop: asyncio.AbstractEventLoop,
+        reset_buffer_before_write: bool,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            serial: connected Serial object
+            timeout: timeout in seconds to wait for each response
+            max_in_flight: how many commands may await responses at once
+            loop: event loop
+            reset_buffer_before_write: discard unsolicited input before
+             writing, if no command is awaiting a response
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self._serial = serial
+        self._timeout = timeout
+        self._max_in_flight = max_in_flight
+        self._loop = loop
+        self._reset_buffer_before_write = reset_buffer_before_write
+        self._in_flight = 0
+        self._waiting: Deque["asyncio.Future[None]"] = deque()
+        self._pending: Deque[_PendingResponse] = deque()
+        self._read_buffer = bytearray()
+        self._write_buffer = bytearray()
+        self._fd: Optional[int] = None
+
+    @property
+    def max_in_flight(self) -> int:
+        """How many commands may await responses at once."""
+        return self._max_in_flight
+
+    async def request(
+        self, data: bytes, ack: bytes, timeout: Optional[float] = None
+    ) -> bytes:
+        """
+        Send a command and wait for its response.
+
+        Waits first for room in the window of commands awaiting responses.
+
+        Args:
+            data: the command to write
+            ack: the sequence of bytes that ends the command's response
+            timeout: optional override of the default timeout in seconds
+
+        Returns:
+            The response, ending in the ack. If no response arrives in time,
+            the data read so far, like a timed-out `AsyncSerial.read_until`.
+            Every other command awaiting a response then gets an empty
+            response, because later responses can no longer be matched.
+        """
+        await self._acquire_slot()
+        try:
+            if self._fd is None:
+                raise PortNotOpenError()
+
+            if self._reset_buffer_before_write and not self._pending:
+                self._serial.reset_input_buffer()
+                self._read_buffer.clear()
+
+            future: "asyncio.Future[bytes]" = self._loop.create_future()
+            self._write(data)
+            self._pending.append(_PendingResponse(ack=ack, future=future))
+
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(future),
+                    timeout=timeout if timeout is not None else self._timeout,
+                )
+            except asyncio.TimeoutError:
+                partial_response = bytes(self._read_buffer)
+                log.debug(f"{self._serial.port}: Timed out <- {partial_response!r}")
+                self._drop_pending()
+                return partial_response
+        finally:
+            self._release_slot()
+
+    async def open(self) -> None:
+        """
+        Open the connection.
+
+        Returns: None
+        """
+        await self._loop.run_in_executor(None, self._serial.open)
+        self._start()
+
+    async def close(self) -> None:
+        """
+        Close the connection
+
+        Returns: None
+        """
+        self._stop()
+        self._serial.close()
+
+    async def is_open(self) -> bool:
+        """
+        Check if connection is open.
+
+        Returns: boolean
+        """
+        return self._fd is not None and self._serial.is_open is True
+
+    def reset_input_buffer(self) -> None:
+        """Reset the input buffer"""
+        self._serial.reset_input_buffer()
+        self._read_buffer.clear()
+
+    async def _acquire_slot(self) -> None:
+        # Commands get slots in the window in the order they're sent.
+        # Unlike asyncio.Semaphore, this keeps a caller that sends
+        # commands back to back from starving the others.
+        if self._in_flight < self._max_in_flight and not self._waiting:
+            self._in_flight += 1
+            return
+
+        waiter: "asyncio.Future[None]" = self._loop.create_future()
+        self._waiting.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as this was cancelled; pass it on
+                self._release_slot()
+            elif waiter in self._waiting:
+                self._waiting.remove(waiter)
+            raise
+
+    def _release_slot(self) -> None:
+        while self._waiting:
+            waiter = self._waiting.popleft()
+            if not waiter.done():
+                # Hand the slot straight to the next waiter
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _start(self) -> None:
+        fd: int = self._serial.fileno()
+        self._loop.add_reader(fd, self._on_readable)
+        self._fd = fd
+
+    def _stop(self) -> None:
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            self._loop.remove_writer(self._fd)
+            self._fd = None
+        self._write_buffer.clear()
+        self._drop_pending()
+
+    def _stop_after_error(self) -> None:
+        # The port is no good anymore. Close it, so it can be opened again.
+        self._stop()
+        self._serial.close()
+
+    def _write(self, data: bytes) -> None:
+        assert self._fd is not None, "Port is not open"
+
+        if self._write_buffer:
+            # Keep writes in order behind the ones still waiting
+            self._write_buffer.extend(data)
+            return
+
+        try:
+            written = os.write(self._fd, data)
+        except BlockingIOError:
+            written = 0
+
+        if written < len(data):
+            self._write_buffer.extend(data[written:])
+            self._loop.add_writer(self._fd, self._on_writable)
+
+    def _on_writable(self) -> None:
+        assert self._fd is not None
+
+        try:
+            written = os.write(self._fd, self._write_buffer)
+        except BlockingIOError:
+            return
+        except OSError:
+            log.exception(f"{self._serial.port}: Write failed")
+            self._stop_after_error()
+            return
+
+        del self._write_buffer[:written]
+
+        if not self._write_buffer:
+            self._loop.remove_writer(self._fd)
+
+    def _on_readable(self) -> None:
+        assert self._fd is not None
+
+        try:
+            data = os.read(self._fd, READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            log.exception(f"{self._serial.port}: Read failed")
+            self._stop_after_error()
+            return
+
+        if not data:
+            log.warning(f"{self._serial.port}: Connection closed")
+            self._stop_after_error()
+            return
+
+        self._read_buffer.extend(data)
+        self._match_responses()
+
+    def _match_responses(self) -> None:
+        while self._pending:
+            ack, future = self._pending[0]
+            ack_index = self._read_buffer.find(ack)
+
+            if ack_index < 0:
+                return
+
+            end = ack_index + len(ack)
+            response = bytes(self._read_buffer[:end])
+            del self._read_buffer[:end]
+            self._pending.popleft()
+
+            if not future.done():
+                future.set_result(response)
+
+    def _drop_pending(self) -> None:
+        self._read_buffer.clear()
+
+        while self._pending:
+            future = self._pending.popleft().future
+            if not future.done():
+                future.set_result(b"")
@@ -54,6 +54,7 @@ class HeaterShakerDriver(AbstractHeaterShakerDriver):
             ack=HS_ACK,
             loop=loop,
             error_keyword=HS_ERROR_KEYWORD,
+            max_in_flight=1,
         )
         return cls(connection=connection)
 
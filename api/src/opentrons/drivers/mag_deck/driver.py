@@ -72,6 +72,7 @@ class MagDeckDriver(AbstractMagDeckDriver):
             ack=MAG_DECK_ACK,
             loop=loop,
             reset_buffer_before_write=False,
+            max_in_flight=1,
         )
         return cls(connection=connection)
 
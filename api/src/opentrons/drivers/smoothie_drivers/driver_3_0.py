@@ -824,6 +824,7 @@ class SmoothieDriver:
         suppress_error_msg: bool = False,
         ack_timeout: float = DEFAULT_ACK_TIMEOUT,
         suppress_home_after_error: bool = False,
+        synchronize: bool = True,
     ) -> str:
         """
         Submit a GCODE command to the robot, followed by M400 to block until
@@ -859,12 +860,16 @@ class SmoothieDriver:
             like home, it should be long enough to allow the command to
             complete in the worst case. If this is None, the timeout will
             be infinite. This is almost certainly not what you want.
+        :param synchronize: whether to follow the command with M400. Commands
+            that already end in M400 are only acked once they're done, so
+            they can skip the extra round trip by passing False along with
+            an `ack_timeout` long enough to execute them.
         """
         if self.simulating:
             return ""
         try:
             return await self._send_command_unsynchronized(
-                command, ack_timeout, timeout
+                command, ack_timeout, timeout, synchronize
             )
         except SmoothieError as se:
             # XXX: This is a reentrancy error because another command could
@@ -885,7 +890,11 @@ class SmoothieDriver:
             raise SmoothieError(se.ret_code, str(command))
 
     async def _send_command_unsynchronized(
-        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+        self,
+        command: CommandBuilder,
+        ack_timeout: float,
+        execute_timeout: float,
+        synchronize: bool = True,
     ) -> str:
         assert self._connection, "There is no connection."
         command_result = ""
@@ -893,12 +902,13 @@ class SmoothieDriver:
             command_result = await self._connection.send_command(
                 command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
             )
-            wait_command = CommandBuilder(
-                terminator=SMOOTHIE_COMMAND_TERMINATOR
-            ).add_gcode(gcode=GCODE.WAIT)
-            await self._connection.send_command(
-                command=wait_command, retries=0, timeout=execute_timeout
-            )
+            if synchronize:
+                wait_command = CommandBuilder(
+                    terminator=SMOOTHIE_COMMAND_TERMINATOR
+                ).add_gcode(gcode=GCODE.WAIT)
+                await self._connection.send_command(
+                    command=wait_command, retries=0, timeout=execute_timeout
+                )
         except AlarmResponse as e:
             self._handle_return(ret_code=e.response, is_alarm=True)
         except ErrorResponse as e:
@@ -1379,26 +1389,42 @@ class SmoothieDriver:
         if home_flagged_axes:
             await self.home_flagged_axes("".join(list(target.keys())))
 
-        async def _do_split() -> None:
-            try:
-                for sc in (c for c in (split_prefix, split_command) if c):
-                    await self._send_command(sc)
-            finally:
-                if split_postfix:
-                    await self._send_command(split_postfix)
+        # Send the whole move as one line, waiting with M400 only where
+        # motion has to finish first, rather than following each part with
+        # its own M400 round trip. Smoothie acks the line once it's done.
+        batch = _command_builder()
+        if split_command_string:
+            # restore microstepping only once the split move is done
+            batch.add_builder(builder=split_prefix).add_builder(builder=split_command)
+            batch.add_gcode(gcode=GCODE.WAIT).add_builder(builder=split_postfix)
+        batch.add_builder(builder=command)
+
+        # dwell pipette motors because they get hot
+        plunger_axis_moved = "".join(set("BC") & set(target.keys()))
+        if plunger_axis_moved:
+            self.dwell_axes(plunger_axis_moved)
+            batch.add_gcode(gcode=GCODE.WAIT).add_builder(
+                builder=self._generate_current_command()
+            )
+        batch.add_gcode(gcode=GCODE.WAIT)
 
+        completed = False
         try:
-            log.debug(f"move: {command}")
+            log.debug(f"move: {batch}")
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
-            await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            await self._send_command(
+                batch, ack_timeout=DEFAULT_EXECUTE_TIMEOUT, synchronize=False
+            )
+            completed = True
         finally:
-            # dwell pipette motors because they get hot
-            plunger_axis_moved = "".join(set("BC") & set(target.keys()))
-            if plunger_axis_moved:
-                self.dwell_axes(plunger_axis_moved)
-                await self._set_saved_current()
+            if not completed:
+                # The line may have stopped partway through, so make sure
+                # the plungers are back to microstepping and dwelling
+                if split_postfix:
+                    await self._send_command(split_postfix)
+                if plunger_axis_moved:
+                    await self._set_saved_current()
             self._axes_moved_at.mark_moved(moving_axes)
 
         self._update_position(target)
@@ -66,6 +66,7 @@ class TempDeckDriver(AbstractTempDeckDriver):
             ack=TEMP_DECK_ACK,
             loop=loop,
             reset_buffer_before_write=False,
+            max_in_flight=1,
         )
         return cls(connection=connection)
 
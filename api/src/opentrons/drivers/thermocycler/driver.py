@@ -7,7 +7,11 @@ from typing import Optional, Dict
 
 from opentrons.drivers import utils
 from opentrons.drivers.command_builder import CommandBuilder
-from opentrons.drivers.asyncio.communication import SerialConnection, AsyncSerial
+from opentrons.drivers.asyncio.communication import (
+    SerialConnection,
+    AsyncSerial,
+    create_serial_port,
+)
 from opentrons.drivers.thermocycler.abstract import AbstractThermocyclerDriver
 from opentrons.drivers.types import Temperature, PlateTemperature, ThermocyclerLidStatus
 
@@ -73,12 +77,13 @@ class ThermocyclerDriverFactory:
 
         Returns: driver
         """
-        serial_port = await AsyncSerial.create(
+        serial_port = await create_serial_port(
             port=port,
             baud_rate=TC_BAUDRATE,
             timeout=DEFAULT_TC_TIMEOUT,
             loop=loop,
             reset_buffer_before_write=False,
+            max_in_flight=1,
         )
         connection_temp = SerialConnection(
             serial=serial_port,
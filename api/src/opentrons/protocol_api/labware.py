@@ -779,12 +779,10 @@ def select_tiprack_from_list(
         raise TipSelectionError(
             "The starting tip you selected " f"does not exist in {first}"
         )
-    elif starting_point:
-        first_well = starting_point
-    else:
-        first_well = first.wells()[0]
 
-    next_tip = first.next_tip(num_channels, first_well)
+    # Without a starting point, search from the first well, which is where
+    # the tip tracker starts anyway.
+    next_tip = first.next_tip(num_channels, starting_point)
     if next_tip:
         return first, next_tip
     else:
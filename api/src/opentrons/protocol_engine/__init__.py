@@ -20,6 +20,7 @@ from .state import (
     State,
     StateView,
     CommandSlice,
+    CommandChanges,
     CurrentCommand,
     EngineConfigs,
     StateSummary,
@@ -68,6 +69,7 @@ __all__ = [
     "State",
     "StateView",
     "CommandSlice",
+    "CommandChanges",
     "CurrentCommand",
     # public value interfaces and models
     "LabwareOffset",
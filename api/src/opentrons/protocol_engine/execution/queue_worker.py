@@ -3,7 +3,7 @@ import asyncio
 from logging import getLogger
 from typing import Optional
 
-from ..state import StateStore
+from ..state import StateStore, SubstoreKey
 from ..errors import RunStoppedError
 from .command_executor import CommandExecutor
 
@@ -68,8 +68,9 @@ class QueueWorker:
 
     async def _run_commands(self) -> None:
         while not self._state_store.commands.get_stop_requested():
-            command_id = await self._state_store.wait_for(
-                condition=self._state_store.commands.get_next_queued
+            command_id = await self._state_store.wait_for_keys(
+                [SubstoreKey.COMMANDS],
+                condition=self._state_store.commands.get_next_queued,
             )
 
             await self._command_executor.execute(command_id=command_id)
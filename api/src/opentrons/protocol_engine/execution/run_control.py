@@ -1,7 +1,7 @@
 """Run control command side-effect logic."""
 import asyncio
 
-from ..state import StateStore
+from ..state import StateStore, SubstoreKey
 from ..actions import ActionDispatcher, PauseAction, PauseSource
 
 
@@ -23,8 +23,9 @@ class RunControlHandler:
         """Issue a PauseAction to the store, pausing the run."""
         if not self._state_store.get_configs().ignore_pause:
             self._action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL))
-            await self._state_store.wait_for(
-                condition=self._state_store.commands.get_is_running
+            await self._state_store.wait_for_keys(
+                [SubstoreKey.COMMANDS],
+                condition=self._state_store.commands.get_is_running,
             )
 
     async def wait_for_duration(self, seconds: float) -> None:
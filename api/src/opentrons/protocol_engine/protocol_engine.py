@@ -14,7 +14,7 @@ from .execution import (
     HardwareEventForwarder,
     HardwareStopper,
 )
-from .state import StateStore, StateView
+from .state import StateStore, StateView, CommandKey, SubstoreKey
 from .plugins import AbstractPlugin, PluginStarter
 from .actions import (
     ActionDispatcher,
@@ -149,11 +149,24 @@ class ProtocolEngine:
 
     async def wait_for_command(self, command_id: str) -> None:
         """Wait for a command to be completed."""
-        await self._state_store.wait_for(
+        await self._state_store.wait_for_keys(
+            [CommandKey(command_id)],
             self._state_store.commands.get_is_complete,
             command_id=command_id,
         )
 
+    async def wait_for_command_changes(self, cursor: int) -> None:
+        """Wait for commands to be added or changed since a change cursor.
+
+        Also returns once the engine has stopped, since no more changes may come.
+        See `CommandView.get_changes_since` for how change cursors work.
+        """
+        await self._state_store.wait_for_keys(
+            [SubstoreKey.COMMANDS],
+            self._state_store.commands.get_is_stopped_or_has_changes_since,
+            cursor=cursor,
+        )
+
     async def add_and_execute_command(self, request: CommandCreate) -> Command:
         """Add a command to the queue and wait for it to complete.
 
@@ -190,8 +203,9 @@ class ProtocolEngine:
         Raises:
             CommandExecutionFailedError: if any protocol command failed.
         """
-        await self._state_store.wait_for(
-            condition=self._state_store.commands.get_all_complete
+        await self._state_store.wait_for_keys(
+            [SubstoreKey.COMMANDS],
+            condition=self._state_store.commands.get_all_complete,
         )
 
     async def finish(
@@ -1,8 +1,16 @@
 """Protocol engine state module."""
 
 from .state import State, StateStore, StateView
+from .change_notifier import ChangeKey, CommandKey, SubstoreKey
 from .state_summary import StateSummary
-from .commands import CommandState, CommandView, CommandSlice, CurrentCommand
+from .commands import (
+    CommandState,
+    CommandView,
+    CommandSlice,
+    CommandChanges,
+    CommandEntry,
+    CurrentCommand,
+)
 from .labware import LabwareState, LabwareView
 from .pipettes import PipetteState, PipetteView, HardwarePipette, CurrentWell
 from .modules import ModuleState, ModuleView, HardwareModule
@@ -28,10 +36,16 @@ __all__ = [
     "StateStore",
     "StateView",
     "StateSummary",
+    # state change subscription keys
+    "ChangeKey",
+    "CommandKey",
+    "SubstoreKey",
     # command state and values
     "CommandState",
     "CommandView",
     "CommandSlice",
+    "CommandChanges",
+    "CommandEntry",
     "CurrentCommand",
     # labware state and values
     "LabwareState",
@@ -1,19 +1,101 @@
 """Simple state change notification interface."""
 import asyncio
+from dataclasses import dataclass
+from enum import Enum
+from itertools import count
+from typing import AbstractSet, Collection, Dict, Optional, Union
+
+
+class SubstoreKey(str, Enum):
+    """Keys for changes to a whole substore's state."""
+
+    COMMANDS = "commands"
+    LABWARE = "labware"
+    PIPETTES = "pipettes"
+    MODULES = "modules"
+
+
+@dataclass(frozen=True)
+class CommandKey:
+    """Key for changes to a single command."""
+
+    command_id: str
+
+
+ChangeKey = Union[SubstoreKey, CommandKey]
 
 
 class ChangeNotifier:
-    """An interface tto emit or subscribe to state change notifications."""
+    """An interface to emit or subscribe to state change notifications.
+
+    Waiters may subscribe to specific change keys, in which case they are
+    only woken by notifications for those keys, or by notifications that
+    do not specify any keys at all. Waiters that do not subscribe to any
+    keys are woken by every notification.
+
+    Waiters are always woken in the order they started waiting.
+    """
 
     def __init__(self) -> None:
-        """Initialize the ChangeNotifier with an internal Event."""
-        self._event = asyncio.Event()
+        """Initialize the ChangeNotifier's waiter registries."""
+        self._waiter_ids = count()
+        self._waiters: Dict[int, "asyncio.Future[None]"] = {}
+        self._unkeyed_waiters: Dict[int, "asyncio.Future[None]"] = {}
+        self._waiters_by_key: Dict[ChangeKey, Dict[int, "asyncio.Future[None]"]] = {}
+
+    def notify(self, keys: Optional[AbstractSet[ChangeKey]] = None) -> None:
+        """Notify `wait`'ers that the state has changed.
+
+        Arguments:
+            keys: The keys that have changed. If `None`, all waiters are
+                notified, regardless of what they are subscribed to.
+        """
+        if keys is None:
+            to_wake = self._waiters
+        else:
+            to_wake = dict(self._unkeyed_waiters)
+
+            for key in keys:
+                keyed_waiters = self._waiters_by_key.get(key)
+                if keyed_waiters:
+                    to_wake.update(keyed_waiters)
+
+            if len(to_wake) > 1:
+                to_wake = dict(sorted(to_wake.items()))
+
+        for waiter in to_wake.values():
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait(self, keys: Optional[Collection[ChangeKey]] = None) -> None:
+        """Wait until the next state change notification.
+
+        Arguments:
+            keys: Only wake on notifications for these keys. If `None`,
+                wake on every notification.
+        """
+        waiter_id = next(self._waiter_ids)
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        key_set = frozenset(keys) if keys is not None else None
+
+        self._waiters[waiter_id] = waiter
+
+        if key_set is None:
+            self._unkeyed_waiters[waiter_id] = waiter
+        else:
+            for key in key_set:
+                self._waiters_by_key.setdefault(key, {})[waiter_id] = waiter
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
-        self._event.set()
+        try:
+            await waiter
+        finally:
+            del self._waiters[waiter_id]
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+            if key_set is None:
+                del self._unkeyed_waiters[waiter_id]
+            else:
+                for key in key_set:
+                    keyed_waiters = self._waiters_by_key[key]
+                    del keyed_waiters[waiter_id]
+                    if not keyed_waiters:
+                        del self._waiters_by_key[key]
@@ -4,7 +4,7 @@ from collections import OrderedDict
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Mapping, Optional, Union
+from typing import Dict, List, Mapping, Optional, Sequence, Union
 
 from opentrons.ordered_set import OrderedSet
 
@@ -35,6 +35,7 @@ from ..errors import (
 )
 from ..types import EngineStatus
 from .abstract_store import HasState, HandlesActions
+from .persistent_vector import PersistentVector
 
 
 class QueueStatus(str, Enum):
@@ -74,6 +75,15 @@ class CommandSlice:
     total_length: int
 
 
+@dataclass(frozen=True)
+class CommandChanges:
+    """The commands that were added or changed since a change cursor."""
+
+    commands: List[CommandEntry]
+    cursor: int
+    total_length: int
+
+
 @dataclass(frozen=True)
 class CurrentCommand:
     """The "current" command's ID and index in the overall commands list."""
@@ -96,8 +106,12 @@ class CommandEntry:
 class CommandState:
     """State of all protocol engine command resources."""
 
-    all_command_ids: List[str]
-    """All command IDs, in insertion order."""
+    all_commands: PersistentVector[Command]
+    """All command resources, in insertion order.
+
+    Replaced rather than mutated on every change, so any previously
+    retrieved vector remains an unchanging snapshot of past state.
+    """
 
     queued_command_ids: OrderedSet[str]
     """The IDs of queued commands, in FIFO order"""
@@ -109,7 +123,13 @@ class CommandState:
     """The ID of the currently running command, if any"""
 
     commands_by_id: Dict[str, CommandEntry]
-    """All command resources, in insertion order, mapped by their unique IDs."""
+    """All command resources, mapped by their unique IDs, with their indices."""
+
+    command_changes: PersistentVector[int]
+    """The index of every command added or replaced, in the order it happened.
+
+    Positions in this log are the change cursors of `CommandView.get_changes_since`.
+    """
 
     queue_status: QueueStatus
     """Whether the engine is currently pulling new commands off the queue to execute.
@@ -159,7 +179,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
             is_door_blocking=is_door_blocking,
             run_result=None,
             running_command_id=None,
-            all_command_ids=[],
+            all_commands=PersistentVector(),
+            command_changes=PersistentVector(),
             queued_command_ids=OrderedSet(),
             queued_setup_command_ids=OrderedSet(),
             commands_by_id=OrderedDict(),
@@ -188,12 +209,7 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 status=CommandStatus.QUEUED,
             )
 
-            next_index = len(self._state.all_command_ids)
-            self._state.all_command_ids.append(action.command_id)
-            self._state.commands_by_id[queued_command.id] = CommandEntry(
-                index=next_index,
-                command=queued_command,
-            )
+            self._add_command(queued_command)
 
             if action.request.intent == CommandIntent.SETUP:
                 self._state.queued_setup_command_ids.add(queued_command.id)
@@ -208,17 +224,9 @@ class CommandStore(HasState[CommandState], HandlesActions):
             prev_entry = self._state.commands_by_id.get(command.id)
 
             if prev_entry is None:
-                index = len(self._state.all_command_ids)
-                self._state.all_command_ids.append(command.id)
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=index,
-                    command=command,
-                )
+                self._add_command(command)
             else:
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=command,
-                )
+                self._replace_command(prev_entry.index, command)
 
             self._state.queued_command_ids.discard(command.id)
             self._state.queued_setup_command_ids.discard(command.id)
@@ -237,12 +245,12 @@ class CommandStore(HasState[CommandState], HandlesActions):
             )
 
             prev_entry = self._state.commands_by_id[action.command_id]
-            self._state.commands_by_id[action.command_id] = CommandEntry(
-                index=prev_entry.index,
+            self._replace_command(
+                prev_entry.index,
                 # TODO(mc, 2022-06-06): add new "cancelled" status or similar
                 # and don't set `completedAt` in commands other than the
                 # specific one that failed
-                command=prev_entry.command.copy(
+                prev_entry.command.copy(
                     update={
                         "error": error_occurrence,
                         "completedAt": action.failed_at,
@@ -264,10 +272,9 @@ class CommandStore(HasState[CommandState], HandlesActions):
 
             for command_id in other_command_ids_to_fail:
                 prev_entry = self._state.commands_by_id[command_id]
-
-                self._state.commands_by_id[command_id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=prev_entry.command.copy(
+                self._replace_command(
+                    prev_entry.index,
+                    prev_entry.command.copy(
                         update={
                             "completedAt": action.failed_at,
                             "status": CommandStatus.FAILED,
@@ -337,6 +344,23 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 elif action.event.new_state == DoorState.CLOSED:
                     self._state.is_door_blocking = False
 
+    def _add_command(self, command: Command) -> None:
+        index = len(self._state.all_commands)
+        self._state.all_commands = self._state.all_commands.append(command)
+        self._state.command_changes = self._state.command_changes.append(index)
+        self._state.commands_by_id[command.id] = CommandEntry(
+            index=index,
+            command=command,
+        )
+
+    def _replace_command(self, index: int, command: Command) -> None:
+        self._state.all_commands = self._state.all_commands.set(index, command)
+        self._state.command_changes = self._state.command_changes.append(index)
+        self._state.commands_by_id[command.id] = CommandEntry(
+            index=index,
+            command=command,
+        )
+
 
 class CommandView(HasState[CommandState]):
     """Read-only command state view."""
@@ -354,17 +378,17 @@ class CommandView(HasState[CommandState]):
         except KeyError:
             raise CommandDoesNotExistError(f"Command {command_id} does not exist")
 
-    def get_all(self) -> List[Command]:
-        """Get a list of all commands in state.
+    def get_all(self) -> Sequence[Command]:
+        """Get a sequence of all commands in state.
 
         Entries are returned in the order of first-added command to last-added command.
         Replacing a command (to change its status, for example) keeps its place in the
         ordering.
+
+        The returned sequence is an immutable snapshot that shares its storage with
+        engine state, so it is cheap to get and safe to hold on to.
         """
-        return [
-            self._state.commands_by_id[cid].command
-            for cid in self._state.all_command_ids
-        ]
+        return self._state.all_commands
 
     def get_slice(
         self,
@@ -375,12 +399,8 @@ class CommandView(HasState[CommandState]):
 
         If the cursor is omitted, return the tail of `length` of the collection.
         """
-        # TODO(mc, 2022-01-31): this is not the most performant way to implement
-        # this; if this becomes a problem, change or the underlying data structure
-        # to something that isn't just an OrderedDict
-        all_command_ids = self._state.all_command_ids
-        commands_by_id = self._state.commands_by_id
-        total_length = len(all_command_ids)
+        all_commands = self._state.all_commands
+        total_length = len(all_commands)
 
         if cursor is None:
             cursor = total_length - length
@@ -388,15 +408,54 @@ class CommandView(HasState[CommandState]):
         # start is inclusive, stop is exclusive
         actual_cursor = max(0, min(cursor, total_length - 1))
         stop = min(total_length, actual_cursor + length)
-        command_ids = all_command_ids[actual_cursor:stop]
-        commands = [commands_by_id[cid].command for cid in command_ids]
 
         return CommandSlice(
-            commands=commands,
+            commands=all_commands[actual_cursor:stop],
             cursor=actual_cursor,
             total_length=total_length,
         )
 
+    def get_changes_since(self, cursor: int) -> CommandChanges:
+        """Get the commands that were added or changed since a change cursor.
+
+        Change cursors count every time a command was added or replaced. Start
+        from a cursor of 0 to get every command, then pass the returned cursor
+        to the next call to get only what changed in between. A cursor that
+        doesn't belong to this state, like one from another run, is treated as 0.
+
+        Returns:
+            The current version of each command that changed, in list order,
+            along with its index in the overall list.
+        """
+        command_changes = self._state.command_changes
+        change_count = len(command_changes)
+
+        if not 0 <= cursor <= change_count:
+            cursor = 0
+
+        all_commands = self._state.all_commands
+        changed_indices = sorted(set(command_changes[cursor:change_count]))
+
+        return CommandChanges(
+            commands=[
+                CommandEntry(index=index, command=all_commands[index])
+                for index in changed_indices
+            ],
+            cursor=change_count,
+            total_length=len(all_commands),
+        )
+
+    def get_has_changes_since(self, cursor: int) -> bool:
+        """Get whether `get_changes_since` would return any commands."""
+        return cursor != len(self._state.command_changes)
+
+    def get_is_stopped_or_has_changes_since(self, cursor: int) -> bool:
+        """Get whether the engine has stopped, or any commands changed since `cursor`.
+
+        After either, a client following changes has something new to act on.
+        """
+        return self.get_is_stopped() or self.get_has_changes_since(cursor)
+
     def get_all_errors(self) -> List[ErrorOccurrence]:
         """Get a list of all errors that have occurred."""
         return list(self._state.errors_by_id.values())
@@ -418,14 +477,15 @@ class CommandView(HasState[CommandState]):
 
         # TODO(mc, 2022-02-07): this is O(n) in the worst case for no good reason.
         # Resolve prior to JSONv6 support, where this will matter.
-        for reverse_index, cid in enumerate(reversed(self._state.all_command_ids)):
-            if self.get_is_complete(cid):
-                entry = self._state.commands_by_id[cid]
+        all_commands = self._state.all_commands
+        for index in reversed(range(len(all_commands))):
+            command = all_commands[index]
+            if command.status in (CommandStatus.SUCCEEDED, CommandStatus.FAILED):
                 return CurrentCommand(
-                    command_id=entry.command.id,
-                    command_key=entry.command.key,
-                    created_at=entry.command.createdAt,
-                    index=len(self._state.all_command_ids) - reverse_index - 1,
+                    command_id=command.id,
+                    command_key=command.key,
+                    created_at=command.createdAt,
+                    index=index,
                 )
 
         return None
@@ -505,10 +565,9 @@ class CommandView(HasState[CommandState]):
         no_command_queued = len(self._state.queued_command_ids) == 0
 
         if no_command_running and no_command_queued:
-            for command_id in self._state.all_command_ids:
-                command = self._state.commands_by_id[command_id].command
+            for command in self._state.all_commands:
                 if command.error and command.intent != CommandIntent.SETUP:
-                    raise ProtocolCommandFailedError(command_id=command_id)
+                    raise ProtocolCommandFailedError(command_id=command.id)
             return True
         else:
             return False
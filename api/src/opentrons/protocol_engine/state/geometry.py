@@ -1,6 +1,6 @@
 """Geometry state getters."""
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Dict, List, Optional
 
 from opentrons.types import Point, DeckSlotName
 from opentrons.hardware_control.dev_types import PipetteDict
@@ -50,6 +50,24 @@ class GeometryView:
         self._labware = labware_view
         self._modules = module_view
 
+        # Positions and heights only depend on what's loaded where on the
+        # deck, so they're cached until `clear_cache` is called.
+        self._labware_positions: Dict[str, Point] = {}
+        self._labware_highest_z: Dict[str, float] = {}
+        self._all_labware_highest_z: Optional[float] = None
+        self._ancestor_slot_names: Dict[str, DeckSlotName] = {}
+
+    def clear_cache(self) -> None:
+        """Forget cached labware positions and heights.
+
+        Must be called whenever labware or modules are loaded, moved, or
+        otherwise change where they are on the deck.
+        """
+        self._labware_positions.clear()
+        self._labware_highest_z.clear()
+        self._all_labware_highest_z = None
+        self._ancestor_slot_names.clear()
+
     def get_labware_highest_z(self, labware_id: str) -> float:
         """Get the highest Z-point of a labware."""
         labware_data = self._labware.get(labware_id)
@@ -59,16 +77,19 @@ class GeometryView:
     # TODO(mc, 2022-06-24): rename this method
     def get_all_labware_highest_z(self) -> float:
         """Get the highest Z-point across all labware."""
-        return max(
-            *(
-                self._get_highest_z_from_labware_data(lw_data)
-                for lw_data in self._labware.get_all()
-            ),
-            *(
-                self._modules.get_overall_height(module.id)
-                for module in self._modules.get_all()
-            ),
-        )
+        if self._all_labware_highest_z is None:
+            self._all_labware_highest_z = max(
+                *(
+                    self._get_highest_z_from_labware_data(lw_data)
+                    for lw_data in self._labware.get_all()
+                ),
+                *(
+                    self._modules.get_overall_height(module.id)
+                    for module in self._modules.get_all()
+                ),
+            )
+
+        return self._all_labware_highest_z
 
     def get_labware_parent_position(self, labware_id: str) -> Point:
         """Get the position of the labware's parent slot (deck or module)."""
@@ -106,14 +127,19 @@ class GeometryView:
 
     def get_labware_position(self, labware_id: str) -> Point:
         """Get the calibrated origin of the labware."""
-        origin_pos = self.get_labware_origin_position(labware_id)
-        cal_offset = self._labware.get_labware_offset_vector(labware_id)
+        position = self._labware_positions.get(labware_id)
+
+        if position is None:
+            origin_pos = self.get_labware_origin_position(labware_id)
+            cal_offset = self._labware.get_labware_offset_vector(labware_id)
+            position = Point(
+                x=origin_pos.x + cal_offset.x,
+                y=origin_pos.y + cal_offset.y,
+                z=origin_pos.z + cal_offset.z,
+            )
+            self._labware_positions[labware_id] = position
 
-        return Point(
-            x=origin_pos.x + cal_offset.x,
-            y=origin_pos.y + cal_offset.y,
-            z=origin_pos.z + cal_offset.z,
-        )
+        return position
 
     def get_well_position(
         self,
@@ -175,6 +201,10 @@ class GeometryView:
         ]
 
     def _get_highest_z_from_labware_data(self, lw_data: LoadedLabware) -> float:
+        highest_z = self._labware_highest_z.get(lw_data.id)
+        if highest_z is not None:
+            return highest_z
+
         labware_pos = self.get_labware_position(lw_data.id)
         definition = self._labware.get_definition(lw_data.id)
         z_dim = definition.dimensions.zDimension
@@ -182,7 +212,10 @@ class GeometryView:
         if isinstance(lw_data.location, ModuleLocation):
             module_id = lw_data.location.moduleId
             height_over_labware = self._modules.get_height_over_labware(module_id)
-        return labware_pos.z + z_dim + height_over_labware
+
+        highest_z = labware_pos.z + z_dim + height_over_labware
+        self._labware_highest_z[lw_data.id] = highest_z
+        return highest_z
 
     def get_nominal_effective_tip_length(
         self,
@@ -269,12 +302,16 @@ class GeometryView:
 
     def get_ancestor_slot_name(self, labware_id: str) -> DeckSlotName:
         """Get the slot name of the labware or the module that the labware is on."""
-        labware = self._labware.get(labware_id)
-        slot_name: DeckSlotName
+        slot_name = self._ancestor_slot_names.get(labware_id)
+
+        if slot_name is None:
+            labware = self._labware.get(labware_id)
+
+            if isinstance(labware.location, DeckSlotLocation):
+                slot_name = labware.location.slotName
+            else:
+                module_id = labware.location.moduleId
+                slot_name = self._modules.get_location(module_id).slotName
+            self._ancestor_slot_names[labware_id] = slot_name
 
-        if isinstance(labware.location, DeckSlotLocation):
-            slot_name = labware.location.slotName
-        else:
-            module_id = labware.location.moduleId
-            slot_name = self._modules.get_location(module_id).slotName
         return slot_name
@@ -4,7 +4,7 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Mapping, Optional, Sequence
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3, SlotDefV3
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
@@ -37,6 +37,46 @@ from .abstract_store import HasState, HandlesActions
 
 _TRASH_LOCATION = DeckSlotLocation(slotName=DeckSlotName.FIXED_TRASH)
 
+_NO_OFFSET_VECTOR = LabwareOffsetVector(x=0, y=0, z=0)
+
+_WELL_NAME_PATTERN = re.compile(WELL_NAME_PATTERN, re.X)
+
+
+@dataclass(frozen=True)
+class LabwareDefinitionIndex:
+    """Well orderings derived from a labware definition.
+
+    Built once, when the definition is added to state, so views don't
+    re-derive them from the definition on every call.
+    """
+
+    wells: List[str]
+    well_columns: Dict[str, List[str]]
+    well_rows: Dict[str, List[str]]
+
+    @classmethod
+    def from_definition(cls, definition: LabwareDefinition) -> LabwareDefinitionIndex:
+        """Index a labware definition."""
+        wells = [well_name for col in definition.ordering for well_name in col]
+        well_columns = {
+            f"{i+1}": list(col) for i, col in enumerate(definition.ordering)
+        }
+        well_rows: Dict[str, List[str]] = defaultdict(list)
+        for well_name in wells:
+            match = _WELL_NAME_PATTERN.match(well_name)
+            assert match, f"Well name did not match pattern {_WELL_NAME_PATTERN}"
+            well_rows[match.group(1)].append(well_name)
+
+        return cls(wells=wells, well_columns=well_columns, well_rows=dict(well_rows))
+
+
+def index_slot_definitions(deck_definition: DeckDefinitionV3) -> Dict[str, SlotDefV3]:
+    """Get a deck definition's slots by ID."""
+    return {
+        slot_def["id"]: slot_def
+        for slot_def in deck_definition["locations"]["orderedSlots"]
+    }
+
 
 @dataclass
 class LabwareState:
@@ -54,6 +94,11 @@ class LabwareState:
     definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV3
 
+    # Derived from definitions_by_uri and deck_definition, and kept in sync
+    # with them, for lookups that would otherwise search the definitions.
+    definition_indexes_by_uri: Dict[str, LabwareDefinitionIndex]
+    slot_definitions_by_id: Dict[str, SlotDefV3]
+
 
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
@@ -94,6 +139,11 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             labware_offsets_by_id={},
             labware_by_id=labware_by_id,
             deck_definition=deck_definition,
+            definition_indexes_by_uri={
+                uri: LabwareDefinitionIndex.from_definition(definition)
+                for uri, definition in definitions_by_uri.items()
+            },
+            slot_definitions_by_id=index_slot_definitions(deck_definition),
         )
 
     def handle_action(self, action: Action) -> None:
@@ -117,7 +167,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 load_name=action.definition.parameters.loadName,
                 version=action.definition.version,
             )
-            self._state.definitions_by_uri[uri] = action.definition
+            self._add_definition(uri, action.definition)
 
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
@@ -141,7 +191,14 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 offsetId=command.result.offsetId,
             )
 
-            self._state.definitions_by_uri[definition_uri] = command.result.definition
+            self._add_definition(definition_uri, command.result.definition)
+
+    def _add_definition(self, uri: str, definition: LabwareDefinition) -> None:
+        """Add a labware definition to state, replacing any with the same URI."""
+        self._state.definitions_by_uri[uri] = definition
+        self._state.definition_indexes_by_uri[
+            uri
+        ] = LabwareDefinitionIndex.from_definition(definition)
 
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
@@ -193,15 +250,13 @@ class LabwareView(HasState[LabwareState]):
 
     def get_slot_definition(self, slot: DeckSlotName) -> SlotDefV3:
         """Get the definition of a slot in the deck."""
-        deck_def = self.get_deck_definition()
-
-        for slot_def in deck_def["locations"]["orderedSlots"]:
-            if slot_def["id"] == str(slot):
-                return slot_def
-
-        raise errors.SlotDoesNotExistError(
-            f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
-        )
+        try:
+            return self._state.slot_definitions_by_id[str(slot)]
+        except KeyError as e:
+            raise errors.SlotDoesNotExistError(
+                f"Slot ID {slot} does not exist in deck"
+                f" {self.get_deck_definition()['otId']}"
+            ) from e
 
     def get_slot_position(self, slot: DeckSlotName) -> Point:
         """Get the position of a deck slot."""
@@ -230,6 +285,16 @@ class LabwareView(HasState[LabwareState]):
                 f"Labware definition for matching {uri} not found."
             ) from e
 
+    def _get_definition_index(self, labware_id: str) -> LabwareDefinitionIndex:
+        """Get the index of a labware's definition."""
+        uri = self.get(labware_id).definitionUri
+        try:
+            return self._state.definition_indexes_by_uri[uri]
+        except KeyError as e:
+            raise errors.LabwareDefinitionDoesNotExistError(
+                f"Labware definition for matching {uri} not found."
+            ) from e
+
     def get_location(self, labware_id: str) -> LabwareLocation:
         """Get labware location by the labware's unique identifier."""
         return self.get(labware_id).location
@@ -260,7 +325,7 @@ class LabwareView(HasState[LabwareState]):
         definition = self.get_definition(labware_id)
 
         if well_name is None:
-            well_name = definition.ordering[0][0]
+            well_name = self._get_definition_index(labware_id).wells[0]
 
         try:
             return definition.wells[well_name]
@@ -271,32 +336,15 @@ class LabwareView(HasState[LabwareState]):
 
     def get_wells(self, labware_id: str) -> List[str]:
         """Get labware wells as a list of well names."""
-        definition = self.get_definition(labware_id=labware_id)
-        wells = list()
-        for col in definition.ordering:
-            for well_name in col:
-                wells.append(well_name)
-        return wells
+        return list(self._get_definition_index(labware_id).wells)
 
     def get_well_columns(self, labware_id: str) -> Dict[str, List[str]]:
         """Get well columns."""
-        definition = self.get_definition(labware_id=labware_id)
-        wells_by_cols = defaultdict(list)
-        for i, col in enumerate(definition.ordering):
-            wells_by_cols[f"{i+1}"] = col
-        return wells_by_cols
+        return _copy_well_names(self._get_definition_index(labware_id).well_columns)
 
     def get_well_rows(self, labware_id: str) -> Dict[str, List[str]]:
         """Get well rows."""
-        definition = self.get_definition(labware_id=labware_id)
-        wells_by_rows = defaultdict(list)
-        pattern = re.compile(WELL_NAME_PATTERN, re.X)
-        for col in definition.ordering:
-            for well_name in col:
-                match = pattern.match(well_name)
-                assert match, f"Well name did not match pattern {pattern}"
-                wells_by_rows[match.group(1)].append(well_name)
-        return wells_by_rows
+        return _copy_well_names(self._get_definition_index(labware_id).well_rows)
 
     def get_tip_length(self, labware_id: str) -> float:
         """Get the tip length of a tip rack."""
@@ -354,7 +402,7 @@ class LabwareView(HasState[LabwareState]):
         """Get the labware's calibration offset."""
         offset_id = self.get(labware_id=labware_id).offsetId
         if offset_id is None:
-            return LabwareOffsetVector(x=0, y=0, z=0)
+            return _NO_OFFSET_VECTOR
         else:
             return self._state.labware_offsets_by_id[offset_id].vector
 
@@ -399,3 +447,8 @@ class LabwareView(HasState[LabwareState]):
             ):
                 return candidate
         return None
+
+
+def _copy_well_names(well_names: Mapping[str, List[str]]) -> Dict[str, List[str]]:
+    """Copy an index's well names, so callers can't modify the index."""
+    return {key: list(names) for key, names in well_names.items()}
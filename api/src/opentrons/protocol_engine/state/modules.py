@@ -597,12 +597,12 @@ class ModuleView(HasState[ModuleState]):
 
         Returns True if we need to dodge, False otherwise.
         """
-        all_mods = self.get_all()
-        if all_mods and ModuleModel.THERMOCYCLER_MODULE_V1 in [
-            mod.model for mod in all_mods
-        ]:
-            transit = (from_slot, to_slot)
-            if transit in _THERMOCYCLER_SLOT_TRANSITS_TO_DODGE:
+        # Check the transit first, since most moves don't cross the thermocycler
+        # and getting every module is comparatively slow.
+        transit = (from_slot, to_slot)
+        if transit in _THERMOCYCLER_SLOT_TRANSITS_TO_DODGE:
+            all_mods = self.get_all()
+            if ModuleModel.THERMOCYCLER_MODULE_V1 in [mod.model for mod in all_mods]:
                 return True
         return False
 
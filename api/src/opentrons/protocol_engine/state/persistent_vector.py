@@ -0,0 +1,222 @@
+"""An immutable, structurally shared sequence."""
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+
+_T = TypeVar("_T")
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+
+class PersistentVector(Sequence[_T]):
+    """An immutable sequence with cheap appends, replacements, and snapshots.
+
+    Items are stored in a 32-way trie, plus a "tail" buffer of up to 32 items
+    that haven't been pushed into the trie yet. Appending or replacing an item
+    returns a new vector that shares all untouched nodes with the old one,
+    so old vectors remain valid, unchanging snapshots.
+
+    - `append`: O(1) amortized
+    - `set` and integer indexing: O(log32 n)
+    - Iteration and slicing: O(k) for k items, after an O(log32 n) seek
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail")
+
+    _count: int
+    _shift: int
+    _root: List[Any]
+    _tail: List[_T]
+
+    def __init__(self, items: Iterable[_T] = ()) -> None:
+        """Initialize the vector with the given items, if any."""
+        self._count = 0
+        self._shift = _BITS
+        self._root = []
+        self._tail = []
+
+        for item in items:
+            # Safe to mutate in place, since nothing else can see this vector yet.
+            if len(self._tail) < _WIDTH:
+                self._tail.append(item)
+                self._count += 1
+            else:
+                self._root, self._shift = self._push_tail()
+                self._tail = [item]
+                self._count += 1
+
+    def append(self, item: _T) -> PersistentVector[_T]:
+        """Return a new vector with `item` added to the end."""
+        if len(self._tail) < _WIDTH:
+            return self._create(
+                count=self._count + 1,
+                shift=self._shift,
+                root=self._root,
+                tail=self._tail + [item],
+            )
+
+        root, shift = self._push_tail()
+        return self._create(count=self._count + 1, shift=shift, root=root, tail=[item])
+
+    def set(self, index: int, item: _T) -> PersistentVector[_T]:
+        """Return a new vector with the item at `index` replaced by `item`."""
+        index = self._normalize_index(index)
+        tail_offset = self._tail_offset()
+
+        if index >= tail_offset:
+            tail = list(self._tail)
+            tail[index - tail_offset] = item
+            return self._create(
+                count=self._count, shift=self._shift, root=self._root, tail=tail
+            )
+
+        root = self._set_in_node(self._shift, self._root, index, item)
+        return self._create(
+            count=self._count, shift=self._shift, root=root, tail=self._tail
+        )
+
+    def __len__(self) -> int:
+        """Get the number of items in the vector."""
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> _T:  # noqa: D105
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[_T]:  # noqa: D105
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[_T, List[_T]]:
+        """Get an item by index, or a list of items by slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return list(self._iter_range(start, stop))
+
+        index = self._normalize_index(index)
+        return self._leaf_for(index)[index & _MASK]
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over all items, in order."""
+        return self._iter_range(0, self._count)
+
+    def __eq__(self, other: object) -> bool:
+        """Check if another vector or list holds equal items in the same order.
+
+        Lists are accepted so that a vector can stand in for a list of the same
+        items, like the `List[Command]` this class replaces in engine state.
+        """
+        if not isinstance(other, (PersistentVector, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        """Get a string representation of the vector and its items."""
+        return f"{type(self).__name__}({list(self)!r})"
+
+    @classmethod
+    def _create(
+        cls,
+        count: int,
+        shift: int,
+        root: List[Any],
+        tail: List[_T],
+    ) -> PersistentVector[_T]:
+        vector: PersistentVector[_T] = cls.__new__(cls)
+        vector._count = count
+        vector._shift = shift
+        vector._root = root
+        vector._tail = tail
+        return vector
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PersistentVector index out of range")
+        return index
+
+    def _tail_offset(self) -> int:
+        return self._count - len(self._tail)
+
+    def _leaf_for(self, index: int) -> List[_T]:
+        if index >= self._tail_offset():
+            return self._tail
+
+        node = self._root
+        for level in range(self._shift, 0, -_BITS):
+            node = node[(index >> level) & _MASK]
+        return node
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[_T]:
+        index = start
+        while index < stop:
+            leaf = self._leaf_for(index)
+            leaf_start = index & _MASK
+            leaf_stop = min(len(leaf), leaf_start + (stop - index))
+            yield from leaf[leaf_start:leaf_stop]
+            index += leaf_stop - leaf_start
+
+    def _push_tail(self) -> Tuple[List[Any], int]:
+        """Push the full tail into a copy of the trie, returning the new root."""
+        # The trie is full if it holds 32^(levels) leaves.
+        if (self._count >> _BITS) > (1 << self._shift):
+            root = [self._root, _new_path(self._shift, self._tail)]
+            return root, self._shift + _BITS
+
+        return self._push_tail_into(self._shift, self._root), self._shift
+
+    def _push_tail_into(self, level: int, parent: List[Any]) -> List[Any]:
+        subindex = ((self._count - 1) >> level) & _MASK
+        node = list(parent)
+
+        if level == _BITS:
+            child: List[Any] = self._tail
+        elif subindex < len(parent):
+            child = self._push_tail_into(level - _BITS, parent[subindex])
+        else:
+            child = _new_path(level - _BITS, self._tail)
+
+        if subindex < len(node):
+            node[subindex] = child
+        else:
+            node.append(child)
+
+        return node
+
+    def _set_in_node(
+        self, level: int, node: List[Any], index: int, item: _T
+    ) -> List[Any]:
+        new_node = list(node)
+
+        if level == 0:
+            new_node[index & _MASK] = item
+        else:
+            subindex = (index >> level) & _MASK
+            new_node[subindex] = self._set_in_node(
+                level - _BITS, node[subindex], index, item
+            )
+
+        return new_node
+
+
+def _new_path(level: int, node: List[Any]) -> List[Any]:
+    while level > 0:
+        node = [node]
+        level -= _BITS
+    return node
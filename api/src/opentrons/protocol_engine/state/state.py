@@ -3,14 +3,32 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, TypeVar
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Collection,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 
 from ..resources import DeckFixedLabware
-from ..actions import Action, ActionHandler
+from ..commands import LoadLabwareResult, LoadModuleResult
+from ..actions import (
+    Action,
+    ActionHandler,
+    QueueCommandAction,
+    UpdateCommandAction,
+    AddLabwareOffsetAction,
+    AddLabwareDefinitionAction,
+    AddModuleAction,
+)
 from .abstract_store import HasState, HandlesActions
-from .change_notifier import ChangeNotifier
+from .change_notifier import ChangeNotifier, ChangeKey, CommandKey, SubstoreKey
 from .commands import CommandState, CommandStore, CommandView
 from .labware import LabwareState, LabwareStore, LabwareView
 from .pipettes import PipetteState, PipetteStore, PipetteView
@@ -149,7 +167,10 @@ class StateStore(StateView, ActionHandler):
         for substore in self._substores:
             substore.handle_action(action)
 
-        self._update_state_views()
+        if _changes_deck(action):
+            self._geometry.clear_cache()
+
+        self._update_state_views(changed_keys=_get_changed_keys(action))
 
     async def wait_for(
         self,
@@ -201,11 +222,46 @@ class StateStore(StateView, ActionHandler):
         Raises:
             The exception raised by the `condition` function, if any.
         """
-        predicate = partial(condition, *args, **kwargs)
+        return await self._wait_for(None, partial(condition, *args, **kwargs))
+
+    async def wait_for_keys(
+        self,
+        keys: Collection[ChangeKey],
+        condition: Callable[..., Optional[ReturnT]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ReturnT:
+        """Like `wait_for`, but only re-check the condition when `keys` change.
+
+        This avoids re-running `condition` after every action, which matters
+        when there are many concurrent waiters. `condition` must only depend
+        on state covered by `keys`. Actions that aren't tied to specific keys,
+        like play, pause, and stop, will still re-check every condition.
+
+        Arguments:
+            keys: The substores and commands that `condition` depends on.
+            condition: A function that returns a truthy value when the `await`
+                should resolve.
+            *args: Positional arguments to pass to `condition`.
+            **kwargs: Named arguments to pass to `condition`.
+
+        Returns:
+            The truthy value returned by the `condition` function.
+
+        Raises:
+            The exception raised by the `condition` function, if any.
+        """
+        return await self._wait_for(keys, partial(condition, *args, **kwargs))
+
+    async def _wait_for(
+        self,
+        keys: Optional[Collection[ChangeKey]],
+        predicate: Callable[[], Optional[ReturnT]],
+    ) -> ReturnT:
         is_done = predicate()
 
         while not is_done:
-            await self._change_notifier.wait()
+            await self._change_notifier.wait(keys)
             is_done = predicate()
 
         return is_done
@@ -244,7 +300,9 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
+    def _update_state_views(
+        self, changed_keys: Optional[AbstractSet[ChangeKey]]
+    ) -> None:
         """Update state view interfaces to use latest underlying values."""
         next_state = self._get_next_state()
         self._state = next_state
@@ -252,4 +310,54 @@ class StateStore(StateView, ActionHandler):
         self._labware._state = next_state.labware
         self._pipettes._state = next_state.pipettes
         self._modules._state = next_state.modules
-        self._change_notifier.notify()
+        self._change_notifier.notify(changed_keys)
+
+
+def _changes_deck(action: Action) -> bool:
+    """Get whether an action may have changed where labware or modules are.
+
+    Commands that don't load anything, which are most of a protocol's commands,
+    leave the deck alone. Anything else that isn't a command is assumed to
+    have changed it, like adding a module or a labware offset.
+    """
+    if isinstance(action, QueueCommandAction):
+        return False
+
+    elif isinstance(action, UpdateCommandAction):
+        return isinstance(action.command.result, (LoadLabwareResult, LoadModuleResult))
+
+    return True
+
+
+def _get_changed_keys(action: Action) -> Optional[AbstractSet[ChangeKey]]:
+    """Get the change keys that an action may have modified.
+
+    Returns:
+        The modified keys, or `None` if the action may have modified anything.
+        Only frequent actions are narrowed down; everything else is `None`.
+    """
+    if isinstance(action, QueueCommandAction):
+        return {SubstoreKey.COMMANDS, CommandKey(action.command_id)}
+
+    elif isinstance(action, UpdateCommandAction):
+        command = action.command
+
+        # Equipment substores only react to commands that have results.
+        if command.result is None:
+            return {SubstoreKey.COMMANDS, CommandKey(command.id)}
+
+        return {
+            SubstoreKey.COMMANDS,
+            SubstoreKey.LABWARE,
+            SubstoreKey.PIPETTES,
+            SubstoreKey.MODULES,
+            CommandKey(command.id),
+        }
+
+    elif isinstance(action, (AddLabwareOffsetAction, AddLabwareDefinitionAction)):
+        return {SubstoreKey.LABWARE}
+
+    elif isinstance(action, AddModuleAction):
+        return {SubstoreKey.MODULES}
+
+    return None
@@ -1,5 +1,5 @@
 """Protocol run control and management."""
-from typing import List, NamedTuple, Optional
+from typing import NamedTuple, Optional, Sequence
 
 from opentrons.hardware_control import HardwareControlAPI
 from opentrons.protocol_reader import (
@@ -29,7 +29,7 @@ from .legacy_wrappers import (
 class ProtocolRunResult(NamedTuple):
     """Result data from a run, pulled from the ProtocolEngine."""
 
-    commands: List[Command]
+    commands: Sequence[Command]
     state_summary: StateSummary
 
 
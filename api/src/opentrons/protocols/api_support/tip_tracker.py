@@ -1,5 +1,4 @@
-from itertools import dropwhile, takewhile
-from typing import Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentrons.protocols.context.well import WellImplementation
 
@@ -8,9 +7,75 @@ Wells = Sequence[WellImplementation]
 WellColumns = Sequence[Wells]
 
 
+def _first_run(mask: int) -> Tuple[int, int]:
+    """Find the first run of set bits in a mask.
+
+    :return: the index of the run's lowest bit and the run's length
+    """
+    if not mask:
+        return 0, 0
+    start = (mask & -mask).bit_length() - 1
+    shifted = mask >> start
+    return start, (shifted ^ (shifted + 1)).bit_length() - 1
+
+
+def _lowest_bit(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
 class TipTracker:
     def __init__(self, columns: WellColumns):
+        """
+        Construct a tip tracker.
+
+        Which wells have tips is kept in a bitmap with one mask per column,
+        where bit ``n`` is set if the ``n``th well from the top of the column
+        has a tip. The wells read and write their tip state through the
+        tracker, so it's always up to date.
+
+        Every pick-up needs the first unbroken run of tips (or, to return
+        tips, of empty wells) in each column. These are kept per column, along
+        with a mask of the columns whose first run is at least ``n`` long for
+        each ``n``, so finding the next tips doesn't look at every well.
+
+        :param columns: the tiprack's wells, by column
+        """
         self._columns = columns
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._full_masks = [(1 << len(column)) - 1 for column in columns]
+        self._tip_masks = [0] * len(columns)
+        self._tip_run_starts = [0] * len(columns)
+        self._empty_run_starts = [0] * len(columns)
+
+        max_column_length = max((len(column) for column in columns), default=0)
+        # Bit c of _tip_runs[n - 1] is set if column c's first run of tips is
+        # at least n long, and likewise for _empty_runs and empty wells.
+        self._tip_runs: List[int] = [0] * max_column_length
+        self._empty_runs: List[int] = [0] * max_column_length
+
+        for col_idx, column in enumerate(columns):
+            for row_idx, well in enumerate(column):
+                self._positions.setdefault(well.get_name(), (col_idx, row_idx))
+                if well.has_tip():
+                    self._tip_masks[col_idx] |= 1 << row_idx
+            self._update_runs(col_idx)
+
+        for column in columns:
+            for well in column:
+                well.set_tip_tracker(self)
+
+    def has_tip(self, well: WellImplementation) -> bool:
+        """Whether a well in this tiprack has a tip."""
+        col_idx, row_idx = self._positions[well.get_name()]
+        return bool(self._tip_masks[col_idx] >> row_idx & 1)
+
+    def set_has_tip(self, well: WellImplementation, value: bool) -> None:
+        """Set whether a well in this tiprack has a tip."""
+        col_idx, row_idx = self._positions[well.get_name()]
+        if value:
+            self._set_tips(col_idx, self._tip_masks[col_idx] | 1 << row_idx)
+        else:
+            self._set_tips(col_idx, self._tip_masks[col_idx] & ~(1 << row_idx))
 
     def next_tip(
         self, num_tips: int = 1, starting_tip: Optional[WellImplementation] = None
@@ -29,36 +94,27 @@ class TipTracker:
         :type starting_tip: :py:class:`.Well`
         :return: the :py:class:`.Well` meeting the target criteria, or None
         """
-        columns: WellColumns = self._columns
+        if not 0 < num_tips <= len(self._tip_runs):
+            return None
+
+        long_enough = self._tip_runs[num_tips - 1]
         if starting_tip:
-            # Remove columns preceding the one with the pipette's starting tip
-            drop_undefined_columns = list(
-                dropwhile(lambda x: starting_tip not in x, columns)
-            )
-            # Remove tips preceding the starting tip in the first column
-            drop_undefined_columns[0] = list(
-                dropwhile(lambda w: starting_tip is not w, drop_undefined_columns[0])
-            )
-            columns = drop_undefined_columns
-
-        drop_leading_empties = [
-            list(dropwhile(lambda x: not x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: x.has_tip(), column))
-            for column in drop_leading_empties
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-
-        try:
-            first_long_enough = long_enough[0]
-            result: Optional[WellImplementation] = first_long_enough[0]
-        except IndexError:
-            result = None
-
-        return result
+            col_idx, row_idx = self._positions[starting_tip.get_name()]
+            column = self._columns[col_idx]
+            if column[row_idx] is starting_tip:
+                # Only search from the starting tip down in its own column
+                start, length = _first_run(
+                    self._tip_masks[col_idx] >> row_idx << row_idx
+                )
+                if length >= num_tips:
+                    return column[start]
+            # Remove columns up to the one with the pipette's starting tip
+            long_enough = long_enough >> (col_idx + 1) << (col_idx + 1)
+
+        if not long_enough:
+            return None
+        col_idx = _lowest_bit(long_enough)
+        return self._columns[col_idx][self._tip_run_starts[col_idx]]
 
     def use_tips(
         self,
@@ -87,16 +143,15 @@ class TipTracker:
         :param fail_if_full: for backwards compatibility
         """
         # Select the column of the labware that contains the target well
-        target_column = [col for col in self._columns if start_well in col][0]
-
-        well_idx = target_column.index(start_well)
+        col_idx, well_idx = self._positions[start_well.get_name()]
         # Number of tips to pick up is the lesser of (1) the number of tips
         # from the starting well to the end of the column, and (2) the number
         # of channels of the pipette (so a 4-channel pipette would pick up a
         # max of 4 tips, and picking up from the 2nd-to-bottom well in a
         # column would get a maximum of 2 tips)
-        num_tips = min(len(target_column) - well_idx, num_channels)
-        target_wells = target_column[well_idx : well_idx + num_tips]
+        num_tips = min(len(self._columns[col_idx]) - well_idx, num_channels)
+        target_wells = ((1 << num_tips) - 1) << well_idx
+        tips = self._tip_masks[col_idx]
 
         # In API version 2.2, we no longer reset the tip tracker when a tip
         # is dropped back into a tiprack well. This fixes a behavior where
@@ -107,12 +162,11 @@ class TipTracker:
         # dirty tips and non-present tips; but until then, we can avoid the
         # exception.
         if fail_if_full:
-            assert all(
-                well.has_tip() for well in target_wells
-            ), "{} is out of tips".format(str(self))
+            assert tips & target_wells == target_wells, "{} is out of tips".format(
+                str(self)
+            )
 
-        for well in target_wells:
-            well.set_has_tip(False)
+        self._set_tips(col_idx, tips & ~target_wells)
 
     def previous_tip(self, num_tips: int = 1) -> Optional[WellImplementation]:
         """
@@ -126,21 +180,14 @@ class TipTracker:
         :type num_tips: int
         :return: The :py:class:`.Well` meeting the target criteria, or ``None``
         """
-        columns = self._columns
-        drop_leading_filled = [
-            list(dropwhile(lambda x: x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: not x.has_tip(), column))
-            for column in drop_leading_filled
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-        try:
-            return long_enough[0][0]
-        except IndexError:
+        if not 0 < num_tips <= len(self._empty_runs):
+            return None
+
+        long_enough = self._empty_runs[num_tips - 1]
+        if not long_enough:
             return None
+        col_idx = _lowest_bit(long_enough)
+        return self._columns[col_idx][self._empty_run_starts[col_idx]]
 
     def return_tips(self, start_well: WellImplementation, num_channels: int = 1):
         """
@@ -164,12 +211,39 @@ class TipTracker:
         :type num_channels: int
         """
         # Select the column that contains the target_well
-        target_column = [col for col in self._columns if start_well in col][0]
-        well_idx = target_column.index(start_well)
+        col_idx, well_idx = self._positions[start_well.get_name()]
+        target_column = self._columns[col_idx]
         end_idx = min(well_idx + num_channels, len(target_column))
-        drop_targets = target_column[well_idx:end_idx]
-        for well in drop_targets:
-            if well.has_tip():
-                raise AssertionError(f"Well {repr(well)} has a tip")
-        for well in drop_targets:
-            well.set_has_tip(True)
+        drop_targets = ((1 << (end_idx - well_idx)) - 1) << well_idx
+        tips = self._tip_masks[col_idx]
+
+        occupied = tips & drop_targets
+        if occupied:
+            well = target_column[_lowest_bit(occupied)]
+            raise AssertionError(f"Well {repr(well)} has a tip")
+
+        self._set_tips(col_idx, tips | drop_targets)
+
+    def _set_tips(self, col_idx: int, tips: int) -> None:
+        self._tip_masks[col_idx] = tips
+        self._update_runs(col_idx)
+
+    def _update_runs(self, col_idx: int) -> None:
+        tips = self._tip_masks[col_idx]
+        tip_run_start, tip_run_length = _first_run(tips)
+        empty_run_start, empty_run_length = _first_run(
+            ~tips & self._full_masks[col_idx]
+        )
+        self._tip_run_starts[col_idx] = tip_run_start
+        self._empty_run_starts[col_idx] = empty_run_start
+
+        column_bit = 1 << col_idx
+        for run_idx in range(len(self._tip_runs)):
+            if run_idx < tip_run_length:
+                self._tip_runs[run_idx] |= column_bit
+            else:
+                self._tip_runs[run_idx] &= ~column_bit
+            if run_idx < empty_run_length:
+                self._empty_runs[run_idx] |= column_bit
+            else:
+                self._empty_runs[run_idx] &= ~column_bit
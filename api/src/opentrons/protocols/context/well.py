@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING, Optional
 
 from opentrons.protocols.geometry.well_geometry import WellGeometry
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
 
+if TYPE_CHECKING:
+    from opentrons.protocols.api_support.tip_tracker import TipTracker
+
 
 class WellImplementation:
 
@@ -28,6 +32,7 @@ class WellImplementation:
         """
         self._display_name = display_name
         self._has_tip = has_tip
+        self._tip_tracker: Optional[TipTracker] = None
         self._name = name
 
         match = WellImplementation.pattern.match(name)
@@ -40,10 +45,19 @@ class WellImplementation:
         self._geometry = well_geometry
 
     def has_tip(self) -> bool:
+        if self._tip_tracker is not None:
+            return self._tip_tracker.has_tip(self)
         return self._has_tip
 
     def set_has_tip(self, value: bool) -> None:
-        self._has_tip = value
+        if self._tip_tracker is not None:
+            self._tip_tracker.set_has_tip(self, value)
+        else:
+            self._has_tip = value
+
+    def set_tip_tracker(self, tip_tracker: TipTracker) -> None:
+        """Keep whether this well has a tip in a tip tracker from now on."""
+        self._tip_tracker = tip_tracker
 
     def get_display_name(self) -> str:
         return self._display_name
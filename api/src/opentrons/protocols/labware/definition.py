@@ -1,11 +1,15 @@
+import functools
+import hashlib
 import logging
 import json
 import os
 import shutil
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 
 from pathlib import Path
-from typing import Any, AnyStr, List, Dict, Union
+from typing import Any, AnyStr, FrozenSet, List, Dict, Optional, Tuple, Union
 
 import jsonschema  # type: ignore
 
@@ -26,6 +30,16 @@ from opentrons_shared_data.labware.dev_types import LabwareDefinition
 
 MODULE_LOG = logging.getLogger(__name__)
 
+# How many distinct definitions to remember as having passed validation.
+_VERIFIED_DEFINITION_CACHE_SIZE = 256
+
+_verified_definition_hashes: "OrderedDict[str, None]" = OrderedDict()
+_verified_definition_hashes_lock = threading.Lock()
+
+# Raw definition file contents by path, with the (mtime, size) they were read at.
+# Standard definitions never change, so they're stored without a signature.
+_definition_file_cache: Dict[Path, Tuple[Optional[Tuple[int, int]], bytes]] = {}
+
 
 def get_labware_definition(
     load_name: str,
@@ -130,6 +144,7 @@ def save_definition(
     Path(def_path).parent.mkdir(parents=True, exist_ok=True)
     with open(def_path, "w") as f:
         json.dump(labware_def, f)
+    _definition_file_cache.pop(def_path, None)
 
 
 def verify_definition(
@@ -140,27 +155,62 @@ def verify_definition(
     If the definition is invalid, an exception is raised; otherwise parse the
     json and return the valid definition.
 
+    Definitions that already passed are remembered by a hash of their contents,
+    so verifying the same definition again skips the schema validation.
+
     :raises json.JsonDecodeError: If the definition is not valid json
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = load_shared_data("labware/schemas/2.json").decode("utf-8")
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
+        content_hash = _hash_definition_contents(json.dumps(to_return, sort_keys=True))
     else:
         to_return = json.loads(contents)
-    jsonschema.validate(to_return, labware_schema_v2)
+        content_hash = _hash_definition_contents(contents)
+
+    with _verified_definition_hashes_lock:
+        already_verified = content_hash in _verified_definition_hashes
+        if already_verified:
+            _verified_definition_hashes.move_to_end(content_hash)
+
+    if not already_verified:
+        error = jsonschema.exceptions.best_match(
+            _get_labware_schema_validator().iter_errors(to_return)
+        )
+        if error is not None:
+            raise error
+
+        with _verified_definition_hashes_lock:
+            _verified_definition_hashes[content_hash] = None
+            if len(_verified_definition_hashes) > _VERIFIED_DEFINITION_CACHE_SIZE:
+                _verified_definition_hashes.popitem(last=False)
+
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
     return to_return  # type: ignore
 
 
+@functools.lru_cache(maxsize=None)
+def _get_labware_schema_validator() -> Any:
+    """Load the labware schema and compile a validator for it, just once."""
+    labware_schema_v2 = json.loads(load_shared_data("labware/schemas/2.json"))
+    validator_cls = jsonschema.validators.validator_for(labware_schema_v2)
+    validator_cls.check_schema(labware_schema_v2)
+    return validator_cls(labware_schema_v2)
+
+
+def _hash_definition_contents(contents: Union[str, bytes]) -> str:
+    if isinstance(contents, str):
+        contents = contents.encode("utf-8")
+    return hashlib.sha256(contents).hexdigest()
+
+
 def delete_all_custom_labware() -> None:
     """Delete all custom labware"""
     if USER_DEFS_PATH.is_dir():
         shutil.rmtree(USER_DEFS_PATH)
+    _definition_file_cache.clear()
 
 
 def save_calibration(labware: AbstractLabware, delta: Point) -> None:
@@ -256,20 +306,73 @@ def _get_standard_labware_definition(
         )
 
     namespace = namespace.lower()
-    def_path = _get_path_to_labware(load_name, namespace, checked_version)
+    not_found = FileNotFoundError(
+        f'Labware "{load_name}" not found with version {checked_version} '
+        f'in namespace "{namespace}".'
+    )
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
-    except FileNotFoundError:
-        raise FileNotFoundError(
-            f'Labware "{load_name}" not found with version {checked_version} '
-            f'in namespace "{namespace}".'
+        contents = _read_definition_file(
+            _get_path_to_labware(load_name, namespace, checked_version),
+            is_standard=namespace == OPENTRONS_NAMESPACE,
         )
+    except FileNotFoundError:
+        raise not_found
 
+    # Parse a new copy every time, so callers can't modify the cached definition.
+    labware_def: LabwareDefinition = json.loads(contents)
     return labware_def
 
 
+@functools.lru_cache(maxsize=None)
+def _get_standard_labware_index() -> FrozenSet[Path]:
+    """List the definition file of every standard labware and version.
+
+    Built once, the first time it's needed, by listing the shared data
+    directory. Definitions are read later, when they're first loaded.
+    """
+    root = get_shared_data_root() / STANDARD_DEFS_PATH
+    index = set()
+    with os.scandir(root) as load_name_dirs:
+        for load_name_dir in load_name_dirs:
+            if not load_name_dir.is_dir():
+                continue
+            with os.scandir(load_name_dir.path) as definition_files:
+                for definition_file in definition_files:
+                    if definition_file.name.endswith(".json"):
+                        index.add(root / load_name_dir.name / definition_file.name)
+    return frozenset(index)
+
+
+def _read_definition_file(def_path: Path, is_standard: bool) -> bytes:
+    """Read a definition file, reusing an earlier read if it hasn't changed.
+
+    Standard definitions are installed with the software, so they're looked
+    up in the standard labware index and only read once. Custom definitions
+    can be replaced while the robot is running, so they're read again if
+    their modification time or size changed.
+
+    :raises FileNotFoundError: If there is no definition file at the path
+    """
+    if is_standard and def_path not in _get_standard_labware_index():
+        raise FileNotFoundError(str(def_path))
+
+    signature: Optional[Tuple[int, int]]
+    if is_standard:
+        signature = None
+    else:
+        stat = def_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _definition_file_cache.get(def_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    contents = def_path.read_bytes()
+    _definition_file_cache[def_path] = (signature, contents)
+    return contents
+
+
 def _get_parent_identifier(labware: AbstractLabware) -> str:
     """
     Helper function to return whether a labware is on top of a
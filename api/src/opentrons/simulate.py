@@ -25,6 +25,7 @@ import opentrons
 from opentrons.hardware_control import (
     API as HardwareAPI,
     ThreadManager,
+    ThreadManagedHardware,
     SyncHardwareAPI,
 )
 from opentrons.hardware_control.simulator_setup import load_simulator
@@ -343,45 +344,50 @@ def simulate(
     else:
         extra_data = {}
 
-    hardware_simulator = None
-
-    if hardware_simulator_file_path:
-        hardware_simulator = ThreadManager(
-            load_simulator,
-            pathlib.Path(hardware_simulator_file_path),
-        ).sync
-
     protocol = parse.parse(
         contents, file_name, extra_labware=extra_labware, extra_data=extra_data
     )
     bundle_contents: Optional[BundleContents] = None
 
-    # we want a None literal rather than empty dict so get_protocol_api
-    # will look for custom labware if this is a robot
-    gpa_extras = getattr(protocol, "extra_labware", None) or None
-    context = get_protocol_api(
-        getattr(protocol, "api_level", MAX_SUPPORTED_VERSION),
-        bundled_labware=getattr(protocol, "bundled_labware", None),
-        bundled_data=getattr(protocol, "bundled_data", None),
-        hardware_simulator=hardware_simulator,
-        extra_labware=gpa_extras,
-    )
-    broker = context.broker
-    scraper = CommandScraper(stack_logger, log_level, broker)
-    if duration_estimator:
-        broker.subscribe(command_types.COMMAND, duration_estimator.on_message)
+    if hardware_simulator_file_path:
+        hardware_manager: ThreadManagedHardware = ThreadManager(
+            load_simulator,
+            pathlib.Path(hardware_simulator_file_path),
+        )
+    else:
+        hardware_manager = ThreadManager(HardwareAPI.build_hardware_simulator)
 
+    # Stop the simulator's thread when done, so that simulating many protocols
+    # in one process doesn't leave a thread behind for each of them
     try:
-        execute.run_protocol(protocol, context)
-        if (
-            isinstance(protocol, PythonProtocol)
-            and protocol.api_level >= APIVersion(2, 0)
-            and protocol.bundled_labware is None
-            and allow_bundle()
-        ):
-            bundle_contents = bundle_from_sim(protocol, context)
+        # we want a None literal rather than empty dict so get_protocol_api
+        # will look for custom labware if this is a robot
+        gpa_extras = getattr(protocol, "extra_labware", None) or None
+        context = get_protocol_api(
+            getattr(protocol, "api_level", MAX_SUPPORTED_VERSION),
+            bundled_labware=getattr(protocol, "bundled_labware", None),
+            bundled_data=getattr(protocol, "bundled_data", None),
+            hardware_simulator=hardware_manager.sync,
+            extra_labware=gpa_extras,
+        )
+        broker = context.broker
+        scraper = CommandScraper(stack_logger, log_level, broker)
+        if duration_estimator:
+            broker.subscribe(command_types.COMMAND, duration_estimator.on_message)
+
+        try:
+            execute.run_protocol(protocol, context)
+            if (
+                isinstance(protocol, PythonProtocol)
+                and protocol.api_level >= APIVersion(2, 0)
+                and protocol.bundled_labware is None
+                and allow_bundle()
+            ):
+                bundle_contents = bundle_from_sim(protocol, context)
+        finally:
+            context.cleanup()
     finally:
-        context.cleanup()
+        hardware_manager.clean_up()
 
     return scraper.commands, bundle_contents
 
@@ -0,0 +1,441 @@
+"""Simulate many protocols in parallel.
+
+This module has functions that provide a console entrypoint for simulating
+many protocols at once from the command line, for instance to check every
+protocol in a repository in CI. Protocols are simulated with
+:py:obj:`opentrons.simulate.simulate` by a pool of worker processes that
+each stay up to simulate protocol after protocol, so only the first protocol
+each worker simulates pays for importing the Opentrons stack and loading
+shared data.
+"""
+import argparse
+import io
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+import opentrons
+from opentrons.simulate import simulate
+from opentrons.protocols.duration import DurationEstimator
+
+MODULE_LOG = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 300.0
+
+# Simulated by each worker before it takes any protocols, so that the first
+# protocol it simulates doesn't pay for loading the deck, common labware and
+# pipette definitions, and the hardware simulator
+_WARM_UP_PROTOCOL = """
+metadata = {"apiLevel": "2.0"}
+
+def run(ctx):
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    plate = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+    pipette = ctx.load_instrument("p300_single_gen2", "right", tip_racks=[tip_rack])
+    pipette.transfer(10, plate["A1"], plate["B1"])
+"""
+
+
+class SimulationOptions(NamedTuple):
+    """How workers simulate each protocol. See :py:obj:`simulate_batch`."""
+
+    custom_labware_paths: Sequence[str] = ()
+    custom_data_paths: Sequence[str] = ()
+    hardware_simulator_file_path: Optional[str] = None
+    estimate_duration: bool = False
+    log_level: str = "warning"
+
+
+def simulate_batch(
+    protocol_paths: Sequence[str],
+    workers: int,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    options: SimulationOptions = SimulationOptions(),
+) -> Iterator[Dict[str, Any]]:
+    """Simulate many protocols in parallel.
+
+    Each protocol is simulated with :py:obj:`opentrons.simulate.simulate` in
+    one of ``workers`` worker processes. A worker that takes longer than
+    ``timeout`` to simulate a protocol is killed and replaced.
+
+    Results are yielded as each protocol finishes, which may not be the order
+    they were given in. Each result is a dict that can be serialized as JSON,
+    with the keys:
+
+        - ``protocol``: The path of the protocol, as given.
+        - ``status``: ``"ok"`` if the protocol simulated without problems,
+                      ``"error"`` if it raised an exception, or ``"timeout"``
+                      if it took longer than ``timeout``.
+        - ``runLog``: If the status is ``"ok"``, the run log, as a list of
+                      dicts with the keys ``level``, ``text`` and ``logs``.
+                      See :py:obj:`opentrons.simulate.simulate`.
+        - ``estimatedDuration``: If the status is ``"ok"`` and
+                                 ``options.estimate_duration`` is set, the
+                                 estimated duration of the protocol in
+                                 seconds.
+        - ``error``: If the status is not ``"ok"``, what went wrong.
+        - ``elapsed``: How long simulating the protocol took, in seconds.
+
+    Args:
+        protocol_paths: The paths of the protocol files to simulate.
+        workers: How many worker processes to simulate protocols in.
+        timeout: How long, in seconds, each protocol may take to simulate.
+            If ``None``, protocols may take any time.
+        options: How to simulate each protocol.
+
+    Yields:
+        The result of simulating each protocol.
+
+    Raises:
+        ValueError: ``workers`` is less than 1.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    pending: Deque[str] = deque(protocol_paths)
+    pool = _WorkerPool(
+        size=min(workers, len(pending)), timeout=timeout, options=options
+    )
+
+    try:
+        while pending or pool.busy:
+            while pending and pool.start(pending[0]):
+                pending.popleft()
+            yield from pool.wait()
+    finally:
+        pool.close()
+
+
+class _Worker:
+    """A worker process and the protocol it is simulating, if any."""
+
+    def __init__(self, options: SimulationOptions) -> None:
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_run_worker,
+            args=(worker_connection, options),
+            daemon=True,
+        )
+        self.process.start()
+        worker_connection.close()
+        self.ready = False
+        self.protocol: Optional[str] = None
+        self.started_at = 0.0
+
+    def send(self, protocol_path: str) -> None:
+        self.protocol = protocol_path
+        self.started_at = time.monotonic()
+        self.connection.send(protocol_path)
+
+    def failure(self, status: str, error: str) -> Dict[str, Any]:
+        return {
+            "protocol": self.protocol,
+            "status": status,
+            "error": error,
+            "elapsed": time.monotonic() - self.started_at,
+        }
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class _WorkerPool:
+    """Worker processes that each simulate one protocol at a time."""
+
+    def __init__(
+        self, size: int, timeout: Optional[float], options: SimulationOptions
+    ) -> None:
+        self._timeout = timeout
+        self._options = options
+        self._workers: Dict[Connection, _Worker] = {}
+        for _ in range(size):
+            self._add_worker()
+
+    @property
+    def busy(self) -> bool:
+        """Whether any worker is simulating a protocol."""
+        return any(w.protocol is not None for w in self._workers.values())
+
+    def start(self, protocol_path: str) -> bool:
+        """Start simulating a protocol on an idle worker, if there is one."""
+        for worker in self._workers.values():
+            if worker.ready and worker.protocol is None:
+                worker.send(protocol_path)
+                return True
+        return False
+
+    def wait(self) -> List[Dict[str, Any]]:
+        """Wait for workers to finish or time out, and return any results."""
+        results = []
+        deadlines = [
+            worker.started_at + self._timeout
+            for worker in self._workers.values()
+            if worker.protocol is not None and self._timeout is not None
+        ]
+        ready = wait(
+            list(self._workers),
+            timeout=max(min(deadlines) - time.monotonic(), 0) if deadlines else None,
+        )
+
+        for connection in ready:
+            worker = self._workers[connection]  # type: ignore[index]
+            try:
+                result = worker.connection.recv()
+            except EOFError:
+                if worker.protocol is None:
+                    raise RuntimeError("A worker exited while starting up")
+                results.append(
+                    worker.failure("error", "The worker simulating it exited")
+                )
+                self._replace(worker)
+                continue
+
+            if result is None:
+                worker.ready = True
+            else:
+                results.append(result)
+                worker.protocol = None
+
+        for worker in list(self._workers.values()):
+            if worker.protocol is not None and self._timed_out(worker):
+                results.append(
+                    worker.failure("timeout", f"Timed out after {self._timeout} s")
+                )
+                self._replace(worker)
+
+        return results
+
+    def close(self) -> None:
+        """Stop every worker."""
+        for worker in self._workers.values():
+            worker.stop()
+        self._workers.clear()
+
+    def _timed_out(self, worker: _Worker) -> bool:
+        return (
+            self._timeout is not None
+            and time.monotonic() - worker.started_at >= self._timeout
+        )
+
+    def _add_worker(self) -> None:
+        worker = _Worker(self._options)
+        self._workers[worker.connection] = worker
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.stop()
+        del self._workers[worker.connection]
+        self._add_worker()
+
+
+def _run_worker(connection: Connection, options: SimulationOptions) -> None:
+    """Warm up, then simulate protocols sent over ``connection`` until it closes.
+
+    Sends ``None`` when warmed up, then the result of each protocol.
+    """
+    # Keep anything the stack or protocols print out of the results, which
+    # the parent process prints to stdout
+    sys.stdout = sys.stderr
+
+    try:
+        simulate(io.StringIO(_WARM_UP_PROTOCOL), "warm_up.py", log_level="none")
+    except Exception:
+        MODULE_LOG.exception("Failed to warm up protocol simulation")
+    connection.send(None)
+
+    while True:
+        try:
+            protocol_path = connection.recv()
+        except EOFError:
+            return
+        connection.send(_simulate_one(protocol_path, options))
+
+
+def _simulate_one(protocol_path: str, options: SimulationOptions) -> Dict[str, Any]:
+    started_at = time.monotonic()
+    duration_estimator = DurationEstimator() if options.estimate_duration else None  # type: ignore[no-untyped-call]
+    result: Dict[str, Any] = {"protocol": protocol_path}
+
+    try:
+        with open(protocol_path, "rb") as protocol_file:
+            runlog, _ = simulate(
+                protocol_file,  # type: ignore[arg-type]
+                protocol_path,
+                list(options.custom_labware_paths),
+                list(options.custom_data_paths),
+                duration_estimator=duration_estimator,
+                hardware_simulator_file_path=options.hardware_simulator_file_path,
+                log_level=options.log_level,
+            )
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+    else:
+        result["status"] = "ok"
+        result["runLog"] = _serialize_runlog(runlog)
+        if duration_estimator:
+            result["estimatedDuration"] = duration_estimator.get_total_duration()
+
+    result["elapsed"] = time.monotonic() - started_at
+    return result
+
+
+def _serialize_runlog(runlog: List[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "level": command["level"],
+            "text": command["payload"].get("text", ""),
+            "logs": [
+                f"{record.levelname} ({record.module}): {record.getMessage()}"
+                for record in command["logs"]
+            ],
+        }
+        for command in runlog
+    ]
+
+
+def get_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Get the argument parser for this module.
+
+    Useful if you want to use this module as a component of another CLI program
+    and want to add its arguments.
+
+    Args:
+        parser: A parser to add arguments to.
+
+    Returns:
+        The parser with arguments added.
+    """
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="How many protocols to simulate at once, each in its own worker "
+        "process. Defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="How long, in seconds, each protocol may take to simulate before "
+        "it is stopped and reported as timed out. If 0, protocols may take "
+        f"any time. Defaults to {DEFAULT_TIMEOUT:g}.",
+    )
+    parser.add_argument(
+        "-l",
+        "--log-level",
+        choices=["debug", "info", "warning", "error", "none"],
+        default="warning",
+        help="Specify the level filter for logs to include in each run log. "
+        'If "none", do not include logs',
+    )
+    parser.add_argument(
+        "-L",
+        "--custom-labware-path",
+        action="append",
+        default=[os.getcwd()],
+        help="Specify directories to search for custom labware definitions, "
+        "like opentrons_simulate. By default, the current directory is "
+        "searched.",
+    )
+    parser.add_argument(
+        "-D",
+        "--custom-data-path",
+        action="append",
+        nargs="?",
+        const=".",
+        default=[],
+        help="Specify directories to load custom data files from, like "
+        "opentrons_simulate.",
+    )
+    parser.add_argument(
+        "-d",
+        "--custom-data-file",
+        action="append",
+        default=[],
+        help="Specify data files to be made available in "
+        "ProtocolContext.bundled_data, like opentrons_simulate.",
+    )
+    parser.add_argument(
+        "-s",
+        "--custom-hardware-simulator-file",
+        type=str,
+        default=None,
+        help="Specify a file that describes the features present in the "
+        "hardware simulator, like opentrons_simulate.",
+    )
+    parser.add_argument(
+        "-e",
+        "--estimate-duration",
+        action="store_true",
+        help="Estimate how long each protocol will take to complete."
+        " This is an experimental feature.",
+    )
+    parser.add_argument(
+        "protocols",
+        metavar="PROTOCOL",
+        nargs="+",
+        help="The protocol files to simulate.",
+    )
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",
+        version=f"%(prog)s {opentrons.__version__}",
+        help="Print the opentrons package version and exit",
+    )
+    return parser
+
+
+def main() -> int:
+    """Simulate the protocols, printing a line of JSON for each as it finishes."""
+    parser = argparse.ArgumentParser(
+        prog="opentrons_simulate_batch",
+        description="Simulate many OT-2 protocols in parallel",
+    )
+    parser = get_arguments(parser)
+    args = parser.parse_args()
+
+    options = SimulationOptions(
+        custom_labware_paths=args.custom_labware_path,
+        custom_data_paths=args.custom_data_path + args.custom_data_file,
+        hardware_simulator_file_path=args.custom_hardware_simulator_file,
+        estimate_duration=args.estimate_duration,
+        log_level=args.log_level,
+    )
+
+    failed = False
+    for result in simulate_batch(
+        args.protocols,
+        workers=args.jobs,
+        timeout=args.timeout or None,
+        options=options,
+    ):
+        failed = failed or result["status"] != "ok"
+        print(json.dumps(result), flush=True)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
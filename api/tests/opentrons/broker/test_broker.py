@@ -74,3 +74,17 @@ def test_add_listener() -> None:
     fake_obj.method_a(0, "2")
 
     assert calls == expected, "No calls expected after unsubscribe()"
+
+
+def test_has_subscribers() -> None:
+    fake_obj = FakeClass()
+
+    assert fake_obj.broker.has_subscribers("command") is False
+
+    unsubscribe = fake_obj.broker.subscribe("command", lambda message: None)
+
+    assert fake_obj.broker.has_subscribers("command") is True
+
+    unsubscribe()
+
+    assert fake_obj.broker.has_subscribers("command") is False
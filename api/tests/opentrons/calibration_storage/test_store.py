@@ -0,0 +1,130 @@
+import pytest
+from pathlib import Path
+from typing import Any, List
+
+from opentrons import config
+from opentrons.calibration_storage import (
+    delete,
+    file_operators as io,
+    get,
+    modify,
+    store,
+)
+from opentrons.types import Mount, Point
+
+
+@pytest.fixture
+def pipette_dir(ot_config_tempdir: Path) -> Path:
+    pip_dir = config.get_opentrons_path("pipette_calibration_dir")
+    pip_dir.mkdir(parents=True, exist_ok=True)
+    return pip_dir
+
+
+@pytest.fixture
+def file_reads(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    reads: List[str] = []
+    read_cal_file = io.read_cal_file
+
+    def _read_cal_file(filepath: Any, *args: Any, **kwargs: Any) -> Any:
+        reads.append(str(filepath))
+        return read_cal_file(filepath, *args, **kwargs)
+
+    monkeypatch.setattr(io, "read_cal_file", _read_cal_file)
+    return reads
+
+
+def _save_pipette_offset(pip_id: str, mount: Mount) -> None:
+    modify.save_pipette_calibration(
+        offset=Point(1, 2, 3),
+        pip_id=pip_id,
+        mount=mount,
+        tiprack_hash="tiprack-hash",
+        tiprack_uri="opentrons/opentrons_96_tiprack_300ul/1",
+    )
+
+
+def _listed_pipettes() -> List[str]:
+    return [cal.pipette for cal in get.get_all_pipette_offset_calibrations()]
+
+
+def test_build_store_from_existing_files(pipette_dir: Path) -> None:
+    """It should build the store from calibration files saved without one."""
+    (pipette_dir / "left").mkdir()
+    io.save_to_file(pipette_dir / "index.json", {"left": ["pip-1", "pip-2"]})
+    for pip_id in ("pip-1", "pip-2"):
+        io.save_to_file(
+            pipette_dir / "left" / f"{pip_id}.json",
+            {
+                "offset": [1, 2, 3],
+                "tiprack": "tiprack-hash",
+                "uri": "opentrons/opentrons_96_tiprack_300ul/1",
+                "last_modified": "2022-01-01T00:00:00+00:00",
+            },
+        )
+
+    assert _listed_pipettes() == ["pip-1", "pip-2"]
+    assert (pipette_dir / store.STORE_FILE_NAME).exists()
+    assert set(store.load(pipette_dir)) == {
+        "index.json",
+        "left/pip-1.json",
+        "left/pip-2.json",
+    }
+
+
+def test_skip_corrupt_files(pipette_dir: Path) -> None:
+    """It should leave corrupt files out of the store."""
+    (pipette_dir / "left").mkdir()
+    io.save_to_file(pipette_dir / "index.json", {"left": ["pip-1"]})
+    (pipette_dir / "left" / "pip-1.json").write_text("{not json")
+
+    assert _listed_pipettes() == []
+
+
+def test_list_from_cache(pipette_dir: Path, file_reads: List[str]) -> None:
+    """It should list calibrations without reading files once they're cached."""
+    _save_pipette_offset("pip-1", Mount.LEFT)
+    _save_pipette_offset("pip-2", Mount.RIGHT)
+    file_reads.clear()
+
+    assert _listed_pipettes() == ["pip-1", "pip-2"]
+    assert _listed_pipettes() == ["pip-1", "pip-2"]
+    assert file_reads == []
+
+
+def test_list_reads_one_file(pipette_dir: Path, file_reads: List[str]) -> None:
+    """It should list calibrations by reading only the store file."""
+    for i in range(10):
+        _save_pipette_offset(f"pip-{i}", Mount.LEFT)
+    store._cache.clear()
+    file_reads.clear()
+
+    assert len(_listed_pipettes()) == 10
+    assert file_reads == [str(pipette_dir / store.STORE_FILE_NAME)]
+
+
+def test_save_and_delete_update_store(pipette_dir: Path) -> None:
+    """It should keep the store in sync with saves and deletes."""
+    _save_pipette_offset("pip-1", Mount.LEFT)
+    _save_pipette_offset("pip-2", Mount.LEFT)
+    delete.delete_pipette_offset_file("pip-1", Mount.LEFT)
+
+    assert _listed_pipettes() == ["pip-2"]
+    assert not (pipette_dir / "left" / "pip-1.json").exists()
+
+    delete.clear_pipette_offset_calibrations()
+
+    assert _listed_pipettes() == []
+
+
+def test_rebuild_on_outside_index_change(pipette_dir: Path) -> None:
+    """It should rebuild the store if the index was written without it."""
+    _save_pipette_offset("pip-1", Mount.LEFT)
+    assert _listed_pipettes() == ["pip-1"]
+
+    io.save_to_file(
+        pipette_dir / "left" / "pip-2.json",
+        io.read_cal_file(pipette_dir / "left" / "pip-1.json"),
+    )
+    io.save_to_file(pipette_dir / "index.json", {"left": ["pip-1", "pip-2"]})
+
+    assert _listed_pipettes() == ["pip-1", "pip-2"]
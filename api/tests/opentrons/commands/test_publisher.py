@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import pytest
 from decoy import Decoy, matchers
-from typing import Any, Dict, cast
+from typing import Any, Dict, Tuple, cast
 from opentrons.broker import Broker
 from opentrons.commands.types import Command as CommandDict, CommandMessage
 from opentrons.commands.publisher import CommandPublisher, publish, publish_context
@@ -11,8 +11,10 @@ from opentrons.commands.publisher import CommandPublisher, publish, publish_cont
 
 @pytest.fixture
 def broker(decoy: Decoy) -> Broker:
-    """Return a mocked out Broker."""
-    return decoy.mock(cls=Broker)
+    """Return a mocked out Broker with a subscriber."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(True)
+    return broker
 
 
 def test_publish_decorator(decoy: Decoy, broker: Broker) -> None:
@@ -221,6 +223,132 @@ def test_publish_decorator_remaps_instrument(decoy: Decoy, broker: Broker) -> No
     )
 
 
+def test_publish_decorator_with_kwargs(decoy: Decoy, broker: Broker) -> None:
+    """It should map keyword arguments to the command creator."""
+
+    def _get_command_payload(foo: str, bar: int) -> CommandDict:
+        return cast(
+            CommandDict,
+            {"name": "some_command", "payload": {"foo": foo, "bar": bar}},
+        )
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str, *, bar: int = 0, baz: int = 0) -> None:
+            pass
+
+    subject = _Subject(broker=broker)
+    subject.act(bar=42, foo="hello")
+
+    decoy.verify(
+        broker.publish(
+            topic="command",
+            message=cast(
+                CommandMessage,
+                {
+                    "$": "before",
+                    "id": matchers.IsA(str),
+                    "name": "some_command",
+                    "payload": {"foo": "hello", "bar": 42},
+                    "error": None,
+                },
+            ),
+        ),
+    )
+
+
+def test_publish_decorator_with_var_args(decoy: Decoy, broker: Broker) -> None:
+    """It should map arguments of methods that take variable arguments."""
+
+    def _get_command_payload(foo: str, kwargs: Dict[str, Any]) -> CommandDict:
+        return cast(
+            CommandDict,
+            {"name": "some_command", "payload": {"foo": foo, "kwargs": kwargs}},
+        )
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str, *args: Any, **kwargs: Any) -> None:
+            pass
+
+    subject = _Subject(broker=broker)
+    subject.act("hello", 1, 2, bar=42)
+
+    decoy.verify(
+        broker.publish(
+            topic="command",
+            message=cast(
+                CommandMessage,
+                {
+                    "$": "before",
+                    "id": matchers.IsA(str),
+                    "name": "some_command",
+                    "payload": {"foo": "hello", "kwargs": {"bar": 42}},
+                    "error": None,
+                },
+            ),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["args", "kwargs"],
+    argvalues=[
+        ((), {}),
+        (("hello", 42, 43), {}),
+        (("hello",), {"foo": "hello"}),
+        (("hello",), {"baz": 42}),
+    ],
+)
+def test_publish_decorator_with_bad_args(
+    decoy: Decoy,
+    broker: Broker,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> None:
+    """It should raise a TypeError, without publishing, if arguments don't bind."""
+    _act = decoy.mock()
+
+    def _get_command_payload(foo: str, bar: int) -> CommandDict:
+        return cast(
+            CommandDict,
+            {"name": "some_command", "payload": {"foo": foo, "bar": bar}},
+        )
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str, bar: int = 42) -> None:
+            _act()
+
+    subject = _Subject(broker=broker)
+
+    with pytest.raises(TypeError):
+        subject.act(*args, **kwargs)
+
+    decoy.verify(_act(), times=0)
+    decoy.verify(broker.publish(topic="command", message=matchers.Anything()), times=0)
+
+
+def test_publish_decorator_without_subscribers(decoy: Decoy, broker: Broker) -> None:
+    """It should not build or publish messages that nothing would receive."""
+    _act = decoy.mock()
+    _get_command_payload = decoy.mock()
+
+    decoy.when(broker.has_subscribers("command")).then_return(False)
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str, bar: int) -> None:
+            _act()
+
+    subject = _Subject(broker=broker)
+    subject.act("hello", 42)
+
+    decoy.verify(_act())
+    decoy.verify(_get_command_payload(), times=0, ignore_extra_args=True)
+    decoy.verify(broker.publish(topic="command", message=matchers.Anything()), times=0)
+
+
 def test_publish_context(decoy: Decoy, broker: Broker) -> None:
     _act = decoy.mock()
 
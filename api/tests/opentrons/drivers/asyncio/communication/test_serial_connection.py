@@ -5,6 +5,7 @@ from mock import AsyncMock, call
 
 from opentrons.drivers.asyncio.communication.async_serial import AsyncSerial
 from opentrons.drivers.asyncio.communication.serial_connection import SerialConnection
+from opentrons.drivers.asyncio.communication.serial_transport import SerialTransport
 from opentrons.drivers.asyncio.communication import (
     NoResponse,
     AlarmResponse,
@@ -125,3 +126,62 @@ async def test_on_retry(mock_serial_port: AsyncMock, subject: SerialConnection)
 
     mock_serial_port.close.assert_called_once()
     mock_serial_port.open.assert_called_once()
+
+
+@pytest.fixture
+def mock_serial_transport() -> AsyncMock:
+    return AsyncMock(spec=SerialTransport)
+
+
+@pytest.fixture
+async def transport_subject(
+    mock_serial_transport: AsyncMock, ack: str
+) -> SerialConnection:
+    """Create a test subject that sends commands with a SerialTransport."""
+    return SerialConnection(
+        serial=mock_serial_transport,
+        ack=ack,
+        name="name",
+        port="port",
+        retry_wait_time_seconds=0,
+        error_keyword="error",
+        alarm_keyword="alarm",
+    )
+
+
+async def test_send_command_with_transport(
+    mock_serial_transport: AsyncMock, transport_subject: SerialConnection, ack: str
+) -> None:
+    """It should send a command as a request on the transport."""
+    mock_serial_transport.request.return_value = f"response data {ack}".encode()
+
+    response = await transport_subject.send_data(data="send data", timeout=5)
+
+    assert response == "response data"
+    mock_serial_transport.request.assert_called_once_with(
+        data=b"send data", ack=ack.encode(), timeout=5
+    )
+
+
+async def test_send_command_with_transport_retry(
+    mock_serial_transport: AsyncMock, transport_subject: SerialConnection, ack: str
+) -> None:
+    """It should reopen the transport and retry after a read failure."""
+    mock_serial_transport.request.side_effect = (b"", f"response {ack}".encode())
+
+    response = await transport_subject.send_data(data="send data", retries=1)
+
+    assert response == "response"
+    assert mock_serial_transport.request.call_count == 2
+    mock_serial_transport.close.assert_called_once()
+    mock_serial_transport.open.assert_called_once()
+
+
+async def test_send_command_with_transport_retry_exhausted(
+    mock_serial_transport: AsyncMock, transport_subject: SerialConnection
+) -> None:
+    """It should raise after retries over the transport are exhausted."""
+    mock_serial_transport.request.return_value = b""
+
+    with pytest.raises(NoResponse):
+        await transport_subject.send_data(data="send data", retries=2)
@@ -0,0 +1,249 @@
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+from serial import PortNotOpenError  # type: ignore[import]
+
+from opentrons.drivers.asyncio.communication import SerialTransport
+from opentrons.drivers.asyncio.communication.serial_connection import SerialConnection
+
+
+class _FakeDevice:
+    """A device on a local socket that answers each line it receives.
+
+    Answers are held until `release` is called, so tests can control
+    when responses arrive.
+    """
+
+    def __init__(self) -> None:
+        self.received: List[bytes] = []
+        self.connections = 0
+        self.release = asyncio.Event()
+        self.release.set()
+        self._server: "asyncio.AbstractServer"
+        self._writers: List[asyncio.StreamWriter] = []
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        assert self._server.sockets is not None
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def disconnect(self) -> None:
+        """Drop every open connection, like a device that was unplugged."""
+        for writer in self._writers:
+            writer.close()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        self._writers.append(writer)
+        lines: "asyncio.Queue[bytes]" = asyncio.Queue()
+        responder = asyncio.ensure_future(self._respond(lines, writer))
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            self.received.append(line)
+            lines.put_nowait(line)
+        responder.cancel()
+        writer.close()
+
+    async def _respond(
+        self, lines: "asyncio.Queue[bytes]", writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            line = await lines.get()
+            await self.release.wait()
+            writer.write(b"re: " + line.rstrip() + b" ok\n")
+            await writer.drain()
+
+
+@pytest.fixture
+async def device() -> AsyncIterator[_FakeDevice]:
+    device = _FakeDevice()
+    yield device
+    await device.stop()
+
+
+async def _create_subject(device: _FakeDevice, max_in_flight: int) -> SerialTransport:
+    port = await device.start()
+    return await SerialTransport.create(
+        port=f"socket://127.0.0.1:{port}",
+        baud_rate=115200,
+        timeout=1,
+        max_in_flight=max_in_flight,
+    )
+
+
+async def test_request(device: _FakeDevice) -> None:
+    """It should write a command and return its response."""
+    subject = await _create_subject(device, max_in_flight=1)
+
+    response = await subject.request(data=b"M105\n", ack=b"ok\n")
+
+    assert response == b"re: M105 ok\n"
+    assert device.received == [b"M105\n"]
+    await subject.close()
+
+
+async def test_request_matches_responses_in_order(device: _FakeDevice) -> None:
+    """It should match pipelined responses to their commands."""
+    subject = await _create_subject(device, max_in_flight=4)
+
+    responses = await asyncio.gather(
+        *(subject.request(data=f"M{i}\n".encode(), ack=b"ok\n") for i in range(8))
+    )
+
+    assert responses == [f"re: M{i} ok\n".encode() for i in range(8)]
+    await subject.close()
+
+
+async def test_request_window(device: _FakeDevice) -> None:
+    """It should not write more commands than the window allows."""
+    subject = await _create_subject(device, max_in_flight=2)
+    device.release.clear()
+
+    requests = [
+        asyncio.ensure_future(subject.request(data=f"M{i}\n".encode(), ack=b"ok\n"))
+        for i in range(4)
+    ]
+    await asyncio.sleep(0.1)
+
+    assert device.received == [b"M0\n", b"M1\n"]
+    assert subject.max_in_flight == 2
+    assert sum(request.done() for request in requests) == 0
+
+    device.release.set()
+    responses = await asyncio.gather(*requests)
+
+    assert responses == [f"re: M{i} ok\n".encode() for i in range(4)]
+    await subject.close()
+
+
+async def test_request_window_order(device: _FakeDevice) -> None:
+    """It should give slots in the window to commands in the order they're sent."""
+    subject = await _create_subject(device, max_in_flight=1)
+    sent: List[str] = []
+
+    async def _send_repeatedly(name: str, count: int) -> None:
+        for _ in range(count):
+            await subject.request(data=f"{name}\n".encode(), ack=b"ok\n")
+            sent.append(name)
+
+    await asyncio.gather(_send_repeatedly("a", 3), _send_repeatedly("b", 3))
+
+    assert sent == ["a", "b", "a", "b", "a", "b"]
+    await subject.close()
+
+
+async def test_request_cancel(device: _FakeDevice) -> None:
+    """It should free a cancelled command's place in line."""
+    subject = await _create_subject(device, max_in_flight=1)
+    device.release.clear()
+
+    first = asyncio.ensure_future(subject.request(data=b"M0\n", ack=b"ok\n"))
+    second = asyncio.ensure_future(subject.request(data=b"M1\n", ack=b"ok\n"))
+    third = asyncio.ensure_future(subject.request(data=b"M2\n", ack=b"ok\n"))
+    await asyncio.sleep(0.1)
+    second.cancel()
+    device.release.set()
+
+    assert await first == b"re: M0 ok\n"
+    assert await third == b"re: M2 ok\n"
+    assert device.received == [b"M0\n", b"M2\n"]
+    await subject.close()
+
+
+async def test_request_timeout(device: _FakeDevice) -> None:
+    """It should give up on a command, and every one behind it, on timeout."""
+    subject = await _create_subject(device, max_in_flight=2)
+    device.release.clear()
+
+    first = asyncio.ensure_future(
+        subject.request(data=b"M0\n", ack=b"ok\n", timeout=0.1)
+    )
+    second = asyncio.ensure_future(subject.request(data=b"M1\n", ack=b"ok\n"))
+
+    assert await first == b""
+    assert await second == b""
+    await subject.close()
+
+
+async def test_request_closed(device: _FakeDevice) -> None:
+    """It should raise if the port is closed."""
+    subject = await _create_subject(device, max_in_flight=1)
+    await subject.close()
+
+    assert await subject.is_open() is False
+    with pytest.raises(PortNotOpenError):
+        await subject.request(data=b"M105\n", ack=b"ok\n")
+
+
+async def test_connection_retry_after_timeout(device: _FakeDevice) -> None:
+    """It should reopen the port once when a timeout fails several callers."""
+    transport = await _create_subject(device, max_in_flight=2)
+    subject = SerialConnection(
+        serial=transport,
+        port="port",
+        name="name",
+        ack="ok",
+        retry_wait_time_seconds=0.2,
+        error_keyword="error",
+        alarm_keyword="alarm",
+    )
+    device.release.clear()
+
+    timed_out = asyncio.ensure_future(
+        subject.send_data(data="M0\n", retries=1, timeout=0.1)
+    )
+    waiting = asyncio.ensure_future(subject.send_data(data="M1\n", retries=1))
+    await asyncio.sleep(0.15)
+    device.release.set()
+
+    assert await timed_out == "re: M0"
+    assert await waiting == "re: M1"
+    assert device.received == [b"M0\n", b"M1\n", b"M0\n", b"M1\n"]
+    assert device.connections == 2
+    await subject.close()
+
+
+async def test_reopen_after_connection_lost(device: _FakeDevice) -> None:
+    """It should report a lost connection as closed, and open it again."""
+    subject = await _create_subject(device, max_in_flight=1)
+    assert await subject.request(data=b"M105\n", ack=b"ok\n") == b"re: M105 ok\n"
+    assert await subject.is_open() is True
+
+    device.disconnect()
+    for _ in range(100):
+        if not await subject.is_open():
+            break
+        await asyncio.sleep(0.01)
+
+    assert await subject.is_open() is False
+
+    with pytest.raises(PortNotOpenError):
+        await subject.request(data=b"M105\n", ack=b"ok\n")
+
+    await subject.open()
+
+    assert await subject.is_open() is True
+    assert await subject.request(data=b"M105\n", ack=b"ok\n") == b"re: M105 ok\n"
+    assert device.connections == 2
+    await subject.close()
+
+
+async def test_invalid_window() -> None:
+    """It should require room for at least one command."""
+    with pytest.raises(ValueError, match="max_in_flight"):
+        SerialTransport(
+            serial=None,
+            timeout=None,
+            max_in_flight=0,
+            loop=asyncio.get_running_loop(),
+            reset_buffer_before_write=False,
+        )
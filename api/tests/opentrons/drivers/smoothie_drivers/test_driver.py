@@ -11,6 +11,7 @@ from opentrons.drivers.smoothie_drivers.constants import (
     Y_BOUND_OVERRIDE,
 )
 from opentrons.drivers.rpi_drivers.gpio_simulator import SimulatingGPIOCharDev
+from opentrons.drivers.types import MoveSplit
 
 from opentrons.drivers.smoothie_drivers import driver_3_0, constants
 from opentrons.drivers.smoothie_drivers.errors import SmoothieError, SmoothieAlarm
@@ -201,7 +202,8 @@ async def test_clear_limit_switch(
 
     assert [c.strip() for c in cmd_list] == [
         # attempt to move and fail
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 C100.3 G0 C100",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 C100.3 G0 C100 "
+        "M400 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 M400",
         # recover from failure
         "M999",
         "M400",
@@ -242,10 +244,8 @@ async def test_unstick_axes(
         "M400",
         "M119",
         "M400",
-        "M907 A0.5 B0.05 C0.05 X1.25 Y1.25 Z0.5 G4 P0.005 G0 A-2 B-2 C-2 X-2 Y-2 Z-2",
-        "M400",
-        "M907 A0.5 B0.05 C0.05 X1.25 Y1.25 Z0.5 G4 P0.005",
-        "M400",
+        "M907 A0.5 B0.05 C0.05 X1.25 Y1.25 Z0.5 G4 P0.005 G0 A-2 B-2 C-2 X-2 Y-2 Z-2 "
+        "M400 M907 A0.5 B0.05 C0.05 X1.25 Y1.25 Z0.5 G4 P0.005 M400",
         "M203.1 A125 B40 C40 X600 Y400 Z125",
         "M400",
     ]
@@ -464,3 +464,54 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+async def test_move_with_split_error(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should restore microstepping and plunger current after a failed move."""
+    cmd_list = []
+
+    async def write_mock(command, retries, timeout):
+        cmd_list.append(command.build())
+        if constants.GCODE.MOVE in command and constants.GCODE.WAIT in command:
+            raise AlarmResponse(port="", response="ALARM: Hard limit +C")
+        elif constants.GCODE.CURRENT_POSITION in command:
+            return "ok M114.2 X:10 Y:20 Z:30 A:40 B:50 C:60"
+        elif constants.GCODE.HOMING_STATUS in command:
+            return "X:1 Y:1 Z:1 A:1 B:1 C:1"
+        else:
+            return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+    smoothie.configure_splits_for(
+        {
+            "C": MoveSplit(
+                split_distance=1,
+                split_current=1.75,
+                split_speed=1,
+                after_time=1800,
+                fullstep=True,
+            )
+        }
+    )
+    smoothie._steps_per_mm = {"B": 1.0, "C": 1.0}
+
+    with pytest.raises(SmoothieError):
+        await smoothie.move({"C": 3})
+
+    cmds = [c.strip() for c in cmd_list]
+    # the whole move is sent as one line
+    assert cmds[0] == (
+        "M55 M92 C0.03125 G4 P0.01 G0 F60 M907 A0.1 B0.05 C1.75 X0.3 Y0.3 Z0.1"
+        " G4 P0.005 G0 C1 M400 M54 M92 C1.0 G4 P0.01"
+        " G0 F24000 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 C3.3 G0 C3"
+        " M400 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 M400"
+    )
+    # after recovering, restore microstepping and plunger current
+    assert cmds[-4:] == [
+        "M54 M92 C1.0 G4 P0.01",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M400",
+    ]
@@ -122,8 +122,7 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
 
     await subject.move({"X": 0, "Y": 1.123456, "Z": 2, "A": 3})
     expected = [
-        "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 A3 X0 Y1.123 Z2",
-        "M400",
+        "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 A3 X0 Y1.123 Z2 M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
     assert command_log == expected
@@ -132,10 +131,9 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
 
     await subject.move({"B": 2})
     expected = [
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
-        "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
-        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2"
+        # Set plunger current low once it stops
+        " M400 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
     assert command_log == expected
@@ -148,11 +146,9 @@ async def test_plunger_commands(subject: SmoothieDriver, spy: MagicMock):
     expected = [
         # Set active axes high
         "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 B4.55 G0 A3.5"
-        " B4.25 C5.55 X10.988 Y2.123 Z2.5",
-        "M400",
-        # Set plunger current low
-        "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005",
-        "M400",
+        " B4.25 C5.55 X10.988 Y2.123 Z2.5"
+        # Set plunger current low once it stops
+        " M400 M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
     assert command_log == expected
@@ -185,16 +181,9 @@ async def test_move_with_split(subject: SmoothieDriver, spy: MagicMock):
     await subject.move({"X": 0, "Y": 1.123456, "Z": 2, "C": 3})
     expected = [
         "M55 M92 C0.03125 G4 P0.01 G0 F60 M907 A0.1 B0.05 C1.75 X1.25 Y1.25"
-        " Z0.8 G4 P0.005",
-        "M400",
-        "G0 C18.0",
-        "M400",
-        "M54 M92 C1.0 G4 P0.01",
-        "M400",
-        "G0 F24000 M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 C3 X0 Y1.123 Z2",
-        "M400",
-        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005",
-        "M400",
+        " Z0.8 G4 P0.005 G0 C18.0 M400 M54 M92 C1.0 G4 P0.01"
+        " G0 F24000 M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 C3 X0 Y1.123 Z2"
+        " M400 M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
     assert command_log == expected
@@ -204,16 +193,9 @@ async def test_move_with_split(subject: SmoothieDriver, spy: MagicMock):
     await subject.move({"B": 2})
     expected = [
         "M53 M92 B0.03125 G4 P0.01 G0 F60 M907 A0.1 B1.75 C0.05 X0.3 Y0.3 Z0.1"
-        " G4 P0.005",
-        "M400",
-        "G0 B18.0",
-        "M400",
-        "M52 M92 B1.0 G4 P0.01",
-        "M400",
-        "G0 F24000 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
-        "M400",
-        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
-        "M400",
+        " G4 P0.005 G0 B18.0 M400 M52 M92 B1.0 G4 P0.01"
+        " G0 F24000 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2"
+        " M400 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 M400",
     ]
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
     assert command_log == expected
@@ -232,15 +214,11 @@ async def test_set_active_current(subject: SmoothieDriver, spy: MagicMock):
     await subject.home("BC")
     expected = [
         # move all
-        "M907 A2 B2 C2 X2 Y2 Z2 G4 P0.005 G0 A0 B0 C0 X0 Y0 Z0",
-        "M400",
-        "M907 A2 B0 C0 X2 Y2 Z2 G4 P0.005",  # disable BC axes
-        "M400",
+        "M907 A2 B2 C2 X2 Y2 Z2 G4 P0.005 G0 A0 B0 C0 X0 Y0 Z0"
+        " M400 M907 A2 B0 C0 X2 Y2 Z2 G4 P0.005 M400",  # disable BC axes
         # move BC
-        "M907 A0 B2 C2 X0 Y0 Z0 G4 P0.005 G0 B1.3 C1.3 G0 B1 C1",
-        "M400",
-        "M907 A0 B0 C0 X0 Y0 Z0 G4 P0.005",  # disable BC axes
-        "M400",
+        "M907 A0 B2 C2 X0 Y0 Z0 G4 P0.005 G0 B1.3 C1.3 G0 B1 C1"
+        " M400 M907 A0 B0 C0 X0 Y0 Z0 G4 P0.005 M400",  # disable BC axes
         "M907 A0 B0.42 C0.42 X0 Y0 Z0 G4 P0.005 G28.2 BC",  # home BC
         "M400",
         "M907 A0 B0 C0 X0 Y0 Z0 G4 P0.005",  # dwell all axes after home
@@ -329,8 +307,7 @@ async def test_fast_home(subject: SmoothieDriver, spy: MagicMock):
 
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
     assert command_log == [
-        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X406.0",
-        "M400",
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X406.0 M400",
         "M203.1 Y50",
         "M400",
         "M907 A0.1 B0.05 C0.05 X1.25 Y0.8 Z0.1 G4 P0.005 G91 G0 Y-28 G0 Y10 G90",
@@ -355,8 +332,7 @@ async def test_fast_home_two_axes_plus_two_invalid_axes(
 
     command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
     assert command_log == [
-        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X406.0 Y341.0",
-        "M400",
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X406.0 Y341.0 M400",
         "M203.1 Y50",
         "M400",
         "M907 A0.1 B0.05 C0.05 X1.25 Y0.8 Z0.1 G4 P0.005 G91 G0 Y-28 G0 Y10 G90",
@@ -4,7 +4,7 @@ from datetime import datetime
 import pytest
 from decoy import Decoy, matchers
 
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateStore, SubstoreKey
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
 from opentrons.protocol_engine.state import EngineConfigs
@@ -47,8 +47,9 @@ async def test_pause(
     await subject.wait_for_resume()
     decoy.verify(
         mock_action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL)),
-        await mock_state_store.wait_for(
-            condition=mock_state_store.commands.get_is_running
+        await mock_state_store.wait_for_keys(
+            [SubstoreKey.COMMANDS],
+            condition=mock_state_store.commands.get_is_running,
         ),
     )
 
@@ -1,7 +1,11 @@
 """Tests for the ChangeNotifier interface."""
 import asyncio
 import pytest
-from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
+from opentrons.protocol_engine.state.change_notifier import (
+    ChangeNotifier,
+    CommandKey,
+    SubstoreKey,
+)
 
 
 async def test_single_subscriber() -> None:
@@ -54,3 +58,54 @@ async def test_multiple_subscribers(count: int) -> None:
     await asyncio.gather(task_1, task_2, task_3)
 
     assert results == [1, 2, 3]
+
+
+async def test_keyed_subscribers() -> None:
+    """It should only wake keyed subscribers for their keys or for everything."""
+    subject = ChangeNotifier()
+
+    commands_waiter = asyncio.create_task(subject.wait([SubstoreKey.COMMANDS]))
+    command_waiter = asyncio.create_task(subject.wait([CommandKey("command-id")]))
+    labware_waiter = asyncio.create_task(subject.wait([SubstoreKey.LABWARE]))
+    unkeyed_waiter = asyncio.create_task(subject.wait())
+    await asyncio.sleep(0)
+
+    subject.notify({SubstoreKey.COMMANDS, CommandKey("other-command-id")})
+    await asyncio.sleep(0)
+
+    assert commands_waiter.done() is True
+    assert unkeyed_waiter.done() is True
+    assert command_waiter.done() is False
+    assert labware_waiter.done() is False
+
+    subject.notify({CommandKey("command-id")})
+    await asyncio.sleep(0)
+
+    assert command_waiter.done() is True
+    assert labware_waiter.done() is False
+
+    subject.notify()
+    await asyncio.sleep(0)
+
+    assert labware_waiter.done() is True
+
+
+async def test_keyed_subscribers_in_order() -> None:
+    """It should wake keyed subscribers in the order they subscribed."""
+    subject = ChangeNotifier()
+    results = []
+
+    async def _do_task(result: int, key: SubstoreKey) -> None:
+        await subject.wait([key])
+        results.append(result)
+
+    task_1 = asyncio.create_task(_do_task(1, SubstoreKey.LABWARE))
+    task_2 = asyncio.create_task(_do_task(2, SubstoreKey.COMMANDS))
+    task_3 = asyncio.create_task(_do_task(3, SubstoreKey.LABWARE))
+
+    asyncio.get_running_loop().call_soon(
+        subject.notify, {SubstoreKey.COMMANDS, SubstoreKey.LABWARE}
+    )
+    await asyncio.gather(task_1, task_2, task_3)
+
+    assert results == [1, 2, 3]
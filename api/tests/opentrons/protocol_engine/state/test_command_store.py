@@ -18,6 +18,7 @@ from opentrons.protocol_engine.state.commands import (
     RunResult,
     QueueStatus,
 )
+from opentrons.protocol_engine.state.persistent_vector import PersistentVector
 
 from opentrons.protocol_engine.actions import (
     QueueCommandAction,
@@ -54,7 +55,8 @@ def test_initial_state() -> None:
         running_command_id=None,
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
     )
@@ -194,7 +196,7 @@ def test_command_store_queues_commands(
     assert subject.state.commands_by_id == {
         "command-id": CommandEntry(index=0, command=expected_command),
     }
-    assert subject.state.all_command_ids == ["command-id"]
+    assert [c.id for c in subject.state.all_commands] == ["command-id"]
     assert subject.state.queued_command_ids == OrderedSet(["command-id"])
 
 
@@ -348,11 +350,11 @@ def test_running_command_no_queue() -> None:
     subject = CommandStore()
 
     subject.handle_action(running_update)
-    assert subject.state.all_command_ids == ["command-id-1"]
+    assert [c.id for c in subject.state.all_commands] == ["command-id-1"]
     assert subject.state.running_command_id == "command-id-1"
 
     subject.handle_action(completed_update)
-    assert subject.state.all_command_ids == ["command-id-1"]
+    assert [c.id for c in subject.state.all_commands] == ["command-id-1"]
     assert subject.state.running_command_id is None
 
 
@@ -421,7 +423,10 @@ def test_command_failure_clears_queues() -> None:
 
     assert subject.state.running_command_id is None
     assert subject.state.queued_command_ids == OrderedSet()
-    assert subject.state.all_command_ids == ["command-id-1", "command-id-2"]
+    assert [c.id for c in subject.state.all_commands] == [
+        "command-id-1",
+        "command-id-2",
+    ]
     assert subject.state.commands_by_id == {
         "command-id-1": CommandEntry(index=0, command=expected_failed_1),
         "command-id-2": CommandEntry(index=1, command=expected_failed_2),
@@ -521,7 +526,7 @@ def test_setup_command_failure_only_clears_setup_command_queue() -> None:
     assert subject.state.running_command_id is None
     assert subject.state.queued_setup_command_ids == OrderedSet()
     assert subject.state.queued_command_ids == OrderedSet(["command-id-1"])
-    assert subject.state.all_command_ids == [
+    assert [c.id for c in subject.state.all_commands] == [
         "command-id-1",
         "command-id-2",
         "command-id-3",
@@ -543,26 +548,47 @@ def test_command_store_preserves_handle_order() -> None:
     subject = CommandStore()
 
     subject.handle_action(UpdateCommandAction(command=command_a))
-    assert subject.state.all_command_ids == ["command-id-1"]
+    assert subject.state.all_commands == [command_a]
     assert subject.state.commands_by_id == {
         "command-id-1": CommandEntry(index=0, command=command_a),
     }
 
     subject.handle_action(UpdateCommandAction(command=command_b))
-    assert subject.state.all_command_ids == ["command-id-1", "command-id-2"]
+    assert subject.state.all_commands == [command_a, command_b]
     assert subject.state.commands_by_id == {
         "command-id-1": CommandEntry(index=0, command=command_a),
         "command-id-2": CommandEntry(index=1, command=command_b),
     }
 
     subject.handle_action(UpdateCommandAction(command=command_c))
-    assert subject.state.all_command_ids == ["command-id-1", "command-id-2"]
+    assert subject.state.all_commands == [command_c, command_b]
     assert subject.state.commands_by_id == {
         "command-id-1": CommandEntry(index=0, command=command_c),
         "command-id-2": CommandEntry(index=1, command=command_b),
     }
 
 
+def test_command_store_all_commands_snapshots() -> None:
+    """It should leave previously retrieved command sequences unchanged."""
+    command_a = create_queued_command(command_id="command-id-1")
+    command_b = create_running_command(command_id="command-id-2")
+    command_c = create_succeeded_command(command_id="command-id-1")
+
+    subject = CommandStore()
+
+    subject.handle_action(UpdateCommandAction(command=command_a))
+    snapshot_1 = subject.state.all_commands
+
+    subject.handle_action(UpdateCommandAction(command=command_b))
+    snapshot_2 = subject.state.all_commands
+
+    subject.handle_action(UpdateCommandAction(command=command_c))
+
+    assert snapshot_1 == [command_a]
+    assert snapshot_2 == [command_a, command_b]
+    assert subject.state.all_commands == [command_c, command_b]
+
+
 @pytest.mark.parametrize("pause_source", PauseSource)
 def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
     """It should clear the running flag on pause."""
@@ -576,7 +602,8 @@ def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
         run_started_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -596,7 +623,8 @@ def test_command_store_handles_play_action(pause_source: PauseSource) -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -616,7 +644,8 @@ def test_command_store_handles_play_according_to_door_state() -> None:
         run_completed_at=None,
         is_door_blocking=True,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -636,7 +665,8 @@ def test_command_store_handles_play_according_to_door_state() -> None:
         run_started_at=start_time,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -657,7 +687,8 @@ def test_command_store_handles_finish_action() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -689,7 +720,8 @@ def test_command_store_handles_stop_action() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -710,7 +742,8 @@ def test_command_store_cannot_restart_after_should_stop() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -768,7 +801,8 @@ def test_command_store_saves_unknown_finish_error() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -798,7 +832,8 @@ def test_command_store_ignores_stop_after_graceful_finish() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -821,7 +856,8 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -830,6 +866,22 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
     )
 
 
+def test_command_store_records_command_changes() -> None:
+    """It should log the index of every command that is added or replaced."""
+    subject = CommandStore()
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-1"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-2"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-id-1"))
+    )
+
+    assert subject.state.command_changes == PersistentVector([0, 1, 0])
+
+
 def test_command_store_handles_command_failed() -> None:
     """It should store an error and mark the command if it fails."""
     command = create_running_command(command_id="command-id")
@@ -864,7 +916,8 @@ def test_command_store_handles_command_failed() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=["command-id"],
+        all_commands=PersistentVector([expected_failed_command]),
+        command_changes=PersistentVector([0, 0]),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id={
@@ -887,7 +940,8 @@ def test_handles_hardware_stopped() -> None:
         run_completed_at=completed_at,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -912,7 +966,8 @@ def test_handles_door_open_and_close_event() -> None:
         run_completed_at=None,
         is_door_blocking=True,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -929,7 +984,8 @@ def test_handles_door_open_and_close_event() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -952,7 +1008,8 @@ def test_handles_door_event_during_idle_run() -> None:
         run_completed_at=None,
         is_door_blocking=True,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
@@ -968,7 +1025,8 @@ def test_handles_door_event_during_idle_run() -> None:
         run_completed_at=None,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
+        all_commands=PersistentVector(),
+        command_changes=PersistentVector(),
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
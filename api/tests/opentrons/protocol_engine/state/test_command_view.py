@@ -19,11 +19,13 @@ from opentrons.protocol_engine.state.commands import (
     CommandState,
     CommandView,
     CommandSlice,
+    CommandChanges,
     CommandEntry,
     CurrentCommand,
     RunResult,
     QueueStatus,
 )
+from opentrons.protocol_engine.state.persistent_vector import PersistentVector
 
 from .command_fixtures import (
     create_queued_command,
@@ -44,9 +46,9 @@ def get_command_view(
     queued_setup_command_ids: Sequence[str] = (),
     errors_by_id: Optional[Dict[str, errors.ErrorOccurrence]] = None,
     commands: Sequence[cmd.Command] = (),
+    command_changes: Optional[Sequence[int]] = None,
 ) -> CommandView:
     """Get a command view test subject."""
-    all_command_ids = [command.id for command in commands]
     commands_by_id = {
         command.id: CommandEntry(index=index, command=command)
         for index, command in enumerate(commands)
@@ -61,7 +63,10 @@ def get_command_view(
         queued_command_ids=OrderedSet(queued_command_ids),
         queued_setup_command_ids=OrderedSet(queued_setup_command_ids),
         errors_by_id=errors_by_id or {},
-        all_command_ids=all_command_ids,
+        all_commands=PersistentVector(commands),
+        command_changes=PersistentVector(
+            range(len(commands)) if command_changes is None else command_changes
+        ),
         commands_by_id=commands_by_id,
         run_started_at=run_started_at,
     )
@@ -717,6 +722,88 @@ def test_get_slice() -> None:
     )
 
 
+def test_get_changes_since() -> None:
+    """It should return the latest version of each command changed since a cursor."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    command_2 = create_running_command(command_id="command-id-2")
+    command_3 = create_queued_command(command_id="command-id-3")
+
+    subject = get_command_view(
+        commands=[command_1, command_2, command_3],
+        command_changes=[0, 1, 2, 0, 1, 0],
+    )
+
+    assert subject.get_changes_since(cursor=0) == CommandChanges(
+        commands=[
+            CommandEntry(index=0, command=command_1),
+            CommandEntry(index=1, command=command_2),
+            CommandEntry(index=2, command=command_3),
+        ],
+        cursor=6,
+        total_length=3,
+    )
+    assert subject.get_changes_since(cursor=4) == CommandChanges(
+        commands=[
+            CommandEntry(index=0, command=command_1),
+            CommandEntry(index=1, command=command_2),
+        ],
+        cursor=6,
+        total_length=3,
+    )
+    assert subject.get_changes_since(cursor=6) == CommandChanges(
+        commands=[],
+        cursor=6,
+        total_length=3,
+    )
+
+
+@pytest.mark.parametrize("cursor", [-1, 7])
+def test_get_changes_since_unknown_cursor(cursor: int) -> None:
+    """It should return every command for a cursor that doesn't fit the state."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    command_2 = create_running_command(command_id="command-id-2")
+
+    subject = get_command_view(
+        commands=[command_1, command_2],
+        command_changes=[0, 1, 0, 1, 1, 1],
+    )
+
+    assert subject.get_has_changes_since(cursor) is True
+    assert subject.get_changes_since(cursor) == CommandChanges(
+        commands=[
+            CommandEntry(index=0, command=command_1),
+            CommandEntry(index=1, command=command_2),
+        ],
+        cursor=6,
+        total_length=2,
+    )
+
+
+def test_get_has_changes_since() -> None:
+    """It should report whether any command changed since a cursor."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    subject = get_command_view(commands=[command_1], command_changes=[0, 0])
+
+    assert subject.get_has_changes_since(0) is True
+    assert subject.get_has_changes_since(1) is True
+    assert subject.get_has_changes_since(2) is False
+
+
+def test_get_is_stopped_or_has_changes_since() -> None:
+    """It should report whether the engine stopped or any command changed."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    running = get_command_view(commands=[command_1], command_changes=[0, 0])
+    stopped = get_command_view(
+        commands=[command_1],
+        command_changes=[0, 0],
+        run_completed_at=datetime(year=2021, day=1, month=1),
+    )
+
+    assert running.get_is_stopped_or_has_changes_since(1) is True
+    assert running.get_is_stopped_or_has_changes_since(2) is False
+    assert stopped.get_is_stopped_or_has_changes_since(2) is True
+
+
 def test_get_slice_default_cursor() -> None:
     """It should use the tail as the default cursor location."""
     command_1 = create_succeeded_command(command_id="command-id-1")
@@ -168,6 +168,51 @@ def test_get_labware_highest_z(
     assert highest_z == (well_plate_def.dimensions.zDimension + 3 + 3)
 
 
+def test_get_labware_highest_z_cached(
+    decoy: Decoy,
+    well_plate_def: LabwareDefinition,
+    labware_view: LabwareView,
+    subject: GeometryView,
+) -> None:
+    """It should reuse labware positions and heights until the cache is cleared."""
+    labware_data = LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="definition-uri",
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_3),
+        offsetId=None,
+    )
+
+    decoy.when(labware_view.get("labware-id")).then_return(labware_data)
+    decoy.when(labware_view.get_definition("labware-id")).then_return(well_plate_def)
+    decoy.when(labware_view.get_labware_offset_vector("labware-id")).then_return(
+        LabwareOffsetVector(x=0, y=0, z=0)
+    )
+    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_3)).then_return(
+        Point(1, 2, 3)
+    )
+
+    assert subject.get_labware_highest_z("labware-id") == (
+        well_plate_def.dimensions.zDimension + 3
+    )
+
+    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_3)).then_return(
+        Point(1, 2, 10)
+    )
+
+    assert subject.get_labware_highest_z("labware-id") == (
+        well_plate_def.dimensions.zDimension + 3
+    )
+    assert subject.get_labware_position("labware-id").z == 3
+
+    subject.clear_cache()
+
+    assert subject.get_labware_highest_z("labware-id") == (
+        well_plate_def.dimensions.zDimension + 10
+    )
+    assert subject.get_labware_position("labware-id").z == 10
+
+
 def test_get_module_labware_highest_z(
     decoy: Decoy,
     standard_deck_def: DeckDefinitionV3,
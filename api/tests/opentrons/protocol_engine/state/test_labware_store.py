@@ -22,7 +22,12 @@ from opentrons.protocol_engine.actions import (
     AddLabwareDefinitionAction,
     UpdateCommandAction,
 )
-from opentrons.protocol_engine.state.labware import LabwareStore, LabwareState
+from opentrons.protocol_engine.state.labware import (
+    LabwareDefinitionIndex,
+    LabwareStore,
+    LabwareState,
+    index_slot_definitions,
+)
 
 from .command_fixtures import create_load_labware_command
 
@@ -70,6 +75,10 @@ def test_initial_state(
         },
         labware_offsets_by_id={},
         definitions_by_uri={expected_trash_uri: fixed_trash_def},
+        definition_indexes_by_uri={
+            expected_trash_uri: LabwareDefinitionIndex.from_definition(fixed_trash_def)
+        },
+        slot_definitions_by_id=index_slot_definitions(standard_deck_def),
     )
 
 
@@ -146,6 +155,9 @@ def test_handles_load_labware(
     assert subject.state.labware_by_id["test-labware-id"] == expected_labware_data
 
     assert subject.state.definitions_by_uri[expected_definition_uri] == well_plate_def
+    assert subject.state.definition_indexes_by_uri[
+        expected_definition_uri
+    ] == LabwareDefinitionIndex.from_definition(well_plate_def)
 
 
 def test_handles_add_labware_definition(
@@ -162,3 +174,6 @@ def test_handles_add_labware_definition(
     subject.handle_action(AddLabwareDefinitionAction(definition=well_plate_def))
 
     assert subject.state.definitions_by_uri[expected_uri] == well_plate_def
+    assert subject.state.definition_indexes_by_uri[
+        expected_uri
+    ] == LabwareDefinitionIndex.from_definition(well_plate_def)
@@ -19,7 +19,12 @@ from opentrons.protocol_engine.types import (
     ModuleModel,
 )
 
-from opentrons.protocol_engine.state.labware import LabwareState, LabwareView
+from opentrons.protocol_engine.state.labware import (
+    LabwareDefinitionIndex,
+    LabwareState,
+    LabwareView,
+    index_slot_definitions,
+)
 
 
 plate = LoadedLabware(
@@ -62,11 +67,19 @@ def get_labware_view(
     deck_definition: Optional[DeckDefinitionV3] = None,
 ) -> LabwareView:
     """Get a labware view test subject."""
+    definitions_by_uri = definitions_by_uri or {}
     state = LabwareState(
         labware_by_id=labware_by_id or {},
         labware_offsets_by_id=labware_offsets_by_id or {},
-        definitions_by_uri=definitions_by_uri or {},
+        definitions_by_uri=definitions_by_uri,
         deck_definition=deck_definition or cast(DeckDefinitionV3, {"fake": True}),
+        definition_indexes_by_uri={
+            uri: LabwareDefinitionIndex.from_definition(definition)
+            for uri, definition in definitions_by_uri.items()
+        },
+        slot_definitions_by_id=(
+            index_slot_definitions(deck_definition) if deck_definition else {}
+        ),
     )
 
     return LabwareView(state=state)
@@ -263,6 +276,29 @@ def test_get_well_rows(falcon_tuberack_def: LabwareDefinition) -> None:
     assert result == expected_rows
 
 
+def test_get_well_orderings_are_copies(falcon_tuberack_def: LabwareDefinition) -> None:
+    """Modifying returned well names should not modify the state."""
+    subject = get_labware_view(
+        labware_by_id={"tube-rack-id": tube_rack},
+        definitions_by_uri={"some-tube-rack-uri": falcon_tuberack_def},
+    )
+
+    subject.get_wells(labware_id="tube-rack-id").clear()
+    subject.get_well_columns(labware_id="tube-rack-id")["1"].clear()
+    subject.get_well_rows(labware_id="tube-rack-id")["A"].clear()
+
+    assert subject.get_wells(labware_id="tube-rack-id") == [
+        "A1",
+        "B1",
+        "A2",
+        "B2",
+        "A3",
+        "B3",
+    ]
+    assert subject.get_well_columns(labware_id="tube-rack-id")["1"] == ["A1", "B1"]
+    assert subject.get_well_rows(labware_id="tube-rack-id")["A"] == ["A1", "A2", "A3"]
+
+
 def test_get_tip_length_raises_with_non_tip_rack(
     well_plate_def: LabwareDefinition,
 ) -> None:
@@ -0,0 +1,116 @@
+"""Tests for the PersistentVector sequence."""
+import pytest
+from opentrons.protocol_engine.state.persistent_vector import PersistentVector
+
+
+# Sizes around the edges of the tail buffer and each level of the trie.
+SIZES = [0, 1, 31, 32, 33, 64, 65, 1023, 1024, 1056, 1057, 32 * 32 * 32 + 33]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_init_and_iterate(size: int) -> None:
+    """It should hold the items it was initialized with, in order."""
+    items = list(range(size))
+    subject = PersistentVector(items)
+
+    assert len(subject) == size
+    assert list(subject) == items
+    assert subject == items
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_append(size: int) -> None:
+    """It should match a vector built all at once when built by appending."""
+    subject: PersistentVector[int] = PersistentVector()
+
+    for i in range(size):
+        subject = subject.append(i)
+
+    assert subject == PersistentVector(range(size))
+    assert list(subject) == list(range(size))
+
+
+@pytest.mark.parametrize("size", SIZES[1:])
+def test_get_item(size: int) -> None:
+    """It should get items by positive or negative index."""
+    subject = PersistentVector(range(size))
+
+    assert subject[0] == 0
+    assert subject[size // 2] == size // 2
+    assert subject[size - 1] == size - 1
+    assert subject[-1] == size - 1
+    assert subject[-size] == 0
+
+
+@pytest.mark.parametrize("index", [-2, 1])
+def test_get_item_out_of_range(index: int) -> None:
+    """It should raise an IndexError if the index is out of range."""
+    subject = PersistentVector(["hello"])
+
+    with pytest.raises(IndexError):
+        subject[index]
+
+    with pytest.raises(IndexError):
+        subject.set(index, "world")
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        slice(None),
+        slice(0, 32),
+        slice(30, 70),
+        slice(1000, 1100),
+        slice(-5, None),
+        slice(1050, 2000),
+        slice(10, 5),
+        slice(None, None, 7),
+        slice(None, None, -1),
+    ],
+)
+def test_get_slice(index: slice) -> None:
+    """It should get slices of items as lists."""
+    items = list(range(1057))
+    subject = PersistentVector(items)
+
+    assert subject[index] == items[index]
+
+
+@pytest.mark.parametrize("size", SIZES[1:])
+def test_set_leaves_original_unchanged(size: int) -> None:
+    """It should replace items in a new vector, leaving the original as-is."""
+    items = list(range(size))
+    original = PersistentVector(items)
+
+    subject = original
+    for index in {0, size // 3, size - 1}:
+        subject = subject.set(index, -index - 1)
+        items[index] = -index - 1
+
+    assert subject == items
+    assert original == list(range(size))
+
+
+def test_append_leaves_original_unchanged() -> None:
+    """It should append items to a new vector, leaving the original as-is."""
+    original = PersistentVector(range(31))
+    appended_1 = original.append(31)
+    appended_2 = appended_1.append(32)
+    branched = original.append(-1)
+
+    assert original == list(range(31))
+    assert appended_1 == list(range(32))
+    assert appended_2 == list(range(33))
+    assert branched == [*range(31), -1]
+
+
+def test_equality() -> None:
+    """It should compare equal to vectors and lists with equal items."""
+    subject = PersistentVector(["a", "b"])
+
+    assert subject == PersistentVector(["a", "b"])
+    assert subject == ["a", "b"]
+    assert ["a", "b"] == subject
+    assert subject != PersistentVector(["a"])
+    assert subject != ["a", "c"]
+    assert subject != ("a", "b")
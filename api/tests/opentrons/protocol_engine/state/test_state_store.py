@@ -6,9 +6,27 @@ import pytest
 from decoy import Decoy
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.types import DeckSlotName
+from opentrons.protocol_engine import commands
 from opentrons.protocol_engine.state import State, StateStore
-from opentrons.protocol_engine.actions import PlayAction
-from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
+from opentrons.protocol_engine.actions import (
+    PlayAction,
+    QueueCommandAction,
+    UpdateCommandAction,
+    AddModuleAction,
+)
+from opentrons.protocol_engine.state.change_notifier import (
+    ChangeNotifier,
+    CommandKey,
+    SubstoreKey,
+)
+from opentrons.protocol_engine.types import DeckSlotLocation, ModuleDefinition
+
+from .command_fixtures import (
+    create_load_labware_command,
+    create_move_to_well_command,
+)
 
 
 @pytest.fixture
@@ -52,9 +70,39 @@ def test_notify_on_state_change(
     subject: StateStore,
 ) -> None:
     """It should notify state changes when actions are handled."""
-    decoy.verify(change_notifier.notify(), times=0)
+    decoy.verify(change_notifier.notify(None), times=0)
     subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(change_notifier.notify(None), times=1)
+
+
+def test_notify_changed_keys(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+    magdeck_v2_def: ModuleDefinition,
+) -> None:
+    """It should narrow down which keys changed for frequent actions."""
+    subject.handle_action(
+        QueueCommandAction(
+            command_id="command-id",
+            command_key="command-key",
+            created_at=datetime(year=2021, month=1, day=1),
+            request=commands.WaitForResumeCreate(params=commands.WaitForResumeParams()),
+        )
+    )
+    decoy.verify(
+        change_notifier.notify({SubstoreKey.COMMANDS, CommandKey("command-id")}),
+        times=1,
+    )
+
+    subject.handle_action(
+        AddModuleAction(
+            module_id="module-id",
+            serial_number="serial-number",
+            definition=magdeck_v2_def,
+        )
+    )
+    decoy.verify(change_notifier.notify({SubstoreKey.MODULES}), times=1)
 
 
 async def test_wait_for_state(
@@ -74,7 +122,25 @@ async def test_wait_for_state(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=2)
+    decoy.verify(await change_notifier.wait(None), times=2)
+
+
+async def test_wait_for_keys(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only wait for changes to the given keys."""
+    check_condition: Callable[..., Optional[str]] = decoy.mock()
+
+    decoy.when(check_condition("foo", bar="baz")).then_return(None, "hello world")
+
+    result = await subject.wait_for_keys(
+        [CommandKey("command-id")], check_condition, "foo", bar="baz"
+    )
+    assert result == "hello world"
+
+    decoy.verify(await change_notifier.wait([CommandKey("command-id")]), times=1)
 
 
 async def test_wait_for_state_short_circuit(
@@ -90,7 +156,7 @@ async def test_wait_for_state_short_circuit(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=0)
+    decoy.verify(await change_notifier.wait(None), times=0)
 
 
 async def test_wait_for_already_true(decoy: Decoy, subject: StateStore) -> None:
@@ -108,3 +174,53 @@ async def test_wait_for_raises(decoy: Decoy, subject: StateStore) -> None:
 
     with pytest.raises(ValueError, match="oh no"):
         await subject.wait_for(check_condition)
+
+
+def test_geometry_recomputed_on_load(
+    subject: StateStore,
+    well_plate_def: LabwareDefinition,
+    reservoir_def: LabwareDefinition,
+    tip_rack_def: LabwareDefinition,
+) -> None:
+    """It should only recompute cached deck geometry when something is loaded."""
+    for labware_id, slot_name, definition in [
+        ("plate-id", DeckSlotName.SLOT_1, well_plate_def),
+        ("reservoir-id", DeckSlotName.SLOT_3, reservoir_def),
+    ]:
+        subject.handle_action(
+            UpdateCommandAction(
+                command=create_load_labware_command(
+                    labware_id=labware_id,
+                    location=DeckSlotLocation(slotName=slot_name),
+                    definition=definition,
+                    offset_id=None,
+                )
+            )
+        )
+    highest_z = subject.geometry.get_all_labware_highest_z()
+
+    subject.handle_action(
+        UpdateCommandAction(
+            command=create_move_to_well_command(
+                pipette_id="pipette-id", labware_id="plate-id", well_name="A1"
+            )
+        )
+    )
+
+    assert subject.geometry.get_all_labware_highest_z() == highest_z
+
+    subject.handle_action(
+        UpdateCommandAction(
+            command=create_load_labware_command(
+                labware_id="tip-rack-id",
+                location=DeckSlotLocation(slotName=DeckSlotName.SLOT_2),
+                definition=tip_rack_def,
+                offset_id=None,
+            )
+        )
+    )
+
+    assert subject.geometry.get_all_labware_highest_z() == max(
+        highest_z, subject.geometry.get_labware_highest_z("tip-rack-id")
+    )
+    assert subject.geometry.get_all_labware_highest_z() > highest_z
@@ -26,7 +26,7 @@ from opentrons.protocol_engine.execution import (
     HardwareEventForwarder,
 )
 from opentrons.protocol_engine.resources import ModelUtils, ModuleDataProvider
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateStore, CommandKey, SubstoreKey
 from opentrons.protocol_engine.plugins import AbstractPlugin, PluginStarter
 
 from opentrons.protocol_engine.actions import (
@@ -262,8 +262,9 @@ async def test_add_and_execute_command(
     ).then_do(_stub_queued)
 
     decoy.when(
-        await state_store.wait_for(
-            condition=state_store.commands.get_is_complete,
+        await state_store.wait_for_keys(
+            [CommandKey("command-id")],
+            state_store.commands.get_is_complete,
             command_id="command-id",
         ),
     ).then_do(_stub_completed)
@@ -450,7 +451,27 @@ async def test_wait_until_complete(
     await subject.wait_until_complete()
 
     decoy.verify(
-        await state_store.wait_for(condition=state_store.commands.get_all_complete)
+        await state_store.wait_for_keys(
+            [SubstoreKey.COMMANDS],
+            condition=state_store.commands.get_all_complete,
+        )
+    )
+
+
+async def test_wait_for_command_changes(
+    decoy: Decoy,
+    state_store: StateStore,
+    subject: ProtocolEngine,
+) -> None:
+    """It should wait for commands to change since a change cursor, or a stop."""
+    await subject.wait_for_command_changes(cursor=42)
+
+    decoy.verify(
+        await state_store.wait_for_keys(
+            [SubstoreKey.COMMANDS],
+            state_store.commands.get_is_stopped_or_has_changes_since,
+            cursor=42,
+        )
     )
 
 
@@ -157,3 +157,32 @@ def test_return_tips(wells, tiptracker):
     assert wells[7].has_tip()
     # But we won't wrap around
     assert not wells[8].has_tip()
+
+
+def test_select_next_tip_first_run_only(wells, tiptracker):
+    # Only the first unbroken run of tips in each column counts
+    wells[0].set_has_tip(False)
+    wells[3].set_has_tip(False)
+    assert tiptracker.next_tip(2) is wells[1]
+    assert tiptracker.next_tip(3) is wells[8]
+
+
+def test_select_next_tip_from_starting_tip(wells, tiptracker):
+    assert tiptracker.next_tip(starting_tip=wells[3]) is wells[3]
+    assert tiptracker.next_tip(5, starting_tip=wells[3]) is wells[3]
+    # Not enough tips left below the starting tip, so use the next column
+    assert tiptracker.next_tip(6, starting_tip=wells[3]) is wells[8]
+
+    tiptracker.use_tips(wells[8], num_channels=8)
+    assert tiptracker.next_tip(8, starting_tip=wells[3]) is wells[16]
+    # Columns before the starting tip's are skipped
+    assert tiptracker.next_tip(starting_tip=wells[17]) is wells[17]
+
+
+def test_well_tip_state_shared(wells, tiptracker):
+    tiptracker.use_tips(wells[0], num_channels=8)
+    assert [well.has_tip() for well in wells[:9]] == [False] * 8 + [True]
+
+    wells[3].set_has_tip(True)
+    assert tiptracker.next_tip() is wells[3]
+    assert tiptracker.previous_tip(3) is wells[0]
@@ -0,0 +1,106 @@
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List
+
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons_shared_data.labware import load_definition
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+from opentrons.protocols.labware import definition
+
+
+@pytest.fixture
+def custom_def() -> LabwareDefinition:
+    labware_def = load_definition("corning_96_wellplate_360ul_flat", 1)
+    labware_def["namespace"] = "custom_beta"
+    labware_def["parameters"]["loadName"] = "my_custom_plate"
+    return labware_def
+
+
+@pytest.fixture
+def user_defs_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(definition, "USER_DEFS_PATH", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def validated(monkeypatch: pytest.MonkeyPatch) -> List[Any]:
+    """Record every definition that goes through schema validation."""
+    validated: List[Any] = []
+    validator = definition._get_labware_schema_validator()
+
+    class _RecordingValidator:
+        def iter_errors(self, instance: Any) -> Any:
+            validated.append(instance)
+            return validator.iter_errors(instance)
+
+    monkeypatch.setattr(
+        definition, "_get_labware_schema_validator", lambda: _RecordingValidator()
+    )
+    monkeypatch.setattr(definition, "_verified_definition_hashes", OrderedDict())
+    return validated
+
+
+def test_verify_definition_once(
+    custom_def: LabwareDefinition, validated: List[Any]
+) -> None:
+    """It should skip validating contents that already passed."""
+    contents = json.dumps(custom_def)
+
+    assert definition.verify_definition(contents) == custom_def
+    assert definition.verify_definition(contents) == custom_def
+    assert definition.verify_definition(custom_def) == custom_def
+    assert definition.verify_definition(dict(custom_def)) == custom_def
+
+    # Once for the JSON string, once for the equivalent dict.
+    assert len(validated) == 2
+
+
+def test_verify_definition_invalid(
+    custom_def: LabwareDefinition, validated: List[Any]
+) -> None:
+    """It should raise every time for an invalid definition."""
+    del custom_def["wells"]  # type: ignore[misc]
+
+    for _ in range(2):
+        with pytest.raises(jsonschema.ValidationError):
+            definition.verify_definition(custom_def)
+
+    assert len(validated) == 2
+
+
+def test_get_standard_definition_copy() -> None:
+    """It should return a new copy of a standard definition every time."""
+    first = definition.get_labware_definition("corning_96_wellplate_360ul_flat")
+    first["parameters"]["loadName"] = "modified"
+
+    second = definition.get_labware_definition("corning_96_wellplate_360ul_flat")
+
+    assert second == load_definition("corning_96_wellplate_360ul_flat", 1)
+
+
+def test_get_standard_definition_not_found() -> None:
+    """It should raise if there's no such standard definition."""
+    with pytest.raises(FileNotFoundError):
+        definition.get_labware_definition("not_a_labware", "opentrons", 1)
+
+    with pytest.raises(FileNotFoundError):
+        definition.get_labware_definition("corning_96_wellplate_360ul_flat", version=99)
+
+
+def test_get_replaced_custom_definition(
+    custom_def: LabwareDefinition, user_defs_path: Path
+) -> None:
+    """It should return the latest saved version of a custom definition."""
+    definition.save_definition(custom_def)
+    assert definition.get_labware_definition("my_custom_plate") == custom_def
+
+    custom_def["metadata"]["displayName"] = "My Renamed Plate"
+    definition.save_definition(custom_def, force=True)
+    assert definition.get_labware_definition("my_custom_plate") == custom_def
+
+    definition.delete_all_custom_labware()
+    with pytest.raises(FileNotFoundError):
+        definition.get_labware_definition("my_custom_plate")
@@ -0,0 +1,132 @@
+"""Tests for opentrons.simulate_batch."""
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from opentrons import simulate_batch
+from opentrons.simulate_batch import SimulationOptions
+
+
+_OK_PROTOCOL = """
+metadata = {"apiLevel": "2.12"}
+
+def run(ctx):
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    plate = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+    pipette = ctx.load_instrument("p300_single_gen2", "right", tip_racks=[tip_rack])
+    pipette.pick_up_tip()
+    pipette.aspirate(10, plate["A1"])
+    pipette.dispense(10, plate["B1"])
+    pipette.drop_tip()
+"""
+
+_ERROR_PROTOCOL = """
+metadata = {"apiLevel": "2.12"}
+
+def run(ctx):
+    ctx.load_labware("not_a_real_labware", 1)
+"""
+
+_HANGING_PROTOCOL = """
+metadata = {"apiLevel": "2.12"}
+
+def run(ctx):
+    while True:
+        pass
+"""
+
+
+@pytest.fixture
+def protocol_files(tmp_path: Path) -> Dict[str, str]:
+    """Write protocols that simulate fine, raise, and never finish."""
+    paths = {}
+    for name, contents in [
+        ("ok", _OK_PROTOCOL),
+        ("error", _ERROR_PROTOCOL),
+        ("hang", _HANGING_PROTOCOL),
+    ]:
+        path = tmp_path / f"{name}.py"
+        path.write_text(contents)
+        paths[name] = str(path)
+    return paths
+
+
+def test_simulate_batch(protocol_files: Dict[str, str]) -> None:
+    """It should simulate every protocol and report each one's result."""
+    results = list(
+        simulate_batch.simulate_batch(
+            [protocol_files["ok"], protocol_files["error"], protocol_files["ok"]],
+            workers=2,
+            options=SimulationOptions(estimate_duration=True),
+        )
+    )
+
+    assert sorted(result["protocol"] for result in results) == sorted(
+        [protocol_files["ok"], protocol_files["error"], protocol_files["ok"]]
+    )
+
+    ok_results = [r for r in results if r["protocol"] == protocol_files["ok"]]
+    for result in ok_results:
+        assert result["status"] == "ok"
+        assert [command["text"] for command in result["runLog"]] == [
+            "Picking up tip from A1 of Opentrons 96 Tip Rack 300 µL on 1",
+            "Aspirating 10.0 uL from A1 of Corning 96 Well Plate 360 µL Flat on 2 at 92.86 uL/sec",
+            "Dispensing 10.0 uL into B1 of Corning 96 Well Plate 360 µL Flat on 2 at 92.86 uL/sec",
+            "Dropping tip into A1 of Opentrons Fixed Trash on 12",
+        ]
+        assert result["estimatedDuration"] > 0
+        assert result["elapsed"] > 0
+
+    (error_result,) = [r for r in results if r["protocol"] == protocol_files["error"]]
+    assert error_result["status"] == "error"
+    assert "not_a_real_labware" in error_result["error"]
+    assert "runLog" not in error_result
+
+
+def test_simulate_batch_timeout(protocol_files: Dict[str, str]) -> None:
+    """It should stop protocols that take too long and carry on with the rest."""
+    results = list(
+        simulate_batch.simulate_batch(
+            [protocol_files["hang"], protocol_files["ok"]], workers=1, timeout=2
+        )
+    )
+
+    assert [(r["protocol"], r["status"]) for r in results] == [
+        (protocol_files["hang"], "timeout"),
+        (protocol_files["ok"], "ok"),
+    ]
+    assert results[0]["elapsed"] >= 2
+
+
+def test_simulate_batch_no_workers() -> None:
+    """It should require at least one worker."""
+    with pytest.raises(ValueError, match="workers"):
+        list(simulate_batch.simulate_batch(["protocol.py"], workers=0))
+
+
+def test_main(
+    protocol_files: Dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """It should print a line of JSON per protocol and fail if any failed."""
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "opentrons_simulate_batch",
+            "-j",
+            "2",
+            protocol_files["ok"],
+            protocol_files["error"],
+        ],
+    )
+
+    assert simulate_batch.main() == 1
+
+    lines: List[str] = capsys.readouterr().out.splitlines()
+    statuses = {
+        json.loads(line)["protocol"]: json.loads(line)["status"] for line in lines
+    }
+    assert statuses == {protocol_files["ok"]: "ok", protocol_files["error"]: "error"}
@@ -0,0 +1,110 @@
+"""Benchmark planning motion with MoveManager.
+
+Times `MoveManager.plan_motion` with its default blending and with
+`vectorized=True`, for:
+
+- serpentine: visiting every well of a 96-well plate, dipping Z at each one.
+- random: random six-axis targets anywhere in the robot's working volume.
+
+Usage:
+
+    python benchmarks/motion_planning.py --repeat 10 --targets 200
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import (
+    AxisConstraints,
+    Coordinates,
+    MoveManager,
+    MoveTarget,
+    SystemConstraints,
+)
+
+AXES = ["X", "Y", "Z", "A", "B", "C"]
+
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(1000, 40, 20),
+    "Y": AxisConstraints.build(1000, 40, 20),
+    "Z": AxisConstraints.build(800, 20, 10),
+    "A": AxisConstraints.build(800, 20, 10),
+    "B": AxisConstraints.build(600, 10, 5),
+    "C": AxisConstraints.build(600, 10, 5),
+}
+
+Plan = Tuple[Coordinates[str, np.float64], List[MoveTarget[str]]]
+
+
+def _position(**values: float) -> Coordinates[str, np.float64]:
+    return {axis: np.float64(values.get(axis, 0)) for axis in AXES}
+
+
+def _serpentine() -> Plan:
+    targets = []
+    for column in range(12):
+        rows = range(8) if column % 2 == 0 else reversed(range(8))
+        for row in rows:
+            x = 14.4 + column * 9
+            y = 74.2 - row * 9
+            targets += [
+                MoveTarget.build(_position(X=x, Y=y, Z=100), np.float64(400)),
+                MoveTarget.build(_position(X=x, Y=y, Z=90), np.float64(50)),
+                MoveTarget.build(_position(X=x, Y=y, Z=100), np.float64(50)),
+            ]
+    return _position(Z=100), targets
+
+
+def _random(count: int) -> Plan:
+    rng = random.Random(0)
+    targets = [
+        MoveTarget.build(
+            {axis: np.float64(rng.uniform(0, 300)) for axis in AXES},
+            np.float64(rng.uniform(10, 500)),
+        )
+        for _ in range(count)
+    ]
+    return _position(), targets
+
+
+def _seconds_per_plan(repeat: int, plan: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        plan()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--targets", type=int, default=200, help="targets in the random plan"
+    )
+    parser.add_argument("--iteration-limit", type=int, default=20)
+    args = parser.parse_args()
+
+    plans: Dict[str, Plan] = {
+        "serpentine": _serpentine(),
+        "random": _random(args.targets),
+    }
+
+    print(f"{'plan':<16}{'targets':>10}{'default (s)':>14}{'vectorized (s)':>16}")
+    for name, (origin, targets) in plans.items():
+        times = [
+            _seconds_per_plan(
+                args.repeat,
+                lambda: MoveManager(CONSTRAINTS, vectorized=vectorized).plan_motion(
+                    origin, targets, args.iteration_limit
+                ),
+            )
+            for vectorized in (False, True)
+        ]
+        print(f"{name:<16}{len(targets):>10}{times[0]:>14.4f}{times[1]:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark decoding CAN message payloads.
+
+For every payload type in `opentrons_hardware.firmware_bindings.messages.payloads`,
+measures frames decoded per second with:
+
+- legacy: the original `BinarySerializable.build`, which recomputed the format
+  string and field list for every frame.
+- build: the current `BinarySerializable.build`.
+- unpack_from: `BinarySerializable.unpack_from` on a `memoryview`.
+
+Usage:
+
+    python benchmarks/payload_decoding.py --frames 100000
+"""
+import argparse
+import inspect
+import struct
+import time
+from dataclasses import fields
+from typing import Callable, List, Type
+
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings.utils import BinarySerializable
+
+
+def _legacy_build(cls: Type[BinarySerializable], data: bytes) -> BinarySerializable:
+    format_string = f"{cls.ENDIAN}{''.join(v.type.FORMAT for v in fields(cls))}"
+    size = struct.calcsize(format_string)
+    b = struct.unpack(format_string, data[:size])
+    args = {v.name: v.type.build(b[i]) for i, v in enumerate(fields(cls))}
+    return cls(**args)  # type: ignore[call-arg]
+
+
+def _payload_types() -> List[Type[BinarySerializable]]:
+    return [
+        cls
+        for _, cls in inspect.getmembers(payloads, inspect.isclass)
+        if issubclass(cls, BinarySerializable) and cls.__module__ == payloads.__name__
+    ]
+
+
+def _frames_per_second(frames: int, decode: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        decode()
+    return frames / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'payload':<48}{'legacy':>12}{'build':>12}{'unpack_from':>12}")
+    totals = [0.0, 0.0, 0.0]
+
+    for cls in _payload_types():
+        # CAN FD frames carry up to 64 bytes, padded past the payload's size.
+        data = bytes(max(cls.get_size(), 64))
+        view = memoryview(data)
+        rates = [
+            _frames_per_second(args.frames, lambda: _legacy_build(cls, data)),
+            _frames_per_second(args.frames, lambda: cls.build(data)),
+            _frames_per_second(args.frames, lambda: cls.unpack_from(view)),
+        ]
+        totals = [t + 1 / r for t, r in zip(totals, rates)]
+        print(f"{cls.__name__:<48}" + "".join(f"{r:>12,.0f}" for r in rates))
+
+    # Harmonic mean: the rate for a stream with one frame of each payload type.
+    count = len(_payload_types())
+    print(f"{'(mean)':<48}" + "".join(f"{count / t:>12,.0f}" for t in totals))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,16 @@
 from __future__ import annotations
 import asyncio
 from inspect import Traceback
-from typing import Optional, Callable, Tuple, Dict
+from typing import (
+    Optional,
+    Callable,
+    Tuple,
+    Dict,
+    List,
+    Iterable,
+    FrozenSet,
+    NamedTuple,
+)
 import logging
 
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
@@ -30,12 +39,32 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+class _Listener(NamedTuple):
+    """A registered listener and the incoming messages it accepts."""
+
+    callback: MessageListenerCallback
+    filter: Optional[MessageListenerCallbackFilter]
+    message_ids: Optional[FrozenSet[int]]
+    node_ids: Optional[FrozenSet[int]]
+
+    def is_routed(self, message_id: int, node_id: int) -> bool:
+        """Whether messages with this id, from this node, may be accepted."""
+        return (self.message_ids is None or message_id in self.message_ids) and (
+            self.node_ids is None or node_id in self.node_ids
+        )
+
+
 class CanMessenger:
     """High level can messaging class wrapping a CanDriver.
 
     The background task can be controlled with start/stop methods.
 
-    To receive message notifications add a listener using add_listener
+    To receive message notifications add a listener using add_listener.
+
+    Incoming messages are routed to listeners with a table keyed by message id
+    and originating node id, so each message is only checked against the
+    listeners that registered for it. Messages routed to no listener at all
+    are dropped without decoding their payloads.
     """
 
     def __init__(self, driver: AbstractCanDriver) -> None:
@@ -45,10 +74,8 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
-        ] = {}
+        self._listeners: Dict[MessageListenerCallback, _Listener] = {}
+        self._routes: Dict[Tuple[int, int], List[_Listener]] = {}
         self._task: Optional[asyncio.Task[None]] = None
 
     async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
@@ -64,8 +91,9 @@ class CanMessenger:
         )
         data = message.payload.serialize()
         log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
+            "Sending -->\n\tarbitration_id: %s,\n\tpayload: %s",
+            arbitration_id,
+            message.payload,
         )
         await self._drive.send(
             message=CanMessage(arbitration_id=arbitration_id, data=data)
@@ -104,14 +132,35 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Prefer `message_ids` and `node_ids` over a `filter` function where
+        possible. They're checked once per kind of message, rather than once
+        per message.
+
+        Args:
+            listener: The callback for incoming messages.
+            filter: Optional message filtering function.
+            message_ids: If given, only call the listener for these messages.
+            node_ids: If given, only call the listener for messages originating
+                from these nodes.
+        """
+        self._listeners[listener] = _Listener(
+            callback=listener,
+            filter=filter,
+            message_ids=frozenset(message_ids) if message_ids is not None else None,
+            node_ids=frozenset(node_ids) if node_ids is not None else None,
+        )
+        self._routes.clear()
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
         if listener in self._listeners:
             del self._listeners[listener]
+            self._routes.clear()
 
     async def _read_task_shield(self) -> None:
         try:
@@ -125,24 +174,53 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
+            listeners = self._get_listeners(message.arbitration_id)
+            if listeners or log.isEnabledFor(logging.DEBUG):
+                self._dispatch(message, listeners)
+
+    def _get_listeners(self, arbitration_id: ArbitrationId) -> List[_Listener]:
+        """Get the listeners that accept a message."""
+        key = (
+            arbitration_id.parts.message_id,
+            arbitration_id.parts.originating_node_id,
+        )
+        try:
+            route = self._routes[key]
+        except KeyError:
+            route = self._routes[key] = [
+                listener
+                for listener in self._listeners.values()
+                if listener.is_routed(*key)
+            ]
+        return [
+            listener
+            for listener in route
+            if listener.filter is None or listener.filter(arbitration_id)
+        ]
+
+    def _dispatch(self, message: CanMessage, listeners: List[_Listener]) -> None:
+        """Decode a message and call its listeners."""
+        try:
             message_definition = get_definition(
                 MessageId(message.arbitration_id.parts.message_id)
             )
-            if message_definition:
-                try:
-                    build = message_definition.payload_type.build(message.data)
-                    log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
-                    )
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
-            else:
-                log.error(f"Message {message} is not recognized.")
+        except ValueError:
+            message_definition = None
+
+        if message_definition:
+            try:
+                build = message_definition.payload_type.build(message.data)
+                log.debug(
+                    "Received <--\n\tarbitration_id: %s,\n\tpayload: %s",
+                    message.arbitration_id,
+                    build,
+                )
+                for listener in listeners:
+                    listener.callback(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
+            except BinarySerializableException:
+                log.exception(f"Failed to build from {message}")
+        else:
+            log.error(f"Message {message} is not recognized.")
 
 
 class WaitableCallback:
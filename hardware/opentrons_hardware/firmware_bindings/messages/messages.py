@@ -1,6 +1,5 @@
 """Message types."""
-from functools import lru_cache
-from typing import Union, Optional, Type
+from typing import Dict, Union, Optional, Type
 
 from typing_extensions import get_args
 
@@ -78,7 +77,11 @@ MessageDefinition = Union[
 ]
 
 
-@lru_cache(maxsize=None)
+_definitions_by_id: Dict[MessageId, Type[MessageDefinition]] = {}
+for _definition in get_args(MessageDefinition):
+    _definitions_by_id.setdefault(_definition.message_id, _definition)
+
+
 def get_definition(message_id: MessageId) -> Optional[Type[MessageDefinition]]:
     """Get the message type for a message id.
 
@@ -88,10 +91,4 @@ def get_definition(message_id: MessageId) -> Optional[Type[MessageDefinition]]:
     Returns: The message definition for a type
 
     """
-    # Dumb linear search, but the result is memoized.
-    for i in get_args(MessageDefinition):
-        if i.message_id == message_id:
-            # get args returns Tuple[Any...]
-            return i  # type: ignore[no-any-return]
-
-    return None
+    return _definitions_by_id.get(message_id)
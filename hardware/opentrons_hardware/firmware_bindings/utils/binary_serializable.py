@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, TypeVar, Generic, Tuple, Type, Union
 
 
 class BinarySerializableException(BaseException):
@@ -138,6 +138,12 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+BufferType = Union[bytes, bytearray, memoryview]
+"""A buffer that a BinarySerializable can be unpacked from."""
+
+SerializableType = TypeVar("SerializableType", bound="BinarySerializable")
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -157,15 +163,13 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
         try:
-            return struct.pack(string, *vals)
+            return _get_codec(type(self)).pack(self)
         except struct.error as e:
             raise SerializationException(str(e))
 
     @classmethod
-    def build(cls, data: bytes) -> BinarySerializable:
+    def build(cls: Type[SerializableType], data: bytes) -> SerializableType:
         """Create a BinarySerializable from a byte buffer.
 
         The byte buffer must be at least enough bytes to satisfy all fields.
@@ -181,16 +185,31 @@ class BinarySerializable:
         Returns:
             cls
         """
+        return cls.unpack_from(data)
+
+    @classmethod
+    def unpack_from(
+        cls: Type[SerializableType], buffer: BufferType, offset: int = 0
+    ) -> SerializableType:
+        """Create a BinarySerializable from a byte buffer, starting at an offset.
+
+        Unlike `build`, this does not copy the buffer, so it can be used to
+        extract several BinarySerializable objects from a `memoryview` of a
+        stream of bytes. Extra bytes past the end of this object are ignored.
+
+        Args:
+            buffer: Byte buffer
+            offset: Index into the buffer of the first byte of this object.
+
+        Returns:
+            cls
+        """
+        codec = _get_codec(cls)
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
-            # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            args = {v.name: v.type.build(b[i]) for i, v in enumerate(fields(cls))}
-            # Mypy is not liking constructing the derived types.
-            return cls(**args)  # type: ignore[call-arg]
+            values = codec.struct.unpack_from(buffer, offset)
         except struct.error as e:
             raise InvalidFieldException(str(e))
+        return codec.construct(values)
 
     @classmethod
     def _get_format_string(cls) -> str:
@@ -212,7 +231,52 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return _get_codec(cls).struct.size
+
+
+_ConstructFunc = Callable[[Tuple[Any, ...]], SerializableType]
+
+
+class _Codec(Generic[SerializableType]):
+    """A BinarySerializable class's precompiled struct and field converters.
+
+    These are generated once per class, the first time it's packed or unpacked,
+    so the field list and format string aren't recomputed for every message.
+    """
+
+    def __init__(self, cls: Type[SerializableType]) -> None:
+        self.struct = struct.Struct(cls._get_format_string())
+        dataclass_fields = fields(cls)
+        built_values = ", ".join(
+            f"_build_{i}(values[{i}])" for i in range(len(dataclass_fields))
+        )
+        field_values = ", ".join(f"obj.{f.name}.value" for f in dataclass_fields)
+
+        # Like the dataclasses module, generate straight-line functions,
+        # rather than looping over the fields for every message.
+        namespace: Dict[str, Any] = {
+            "_cls": cls,
+            "_pack": self.struct.pack,
+            **{f"_build_{i}": f.type.build for i, f in enumerate(dataclass_fields)},
+        }
+        construct_source = f"def construct(values):\n    return _cls({built_values})\n"
+        pack_source = f"def pack(obj):\n    return _pack({field_values})\n"
+        exec(construct_source + pack_source, namespace)
+
+        self.construct: _ConstructFunc[SerializableType] = namespace["construct"]
+        self.pack: Callable[[SerializableType], bytes] = namespace["pack"]
+
+
+_codecs: Dict[Type[Any], _Codec[Any]] = {}
+
+
+def _get_codec(cls: Type[SerializableType]) -> _Codec[SerializableType]:
+    """Get the codec for a BinarySerializable class, creating it if needed."""
+    try:
+        return _codecs[cls]
+    except KeyError:
+        codec = _codecs[cls] = _Codec(cls)
+        return codec
 
 
 class LittleEndianMixIn:
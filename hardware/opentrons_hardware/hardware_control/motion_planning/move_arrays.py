@@ -0,0 +1,508 @@
+"""Vectorized motion blending.
+
+Each pass of `MoveManager.plan_motion` rebuilds every move from the previous pass's
+neighbors, one move at a time, with the functions in `move_utils`. This module does
+the same math for all of a pass's moves at once, with each move quantity held in a
+numpy array with one row per move, so that long target lists can be planned quickly.
+
+The results match `move_utils` move for move, down to floating point rounding.
+"""
+import dataclasses
+from typing import List, Sequence, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Coordinates,
+    CoordinateValue,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+@dataclasses.dataclass
+class MoveArrays:
+    """A list of moves, as arrays with one row per move.
+
+    Unit vector arrays have a column per axis, and block arrays have a column per
+    block. Moves that are padding at the start or end of a list, like the ones
+    `Move.build_dummy` creates, have zero distance and speeds.
+    """
+
+    unit_vectors: "NDArray[np.float64]"
+    distances: "NDArray[np.float64]"
+    max_speeds: "NDArray[np.float64]"
+    block_distances: "NDArray[np.float64]"
+    block_initial_speeds: "NDArray[np.float64]"
+    block_accelerations: "NDArray[np.float64]"
+    block_final_speeds: "NDArray[np.float64]"
+    block_times: "NDArray[np.float64]"
+
+    @property
+    def initial_speeds(self) -> "NDArray[np.float64]":
+        """Each move's initial speed, like `Move.initial_speed`."""
+        nonzero = self.block_distances != 0
+        first_nonzero = np.argmax(nonzero, axis=1)
+        speeds: "NDArray[np.float64]" = np.where(
+            nonzero.any(axis=1),
+            self.block_initial_speeds[np.arange(len(nonzero)), first_nonzero],
+            0.0,
+        )
+        return speeds
+
+    @property
+    def final_speeds(self) -> "NDArray[np.float64]":
+        """Each move's final speed, like `Move.final_speed`."""
+        nonzero = self.block_distances != 0
+        last_nonzero = nonzero.shape[1] - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+        speeds: "NDArray[np.float64]" = np.where(
+            nonzero.any(axis=1),
+            self.block_final_speeds[np.arange(len(nonzero)), last_nonzero],
+            0.0,
+        )
+        return speeds
+
+    def pad(self) -> "MoveArrays":
+        """Add a zero-length move to the start and end, like `Move.build_dummy`."""
+        dummy_unit_vector = np.zeros((1, self.unit_vectors.shape[1]))
+        dummy_unit_vector[0, 0] = 1.0
+
+        def _pad(array: "NDArray[np.float64]") -> "NDArray[np.float64]":
+            zeros = np.zeros((1, *array.shape[1:]))
+            padded: "NDArray[np.float64]" = np.concatenate(  # type: ignore[no-untyped-call]  # noqa: E501
+                [zeros, array, zeros]
+            )
+            return padded
+
+        return MoveArrays(
+            unit_vectors=np.concatenate(  # type: ignore[no-untyped-call]
+                [dummy_unit_vector, self.unit_vectors, dummy_unit_vector]
+            ),
+            distances=_pad(self.distances),
+            max_speeds=_pad(self.max_speeds),
+            block_distances=_pad(self.block_distances),
+            block_initial_speeds=_pad(self.block_initial_speeds),
+            block_accelerations=_pad(self.block_accelerations),
+            block_final_speeds=_pad(self.block_final_speeds),
+            block_times=_pad(self.block_times),
+        )
+
+    def to_moves(self, axes: Sequence[AxisKey]) -> List[Move[AxisKey]]:
+        """Build Move objects from these arrays.
+
+        Args:
+            axes: The axis of each unit vector column.
+        """
+        # Unit vectors are validated when the arrays are first built from targets,
+        # and speeds are already computed for every move, so don't redo either.
+        initial_speeds = self.initial_speeds
+        final_speeds = self.final_speeds
+        nonzero_blocks = np.count_nonzero(self.block_times, axis=1)
+
+        return [
+            Move.build_computed(
+                unit_vector=dict(zip(axes, self.unit_vectors[i])),
+                distance=self.distances[i],
+                max_speed=self.max_speeds[i],
+                blocks=(self._block(i, 0), self._block(i, 1), self._block(i, 2)),
+                initial_speed=initial_speeds[i],
+                final_speed=final_speeds[i],
+                nonzero_blocks=int(nonzero_blocks[i]),
+            )
+            for i in range(len(self.distances))
+        ]
+
+    def _block(self, move: int, block: int) -> Block:
+        return Block.build_computed(
+            distance=self.block_distances[move, block],
+            initial_speed=self.block_initial_speeds[move, block],
+            acceleration=self.block_accelerations[move, block],
+            final_speed=self.block_final_speeds[move, block],
+            time=self.block_times[move, block],
+        )
+
+
+def targets_to_move_arrays(
+    initial: Coordinates[AxisKey, CoordinateValue], targets: List[MoveTarget[AxisKey]]
+) -> Tuple[List[AxisKey], MoveArrays]:
+    """Vectorized `move_utils.targets_to_moves`.
+
+    Returns:
+        The axis of each unit vector column, and the moves, padded at the start
+        and end.
+    """
+    all_axes: Set[AxisKey] = set()
+    for target in targets:
+        all_axes.update(set(target.position.keys()))
+    axes: List[AxisKey] = list(all_axes)
+
+    positions = np.array(
+        [
+            [initial.get(axis, 0) for axis in axes],
+            *([target.position.get(axis, 0) for axis in axes] for target in targets),
+        ],
+        dtype=np.float64,
+    )
+    displacements = np.diff(positions, axis=0)  # type: ignore[no-untyped-call]
+    distances = _row_norms(displacements)
+
+    zero_length = (distances == 0) | np.all(positions[:-1] == positions[1:], axis=1)
+    if zero_length.any():
+        i = int(np.argmax(zero_length))
+        raise ZeroLengthMoveError(
+            dict(zip(axes, positions[i])), dict(zip(axes, positions[i + 1]))
+        )
+
+    max_speeds = np.array([target.max_speed for target in targets], dtype=np.float64)
+    block_distances = np.repeat(distances[:, np.newaxis] / 3, 3, axis=1)
+    block_initial_speeds = np.repeat(max_speeds[:, np.newaxis], 3, axis=1)
+    block_accelerations = np.zeros_like(block_distances)
+    block_final_speeds, block_times = _block_final_speeds_and_times(
+        block_distances, block_initial_speeds, block_accelerations
+    )
+
+    moves = MoveArrays(
+        unit_vectors=displacements / distances[:, np.newaxis],
+        distances=distances,
+        max_speeds=max_speeds,
+        block_distances=block_distances,
+        block_initial_speeds=block_initial_speeds,
+        block_accelerations=block_accelerations,
+        block_final_speeds=block_final_speeds,
+        block_times=block_times,
+    )
+    return axes, moves.pad()
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstraintArrays:
+    """System constraints, as arrays with one column per axis."""
+
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+
+    @classmethod
+    def from_constraints(
+        cls, constraints: SystemConstraints[AxisKey], axes: Sequence[AxisKey]
+    ) -> "ConstraintArrays":
+        """Build arrays from the constraints of each axis."""
+        return cls(
+            max_acceleration=np.array(
+                [constraints[axis].max_acceleration for axis in axes]
+            ),
+            max_speed_discont=np.array(
+                [constraints[axis].max_speed_discont for axis in axes]
+            ),
+            max_direction_change_speed_discont=np.array(
+                [constraints[axis].max_direction_change_speed_discont for axis in axes]
+            ),
+        )
+
+
+def _is_less_or_close(
+    constraint: "NDArray[np.float64]", value: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    """Vectorized `move_utils.check_less_or_close`."""
+    result: "NDArray[np.bool_]" = (np.abs(value) <= constraint) | np.isclose(
+        value, constraint
+    )
+    return result
+
+
+def _find_initial_speeds(
+    constraints: ConstraintArrays,
+    moves: MoveArrays,
+) -> "NDArray[np.float64]":
+    """Vectorized `move_utils.find_initial_speed` for each unpadded move."""
+    unit_vectors = moves.unit_vectors[1:-1]
+    prev_unit_vectors = moves.unit_vectors[:-2]
+    prev_moving = moves.distances[:-2] > FLOAT_THRESHOLD
+    prev_final_speeds = moves.final_speeds[:-2]
+    initial_speeds: "NDArray[np.float64]" = moves.initial_speeds[1:-1]
+
+    for axis in range(unit_vectors.shape[1]):
+        component = unit_vectors[:, axis]
+        prev_component = np.where(prev_moving, prev_unit_vectors[:, axis], 0.0)
+        from_stop = (prev_component == 0) | (prev_final_speeds == 0)
+        same_direction = prev_component * component > 0
+        speed_discont = constraints.max_speed_discont[axis]
+        direction_discont = constraints.max_direction_change_speed_discont[axis]
+
+        limit = np.where(
+            from_stop,
+            np.abs(speed_discont / component),
+            np.where(
+                same_direction,
+                np.abs(
+                    np.maximum(
+                        np.abs(prev_final_speeds * prev_component), speed_discont
+                    )
+                    / component
+                ),
+                np.abs(direction_discont / component),
+            ),
+        )
+        moving = np.abs(component * initial_speeds) >= FLOAT_THRESHOLD
+        initial_speeds = np.where(
+            moving, np.minimum(limit, initial_speeds), initial_speeds
+        )
+
+    return initial_speeds
+
+
+def _find_final_speeds(
+    constraints: ConstraintArrays,
+    moves: MoveArrays,
+) -> "NDArray[np.float64]":
+    """Vectorized `move_utils.find_final_speed` for each unpadded move."""
+    unit_vectors = moves.unit_vectors[1:-1]
+    next_unit_vectors = moves.unit_vectors[2:]
+    next_moving = moves.distances[2:] > FLOAT_THRESHOLD
+    next_initial_speeds = moves.initial_speeds[2:]
+    final_speeds: "NDArray[np.float64]" = moves.final_speeds[1:-1]
+
+    for axis in range(unit_vectors.shape[1]):
+        component = unit_vectors[:, axis]
+        next_component = np.where(next_moving, next_unit_vectors[:, axis], 0.0)
+        to_stop = (next_component == 0) | (next_initial_speeds == 0)
+        same_direction = next_component * component > 0
+        speed_discont = constraints.max_speed_discont[axis]
+        direction_discont = constraints.max_direction_change_speed_discont[axis]
+
+        limit = np.where(
+            to_stop,
+            np.abs(speed_discont / component),
+            np.where(
+                same_direction,
+                np.abs(
+                    np.maximum(
+                        speed_discont, np.abs(next_initial_speeds * next_component)
+                    )
+                    / component
+                ),
+                np.abs(direction_discont / component),
+            ),
+        )
+        moving = np.abs(component * final_speeds) >= FLOAT_THRESHOLD
+        final_speeds = np.where(moving, np.minimum(limit, final_speeds), final_speeds)
+
+    return final_speeds
+
+
+def _achievable_finals(
+    constraints: ConstraintArrays,
+    unit_vectors: "NDArray[np.float64]",
+    distances: "NDArray[np.float64]",
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Vectorized `move_utils.achievable_final`."""
+    for axis in range(unit_vectors.shape[1]):
+        component = unit_vectors[:, axis]
+        max_final_velocity_sq = (
+            initial_speeds * component
+        ) ** 2 + 2 * constraints.max_acceleration[axis] * distances
+        max_final_velocity = (
+            np.copysign(
+                np.sqrt(max_final_velocity_sq) / component,
+                final_speeds - initial_speeds,
+            )
+            + initial_speeds
+        )
+        constrained = np.copysign(
+            np.minimum(np.abs(max_final_velocity), np.abs(final_speeds)), final_speeds
+        )
+        final_speeds = np.where(component != 0, constrained, final_speeds)
+
+    return final_speeds
+
+
+def _row_norms(vectors: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Get the norm of each row, exactly as `np.linalg.norm` gets it for one vector.
+
+    Norms along an axis round differently, and even the smallest difference can
+    turn a zero-length block into a nonzero one.
+    """
+    return np.array(
+        [np.linalg.norm(v) for v in vectors],  # type: ignore[no-untyped-call]
+        dtype=np.float64,
+    )
+
+
+def _block_final_speeds_and_times(
+    distances: "NDArray[np.float64]",
+    initial_speeds: "NDArray[np.float64]",
+    accelerations: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Vectorized `Block.final_speed` and `Block.time`, stacked."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        final_speeds = np.sqrt(initial_speeds**2 + accelerations * distances * 2)
+        times = np.where(
+            accelerations != 0,
+            (final_speeds - initial_speeds) / accelerations,
+            np.where(initial_speeds != 0, distances / initial_speeds, 0.0),
+        )
+    return np.stack([final_speeds, times])
+
+
+def _build_blocks(
+    constraints: ConstraintArrays,
+    unit_vectors: "NDArray[np.float64]",
+    distances: "NDArray[np.float64]",
+    max_speeds: "NDArray[np.float64]",
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> MoveArrays:
+    """Vectorized `move_utils.build_blocks`, for each move."""
+    for name, speeds in (("initial", initial_speeds), ("final", final_speeds)):
+        too_fast = ~(
+            (np.abs(speeds) <= max_speeds) | np.isclose(np.abs(speeds), max_speeds)
+        )
+        if too_fast.any():
+            i = np.argmax(too_fast)
+            raise AssertionError(
+                f"{name} speed {speeds[i]} exceeds max speed {max_speeds[i]}"
+            )
+
+    max_acc = np.where(unit_vectors != 0, constraints.max_acceleration, 0.0)
+    acc_v = _row_norms(max_acc)[:, np.newaxis] * unit_vectors
+
+    for axis in range(unit_vectors.shape[1]):
+        a_i = acc_v[:, axis]
+        max_acc_i = max_acc[:, axis]
+        over = np.abs(a_i) > max_acc_i
+        scale = np.where(over, max_acc_i / np.where(over, a_i, 1.0), 1.0)
+        acc_v = acc_v * scale[:, np.newaxis]
+    max_acceleration = _row_norms(acc_v)
+
+    initial_speed_sq: "NDArray[np.float64]" = initial_speeds**2
+    final_speed_sq: "NDArray[np.float64]" = final_speeds**2
+    max_achievable_speed = np.sqrt(
+        0.5 * (2 * max_acceleration * distances + initial_speed_sq + final_speed_sq)
+    )
+    max_speed_sq = np.minimum(max_achievable_speed, max_speeds) ** 2
+
+    first_distances = np.abs(max_speed_sq - initial_speed_sq) / (2 * max_acceleration)
+    first_final_speeds, first_times = _block_final_speeds_and_times(
+        first_distances, initial_speeds, max_acceleration
+    )
+    last_distances = np.abs(max_speed_sq - final_speed_sq) / (2 * max_acceleration)
+    last_final_speeds, last_times = _block_final_speeds_and_times(
+        last_distances, first_final_speeds, -max_acceleration
+    )
+
+    # Like build_blocks, this trims the block distances of triangle moves that
+    # overshoot, without recomputing those blocks' speeds or times.
+    overshoot = first_distances + last_distances > distances + FLOAT_THRESHOLD
+    trimmed_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+    first_distances = np.where(
+        overshoot,
+        np.abs(trimmed_speed_sq - initial_speed_sq) / (2 * max_acceleration),
+        first_distances,
+    )
+    last_distances = np.where(
+        overshoot,
+        np.abs(trimmed_speed_sq - final_speed_sq) / (2 * max_acceleration),
+        last_distances,
+    )
+
+    coast = first_distances + last_distances < distances - FLOAT_THRESHOLD
+    coast_distances = np.where(coast, distances - first_distances - last_distances, 0)
+    coast_initial_speeds = np.where(coast, first_final_speeds, 0)
+    coast_final_speeds, coast_times = _block_final_speeds_and_times(
+        coast_distances, coast_initial_speeds, np.zeros_like(distances)
+    )
+
+    return MoveArrays(
+        unit_vectors=unit_vectors,
+        distances=distances,
+        max_speeds=max_speeds,
+        block_distances=np.stack(
+            [first_distances, coast_distances, last_distances], axis=1
+        ),
+        block_initial_speeds=np.stack(
+            [initial_speeds, coast_initial_speeds, first_final_speeds], axis=1
+        ),
+        block_accelerations=np.stack(
+            [max_acceleration, np.zeros_like(distances), -max_acceleration], axis=1
+        ),
+        block_final_speeds=np.stack(
+            [first_final_speeds, coast_final_speeds, last_final_speeds], axis=1
+        ),
+        block_times=np.stack([first_times, coast_times, last_times], axis=1),
+    )
+
+
+def blend(constraints: ConstraintArrays, moves: MoveArrays) -> MoveArrays:
+    """Rebuild every move from its neighbors, like `move_utils.build_move`.
+
+    Args:
+        constraints: The system constraints.
+        moves: The moves to blend, padded at the start and end.
+
+    Returns:
+        The rebuilt moves, without padding.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unit_vectors = moves.unit_vectors[1:-1]
+        distances = moves.distances[1:-1]
+        initial_speeds = _find_initial_speeds(constraints, moves)
+        final_speeds = _find_final_speeds(constraints, moves)
+        final_speeds = _achievable_finals(
+            constraints, unit_vectors, distances, initial_speeds, final_speeds
+        )
+        return _build_blocks(
+            constraints,
+            unit_vectors,
+            distances,
+            moves.max_speeds[1:-1],
+            initial_speeds,
+            final_speeds,
+        )
+
+
+def all_blended(constraints: ConstraintArrays, moves: MoveArrays) -> bool:
+    """Check if the moves are all blended, like `move_utils.all_blended`."""
+    if len(moves.distances) < 2:
+        return True
+
+    block_distances = moves.block_distances
+    distance_sums = block_distances[:, 0] + block_distances[:, 1]
+    distance_sums = distance_sums + block_distances[:, 2]
+    distance_errors = np.abs(distance_sums - moves.distances)
+    if np.any(distance_errors > FLOAT_THRESHOLD) or not np.all(
+        np.isclose(distance_sums, moves.distances)
+    ):
+        return False
+
+    first_unit_vectors = moves.unit_vectors[:-1]
+    second_unit_vectors = moves.unit_vectors[1:]
+    final_speeds = moves.block_final_speeds[:-1, -1, np.newaxis] * first_unit_vectors
+    initial_speeds = moves.block_initial_speeds[1:, 0, np.newaxis] * second_unit_vectors
+    same_direction = first_unit_vectors * second_unit_vectors > 0
+
+    speed_discont = constraints.max_speed_discont
+    direction_discont = constraints.max_direction_change_speed_discont
+    same_direction_ok = (
+        (np.abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD)
+        | _is_less_or_close(speed_discont, final_speeds)
+        | _is_less_or_close(speed_discont, initial_speeds)
+    )
+    direction_change_ok: "NDArray[np.bool_]" = _is_less_or_close(
+        direction_discont, final_speeds
+    ) | _is_less_or_close(direction_discont, initial_speeds)
+
+    return bool(
+        np.all(np.where(same_direction, same_direction_ok, direction_change_ok))
+    )
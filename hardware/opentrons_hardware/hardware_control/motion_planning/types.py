@@ -75,6 +75,27 @@ class Block:
         self.final_speed = _final_speed()
         self.time = _time()
 
+    @classmethod
+    def build_computed(
+        cls,
+        distance: np.float64,
+        initial_speed: np.float64,
+        acceleration: np.float64,
+        final_speed: np.float64,
+        time: np.float64,
+    ) -> Block:
+        """Build a Block whose final speed and time are already computed.
+
+        For callers that compute many blocks at once, like `MoveArrays`.
+        """
+        block: Block = cls.__new__(cls)
+        block.distance = distance
+        block.initial_speed = initial_speed
+        block.acceleration = acceleration
+        block.final_speed = final_speed
+        block.time = time
+        return block
+
 
 @dataclasses.dataclass
 class Move(Generic[AxisKey]):
@@ -128,6 +149,32 @@ class Move(Generic[AxisKey]):
         self.final_speed = _final_speed()
         self.nonzero_blocks = len([b for b in self.blocks if b.time])
 
+    @classmethod
+    def build_computed(
+        cls,
+        unit_vector: Coordinates[AxisKey, np.float64],
+        distance: np.float64,
+        max_speed: np.float64,
+        blocks: Tuple[Block, Block, Block],
+        initial_speed: np.float64,
+        final_speed: np.float64,
+        nonzero_blocks: int,
+    ) -> Move[AxisKey]:
+        """Build a Move whose speeds are already computed.
+
+        The unit vector isn't validated, so it must already be known to be one.
+        For callers that compute many moves at once, like `MoveArrays`.
+        """
+        move: Move[AxisKey] = cls.__new__(cls)
+        move.unit_vector = unit_vector
+        move.distance = distance
+        move.max_speed = max_speed
+        move.blocks = blocks
+        move.initial_speed = initial_speed
+        move.final_speed = final_speed
+        move.nonzero_blocks = nonzero_blocks
+        return move
+
     @classmethod
     def build_dummy(cls, for_axes: Iterable[AxisKey]) -> Move[AxisKey]:
         """Return a Move with dummy values."""
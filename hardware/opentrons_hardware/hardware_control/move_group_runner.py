@@ -1,12 +1,24 @@
 """Class that schedules motion on can bus."""
 import asyncio
 from collections import defaultdict
+from dataclasses import dataclass
 import logging
-from typing import List, Set, Tuple, Iterator, Union
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Iterator,
+    Union,
+)
 import numpy as np
 
 from opentrons_hardware.firmware_bindings import ArbitrationId
-from opentrons_hardware.firmware_bindings.constants import NodeId
+from opentrons_hardware.firmware_bindings.constants import NodeId, MessageId
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
@@ -29,6 +41,7 @@ from opentrons_hardware.firmware_bindings.messages.payloads import (
 )
 from .constants import interrupts_per_sec
 from opentrons_hardware.hardware_control.motion import (
+    MoveGroup,
     MoveGroups,
     MoveGroupSingleAxisStep,
     MoveGroupSingleGripperStep,
@@ -57,19 +70,84 @@ _CompletionPacket = Tuple[ArbitrationId, _AcceptableMoves]
 _Completions = List[_CompletionPacket]
 
 
+@dataclass
+class MoveGroupTiming:
+    """How long a move group spent on the bus, in seconds, as seen from the host.
+
+    Attributes:
+        index: The position of the group in the runner's move groups.
+        group_id: The move group id the group was sent as.
+        expected_duration: How long the group's moves are planned to take.
+        send_duration: Time spent sending the group's moves to the nodes.
+        execute_delay: Time from the previous group completing, or from the start
+            of execution for the first group, until this group's execute request
+            was sent.
+        ack_latency: Time from this group's execute request being sent until the
+            last of its completion acks arrived.
+        timed_out: Whether the group timed out before every ack arrived.
+    """
+
+    index: int
+    group_id: int
+    expected_duration: float
+    send_duration: float = 0.0
+    execute_delay: float = 0.0
+    ack_latency: float = 0.0
+    timed_out: bool = False
+
+
+def _group_duration(move_group: MoveGroup) -> float:
+    return sum(
+        float(list(move.values())[0].duration_sec) for move in move_group if move
+    )
+
+
 class MoveGroupRunner:
     """A move command scheduler."""
 
-    def __init__(self, move_groups: MoveGroups, start_at_index: int = 0) -> None:
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        start_at_index: int = 0,
+        pipeline_depth: Optional[int] = None,
+    ) -> None:
         """Constructor.
 
         Args:
             move_groups: The move groups to run.
             start_at_index: The index the MoveGroupManager will start at
+            pipeline_depth: If set, stream the move groups through this many
+                move group ids, starting at start_at_index, instead of sending
+                every group before execution starts. Each id is refilled with
+                the next waiting group as soon as the group in it completes,
+                while the following group is executing, so sequences longer than
+                the firmware's move group capacity run without stopping.
         """
+        if pipeline_depth is not None and pipeline_depth < 2:
+            raise ValueError("A pipelined runner needs a depth of at least 2.")
         self._move_groups = move_groups
         self._start_at_index = start_at_index
+        self._pipeline_depth = pipeline_depth
         self._is_prepped: bool = False
+        self._timings = [
+            MoveGroupTiming(
+                index=index,
+                group_id=self._group_id(index),
+                expected_duration=_group_duration(move_group),
+            )
+            for index, move_group in enumerate(move_groups)
+        ]
+
+    @property
+    def timings(self) -> List[MoveGroupTiming]:
+        """Timing of each move group, filled in as the groups are sent and run."""
+        return self._timings
+
+    def _group_id(self, index: int) -> int:
+        """The move group id that the group at an index is sent as."""
+        if self._pipeline_depth is None:
+            return self._start_at_index + index
+        return self._start_at_index + index % self._pipeline_depth
 
     @staticmethod
     def _has_moves(move_groups: MoveGroups) -> bool:
@@ -90,7 +168,11 @@ class MoveGroupRunner:
             log.debug("No moves. Nothing to do.")
             return
         await self._clear_groups(can_messenger)
-        await self._send_groups(can_messenger)
+        if self._pipeline_depth is None:
+            await self._send_groups(can_messenger)
+        else:
+            for index in range(min(self._pipeline_depth, len(self._move_groups))):
+                await self._send_group(can_messenger, index)
         self._is_prepped = True
 
     async def execute(self, can_messenger: CanMessenger) -> NodeDict[float]:
@@ -106,6 +188,8 @@ class MoveGroupRunner:
         if not self._is_prepped:
             raise RuntimeError("A group must be prepped before it can be executed.")
         move_completion_data = await self._move(can_messenger)
+        if self._pipeline_depth is not None:
+            return self._accumulate_streamed_move_completions(move_completion_data)
         return self._accumulate_move_completions(move_completion_data)
 
     async def run(self, can_messenger: CanMessenger) -> NodeDict[float]:
@@ -153,6 +237,20 @@ class MoveGroupRunner:
             for node, poslist in position.items()
         }
 
+    @staticmethod
+    def _accumulate_streamed_move_completions(
+        completions: _Completions,
+    ) -> NodeDict[float]:
+        # pipelined groups reuse group ids, but run one after another, so the
+        # last completion each node sent is from its last move
+        return {
+            NodeId(arbid.parts.originating_node_id): float(
+                completion.payload.current_position_um.value
+            )
+            / 1000.0
+            for arbid, completion in completions
+        }
+
     async def _clear_groups(self, can_messenger: CanMessenger) -> None:
         """Send commands to clear the message groups.
 
@@ -166,15 +264,20 @@ class MoveGroupRunner:
 
     async def _send_groups(self, can_messenger: CanMessenger) -> None:
         """Send commands to set up the message groups."""
-        for group_i, group in enumerate(self._move_groups):
-            for seq_i, sequence in enumerate(group):
-                for node, step in sequence.items():
-                    await can_messenger.send(
-                        node_id=node,
-                        message=self._get_message_type(
-                            step, group_i + self._start_at_index, seq_i
-                        ),
-                    )
+        for group_i in range(len(self._move_groups)):
+            await self._send_group(can_messenger, group_i)
+
+    async def _send_group(self, can_messenger: CanMessenger, index: int) -> None:
+        """Send commands to set up one message group."""
+        start = time.monotonic()
+        group_id = self._group_id(index)
+        for seq_i, sequence in enumerate(self._move_groups[index]):
+            for node, step in sequence.items():
+                await can_messenger.send(
+                    node_id=node,
+                    message=self._get_message_type(step, group_id, seq_i),
+                )
+        self._timings[index].send_duration = time.monotonic() - start
 
     def _convert_velocity(
         self, velocity: Union[float, np.float64], interrupts: int
@@ -265,38 +368,80 @@ class MoveGroupRunner:
 
     async def _move(self, can_messenger: CanMessenger) -> _Completions:
         """Run all the move groups."""
-        scheduler = MoveScheduler(self._move_groups)
+        scheduler: MoveScheduler
+        if self._pipeline_depth is None:
+            scheduler = MoveScheduler(self._move_groups, self._timings)
+        else:
+            scheduler = PipelinedMoveScheduler(
+                self._move_groups,
+                self._timings,
+                pipeline_depth=self._pipeline_depth,
+                send_group=lambda index: self._send_group(can_messenger, index),
+            )
         try:
-            can_messenger.add_listener(scheduler)
+            can_messenger.add_listener(
+                scheduler,
+                message_ids=[
+                    MessageId.move_completed,
+                    MessageId.do_self_contained_tip_action_response,
+                ],
+            )
             completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
+        log.debug(f"Move group timings: {self._timings}")
         return completions
 
 
 class MoveScheduler:
     """A message listener that manages the sending of execute move group messages."""
 
-    def __init__(self, move_groups: MoveGroups) -> None:
-        """Constructor."""
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        timings: Optional[List[MoveGroupTiming]] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            move_groups: The move groups to run.
+            timings: If provided, where to record the timing of each group.
+        """
         # For each move group create a set identifying the node and seq id.
         self._moves: List[Set[Tuple[int, int]]] = []
         self._durations: List[float] = []
         self._stop_condition: List[MoveStopCondition] = []
         for move_group in move_groups:
             move_set = set()
-            duration = 0.0
             for seq_id, move in enumerate(move_group):
                 move_set.update(set((k.value, seq_id) for k in move.keys()))
-                duration += float(list(move.values())[0].duration_sec)
                 for step in move_group[seq_id]:
                     self._stop_condition.append(move_group[seq_id][step].stop_condition)
 
             self._moves.append(move_set)
-            self._durations.append(duration)
+            self._durations.append(_group_duration(move_group))
         log.debug(f"Move scheduler running for groups {move_groups}")
+        self._timings = timings or [
+            MoveGroupTiming(index=index, group_id=index, expected_duration=duration)
+            for index, duration in enumerate(self._durations)
+        ]
         self._completion_queue: asyncio.Queue[_CompletionPacket] = asyncio.Queue()
         self._event = asyncio.Event()
+        self._last_completed_at = 0.0
+        self._execute_sent_at = 0.0
+
+    @property
+    def timings(self) -> List[MoveGroupTiming]:
+        """Timing of each move group, filled in as the groups run."""
+        return self._timings
+
+    def _group_id(self, index: int) -> int:
+        """The move group id to execute the group at an index as."""
+        return index
+
+    def _group_index(self, group_id: int) -> Optional[int]:
+        """The index of the group running as a move group id, if any."""
+        return group_id
 
     def _remove_move_group(
         self, message: _AcceptableMoves, arbitration_id: ArbitrationId
@@ -304,14 +449,21 @@ class MoveScheduler:
         seq_id = message.payload.seq_id.value
         group_id = message.payload.group_id.value
         node_id = arbitration_id.parts.originating_node_id
+        index = self._group_index(group_id)
+        if index is None:
+            log.warning(
+                f"Got a move ack for ({node_id}, {seq_id}) in group {group_id}, "
+                "which is not running"
+            )
+            return
         log.info(
             f"Received completion for {node_id} group {group_id} seq {seq_id}"
             ", which "
-            f"{'is' if (node_id, seq_id) in self._moves[group_id] else 'isn''t'}"
+            f"{'is' if (node_id, seq_id) in self._moves[index] else 'isn''t'}"
             " in group"
         )
         try:
-            self._moves[group_id].remove((node_id, seq_id))
+            self._moves[index].remove((node_id, seq_id))
             self._completion_queue.put_nowait((arbitration_id, message))
         except KeyError:
             log.warning(
@@ -319,13 +471,15 @@ class MoveScheduler:
                 "group; may have leaked from an earlier timed-out group"
             )
 
-        if not self._moves[group_id]:
+        if not self._moves[index]:
             log.info(f"Move group {group_id} has completed.")
             self._event.set()
 
     def _handle_move_completed(self, message: MoveCompleted) -> None:
-        group_id = message.payload.group_id.value
+        group_id = self._group_index(message.payload.group_id.value)
         ack_id = message.payload.ack_id.value
+        if group_id is None:
+            return
         if self._stop_condition[
             group_id
         ] == MoveStopCondition.limit_switch and ack_id != UInt8Field(2):
@@ -335,8 +489,10 @@ class MoveScheduler:
                 raise MoveConditionNotMet()
 
     def _handle_tip_action(self, message: TipActionResponse) -> None:
-        group_id = message.payload.group_id.value
+        group_id = self._group_index(message.payload.group_id.value)
         ack_id = message.payload.ack_id.value
+        if group_id is None:
+            return
         limit_switch = bool(
             self._stop_condition[group_id] == MoveStopCondition.limit_switch
         )
@@ -364,37 +520,113 @@ class MoveScheduler:
 
     async def run(self, can_messenger: CanMessenger) -> _Completions:
         """Start each move group after the prior has completed."""
+        self._last_completed_at = time.monotonic()
         for group_id in range(len(self._moves)):
-            self._event.clear()
-
-            log.info(f"Executing move group {group_id}.")
-            await can_messenger.send(
-                node_id=NodeId.broadcast,
-                message=ExecuteMoveGroupRequest(
-                    payload=ExecuteMoveGroupRequestPayload(
-                        group_id=UInt8Field(group_id),
-                        # TODO (al, 2021-11-8): The triggers should be populated
-                        #  with actual values.
-                        start_trigger=UInt8Field(0),
-                        cancel_trigger=UInt8Field(0),
-                    )
-                ),
-            )
+            await self._execute(can_messenger, group_id)
+            await self._wait(group_id)
+
+        return self._reify_completions()
 
-            try:
-                # TODO: The max here can be removed once can_driver.send() no longer
-                # returns before the message actually hits the bus. Right now it
-                # returns when the message is enqueued in the kernel, meaning that
-                # for short move durations we can see the timeout expiring before
-                # the execute even gets sent.
-                await asyncio.wait_for(
-                    self._event.wait(), max(1.0, self._durations[group_id] * 1.1)
+    async def _execute(self, can_messenger: CanMessenger, index: int) -> None:
+        """Send the execute request for a move group."""
+        self._event.clear()
+        group_id = self._group_id(index)
+
+        log.info(f"Executing move group {group_id}.")
+        self._timings[index].execute_delay = time.monotonic() - self._last_completed_at
+        self._execute_sent_at = time.monotonic()
+        await can_messenger.send(
+            node_id=NodeId.broadcast,
+            message=ExecuteMoveGroupRequest(
+                payload=ExecuteMoveGroupRequestPayload(
+                    group_id=UInt8Field(group_id),
+                    # TODO (al, 2021-11-8): The triggers should be populated
+                    #  with actual values.
+                    start_trigger=UInt8Field(0),
+                    cancel_trigger=UInt8Field(0),
                 )
-            except asyncio.TimeoutError:
-                log.warning("Move set timed out")
+            ),
+        )
 
+    async def _wait(self, index: int) -> None:
+        """Wait for the executing move group to complete."""
+        try:
+            # TODO: The max here can be removed once can_driver.send() no longer
+            # returns before the message actually hits the bus. Right now it
+            # returns when the message is enqueued in the kernel, meaning that
+            # for short move durations we can see the timeout expiring before
+            # the execute even gets sent.
+            await asyncio.wait_for(
+                self._event.wait(), max(1.0, self._durations[index] * 1.1)
+            )
+        except asyncio.TimeoutError:
+            log.warning("Move set timed out")
+            self._timings[index].timed_out = True
+
+        self._last_completed_at = time.monotonic()
+        self._timings[index].ack_latency = (
+            self._last_completed_at - self._execute_sent_at
+        )
+
+    def _reify_completions(self) -> _Completions:
         def _reify_queue_iter() -> Iterator[_CompletionPacket]:
             while not self._completion_queue.empty():
                 yield self._completion_queue.get_nowait()
 
         return list(_reify_queue_iter())
+
+
+class PipelinedMoveScheduler(MoveScheduler):
+    """A move scheduler that streams move groups through a few move group ids.
+
+    Only the first `pipeline_depth` groups are sent before execution starts.
+    As each group completes, the next group is executed right away, and then the
+    completed group's id is refilled with the next group that hasn't been sent.
+    """
+
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        timings: List[MoveGroupTiming],
+        pipeline_depth: int,
+        send_group: Callable[[int], Awaitable[None]],
+    ) -> None:
+        """Constructor.
+
+        Args:
+            move_groups: The move groups to run.
+            timings: Where to record the timing of each group. Each group's
+                `group_id` is the id that it's sent and executed as.
+            pipeline_depth: How many move groups can be sent at once.
+            send_group: Send the move group at an index to the nodes.
+        """
+        super().__init__(move_groups, timings)
+        self._pipeline_depth = pipeline_depth
+        self._send_group = send_group
+        self._running: Dict[int, int] = {}
+
+    def _group_id(self, index: int) -> int:
+        return self._timings[index].group_id
+
+    def _group_index(self, group_id: int) -> Optional[int]:
+        return self._running.get(group_id)
+
+    async def _execute(self, can_messenger: CanMessenger, index: int) -> None:
+        self._running = {self._group_id(index): index}
+        await super()._execute(can_messenger, index)
+
+    async def run(self, can_messenger: CanMessenger) -> _Completions:
+        """Start each move group after the prior has completed, refilling ids."""
+        self._last_completed_at = time.monotonic()
+        group_count = len(self._moves)
+        if group_count:
+            await self._execute(can_messenger, 0)
+
+        for index in range(group_count):
+            await self._wait(index)
+            if index + 1 < group_count:
+                await self._execute(can_messenger, index + 1)
+            if index + self._pipeline_depth < group_count:
+                await self._send_group(index + self._pipeline_depth)
+
+        return self._reify_completions()
@@ -77,6 +77,12 @@ def main() -> None:
         default="last",
         help="output the last list or all of the blend log",
     )
+    parser.add_argument(
+        "--vectorized",
+        "-v",
+        action="store_true",
+        help="blend all moves at once with numpy arrays",
+    )
     args = parser.parse_args()
 
     if args.debug:
@@ -102,7 +108,9 @@ def main() -> None:
         for target in params["target_list"]
     ]
 
-    manager = move_manager.MoveManager(constraints=constraints)
+    manager = move_manager.MoveManager(
+        constraints=constraints, vectorized=args.vectorized
+    )
     _, blend_log = manager.plan_motion(
         origin=origin,
         target_list=target_list,
@@ -298,7 +298,10 @@ class SensorScheduler:
         )
         try:
             if log:
-                can_messenger.add_listener(self._log_sensor_output)
+                can_messenger.add_listener(
+                    self._log_sensor_output,
+                    message_ids=[MessageId.read_sensor_response],
+                )
             yield
         finally:
             if log:
@@ -333,16 +336,11 @@ class SensorScheduler:
                 SensorDataType.build(payload.sensor_data).to_float()
             )
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id)
-                == target_sensor.node_id
-            ) and (
-                MessageId(arbitration_id.parts.message_id)
-                == MessageId.read_sensor_response
-            )
-
-        can_messenger.add_listener(_logging_listener, _filter)
+        can_messenger.add_listener(
+            _logging_listener,
+            message_ids=[MessageId.read_sensor_response],
+            node_ids=[target_sensor.node_id],
+        )
         await can_messenger.send(
             node_id=target_sensor.node_id,
             message=BindSensorOutputRequest(
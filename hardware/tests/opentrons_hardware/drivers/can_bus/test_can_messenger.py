@@ -1,6 +1,7 @@
 """Tests for the can messaging class."""
 from __future__ import annotations
 import asyncio
+import logging
 from asyncio import Queue
 
 import pytest
@@ -214,3 +215,91 @@ async def test_waitable_callback_context_with_filter() -> None:
     with WaitableCallback(mock_messenger, some_func) as callback:
         mock_messenger.add_listener.assert_called_once_with(callback, some_func)
     mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+def _incoming_message(
+    message_id: MessageId, originating_node_id: NodeId, data: bytes
+) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=originating_node_id,
+            )
+        ),
+        data=data,
+    )
+
+
+async def test_route_messages(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should only call listeners registered for a message and node id."""
+    incoming_messages.put_nowait(
+        _incoming_message(MessageId.get_move_group_request, NodeId.gantry_x, b"\1")
+    )
+    incoming_messages.put_nowait(
+        _incoming_message(MessageId.get_move_group_request, NodeId.gantry_y, b"\2")
+    )
+    incoming_messages.put_nowait(
+        _incoming_message(MessageId.heartbeat_request, NodeId.gantry_x, b"")
+    )
+
+    by_message = Mock(spec=MessageListenerCallback)
+    by_node = Mock(spec=MessageListenerCallback)
+    by_both = Mock(spec=MessageListenerCallback)
+    subject.add_listener(by_message, message_ids=[MessageId.get_move_group_request])
+    subject.add_listener(by_node, node_ids=[NodeId.gantry_x])
+    subject.add_listener(
+        by_both,
+        message_ids=[MessageId.get_move_group_request],
+        node_ids=[NodeId.gantry_y],
+    )
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    assert [c.args[0] for c in by_message.call_args_list] == [
+        GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(1))),
+        GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(2))),
+    ]
+    assert [c.args[0] for c in by_node.call_args_list] == [
+        GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(1))),
+        HeartbeatRequest(),
+    ]
+    assert [c.args[0] for c in by_both.call_args_list] == [
+        GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(2))),
+    ]
+
+
+async def test_unrouted_messages_not_decoded(
+    subject: CanMessenger,
+    incoming_messages: Queue[CanMessage],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """It should not decode payloads of messages that no listener accepts."""
+    caplog.set_level(logging.INFO)
+
+    # These payloads are too short to decode.
+    incoming_messages.put_nowait(
+        _incoming_message(MessageId.move_completed, NodeId.gantry_x, b"")
+    )
+    incoming_messages.put_nowait(
+        _incoming_message(MessageId.move_completed, NodeId.gantry_y, b"")
+    )
+
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, node_ids=[NodeId.gantry_y])
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    listener.assert_not_called()
+    assert caplog.text.count("Failed to build") == 1
+    assert "gantry_y" in caplog.text
@@ -0,0 +1,92 @@
+"""BinarySerializable tests."""
+from dataclasses import dataclass
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.utils.binary_serializable import (
+    SerializationException,
+)
+
+
+@dataclass
+class _Payload(utils.BinarySerializable):
+    first: utils.UInt8Field
+    second: utils.Int32Field
+    third: utils.UInt16Field
+
+
+@dataclass
+class _LittleEndianPayload(utils.LittleEndianBinarySerializable):
+    first: utils.UInt16Field
+
+
+@dataclass
+class _EmptyPayload(utils.BinarySerializable):
+    pass
+
+
+def test_serialize_and_build() -> None:
+    """It should round trip through bytes, ignoring extra bytes."""
+    subject = _Payload(
+        first=utils.UInt8Field(1),
+        second=utils.Int32Field(-2),
+        third=utils.UInt16Field(3),
+    )
+
+    assert _Payload.get_size() == 7
+    assert subject.serialize() == b"\x01\xff\xff\xff\xfe\x00\x03"
+    assert _Payload.build(subject.serialize() + b"\x00") == subject
+
+
+def test_little_endian() -> None:
+    """It should use the class's endianness."""
+    subject = _LittleEndianPayload(first=utils.UInt16Field(1))
+
+    assert subject.serialize() == b"\x01\x00"
+    assert _LittleEndianPayload.build(b"\x01\x00") == subject
+
+
+def test_empty() -> None:
+    """It should handle payloads with no fields."""
+    assert _EmptyPayload.get_size() == 0
+    assert _EmptyPayload().serialize() == b""
+    assert _EmptyPayload.build(b"\x01") == _EmptyPayload()
+
+
+def test_unpack_from() -> None:
+    """It should unpack consecutive payloads from a memoryview of a buffer."""
+    buffer = memoryview(b"\xaa\x01\x00\x00\x00\x02\x00\x03\x04\x00\x00\x00\x05\x00\x06")
+
+    assert _Payload.unpack_from(buffer, 1) == _Payload(
+        first=utils.UInt8Field(1),
+        second=utils.Int32Field(2),
+        third=utils.UInt16Field(3),
+    )
+    assert _Payload.unpack_from(buffer, 8) == _Payload(
+        first=utils.UInt8Field(4),
+        second=utils.Int32Field(5),
+        third=utils.UInt16Field(6),
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["data", "offset"],
+    argvalues=[[b"\x01\x02", 0], [bytes(7), 1]],
+)
+def test_build_too_short(data: bytes, offset: int) -> None:
+    """It should raise if there aren't enough bytes."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Payload.unpack_from(data, offset)
+
+
+def test_serialize_out_of_range() -> None:
+    """It should raise if a value doesn't fit in its field."""
+    subject = _Payload(
+        first=utils.UInt8Field(256),
+        second=utils.Int32Field(0),
+        third=utils.UInt16Field(0),
+    )
+
+    with pytest.raises(SerializationException):
+        subject.serialize()
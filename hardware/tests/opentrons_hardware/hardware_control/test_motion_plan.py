@@ -1,5 +1,6 @@
 """Tests for motion planning."""
 import numpy as np
+import pytest
 from hypothesis import given, assume, strategies as st
 from hypothesis.extra import numpy as hynp
 from typing import Iterator, List
@@ -10,6 +11,7 @@ from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     MoveTarget,
     SystemConstraints,
+    ZeroLengthMoveError,
     vectorize,
 )
 
@@ -187,3 +189,91 @@ def test_close_move_plan(
     )
 
     assert converged
+
+
+def _assert_plans_match(
+    constraints: SystemConstraints[str],
+    origin: Coordinates[str, np.float64],
+    targets: List[MoveTarget[str]],
+) -> None:
+    """Plan the same motion with both blending modes and compare the results."""
+    converged, blend_log = move_manager.MoveManager(constraints).plan_motion(
+        origin=origin, target_list=targets, iteration_limit=20
+    )
+    vectorized_converged, vectorized_blend_log = move_manager.MoveManager(
+        constraints, vectorized=True
+    ).plan_motion(origin=origin, target_list=targets, iteration_limit=20)
+
+    assert vectorized_converged == converged
+    assert len(vectorized_blend_log) == len(blend_log)
+    for moves, vectorized_moves in zip(blend_log, vectorized_blend_log):
+        assert len(vectorized_moves) == len(moves)
+        for move, vectorized_move in zip(moves, vectorized_moves):
+            assert vectorized_move.unit_vector.keys() == move.unit_vector.keys()
+            assert np.allclose(
+                vectorize(vectorized_move.unit_vector), vectorize(move.unit_vector)
+            )
+            assert np.isclose(vectorized_move.distance, move.distance)
+            assert np.isclose(vectorized_move.max_speed, move.max_speed)
+            assert np.isclose(vectorized_move.initial_speed, move.initial_speed)
+            assert np.isclose(vectorized_move.final_speed, move.final_speed)
+            assert vectorized_move.nonzero_blocks == move.nonzero_blocks
+            for block, vectorized_block in zip(move.blocks, vectorized_move.blocks):
+                assert np.isclose(vectorized_block.distance, block.distance)
+                assert np.isclose(vectorized_block.initial_speed, block.initial_speed)
+                assert np.isclose(vectorized_block.acceleration, block.acceleration)
+                assert np.isclose(vectorized_block.final_speed, block.final_speed)
+                assert np.isclose(vectorized_block.time, block.time)
+
+
+@given(
+    constraints=st.fixed_dictionaries(
+        {axis: generate_axis_constraint() for axis in SIXAXES}
+    ),
+    origin=generate_coordinates(),
+    targets=generate_target_list(),
+)
+def test_vectorized_move_plan(
+    constraints: SystemConstraints[str],
+    origin: Coordinates[str, np.float64],
+    targets: List[MoveTarget[str]],
+) -> None:
+    """The vectorized planner should make the same plan as the default one."""
+    assume(reject_close_coordinates(origin, targets[0].position))
+    _assert_plans_match(constraints, origin, targets)
+
+
+@given(
+    constraints=st.fixed_dictionaries(
+        {axis: generate_axis_constraint() for axis in SIXAXES}
+    ),
+    origin=generate_coordinates(),
+    data=st.data(),
+)
+def test_vectorized_close_move_plan(
+    constraints: SystemConstraints[str],
+    origin: Coordinates[str, np.float64],
+    data: st.DataObject,
+) -> None:
+    """The vectorized planner should make the same plan as the default one."""
+    targets = data.draw(generate_close_target_list(origin))
+    _assert_plans_match(constraints, origin, targets)
+
+
+def test_vectorized_zero_length_move() -> None:
+    """The vectorized planner should reject zero-length moves."""
+    constraints: SystemConstraints[str] = {
+        axis: AxisConstraints.build(
+            max_acceleration=1000,
+            max_speed_discont=20,
+            max_direction_change_speed_discont=10,
+        )
+        for axis in SIXAXES
+    }
+    origin = {axis: np.float64(0) for axis in SIXAXES}
+    targets = [MoveTarget.build(origin, np.float64(100))]
+
+    with pytest.raises(ZeroLengthMoveError):
+        move_manager.MoveManager(constraints, vectorized=True).plan_motion(
+            origin=origin, target_list=targets, iteration_limit=20
+        )
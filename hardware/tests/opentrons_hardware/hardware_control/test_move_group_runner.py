@@ -1,6 +1,7 @@
 """Tests for the move scheduler."""
 import pytest
-from typing import List, Any
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 from numpy import float64
 from mock import AsyncMock, call, MagicMock
 from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
@@ -562,3 +563,157 @@ async def test_empty_groups(
     mg = MoveGroupRunner(empty_group)
     await mg.run(mock_can_messenger)
     mock_can_messenger.send.assert_not_called()
+
+
+class MockMoveGroupSlots:
+    """Side effect mocks of CanMessenger that track the nodes' move group slots.
+
+    Executing a group immediately completes the moves that were added to it, and
+    empties it so that it can be refilled.
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.slots: Dict[int, Dict[Tuple[NodeId, int], int]] = defaultdict(dict)
+        self.listener: Optional[MessageListenerCallback] = None
+        self.messages: List[MessageDefinition] = []
+
+    def add_listener(self, listener: MessageListenerCallback, **kwargs: Any) -> None:
+        """Mock add_listener function."""
+        self.listener = listener
+
+    async def mock_send(self, node_id: NodeId, message: MessageDefinition) -> None:
+        """Mock send function."""
+        self.messages.append(message)
+        if isinstance(message, md.AddLinearMoveRequest):
+            slot = self.slots[message.payload.group_id.value]
+            key = (node_id, message.payload.seq_id.value)
+            assert key not in slot, "Overwrote a move that hasn't run"
+            slot[key] = message.payload.duration.value
+        elif isinstance(message, md.ExecuteMoveGroupRequest):
+            assert self.listener
+            group_id = message.payload.group_id.value
+            slot = self.slots.pop(group_id)
+            for (node, seq_id), duration in slot.items():
+                payload = MoveCompletedPayload(
+                    group_id=UInt8Field(group_id),
+                    seq_id=UInt8Field(seq_id),
+                    current_position_um=UInt32Field(duration),
+                    encoder_position=UInt32Field(duration),
+                    ack_id=UInt8Field(1),
+                )
+                arbitration_id = ArbitrationId(
+                    parts=ArbitrationIdParts(originating_node_id=node)
+                )
+                self.listener(md.MoveCompleted(payload=payload), arbitration_id)
+
+
+def _build_numbered_groups(count: int) -> MoveGroups:
+    """Build move groups whose steps' durations identify their group."""
+    return [
+        [
+            {
+                NodeId.gantry_x: MoveGroupSingleAxisStep(
+                    distance_mm=float64(1),
+                    velocity_mm_sec=float64(1),
+                    duration_sec=float64(group / interrupts_per_sec),
+                ),
+                NodeId.gantry_y: MoveGroupSingleAxisStep(
+                    distance_mm=float64(1),
+                    velocity_mm_sec=float64(1),
+                    duration_sec=float64(group / interrupts_per_sec),
+                ),
+            }
+        ]
+        for group in range(count)
+    ]
+
+
+async def test_pipelined_run() -> None:
+    """It should refill move group ids as the groups in them complete."""
+    move_groups = _build_numbered_groups(5)
+    mock_slots = MockMoveGroupSlots()
+    mock_can_messenger = MagicMock()
+    mock_can_messenger.send = AsyncMock(side_effect=mock_slots.mock_send)
+    mock_can_messenger.add_listener.side_effect = mock_slots.add_listener
+    subject = MoveGroupRunner(move_groups=move_groups, pipeline_depth=2)
+
+    position = await subject.run(mock_can_messenger)
+
+    events = [
+        ("add", m.payload.group_id.value, m.payload.duration.value)
+        if isinstance(m, md.AddLinearMoveRequest)
+        else ("execute", m.payload.group_id.value)
+        if isinstance(m, md.ExecuteMoveGroupRequest)
+        else ("clear",)
+        for m in mock_slots.messages
+    ]
+    assert events == [
+        ("clear",),
+        ("add", 0, 0),
+        ("add", 0, 0),
+        ("add", 1, 1),
+        ("add", 1, 1),
+        ("execute", 0),
+        ("execute", 1),
+        ("add", 0, 2),
+        ("add", 0, 2),
+        ("execute", 0),
+        ("add", 1, 3),
+        ("add", 1, 3),
+        ("execute", 1),
+        ("add", 0, 4),
+        ("add", 0, 4),
+        ("execute", 0),
+    ]
+    assert position == {NodeId.gantry_x: 0.004, NodeId.gantry_y: 0.004}
+    assert [t.group_id for t in subject.timings] == [0, 1, 0, 1, 0]
+    assert not any(t.timed_out for t in subject.timings)
+
+
+async def test_pipelined_start_at_index() -> None:
+    """It should stream move groups through ids starting at start_at_index."""
+    move_groups = _build_numbered_groups(3)
+    mock_slots = MockMoveGroupSlots()
+    mock_can_messenger = MagicMock()
+    mock_can_messenger.send = AsyncMock(side_effect=mock_slots.mock_send)
+    mock_can_messenger.add_listener.side_effect = mock_slots.add_listener
+    subject = MoveGroupRunner(
+        move_groups=move_groups, start_at_index=2, pipeline_depth=2
+    )
+
+    position = await subject.run(mock_can_messenger)
+
+    assert [
+        m.payload.group_id.value
+        for m in mock_slots.messages
+        if isinstance(m, md.ExecuteMoveGroupRequest)
+    ] == [2, 3, 2]
+    assert position == {NodeId.gantry_x: 0.002, NodeId.gantry_y: 0.002}
+
+
+async def test_timings(move_group_multiple: MoveGroups) -> None:
+    """It should record the timing of each move group."""
+    subject = MoveGroupRunner(move_groups=move_group_multiple)
+    mock_sender = MockSendMoveCompleter(move_group_multiple, MagicMock())
+    mock_can_messenger = MagicMock()
+    mock_can_messenger.send = AsyncMock(side_effect=mock_sender.mock_send)
+    mock_can_messenger.add_listener.side_effect = lambda listener, **kwargs: setattr(
+        mock_sender, "_listener", listener
+    )
+
+    await subject.run(mock_can_messenger)
+
+    assert [t.index for t in subject.timings] == [0, 1, 2]
+    assert [t.expected_duration for t in subject.timings] == [2142, 1, 2468]
+    for timing in subject.timings:
+        assert timing.send_duration >= 0
+        assert timing.execute_delay >= 0
+        assert timing.ack_latency >= 0
+        assert not timing.timed_out
+
+
+def test_pipeline_too_shallow() -> None:
+    """It should reject pipelines that can't refill ahead of execution."""
+    with pytest.raises(ValueError):
+        MoveGroupRunner(move_groups=[], pipeline_depth=1)
@@ -448,6 +448,57 @@ def test_blend_motion() -> None:
     assert all_blended(CONSTRAINTS, blend_log[-1])
 
 
+def test_build_computed() -> None:
+    """Building from computed values should match building with constructors."""
+    blocks = (
+        Block(distance=2, initial_speed=0, acceleration=4),
+        Block(distance=3, initial_speed=4, acceleration=0),
+        Block(distance=0, initial_speed=4, acceleration=-4),
+    )
+    move = Move.build(
+        unit_vector={"X": 0.6, "Y": 0.8},
+        distance=5,
+        max_speed=4,
+        blocks=blocks,
+    )
+
+    computed_blocks = (
+        Block.build_computed(
+            distance=np.float64(2),
+            initial_speed=np.float64(0),
+            acceleration=np.float64(4),
+            final_speed=np.float64(4),
+            time=np.float64(1),
+        ),
+        Block.build_computed(
+            distance=np.float64(3),
+            initial_speed=np.float64(4),
+            acceleration=np.float64(0),
+            final_speed=np.float64(4),
+            time=np.float64(0.75),
+        ),
+        Block.build_computed(
+            distance=np.float64(0),
+            initial_speed=np.float64(4),
+            acceleration=np.float64(-4),
+            final_speed=np.float64(4),
+            time=np.float64(0),
+        ),
+    )
+    computed_move = Move.build_computed(
+        unit_vector={"X": np.float64(0.6), "Y": np.float64(0.8)},
+        distance=np.float64(5),
+        max_speed=np.float64(4),
+        blocks=computed_blocks,
+        initial_speed=np.float64(0),
+        final_speed=np.float64(4),
+        nonzero_blocks=2,
+    )
+
+    assert computed_blocks == blocks
+    assert computed_move == move
+
+
 coords = st.lists(st.floats(min_value=0, max_value=1e64), min_size=4, max_size=4)
 
 
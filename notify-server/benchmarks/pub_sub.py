@@ -0,0 +1,170 @@
+"""Benchmark publishing events through the notify-server to many subscribers.
+
+Runs the server, the publisher, and N subscribers to one topic in separate
+processes, publishes events at a fixed rate, and reports:
+
+- throughput: events delivered per second, summed over all subscribers.
+- latency: time from publishing an event to a subscriber receiving it.
+- loss: events the server dropped or coalesced, or ZMQ dropped for slow
+  subscribers.
+
+Subscribers read raw frames instead of parsing each event, so the benchmark
+measures the server rather than the subscribers.
+
+Pass `--max-batch-size 1` to publish one message per wake-up, like the server
+used to.
+
+Usage:
+
+    python benchmarks/pub_sub.py --subscribers 10 --events 5000 --rate 2000
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, List
+
+import zmq  # type: ignore
+
+from notify_server.clients import publisher
+from notify_server.models.event import Event
+from notify_server.models.payload_type import UserData
+from notify_server.server import server
+from notify_server.settings import ServerBindAddress, Settings
+
+_TOPIC = "benchmark"
+_IDLE_TIMEOUT_MS = 1000
+
+
+def _run_server(settings: Settings) -> None:
+    asyncio.run(server.run(settings))
+
+
+def _run_subscribers(
+    address: str, count: int, events: int, ready: Any, results: Any
+) -> None:
+    context = zmq.Context.instance()
+    poller = zmq.Poller()
+    sockets = []
+    for _ in range(count):
+        socket = context.socket(zmq.SUB)
+        socket.connect(address)
+        socket.subscribe(_TOPIC)
+        poller.register(socket, zmq.POLLIN)
+        sockets.append(socket)
+
+    # Give the subscribers time to connect, or ZMQ drops the first events.
+    time.sleep(0.5)
+    ready.set()
+
+    latencies: List[float] = []
+    while len(latencies) < count * events:
+        polled = poller.poll(_IDLE_TIMEOUT_MS)
+        if not polled:
+            break
+        for socket, _ in polled:
+            frames = socket.recv_multipart()
+            sent = json.loads(frames[1])["data"]["data"]["sent"]
+            latencies.append(time.perf_counter() - sent)
+
+    last_received = time.perf_counter() - (0 if polled else _IDLE_TIMEOUT_MS / 1000)
+    results.put((latencies, last_received))
+
+    for socket in sockets:
+        socket.close()
+    context.term()
+
+
+async def _publish(address: str, events: int, rate: int) -> float:
+    pub = publisher.create(address)
+    start = time.perf_counter()
+
+    for i in range(events):
+        # Pace the publisher, sleeping whenever it gets ahead of schedule.
+        ahead = start + i / rate - time.perf_counter()
+        if ahead > 0:
+            await asyncio.sleep(ahead)
+        await pub.send(
+            _TOPIC,
+            Event(
+                createdOn=datetime.now(tz=timezone.utc),
+                publisher="benchmark",
+                data=UserData(data={"sent": time.perf_counter()}),
+            ),
+        )
+
+    pub.close()
+    return start
+
+
+def _main(subscribers: int, events: int, rate: int, max_batch_size: int) -> None:
+    with TemporaryDirectory() as tmp_dir:
+        settings = Settings(
+            publisher_address=ServerBindAddress(
+                scheme="ipc", path=str(Path(tmp_dir) / "publisher")
+            ),
+            subscriber_address=ServerBindAddress(
+                scheme="ipc", path=str(Path(tmp_dir) / "subscriber")
+            ),
+            max_queue_size=events,
+            max_batch_size=max_batch_size,
+            coalesced_topics=[],
+        )
+        server_process = multiprocessing.Process(target=_run_server, args=(settings,))
+        server_process.start()
+
+        ready = multiprocessing.Event()
+        results: Any = multiprocessing.Queue()
+        subscriber_process = multiprocessing.Process(
+            target=_run_subscribers,
+            args=(
+                settings.subscriber_address.connection_string(),
+                subscribers,
+                events,
+                ready,
+                results,
+            ),
+        )
+        subscriber_process.start()
+        ready.wait()
+
+        start = asyncio.run(
+            _publish(settings.publisher_address.connection_string(), events, rate)
+        )
+        latencies, last_received = results.get()
+        subscriber_process.join()
+        server_process.terminate()
+        server_process.join()
+
+    latencies.sort()
+    expected = events * subscribers
+    print(
+        f"{subscribers} subscribers, {events} events at {rate}/s,"
+        f" max batch size {max_batch_size}"
+    )
+    print(f"throughput   {len(latencies) / (last_received - start):10.0f} events/s")
+    print(
+        f"latency      median {statistics.median(latencies) * 1000:8.2f} ms"
+        f"   p99 {latencies[int(len(latencies) * 0.99)] * 1000:8.2f} ms"
+    )
+    print(f"lost         {expected - len(latencies):10d} of {expected}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=10)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--rate", type=int, default=2000, help="events per second")
+    parser.add_argument("--max-batch-size", type=int, default=100)
+    args = parser.parse_args()
+    _main(
+        subscribers=args.subscribers,
+        events=args.events,
+        rate=args.rate,
+        max_batch_size=args.max_batch_size,
+    )
@@ -0,0 +1,94 @@
+"""A bounded queue of multipart messages that is read in batches."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Collection, Hashable, List
+
+log = logging.getLogger(__name__)
+
+Frames = List[bytes]
+
+
+class BatchQueue:
+    """A bounded FIFO queue of multipart messages: topic, data.
+
+    Messages are read out in batches, so the publishing task can send everything
+    that piled up while it was busy with one wake-up.
+
+    Putting a message never blocks the receiving task:
+
+    - When the queue is full, the oldest message is dropped to make room.
+    - A message on a coalesced topic replaces a message on the same topic that
+      is still waiting to be sent. This is meant for high-rate topics where
+      subscribers only care about the latest event. It only takes effect when
+      the queue is backed up; otherwise, every message is sent.
+    """
+
+    def __init__(self, maxsize: int, coalesced_topics: Collection[str] = ()) -> None:
+        """Construct.
+
+        :param maxsize: The most messages to hold before dropping the oldest.
+        :param coalesced_topics: Topics whose pending messages get replaced by
+            newer ones.
+        """
+        self._maxsize = maxsize
+        self._coalesced_topics = frozenset(t.encode("utf-8") for t in coalesced_topics)
+        # Coalesced messages are keyed by their topic, others by a unique counter.
+        self._messages: "OrderedDict[Hashable, Frames]" = OrderedDict()
+        self._next_key = 0
+        self._not_empty = asyncio.Event()
+        self._dropping = False
+        self.dropped_count = 0
+        self.coalesced_count = 0
+
+    def __len__(self) -> int:
+        """Get the number of messages waiting to be sent."""
+        return len(self._messages)
+
+    def put_nowait(self, frames: Frames) -> None:
+        """Enqueue a message, dropping or replacing another one if needed."""
+        topic = frames[0] if frames else b""
+        key: Hashable
+
+        if topic in self._coalesced_topics:
+            key = topic
+            if key in self._messages:
+                # Keep arrival order: the replacement goes after everything
+                # that was received before it.
+                self._messages.move_to_end(key)
+                self.coalesced_count += 1
+        else:
+            key = self._next_key
+            self._next_key += 1
+
+        if key not in self._messages and len(self._messages) >= self._maxsize:
+            self._messages.popitem(last=False)
+            self.dropped_count += 1
+            if not self._dropping:
+                # Warn once per backlog instead of once per message.
+                self._dropping = True
+                log.warning(
+                    "Queue full, dropping oldest messages"
+                    " (%d dropped since startup).",
+                    self.dropped_count,
+                )
+
+        self._messages[key] = frames
+        self._not_empty.set()
+
+    async def get_batch(self, max_size: int) -> List[Frames]:
+        """Wait for at least one message, then dequeue up to `max_size` of them."""
+        while not self._messages:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        batch: List[Frames] = []
+        while self._messages and len(batch) < max_size:
+            batch.append(self._messages.popitem(last=False)[1])
+
+        if not self._messages:
+            self._dropping = False
+
+        return batch
@@ -2,15 +2,15 @@
 
 import logging
 import asyncio
-from asyncio import Queue
 
 from notify_server.network.connection import create_publisher, create_pull, Connection
+from notify_server.server.batch_queue import BatchQueue
 from notify_server.settings import Settings
 
 log = logging.getLogger(__name__)
 
 
-async def _publisher_server_task(connection: Connection, queue: Queue) -> None:
+async def _publisher_server_task(connection: Connection, queue: BatchQueue) -> None:
     """
     Run a task that reads multipart messages: topic, data.
 
@@ -25,26 +25,30 @@ async def _publisher_server_task(connection: Connection, queue: Queue) -> None:
         while True:
             m = await connection.recv_multipart()
             log.debug("Event: %s", m)
-            await queue.put(m)
+            queue.put_nowait(m)
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
         connection.close()
 
 
-async def _subscriber_server_task(connection: Connection, queue: Queue) -> None:
+async def _subscriber_server_task(
+    connection: Connection, queue: BatchQueue, max_batch_size: int
+) -> None:
     """
     Run a task that publishes messages to subscribers.
 
     :param connection: The network connection.
     :param queue: The queue of multipart messages to send
+    :param max_batch_size: The most messages to send per wake-up.
     :return: None
     """
     try:
         while True:
-            s = await queue.get()
-            log.debug("Publishing: %s", s)
-            await connection.send_multipart(s)
+            batch = await queue.get_batch(max_batch_size)
+            log.debug("Publishing %d messages", len(batch))
+            for s in batch:
+                await connection.send_multipart(s)
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
@@ -53,11 +57,16 @@ async def _subscriber_server_task(connection: Connection, queue: Queue) -> None:
 
 async def run(settings: Settings) -> None:
     """Run the server tasks. Will not return."""
-    queue: Queue = Queue()
+    queue = BatchQueue(
+        maxsize=settings.max_queue_size,
+        coalesced_topics=settings.coalesced_topics,
+    )
 
     subtask = asyncio.create_task(
         _subscriber_server_task(
-            create_publisher(settings.subscriber_address.connection_string()), queue
+            create_publisher(settings.subscriber_address.connection_string()),
+            queue,
+            settings.max_batch_size,
         )
     )
     pubtask = asyncio.create_task(
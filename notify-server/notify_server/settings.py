@@ -1,8 +1,12 @@
 """Settings class."""
 
+from typing import List
+
 from typing_extensions import Literal
 from pydantic import BaseSettings, BaseModel, Field
 
+from notify_server.models.topics import RobotEventTopics
+
 
 class ServerBindAddress(BaseModel):
     """A bind address for server zmq socket."""
@@ -33,6 +37,23 @@ class Settings(BaseSettings):
         "development environment",
     )
 
+    max_queue_size: int = Field(
+        1000,
+        gt=0,
+        description="The most messages to hold for subscribers. When full, the "
+        "oldest message is dropped.",
+    )
+    max_batch_size: int = Field(
+        100,
+        gt=0,
+        description="The most queued messages to publish at once.",
+    )
+    coalesced_topics: List[str] = Field(
+        [RobotEventTopics.HARDWARE_EVENTS.value],
+        description="High-rate topics on which only the latest queued message "
+        "is published when subscribers fall behind.",
+    )
+
     class Config:
         """Configuration for settings class."""
 
@@ -0,0 +1,77 @@
+"""Batch queue unit tests."""
+import asyncio
+
+import pytest
+
+from notify_server.server.batch_queue import BatchQueue
+
+pytestmark = pytest.mark.asyncio
+
+
+def _frames(topic: str, data: str) -> list:
+    return [topic.encode("utf-8"), data.encode("utf-8")]
+
+
+async def test_get_batch_in_order() -> None:
+    """It should return queued messages in order, up to the batch size."""
+    queue = BatchQueue(maxsize=10)
+    for i in range(5):
+        queue.put_nowait(_frames("topic", str(i)))
+
+    assert await queue.get_batch(3) == [_frames("topic", str(i)) for i in range(3)]
+    assert await queue.get_batch(3) == [_frames("topic", str(i)) for i in (3, 4)]
+    assert len(queue) == 0
+
+
+async def test_get_batch_waits() -> None:
+    """It should wait for a message if the queue is empty."""
+    queue = BatchQueue(maxsize=10)
+    task = asyncio.ensure_future(queue.get_batch(10))
+
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    queue.put_nowait(_frames("topic", "data"))
+    assert await task == [_frames("topic", "data")]
+
+
+async def test_drop_oldest_when_full() -> None:
+    """It should drop the oldest message to make room for a new one."""
+    queue = BatchQueue(maxsize=2)
+    for i in range(4):
+        queue.put_nowait(_frames("topic", str(i)))
+
+    assert queue.dropped_count == 2
+    assert await queue.get_batch(10) == [_frames("topic", "2"), _frames("topic", "3")]
+
+
+async def test_coalesce_topic() -> None:
+    """It should replace a pending message on a coalesced topic with the latest."""
+    queue = BatchQueue(maxsize=10, coalesced_topics=["fast"])
+    queue.put_nowait(_frames("fast", "0"))
+    queue.put_nowait(_frames("slow", "0"))
+    queue.put_nowait(_frames("fast", "1"))
+    queue.put_nowait(_frames("slow", "1"))
+    queue.put_nowait(_frames("fast", "2"))
+
+    assert queue.coalesced_count == 2
+    assert await queue.get_batch(10) == [
+        _frames("slow", "0"),
+        _frames("slow", "1"),
+        _frames("fast", "2"),
+    ]
+
+    # Once sent, the next message on the topic is queued again.
+    queue.put_nowait(_frames("fast", "3"))
+    assert await queue.get_batch(10) == [_frames("fast", "3")]
+
+
+async def test_coalesce_does_not_drop() -> None:
+    """It should not drop anything to replace a pending coalesced message."""
+    queue = BatchQueue(maxsize=2, coalesced_topics=["fast"])
+    queue.put_nowait(_frames("slow", "0"))
+    queue.put_nowait(_frames("fast", "0"))
+    queue.put_nowait(_frames("fast", "1"))
+
+    assert queue.dropped_count == 0
+    assert await queue.get_batch(10) == [_frames("slow", "0"), _frames("fast", "1")]
@@ -0,0 +1,129 @@
+"""Benchmark loading stored protocol analyses.
+
+Compares, for a single stored analysis with many commands:
+
+- The schema v2 storage format: unpickle a dict, then `CompletedAnalysis.parse_obj`.
+- The current storage format, parsed: `AnalysisStore.get_by_protocol`.
+- The current storage format, unparsed: `AnalysisStore.get_by_protocol_as_document`,
+  which is what `GET /protocols/{id}/analyses` uses.
+
+Usage:
+
+    python benchmarks/analysis_store_load.py --commands 10000 --repeat 5
+"""
+import argparse
+import asyncio
+import pickle
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Awaitable, Callable, List
+
+from opentrons.protocol_engine import commands as pe_commands
+from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
+
+from robot_server.persistence.database import create_sql_engine
+from robot_server.protocols.analysis_models import CompletedAnalysis
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.protocol_store import ProtocolStore, ProtocolResource
+
+
+def _make_commands(count: int) -> List[pe_commands.Command]:
+    return [
+        pe_commands.WaitForResume(
+            id=f"command-{i}",
+            key=f"command-key-{i}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime.now(tz=timezone.utc),
+            startedAt=datetime.now(tz=timezone.utc),
+            completedAt=datetime.now(tz=timezone.utc),
+            params=pe_commands.WaitForResumeParams(message=f"pause {i}"),
+            result=pe_commands.WaitForResumeResult(),
+        )
+        for i in range(count)
+    ]
+
+
+async def _time(repeat: int, func: Callable[[], Awaitable[object]]) -> List[float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _report(name: str, durations: List[float]) -> None:
+    print(
+        f"{name:<32}"
+        f" median {statistics.median(durations) * 1000:9.1f} ms"
+        f"   min {min(durations) * 1000:9.1f} ms"
+    )
+
+
+async def _main(command_count: int, repeat: int) -> None:
+    with TemporaryDirectory() as tmp_dir:
+        sql_engine = create_sql_engine(Path(tmp_dir) / "benchmark.db")
+        protocol_store = ProtocolStore.create_empty(sql_engine=sql_engine)
+        analysis_store = AnalysisStore(sql_engine=sql_engine)
+
+        await protocol_store.insert(
+            ProtocolResource(
+                protocol_id="protocol-id",
+                created_at=datetime.now(tz=timezone.utc),
+                source=ProtocolSource(
+                    directory=Path(tmp_dir),
+                    main_file=Path(tmp_dir) / "protocol.json",
+                    config=JsonProtocolConfig(schema_version=6),
+                    files=[],
+                    metadata={},
+                    labware_definitions=[],
+                ),
+                protocol_key=None,
+            )
+        )
+
+        commands = _make_commands(command_count)
+        analysis_store.add_pending(protocol_id="protocol-id", analysis_id="a-id")
+        await analysis_store.update(
+            analysis_id="a-id",
+            commands=commands,
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+
+        legacy_pickle = pickle.dumps(
+            (await analysis_store.get_by_protocol("protocol-id"))[0].dict()
+        )
+
+        async def load_legacy() -> object:
+            return CompletedAnalysis.parse_obj(pickle.loads(legacy_pickle))
+
+        async def load_parsed() -> object:
+            return await analysis_store.get_by_protocol("protocol-id")
+
+        async def load_document() -> object:
+            return await analysis_store.get_by_protocol_as_document("protocol-id")
+
+        stored_size = len(
+            sql_engine.execute("SELECT completed_analysis FROM analysis").one()[0]
+        )
+        print(f"{command_count} commands, {repeat} repetitions")
+        print(f"pickled size {len(legacy_pickle) / 1024:.0f} KiB")
+        print(f"stored size  {stored_size / 1024:.0f} KiB")
+        _report("v2 format (pickle + parse_obj)", await _time(repeat, load_legacy))
+        _report("get_by_protocol", await _time(repeat, load_parsed))
+        _report("get_by_protocol_as_document", await _time(repeat, load_document))
+
+        sql_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_main(command_count=args.commands, repeat=args.repeat))
@@ -0,0 +1,192 @@
+"""Benchmark sending notify-server events to many notification websockets.
+
+Compares, for N websockets listening to the same topic:
+
+- per-socket: each websocket opens its own notify-server subscriber and
+  serializes every event itself, like the notifications router used to.
+- fan-out: every websocket shares one subscriber per topic through
+  `EventFanout`, which serializes each event once.
+
+The notify-server and the publisher run in their own processes, so only the
+robot-server side is measured. Websockets are stand-ins that record when each
+message was sent to them.
+
+Usage:
+
+    python benchmarks/notification_fanout.py --websockets 20 --events 2000 --rate 500
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, AsyncIterator, List, Tuple
+
+from notify_server.clients import publisher, subscriber
+from notify_server.models.event import Event
+from notify_server.models.payload_type import UserData
+from notify_server.server import server
+from notify_server.settings import ServerBindAddress, Settings
+
+from robot_server.service.notifications.event_fanout import EventFanout
+
+_TOPIC = "benchmark"
+_IDLE_TIMEOUT_SEC = 1.0
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: List[Tuple[float, str]] = []
+
+    async def send_text(self, message: str) -> None:
+        self.sent.append((time.perf_counter(), message))
+
+
+def _run_server(settings: Settings) -> None:
+    asyncio.run(server.run(settings))
+
+
+def _run_publisher(address: str, events: int, rate: int, start: Any) -> None:
+    async def publish() -> None:
+        pub = publisher.create(address)
+        start.wait()
+        begin = time.perf_counter()
+        for i in range(events):
+            ahead = begin + i / rate - time.perf_counter()
+            if ahead > 0:
+                await asyncio.sleep(ahead)
+            await pub.send(
+                _TOPIC,
+                Event(
+                    createdOn=datetime.now(tz=timezone.utc),
+                    publisher="benchmark",
+                    data=UserData(data={"sent": time.perf_counter()}),
+                ),
+            )
+        pub.close()
+
+    asyncio.run(publish())
+
+
+async def _until_idle(messages: AsyncIterator[str], websocket: _FakeWebSocket) -> None:
+    while True:
+        try:
+            message = await asyncio.wait_for(messages.__anext__(), _IDLE_TIMEOUT_SEC)
+        except asyncio.TimeoutError:
+            return
+        await websocket.send_text(message)
+
+
+async def _per_socket(
+    address: str, websockets: List[_FakeWebSocket], ready: asyncio.Event
+) -> None:
+    subscribers = [subscriber.create(address, [_TOPIC]) for _ in websockets]
+
+    async def serialize(sub: subscriber.Subscriber) -> AsyncIterator[str]:
+        async for entry in sub:
+            yield entry.json()
+
+    ready.set()
+    await asyncio.gather(
+        *(
+            _until_idle(serialize(sub), websocket)
+            for sub, websocket in zip(subscribers, websockets)
+        )
+    )
+    for sub in subscribers:
+        sub.close()
+
+
+async def _fanout(
+    address: str, websockets: List[_FakeWebSocket], ready: asyncio.Event
+) -> None:
+    fanout = EventFanout(address)
+    listeners = [fanout.listen([_TOPIC]) for _ in websockets]
+    opened = [listener.__enter__() for listener in listeners]
+
+    ready.set()
+    await asyncio.gather(
+        *(
+            _until_idle(listener, websocket)
+            for listener, websocket in zip(opened, websockets)
+        )
+    )
+    for listener in listeners:
+        listener.__exit__(None, None, None)
+
+
+async def _measure(
+    mode: str, settings: Settings, websocket_count: int, events: int, rate: int
+) -> None:
+    websockets = [_FakeWebSocket() for _ in range(websocket_count)]
+    ready = asyncio.Event()
+    start = multiprocessing.Event()
+    publisher_process = multiprocessing.Process(
+        target=_run_publisher,
+        args=(settings.publisher_address.connection_string(), events, rate, start),
+    )
+    publisher_process.start()
+
+    route = _per_socket if mode == "per-socket" else _fanout
+    task = asyncio.create_task(
+        route(settings.subscriber_address.connection_string(), websockets, ready)
+    )
+    await ready.wait()
+    # Give the subscribers time to connect, or ZMQ drops the first events.
+    await asyncio.sleep(0.5)
+
+    begin = time.perf_counter()
+    start.set()
+    await task
+    publisher_process.join()
+
+    received = [
+        (received_at, json.loads(message)["event"]["data"]["data"]["sent"])
+        for websocket in websockets
+        for received_at, message in websocket.sent
+    ]
+    latencies = sorted(received_at - sent for received_at, sent in received)
+    last_received = max(received_at for received_at, _ in received)
+    expected = events * websocket_count
+
+    print(
+        f"{mode:<12}"
+        f" {len(latencies) / (last_received - begin):9.0f} messages/s"
+        f"   latency median {statistics.median(latencies) * 1000:8.2f} ms"
+        f"   p99 {latencies[int(len(latencies) * 0.99)] * 1000:8.2f} ms"
+        f"   lost {expected - len(latencies)} of {expected}"
+    )
+
+
+def _main(websockets: int, events: int, rate: int) -> None:
+    with TemporaryDirectory() as tmp_dir:
+        settings = Settings(
+            publisher_address=ServerBindAddress(
+                scheme="ipc", path=str(Path(tmp_dir) / "publisher")
+            ),
+            subscriber_address=ServerBindAddress(
+                scheme="ipc", path=str(Path(tmp_dir) / "subscriber")
+            ),
+        )
+        server_process = multiprocessing.Process(target=_run_server, args=(settings,))
+        server_process.start()
+
+        print(f"{websockets} websockets, {events} events at {rate}/s")
+        for mode in ("per-socket", "fan-out"):
+            asyncio.run(_measure(mode, settings, websockets, events, rate))
+
+        server_process.terminate()
+        server_process.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--websockets", type=int, default=20)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--rate", type=int, default=500, help="events per second")
+    args = parser.parse_args()
+    _main(websockets=args.websockets, events=args.events, rate=args.rate)
@@ -0,0 +1,136 @@
+"""Benchmark rehydrating a ProtocolStore at server startup.
+
+Compares, for many stored Python protocols:
+
+- Eager rehydration: `ProtocolStore.rehydrate()` reads every protocol's files
+  before returning, so the server can't answer requests until it's done.
+- Lazy rehydration: `ProtocolStore.rehydrate(lazy=True)` only reads protocol IDs,
+  then each protocol's files are read by the first `get()` for it.
+
+Usage:
+
+    python benchmarks/protocol_store_rehydration.py --protocols 100 --repeat 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Awaitable, Callable, List
+
+from opentrons.protocol_reader import ProtocolReader
+
+from robot_server.persistence.database import create_sql_engine
+from robot_server.protocols.protocol_store import ProtocolStore, ProtocolResource
+
+
+_PROTOCOL_TEMPLATE = """
+metadata = {{"apiLevel": "2.11", "protocolName": "Protocol {index}"}}
+
+
+def run(protocol):
+{body}
+"""
+
+
+async def _save_protocols(
+    protocol_store: ProtocolStore,
+    protocols_directory: Path,
+    protocol_reader: ProtocolReader,
+    count: int,
+    steps: int,
+) -> None:
+    body = "\n".join(f"    protocol.comment('step {i}')" for i in range(steps))
+
+    for index in range(count):
+        protocol_id = f"protocol-{index}"
+        directory = protocols_directory / protocol_id
+        directory.mkdir()
+        main_file = directory / "protocol.py"
+        main_file.write_text(_PROTOCOL_TEMPLATE.format(index=index, body=body))
+
+        await protocol_store.insert(
+            ProtocolResource(
+                protocol_id=protocol_id,
+                created_at=datetime.now(tz=timezone.utc),
+                source=await protocol_reader.read_saved(
+                    files=[main_file], directory=directory
+                ),
+                protocol_key=None,
+            )
+        )
+
+
+async def _time(repeat: int, func: Callable[[], Awaitable[object]]) -> List[float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _report(name: str, durations: List[float]) -> None:
+    print(
+        f"{name:<32}"
+        f" median {statistics.median(durations) * 1000:9.1f} ms"
+        f"   min {min(durations) * 1000:9.1f} ms"
+    )
+
+
+async def _main(protocol_count: int, steps: int, repeat: int) -> None:
+    with TemporaryDirectory() as tmp_dir:
+        sql_engine = create_sql_engine(Path(tmp_dir) / "benchmark.db")
+        protocols_directory = Path(tmp_dir) / "protocols"
+        protocols_directory.mkdir()
+        protocol_reader = ProtocolReader()
+
+        await _save_protocols(
+            protocol_store=ProtocolStore.create_empty(sql_engine=sql_engine),
+            protocols_directory=protocols_directory,
+            protocol_reader=protocol_reader,
+            count=protocol_count,
+            steps=steps,
+        )
+
+        async def rehydrate(lazy: bool) -> ProtocolStore:
+            return await ProtocolStore.rehydrate(
+                sql_engine=sql_engine,
+                protocols_directory=protocols_directory,
+                protocol_reader=protocol_reader,
+                lazy=lazy,
+            )
+
+        async def rehydrate_lazy_and_get_one() -> object:
+            protocol_store = await rehydrate(lazy=True)
+            return await protocol_store.get("protocol-0")
+
+        async def rehydrate_lazy_and_warm() -> None:
+            protocol_store = await rehydrate(lazy=True)
+            await protocol_store.warm_source_cache()
+
+        print(f"{protocol_count} protocols, {steps} steps each, {repeat} repetitions")
+        _report("eager rehydrate", await _time(repeat, lambda: rehydrate(False)))
+        _report("lazy rehydrate", await _time(repeat, lambda: rehydrate(True)))
+        _report(
+            "lazy rehydrate + first get",
+            await _time(repeat, rehydrate_lazy_and_get_one),
+        )
+        _report(
+            "lazy rehydrate + warm cache", await _time(repeat, rehydrate_lazy_and_warm)
+        )
+
+        sql_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--protocols", type=int, default=100)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(
+        _main(protocol_count=args.protocols, steps=args.steps, repeat=args.repeat)
+    )
@@ -0,0 +1,206 @@
+"""Benchmark reading runs from a RunStore while other runs are being saved.
+
+Simulates the robot's app polling the run list and a run's command pages
+while end-of-run saves write thousands of commands, and reports:
+
+- read latency: how long each `get_all` and `get_commands_slice` took.
+- event loop lag: how late a task that wakes up every 10 ms was woken up,
+  which is how long the database blocked every other request.
+
+Pass `--journal-mode delete` to compare against SQLite's default rollback journal,
+in which writers and readers block each other. Pass `--in-event-loop` to run
+every transaction directly on the event loop, like RunStore used to.
+
+Usage:
+
+    python benchmarks/run_store_load.py --runs 20 --commands 5000 --readers 4
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, Dict, List, TypeVar
+
+import sqlalchemy
+
+from opentrons.protocol_engine import (
+    StateSummary,
+    EngineStatus,
+    commands as pe_commands,
+)
+
+from robot_server.persistence import database
+from robot_server.persistence.database import create_sql_engine
+from robot_server.runs import run_store as run_store_module
+from robot_server.runs.run_store import RunStore
+
+
+_TICK_SEC = 0.01
+
+_ResultT = TypeVar("_ResultT")
+
+
+def _make_commands(run_index: int, count: int) -> List[pe_commands.Command]:
+    return [
+        pe_commands.WaitForResume(
+            id=f"run-{run_index}-command-{i}",
+            key=f"command-key-{i}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime.now(tz=timezone.utc),
+            startedAt=datetime.now(tz=timezone.utc),
+            completedAt=datetime.now(tz=timezone.utc),
+            params=pe_commands.WaitForResumeParams(message=f"pause {i}"),
+            result=pe_commands.WaitForResumeResult(),
+        )
+        for i in range(count)
+    ]
+
+
+def _make_summary() -> StateSummary:
+    return StateSummary(
+        status=EngineStatus.SUCCEEDED,
+        errors=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        labwareOffsets=[],
+    )
+
+
+async def _save_runs(
+    run_store: RunStore,
+    commands_by_index: Dict[int, List[pe_commands.Command]],
+    durations: List[float],
+) -> None:
+    summary = _make_summary()
+    for run_index, run_commands in commands_by_index.items():
+        run_id = f"run-{run_index}"
+        await run_store.insert(
+            run_id=run_id, created_at=datetime.now(tz=timezone.utc), protocol_id=None
+        )
+        start = time.perf_counter()
+        await run_store.update_run_state(
+            run_id=run_id, summary=summary, commands=run_commands
+        )
+        durations.append(time.perf_counter() - start)
+        # Let readers in between saves, as the server would between runs.
+        await asyncio.sleep(_TICK_SEC)
+
+
+async def _read_runs(
+    run_store: RunStore,
+    stop: asyncio.Event,
+    durations: List[float],
+    once: bool = False,
+) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        runs = await run_store.get_all()
+        for run in runs[-3:]:
+            await run_store.get_commands_slice(run_id=run.run_id, cursor=0, length=20)
+        durations.append(time.perf_counter() - start)
+        if once:
+            return
+        await asyncio.sleep(0)
+
+
+async def _measure_lag(stop: asyncio.Event, lags: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(_TICK_SEC)
+        lags.append(time.perf_counter() - start - _TICK_SEC)
+
+
+def _report(name: str, durations: List[float]) -> None:
+    if not durations:
+        print(f"{name:<24} n      0")
+        return
+
+    durations = sorted(durations)
+    p99 = durations[min(len(durations) - 1, int(len(durations) * 0.99))]
+    print(
+        f"{name:<24}"
+        f" n {len(durations):6}"
+        f"   median {statistics.median(durations) * 1000:8.1f} ms"
+        f"   p99 {p99 * 1000:8.1f} ms"
+        f"   max {durations[-1] * 1000:8.1f} ms"
+    )
+
+
+async def _run_in_event_loop(
+    sql_engine: sqlalchemy.engine.Engine,
+    func: Callable[[sqlalchemy.engine.Connection], _ResultT],
+) -> _ResultT:
+    return database._run_transaction(sql_engine, func)
+
+
+async def _main(
+    runs: int, commands: int, readers: int, journal_mode: str, in_event_loop: bool
+) -> None:
+    if in_event_loop:
+        setattr(run_store_module, "run_in_thread", _run_in_event_loop)
+
+    with TemporaryDirectory() as tmp_dir:
+        sql_engine = create_sql_engine(Path(tmp_dir) / "benchmark.db")
+
+        with sql_engine.connect() as connection:
+            connection.exec_driver_sql(f"PRAGMA journal_mode={journal_mode};")
+
+        run_store = RunStore(sql_engine=sql_engine)
+        stop = asyncio.Event()
+        write_durations: List[float] = []
+        read_durations: List[float] = []
+        lags: List[float] = []
+
+        # Seed one run so readers have something to page through from the start.
+        await _save_runs(run_store, {0: _make_commands(0, commands)}, [])
+        # Warm up one-time costs, like building pydantic's command parsers.
+        await _read_runs(run_store, asyncio.Event(), [], once=True)
+
+        # Build every run's commands up front, so building them doesn't count as lag.
+        commands_by_index = {i: _make_commands(i, commands) for i in range(1, runs + 1)}
+
+        lag_task = asyncio.create_task(_measure_lag(stop, lags))
+        reader_tasks = [
+            asyncio.create_task(_read_runs(run_store, stop, read_durations))
+            for _ in range(readers)
+        ]
+
+        start = time.perf_counter()
+        await _save_runs(run_store, commands_by_index, write_durations)
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await asyncio.gather(lag_task, *reader_tasks)
+
+        print(
+            f"journal_mode={journal_mode}, in_event_loop={in_event_loop},"
+            f" {runs} runs x {commands} commands, {readers} readers, {elapsed:.1f} s"
+        )
+        _report("end-of-run save", write_durations)
+        _report("run list + command pages", read_durations)
+        _report("event loop lag", lags)
+
+        sql_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--commands", type=int, default=5000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--journal-mode", choices=["wal", "delete"], default="wal")
+    parser.add_argument("--in-event-loop", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(
+        _main(
+            runs=args.runs,
+            commands=args.commands,
+            readers=args.readers,
+            journal_mode=args.journal_mode,
+            in_event_loop=args.in_event_loop,
+        )
+    )
@@ -10,10 +10,12 @@ from .errors import exception_handlers
 from .hardware import initialize_hardware, cleanup_hardware
 from .router import router
 from .service import initialize_logging
+from .service.notifications.event_fanout import clean_up_event_fanout
 from .service.task_runner import (
     initialize_task_runner,
     clean_up_task_runner,
 )
+from .protocols.dependencies import clean_up_analysis_worker_pool
 from .settings import get_settings
 
 log = logging.getLogger(__name__)
@@ -63,6 +65,8 @@ async def on_shutdown() -> None:
     shutdown_results = await asyncio.gather(
         cleanup_hardware(app.state),
         clean_up_task_runner(app.state),
+        clean_up_analysis_worker_pool(app.state),
+        clean_up_event_fanout(app.state),
         return_exceptions=True,
     )
 
@@ -29,6 +29,27 @@ class HealthLinks(BaseModel):
     )
 
 
+class ProtocolAnalysisCacheStats(BaseModel):
+    """Usage statistics of the cache of completed protocol analyses."""
+
+    hits: int = Field(
+        ...,
+        description="Uploaded protocols that reused a cached analysis"
+        " since the server started",
+    )
+    misses: int = Field(
+        ...,
+        description="Uploaded protocols that had to be analyzed"
+        " since the server started",
+    )
+    entries: int = Field(..., description="Number of cached analyses")
+    size_bytes: int = Field(..., description="Total size of cached analyses")
+    max_size_bytes: int = Field(
+        ...,
+        description="Maximum total size of cached analyses",
+    )
+
+
 class Health(BaseModel):
     """Information about the server and system."""
 
@@ -77,6 +98,11 @@ class Health(BaseModel):
         min_items=2,
         max_items=2,
     )
+    protocol_analysis_cache: typing.Optional[ProtocolAnalysisCacheStats] = Field(
+        None,
+        description="Usage statistics of the protocol analysis cache."
+        " Null if the cache hasn't been used since the server started.",
+    )
     links: HealthLinks
 
     class Config:
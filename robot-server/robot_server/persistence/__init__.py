@@ -12,8 +12,25 @@ from typing_extensions import Final
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.settings import get_settings
 
-from .database import create_sql_engine, sqlite_rowid, ensure_utc_datetime
-from .tables import protocol_table, analysis_table, run_table, action_table
+from .database import (
+    create_sql_engine,
+    run_in_thread,
+    sqlite_rowid,
+    ensure_utc_datetime,
+)
+from .documents import (
+    encode_json_document,
+    decode_json_document,
+    UnknownDocumentFormatError,
+)
+from .tables import (
+    protocol_table,
+    analysis_table,
+    run_table,
+    run_command_table,
+    action_table,
+    analysis_cache_table,
+)
 
 _sql_engine_accessor = AppStateAccessor[sqlalchemy.engine.Engine]("sql_engine")
 _persistence_directory_accessor = AppStateAccessor[Path]("persistence_directory")
@@ -116,8 +133,14 @@ __all__ = [
     "protocol_table",
     "analysis_table",
     "run_table",
+    "run_command_table",
     "action_table",
+    "analysis_cache_table",
     # database utilities and helpers
+    "run_in_thread",
     "sqlite_rowid",
     "ensure_utc_datetime",
+    "encode_json_document",
+    "decode_json_document",
+    "UnknownDocumentFormatError",
 ]
@@ -1,8 +1,13 @@
 """SQLite database initialization and utilities."""
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from typing import Callable, TypeVar
 
+import anyio
 import sqlalchemy
+from sqlalchemy.pool import QueuePool
+from typing_extensions import Final
 
 from .tables import add_tables_to_db
 from .migrations import migrate
@@ -23,11 +28,26 @@ from .migrations import migrate
 sqlite_rowid = sqlalchemy.column("_ROWID_")
 
 
+# Connections kept open for reuse. Requests, background analyses, and
+# end-of-run saves each hold one only for the length of a transaction.
+_POOL_SIZE: Final = 5
+_POOL_MAX_OVERFLOW: Final = 10
+
+# How long a connection waits for another connection's write lock, in seconds.
+_BUSY_TIMEOUT: Final = 10.0
+
+# Negative values are in KiB, rather than in pages.
+_CACHE_SIZE: Final = -8 * 1024
+
+_ResultT = TypeVar("_ResultT")
+
+
 def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
     """Create a SQL engine with tables and migrations."""
     sql_engine = _open_db_no_cleanup(db_file_path=path)
 
     try:
+        _enable_write_ahead_log(sql_engine)
         add_tables_to_db(sql_engine)
         migrate(sql_engine)
     except Exception:
@@ -37,28 +57,83 @@ def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
     return sql_engine
 
 
+async def run_in_thread(
+    sql_engine: sqlalchemy.engine.Engine,
+    func: Callable[[sqlalchemy.engine.Connection], _ResultT],
+) -> _ResultT:
+    """Run `func` in a single transaction, in a worker thread.
+
+    Use this to keep slow queries, and the parsing of their results,
+    from blocking the event loop. `func` must not touch any state
+    that other threads use, except through the transaction it's given.
+
+    Arguments:
+        sql_engine: The database to open a transaction on.
+        func: A function to call with the open transaction.
+            The transaction commits if `func` returns,
+            and rolls back if `func` raises.
+
+    Returns:
+        Whatever `func` returns.
+    """
+    return await anyio.to_thread.run_sync(partial(_run_transaction, sql_engine, func))
+
+
+def _run_transaction(
+    sql_engine: sqlalchemy.engine.Engine,
+    func: Callable[[sqlalchemy.engine.Connection], _ResultT],
+) -> _ResultT:
+    with sql_engine.begin() as transaction:
+        return func(transaction)
+
+
 def _open_db_no_cleanup(db_file_path: Path) -> sqlalchemy.engine.Engine:
     """Create a database engine for performing transactions."""
     engine = sqlalchemy.create_engine(
         # sqlite://<hostname>/<path>
         # where <hostname> is empty.
         f"sqlite:///{db_file_path}",
+        # SQLAlchemy 1.4 defaults to opening a new connection for every
+        # transaction with file databases. Keep a pool of them open instead,
+        # shared by the event loop and `run_in_thread()`'s worker threads.
+        poolclass=QueuePool,
+        pool_size=_POOL_SIZE,
+        max_overflow=_POOL_MAX_OVERFLOW,
+        connect_args={"check_same_thread": False, "timeout": _BUSY_TIMEOUT},
     )
 
-    # Enable foreign key support in sqlite
-    # https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#foreign-key-support
     @sqlalchemy.event.listens_for(engine, "connect")  # type: ignore[misc]
     def _set_sqlite_pragma(
         dbapi_connection: sqlalchemy.engine.CursorResult,
         connection_record: sqlalchemy.engine.CursorResult,
     ) -> None:
         cursor = dbapi_connection.cursor()
+        # Enable foreign key support in sqlite
+        # https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#foreign-key-support
         cursor.execute("PRAGMA foreign_keys=ON;")
+        # Sync on every commit, so a saved run survives a power loss right after.
+        cursor.execute("PRAGMA synchronous=FULL;")
+        cursor.execute(f"PRAGMA cache_size={_CACHE_SIZE};")
+        cursor.execute("PRAGMA temp_store=MEMORY;")
         cursor.close()
 
     return engine
 
 
+def _enable_write_ahead_log(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """Switch the database to write-ahead logging.
+
+    This lets readers keep reading while a write is ongoing, so a run's
+    end-of-run save doesn't stall listing runs and commands.
+    Unlike most pragmas, the journal mode is stored in the database file,
+    so this only needs to run once, before anything else uses the database.
+
+    https://www.sqlite.org/wal.html
+    """
+    with sql_engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL;")
+
+
 def ensure_utc_datetime(dt: object) -> datetime:
     """Ensure an object is a TZ-aware UTC datetime.
 
@@ -0,0 +1,51 @@
+"""Compact storage format for large JSON documents, like protocol analyses.
+
+A stored document is a one-byte format version header followed by the
+format's payload. Reading a stored document never requires parsing it,
+so callers can choose whether to validate it into a model or send its JSON
+text as-is.
+
+Document format versions:
+
+- Version 1
+    - zlib-compressed, UTF-8 encoded JSON text
+"""
+import zlib
+
+from typing_extensions import Final
+
+
+_FORMAT_VERSION_ZLIB_JSON: Final = 1
+
+# Fast compression is a better tradeoff than small size here,
+# since documents are written while the robot is doing other work
+# and JSON compresses well even at low levels.
+_ZLIB_LEVEL: Final = 1
+
+
+class UnknownDocumentFormatError(ValueError):
+    """Error raised when a stored document has an unrecognized format header."""
+
+    def __init__(self, format_version: int) -> None:
+        """Initialize the error message from the unrecognized version."""
+        super().__init__(f"Unknown stored document format version {format_version}.")
+
+
+def encode_json_document(json_text: str) -> bytes:
+    """Encode JSON text for storage in a `LargeBinary` column."""
+    payload = zlib.compress(json_text.encode("utf-8"), _ZLIB_LEVEL)
+    return bytes([_FORMAT_VERSION_ZLIB_JSON]) + payload
+
+
+def decode_json_document(document: bytes) -> str:
+    """Decode JSON text stored by `encode_json_document`, without parsing it.
+
+    Raises:
+        UnknownDocumentFormatError: The document has an unrecognized header.
+    """
+    format_version = document[0] if len(document) > 0 else -1
+
+    if format_version != _FORMAT_VERSION_ZLIB_JSON:
+        raise UnknownDocumentFormatError(format_version)
+
+    return zlib.decompress(memoryview(document)[1:]).decode("utf-8")
@@ -23,17 +23,25 @@ Database schema versions:
     - `run_table.commands` column added
     - `run_table.engine_status` column added
     - `run_table._updated_at` column added
+- Version 2
+    - `run_command_table` added
+    - `run_table.commands` moved into `run_command_table`, one row per command
+- Version 3
+    - `analysis_table.completed_analysis` re-encoded from a pickled dict
+      to a compressed JSON document (see `documents.py`)
 """
 import logging
+import pickle
 from datetime import datetime, timezone
 from typing import Optional
 from typing_extensions import Final
 
 import sqlalchemy
 
-from .tables import migration_table, run_table
+from .documents import encode_json_document
+from .tables import migration_table, analysis_table, run_table, run_command_table
 
-_LATEST_SCHEMA_VERSION: Final = 1
+_LATEST_SCHEMA_VERSION: Final = 3
 
 _log = logging.getLogger(__name__)
 
@@ -46,6 +54,8 @@ def migrate(sql_engine: sqlalchemy.engine.Engine) -> None:
     existing tables.
 
     NOTE: added columns should be nullable.
+    Data migrations, like moving rows into a newly added table,
+    run in the same transaction as any column changes.
     """
     with sql_engine.begin() as transaction:
         version = _get_schema_version(transaction)
@@ -53,6 +63,10 @@ def migrate(sql_engine: sqlalchemy.engine.Engine) -> None:
         if version is not None:
             if version < 1:
                 _migrate_0_to_1(transaction)
+            if version < 2:
+                _migrate_1_to_2(transaction)
+            if version < 3:
+                _migrate_2_to_3(transaction)
 
             _log.info(
                 f"Migrated database from schema {version}"
@@ -130,3 +144,75 @@ def _migrate_0_to_1(transaction: sqlalchemy.engine.Connection) -> None:
     transaction.execute(add_commands_column)
     transaction.execute(add_status_column)
     transaction.execute(add_updated_at_column)
+
+
+def _migrate_1_to_2(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 2.
+
+    `run_command_table` was added by SQLAlchemy before this migration runs.
+    This migration copies each run's pickled `commands` list into that table,
+    one row per command, and then clears the old column.
+    """
+    select_run_commands = sqlalchemy.select(run_table.c.id, run_table.c.commands)
+    clear_run_commands = sqlalchemy.update(run_table).values(commands=None)
+
+    for row in transaction.execute(select_run_commands).all():
+        if row.commands:
+            transaction.execute(
+                sqlalchemy.insert(run_command_table),
+                [
+                    {
+                        "run_id": row.id,
+                        "index_in_run": index,
+                        "command_id": command["id"],
+                        "command": command,
+                    }
+                    for index, command in enumerate(row.commands)
+                ],
+            )
+
+    transaction.execute(clear_run_commands)
+
+
+def _migrate_2_to_3(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 3.
+
+    This migration re-encodes every stored completed analysis
+    from a pickled `CompletedAnalysis.dict()` to a compressed JSON document.
+    Each analysis is validated once here so that it never has to be
+    re-validated when it's served.
+
+    An analysis that can't be unpickled or doesn't validate is deleted,
+    instead of failing the migration and keeping the server from starting.
+    """
+    # Imported here to avoid a circular import between persistence and protocols.
+    from robot_server.protocols.analysis_models import CompletedAnalysis
+
+    select_analyses = sqlalchemy.select(
+        analysis_table.c.id, analysis_table.c.completed_analysis
+    )
+
+    for row in transaction.execute(select_analyses).all():
+        try:
+            completed_analysis = CompletedAnalysis.parse_obj(
+                pickle.loads(row.completed_analysis)
+            )
+        except Exception:
+            _log.warning(
+                f"Deleting analysis {row.id} because it could not be migrated.",
+                exc_info=True,
+            )
+            transaction.execute(
+                sqlalchemy.delete(analysis_table).where(analysis_table.c.id == row.id)
+            )
+            continue
+
+        transaction.execute(
+            sqlalchemy.update(analysis_table)
+            .where(analysis_table.c.id == row.id)
+            .values(
+                completed_analysis=encode_json_document(
+                    completed_analysis.json(exclude_none=True)
+                )
+            )
+        )
@@ -55,6 +55,8 @@ analysis_table = sqlalchemy.Table(
         sqlalchemy.String,
         nullable=False,
     ),
+    # NOTE: Stored as a compressed JSON document as of schema v3.
+    # See `documents.py`.
     sqlalchemy.Column(
         "completed_analysis",
         sqlalchemy.LargeBinary,
@@ -86,6 +88,8 @@ run_table = sqlalchemy.Table(
     # column added in schema v1
     sqlalchemy.Column("state_summary", sqlalchemy.PickleType, nullable=True),
     # column added in schema v1
+    # NOTE: No longer written as of schema v2.
+    # Commands are stored row-by-row in `run_command_table`, instead.
     sqlalchemy.Column("commands", sqlalchemy.PickleType, nullable=True),
     # column added in schema v1
     sqlalchemy.Column("engine_status", sqlalchemy.String, nullable=True),
@@ -116,6 +120,47 @@ action_table = sqlalchemy.Table(
     ),
 )
 
+# table added in schema v2
+run_command_table = sqlalchemy.Table(
+    "run_command",
+    _metadata,
+    sqlalchemy.Column("row_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "run_id",
+        sqlalchemy.String,
+        sqlalchemy.ForeignKey("run.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("index_in_run", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("command_id", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("command", sqlalchemy.PickleType, nullable=False),
+    sqlalchemy.Index(
+        "ix_run_command_run_id_index_in_run",
+        "run_id",
+        "index_in_run",
+        unique=True,
+    ),
+    sqlalchemy.Index(
+        "ix_run_command_run_id_command_id",
+        "run_id",
+        "command_id",
+        unique=True,
+    ),
+)
+
+# Completed analyses, keyed by a hash of everything that determines their results,
+# so that re-uploaded protocols can skip analysis.
+analysis_cache_table = sqlalchemy.Table(
+    "analysis_cache",
+    _metadata,
+    sqlalchemy.Column("key", sqlalchemy.String, primary_key=True),
+    # NOTE: Stored as a compressed JSON document. See `documents.py`.
+    sqlalchemy.Column("completed_analysis", sqlalchemy.LargeBinary, nullable=False),
+    sqlalchemy.Column("size", sqlalchemy.Integer, nullable=False),
+    # NOTE: See above note about naive datetimes
+    sqlalchemy.Column("last_used_at", sqlalchemy.DateTime, nullable=False, index=True),
+)
+
 
 def add_tables_to_db(sql_engine: sqlalchemy.engine.Engine) -> None:
     """Create the necessary database tables to back all data stores.
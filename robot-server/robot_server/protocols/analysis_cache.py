@@ -0,0 +1,274 @@
+"""A content-addressed cache of completed protocol analyses."""
+import hashlib
+import json
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Dict, Mapping, Optional, Tuple
+
+import anyio
+import sqlalchemy
+
+from opentrons import __version__ as api_version
+from opentrons.hardware_control.dev_types import PipetteDict
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.types import Mount
+from opentrons.util.helpers import utc_now
+
+from robot_server.persistence import (
+    analysis_cache_table,
+    sqlite_rowid,
+    encode_json_document,
+    decode_json_document,
+    run_in_thread,
+)
+
+from .analysis_models import CompletedAnalysis
+from .analysis_store import CURRENT_ANALYZER_VERSION
+
+
+_log = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AnalysisCacheStats:
+    """Usage statistics of an `AnalysisCache`.
+
+    Attributes:
+        hits: Lookups that found a cached analysis, since the server started.
+        misses: Lookups that did not find a cached analysis, since the server started.
+        entries: Number of analyses currently cached.
+        size: Total size of all cached analyses, in bytes.
+        max_size: Maximum total size of all cached analyses, in bytes.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    max_size: int
+
+
+def compute_analysis_cache_key(
+    protocol_source: ProtocolSource,
+    protocol_key: Optional[str],
+    attached_instruments: Mapping[Mount, PipetteDict],
+) -> str:
+    """Compute a key that identifies everything that determines an analysis's result.
+
+    This reads every protocol file from disk, so it should be run in a worker thread.
+
+    Arguments:
+        protocol_source: The protocol to be analyzed.
+        protocol_key: The client-provided key of the protocol, if any.
+        attached_instruments: The instruments attached to the robot, by mount.
+
+    Returns:
+        A string that will be equal for any two analyses that would be equal.
+    """
+    instrument_models: Dict[str, Optional[str]] = {
+        mount.name: instrument.get("model")
+        for mount, instrument in attached_instruments.items()
+    }
+    config = {
+        "analyzerVersion": CURRENT_ANALYZER_VERSION,
+        "apiVersion": api_version,
+        "protocolKey": protocol_key,
+        "instrumentModels": instrument_models,
+    }
+
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps(config, sort_keys=True).encode("utf-8"))
+
+    for source_file in sorted(protocol_source.files, key=lambda f: f.path.name):
+        contents = source_file.path.read_bytes()
+        file_header = {
+            "name": source_file.path.name,
+            "role": source_file.role.value,
+            "size": len(contents),
+        }
+        hasher.update(json.dumps(file_header, sort_keys=True).encode("utf-8"))
+        hasher.update(contents)
+
+    return hasher.hexdigest()
+
+
+class AnalysisCache:
+    """A persistent cache of completed analyses, keyed by `compute_analysis_cache_key`.
+
+    When the total size of all cached analyses exceeds the cache's maximum size,
+    the least-recently used analyses are evicted.
+    """
+
+    def __init__(
+        self,
+        *,
+        _sql_engine: sqlalchemy.engine.Engine,
+        _max_size: int,
+        _entries: int,
+        _size: int,
+    ) -> None:
+        """Do not call directly.
+
+        Use `create()` instead.
+        """
+        self._sql_engine = _sql_engine
+        self._max_size = _max_size
+        self._hits = 0
+        self._misses = 0
+        # Kept in memory, so getting stats doesn't have to query the database.
+        self._entries = _entries
+        self._size = _size
+
+    @classmethod
+    async def create(
+        cls, sql_engine: sqlalchemy.engine.Engine, max_size: int
+    ) -> "AnalysisCache":
+        """Create a cache, picking up any analyses already cached in the database.
+
+        Arguments:
+            sql_engine: The database to store cached analyses in.
+            max_size: The maximum total size of all cached analyses, in bytes,
+                as stored.
+        """
+        entries, size = await run_in_thread(sql_engine, _select_totals)
+        return cls(
+            _sql_engine=sql_engine,
+            _max_size=max_size,
+            _entries=entries,
+            _size=size,
+        )
+
+    async def get(self, key: str) -> Optional[CompletedAnalysis]:
+        """Get a cached analysis, marking it as recently used.
+
+        The returned analysis will have the ID it was originally stored with.
+
+        Returns:
+            The cached analysis, or `None` if there is no analysis with this key.
+        """
+        select_document = sqlalchemy.select(
+            analysis_cache_table.c.completed_analysis
+        ).where(analysis_cache_table.c.key == key)
+        update_last_used_at = (
+            sqlalchemy.update(analysis_cache_table)
+            .where(analysis_cache_table.c.key == key)
+            .values(last_used_at=utc_now())
+        )
+
+        def read(transaction: sqlalchemy.engine.Connection) -> Optional[bytes]:
+            document: Optional[bytes] = transaction.execute(
+                select_document
+            ).scalar_one_or_none()
+            if document is not None:
+                transaction.execute(update_last_used_at)
+            return document
+
+        document = await run_in_thread(self._sql_engine, read)
+
+        if document is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+
+        def parse_document(document: bytes) -> CompletedAnalysis:
+            return CompletedAnalysis.parse_raw(decode_json_document(document))
+
+        return await anyio.to_thread.run_sync(
+            parse_document,
+            document,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+
+    async def put(self, key: str, completed_analysis: CompletedAnalysis) -> None:
+        """Add an analysis to the cache, evicting others to make room if needed.
+
+        If the analysis alone is larger than the cache's maximum size,
+        it is not cached.
+        """
+
+        def encode_document() -> bytes:
+            return encode_json_document(completed_analysis.json(exclude_none=True))
+
+        document = await anyio.to_thread.run_sync(encode_document)
+
+        if len(document) > self._max_size:
+            _log.info(
+                f"Not caching analysis {completed_analysis.id} because its size"
+                f" of {len(document)} bytes exceeds the cache's maximum size."
+            )
+            return
+
+        delete_existing = sqlalchemy.delete(analysis_cache_table).where(
+            analysis_cache_table.c.key == key
+        )
+        insert_new = sqlalchemy.insert(analysis_cache_table).values(
+            key=key,
+            completed_analysis=document,
+            size=len(document),
+            last_used_at=utc_now(),
+        )
+
+        def write(transaction: sqlalchemy.engine.Connection) -> Tuple[int, int]:
+            transaction.execute(delete_existing)
+            transaction.execute(insert_new)
+            return self._evict(transaction)
+
+        self._entries, self._size = await run_in_thread(self._sql_engine, write)
+
+    def get_stats(self) -> AnalysisCacheStats:
+        """Get the cache's current usage statistics."""
+        return AnalysisCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=self._entries,
+            size=self._size,
+            max_size=self._max_size,
+        )
+
+    def _evict(self, transaction: sqlalchemy.engine.Connection) -> Tuple[int, int]:
+        """Delete least-recently used entries until the cache fits in its max size.
+
+        Returns:
+            The number of entries left in the cache, and their total size.
+        """
+        select_entries = sqlalchemy.select(
+            analysis_cache_table.c.key, analysis_cache_table.c.size
+        ).order_by(
+            sqlalchemy.desc(analysis_cache_table.c.last_used_at),
+            sqlalchemy.desc(sqlite_rowid),
+        )
+
+        total_size = 0
+        kept_entries = 0
+        kept_size = 0
+        keys_to_evict = []
+
+        for row in transaction.execute(select_entries):
+            total_size += row.size
+            if total_size > self._max_size:
+                keys_to_evict.append(row.key)
+            else:
+                kept_entries += 1
+                kept_size = total_size
+
+        if keys_to_evict:
+            transaction.execute(
+                sqlalchemy.delete(analysis_cache_table).where(
+                    analysis_cache_table.c.key.in_(keys_to_evict)
+                )
+            )
+            _log.info(f"Evicted {len(keys_to_evict)} analyses from the cache.")
+
+        return kept_entries, kept_size
+
+
+def _select_totals(transaction: sqlalchemy.engine.Connection) -> Tuple[int, int]:
+    select_totals = sqlalchemy.select(
+        sqlalchemy.func.count(),
+        sqlalchemy.func.coalesce(sqlalchemy.func.sum(analysis_cache_table.c.size), 0),
+    ).select_from(analysis_cache_table)
+    entries, size = transaction.execute(select_totals).one()
+    return entries, size
@@ -1,10 +1,10 @@
 """Protocol analysis storage."""
 from __future__ import annotations
 
-import pickle
 from dataclasses import dataclass
+from functools import partial
 from logging import getLogger
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import anyio
 import sqlalchemy
@@ -16,7 +16,13 @@ from opentrons.protocol_engine import (
     LoadedLabware,
 )
 
-from robot_server.persistence import analysis_table, sqlite_rowid
+from robot_server.persistence import (
+    analysis_table,
+    sqlite_rowid,
+    encode_json_document,
+    decode_json_document,
+    run_in_thread,
+)
 
 from .analysis_models import (
     AnalysisSummary,
@@ -52,7 +58,7 @@ _log = getLogger(__name__)
 #
 # This does not necessarily have any correspondence with the user-facing
 # robot software version.
-_CURRENT_ANALYZER_VERSION = "initial"
+CURRENT_ANALYZER_VERSION = "initial"
 
 
 class AnalysisNotFoundError(ValueError):
@@ -64,12 +70,10 @@ class AnalysisNotFoundError(ValueError):
 
 
 # TODO(mm, 2022-05-19): Unlike ProtocolStore and RunStore, this class doesn't
-# have an in-memory cache. This is because of implementation difficulties:
-# this class is currently the only one of the three to have any async methods,
-# which functools.lru_cache() doesn't support.
+# have an in-memory cache of its reads.
 #
 # We should have a consistent strategy across all stores.
-# Either figure out an in-memory cache that supports async methods,
+# Either cache this class's reads like the others do,
 # or remove in-memory caching from all stores.
 class AnalysisStore:
     """Storage interface for protocol analyses.
@@ -103,14 +107,23 @@ class AnalysisStore:
         )
         return _summarize_pending(pending_analysis=new_pending_analysis)
 
+    def remove_pending(self, analysis_id: str) -> None:
+        """Remove a pending analysis that will never complete.
+
+        Args:
+            analysis_id: The ID of the analysis to remove, for example because
+                it was cancelled. Must point to a valid pending analysis.
+        """
+        self._pending_store.remove(analysis_id=analysis_id)
+
     async def update(
         self,
         analysis_id: str,
-        commands: List[Command],
+        commands: Sequence[Command],
         labware: List[LoadedLabware],
         pipettes: List[LoadedPipette],
         errors: List[ErrorOccurrence],
-    ) -> None:
+    ) -> CompletedAnalysis:
         """Promote a pending analysis to completed, adding details of its results.
 
         Args:
@@ -121,6 +134,9 @@ class AnalysisStore:
             pipettes: See `CompletedAnalysis.pipettes`.
             errors: See `CompletedAnalysis.errors`. Also used to infer whether
                 the completed analysis result is `OK` or `NOT_OK`.
+
+        Returns:
+            The completed analysis, as stored.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -137,7 +153,8 @@ class AnalysisStore:
         completed_analysis = CompletedAnalysis.construct(
             id=analysis_id,
             result=result,
-            commands=commands,
+            # Copy into a list, which Pydantic knows how to serialize.
+            commands=list(commands),
             labware=labware,
             pipettes=pipettes,
             errors=errors,
@@ -145,7 +162,7 @@ class AnalysisStore:
         completed_analysis_resource = _CompletedAnalysisResource(
             id=completed_analysis.id,
             protocol_id=protocol_id,
-            analyzer_version=_CURRENT_ANALYZER_VERSION,
+            analyzer_version=CURRENT_ANALYZER_VERSION,
             completed_analysis=completed_analysis,
         )
         await self._completed_store.add(
@@ -154,6 +171,8 @@ class AnalysisStore:
 
         self._pending_store.remove(analysis_id=analysis_id)
 
+        return completed_analysis
+
     async def get(self, analysis_id: str) -> ProtocolAnalysis:
         """Get a single protocol analysis by its ID.
 
@@ -172,12 +191,14 @@ class AnalysisStore:
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
-    def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
+    async def get_summaries_by_protocol(
+        self, protocol_id: str
+    ) -> List[AnalysisSummary]:
         """Get summaries of all analyses for a protocol, in order from oldest first.
 
         If `protocol_id` doesn't point to a valid protocol, returns an empty list.
         """
-        completed_analysis_ids = self._completed_store.get_ids_by_protocol(
+        completed_analysis_ids = await self._completed_store.get_ids_by_protocol(
             protocol_id=protocol_id
         )
         completed_analysis_summaries = [
@@ -210,6 +231,25 @@ class AnalysisStore:
         else:
             return completed_analyses + [pending_analysis]
 
+    async def get_by_protocol_as_document(self, protocol_id: str) -> List[str]:
+        """Like `get_by_protocol()`, but return each analysis as JSON text.
+
+        Completed analyses are returned exactly as they were stored,
+        without being parsed or re-validated, so this is much faster than
+        `get_by_protocol()` for large analyses. Each document is compatible
+        with the `ProtocolAnalysis` response model.
+        """
+        completed_analyses = await self._completed_store.get_documents_by_protocol(
+            protocol_id=protocol_id
+        )
+
+        pending_analysis = self._pending_store.get_by_protocol(protocol_id=protocol_id)
+
+        if pending_analysis is None:
+            return completed_analyses
+        else:
+            return completed_analyses + [pending_analysis.json()]
+
 
 class _PendingAnalysisStore:
     """An in-memory store of protocol analyses that are pending.
@@ -291,7 +331,9 @@ class _CompletedAnalysisResource:
         """
 
         def serialize_completed_analysis() -> bytes:
-            return pickle.dumps(self.completed_analysis.dict())
+            # Exclude None to match how response bodies are rendered,
+            # so stored documents can be sent without re-rendering them.
+            return encode_json_document(self.completed_analysis.json(exclude_none=True))
 
         serialized_completed_analysis = await anyio.to_thread.run_sync(
             serialize_completed_analysis,
@@ -318,10 +360,10 @@ class _CompletedAnalysisResource:
         Avoid calling this from inside a SQL transaction, since it might be slow.
         """
         analyzer_version = sql_row.analyzer_version
-        if analyzer_version != _CURRENT_ANALYZER_VERSION:
+        if analyzer_version != CURRENT_ANALYZER_VERSION:
             _log.warning(
                 f'Analysis in database was created under version "{analyzer_version}",'
-                f' but we are version "{_CURRENT_ANALYZER_VERSION}".'
+                f' but we are version "{CURRENT_ANALYZER_VERSION}".'
                 f" This may cause compatibility problems."
             )
         assert isinstance(analyzer_version, str)
@@ -333,7 +375,9 @@ class _CompletedAnalysisResource:
         assert isinstance(protocol_id, str)
 
         def parse_completed_analysis() -> CompletedAnalysis:
-            return CompletedAnalysis.parse_obj(pickle.loads(sql_row.completed_analysis))
+            return CompletedAnalysis.parse_raw(
+                decode_json_document(sql_row.completed_analysis)
+            )
 
         completed_analysis = await anyio.to_thread.run_sync(
             parse_completed_analysis,
@@ -361,11 +405,15 @@ class _CompletedAnalysisStore:
         statement = sqlalchemy.select(analysis_table).where(
             analysis_table.c.id == analysis_id
         )
-        with self._sql_engine.begin() as transaction:
-            try:
-                result = transaction.execute(statement).one()
-            except sqlalchemy.exc.NoResultFound:
-                return None
+
+        def read(
+            transaction: sqlalchemy.engine.Connection,
+        ) -> Optional[sqlalchemy.engine.Row]:
+            return transaction.execute(statement).one_or_none()
+
+        result = await run_in_thread(self._sql_engine, read)
+        if result is None:
+            return None
         return await _CompletedAnalysisResource.from_sql_row(result)
 
     async def get_by_protocol(
@@ -381,19 +429,39 @@ class _CompletedAnalysisStore:
             .where(analysis_table.c.protocol_id == protocol_id)
             .order_by(sqlite_rowid)
         )
-        with self._sql_engine.begin() as transaction:
-            results = transaction.execute(statement).all()
+        results = await run_in_thread(self._sql_engine, partial(_read_all, statement))
         return [await _CompletedAnalysisResource.from_sql_row(r) for r in results]
 
-    def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
+    async def get_documents_by_protocol(self, protocol_id: str) -> List[str]:
+        """Like `get_by_protocol()`, but return only each analysis's JSON text.
+
+        Documents are decompressed in a worker thread, but not parsed.
+        """
+        statement = (
+            sqlalchemy.select(analysis_table.c.completed_analysis)
+            .where(analysis_table.c.protocol_id == protocol_id)
+            .order_by(sqlite_rowid)
+        )
+        results = await run_in_thread(self._sql_engine, partial(_read_all, statement))
+
+        def decode_documents() -> List[str]:
+            return [decode_json_document(r.completed_analysis) for r in results]
+
+        return await anyio.to_thread.run_sync(
+            decode_documents,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+
+    async def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
         """Like `get_by_protocol()`, but return only the ID of each analysis."""
         statement = (
             sqlalchemy.select(analysis_table.c.id)
             .where(analysis_table.c.protocol_id == protocol_id)
             .order_by(sqlite_rowid)
         )
-        with self._sql_engine.begin() as transaction:
-            results = transaction.execute(statement).all()
+        results = await run_in_thread(self._sql_engine, partial(_read_all, statement))
 
         result_ids: List[str] = []
         for row in results:
@@ -408,9 +476,18 @@ class _CompletedAnalysisStore:
         statement = analysis_table.insert().values(
             await completed_analysis_resource.to_sql_values()
         )
-        with self._sql_engine.begin() as transaction:
+
+        def insert(transaction: sqlalchemy.engine.Connection) -> None:
             transaction.execute(statement)
 
+        await run_in_thread(self._sql_engine, insert)
+
+
+def _read_all(
+    statement: sqlalchemy.sql.Select, transaction: sqlalchemy.engine.Connection
+) -> List[sqlalchemy.engine.Row]:
+    return transaction.execute(statement).all()
+
 
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
     return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
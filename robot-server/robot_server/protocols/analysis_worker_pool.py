@@ -0,0 +1,322 @@
+"""A pool of worker processes to run protocol analyses."""
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Union
+
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_runner import ProtocolRunResult, create_simulating_runner
+
+
+log = logging.getLogger(__name__)
+
+
+AnalyzeFunc = Callable[[ProtocolSource], Awaitable[ProtocolRunResult]]
+
+
+class AnalysisFailedError(RuntimeError):
+    """Error raised when a worker process could not produce an analysis result.
+
+    Attributes:
+        error_type: The name of the underlying error's type.
+        detail: A description of the underlying error.
+    """
+
+    def __init__(self, error_type: str, detail: str) -> None:
+        """Initialize the error with details of what went wrong."""
+        super().__init__(f"{error_type}: {detail}")
+        self.error_type = error_type
+        self.detail = detail
+
+
+class AnalysisTimeoutError(AnalysisFailedError):
+    """Error raised when an analysis takes longer than the pool's timeout."""
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the error with the timeout that was exceeded."""
+        super().__init__(
+            error_type=type(self).__name__,
+            detail=f"Protocol analysis did not complete within {timeout} seconds.",
+        )
+
+
+class AnalysisCancelledError(RuntimeError):
+    """Error raised when an analysis was cancelled before it completed."""
+
+    def __init__(self, analysis_id: str) -> None:
+        """Initialize the error with the ID of the cancelled analysis."""
+        super().__init__(f'Analysis "{analysis_id}" was cancelled.')
+
+
+async def run_simulated_analysis(protocol_source: ProtocolSource) -> ProtocolRunResult:
+    """Analyze a protocol by running it with a simulating ProtocolRunner."""
+    protocol_runner = await create_simulating_runner()
+    result = await protocol_runner.run(protocol_source)
+
+    # Copy commands into a plain list, which is cheaper to send between processes.
+    return ProtocolRunResult(
+        commands=list(result.commands),
+        state_summary=result.state_summary,
+    )
+
+
+class AnalysisWorkerPool:
+    """Run protocol analyses in worker processes, off of the server's event loop.
+
+    At most `max_workers` analyses run at once; any more wait their turn.
+    Worker processes are started as needed and reused between analyses.
+    An analysis that times out or is cancelled has its worker process killed,
+    since that's the only way to reliably interrupt a running protocol.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout: Optional[float],
+        analyze_func: AnalyzeFunc = run_simulated_analysis,
+    ) -> None:
+        """Initialize the pool. No worker processes are started until needed.
+
+        Arguments:
+            max_workers: The maximum number of analyses to run at once.
+            timeout: The maximum number of seconds a single analysis may take.
+                If `None`, analyses may take as long as they need.
+            analyze_func: The function that worker processes call to analyze a
+                protocol. Must be importable by name, so it can be sent to workers.
+        """
+        assert max_workers > 0, "Analysis worker pool needs at least one worker."
+
+        self._timeout = timeout
+        self._analyze_func = analyze_func
+        self._slots = asyncio.Semaphore(max_workers)
+        self._idle_workers: List[_Worker] = []
+        self._workers_by_analysis_id: Dict[str, _Worker] = {}
+        self._active_analysis_ids: Set[str] = set()
+        self._cancelled_analysis_ids: Set[str] = set()
+        # Each busy worker needs a thread to wait on its results without blocking.
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="analysis-worker-pool",
+        )
+
+    async def analyze(
+        self,
+        analysis_id: str,
+        protocol_source: ProtocolSource,
+    ) -> ProtocolRunResult:
+        """Analyze a protocol in a worker process.
+
+        Arguments:
+            analysis_id: A unique ID for this analysis, used for cancellation.
+            protocol_source: The protocol to analyze.
+
+        Returns:
+            The results of the analysis.
+
+        Raises:
+            AnalysisFailedError: The worker process raised an error or exited
+                unexpectedly.
+            AnalysisTimeoutError: The analysis took longer than the pool's timeout.
+            AnalysisCancelledError: The analysis was cancelled with `cancel`.
+        """
+        assert analysis_id not in self._active_analysis_ids
+        self._active_analysis_ids.add(analysis_id)
+
+        try:
+            async with self._slots:
+                return await self._analyze_in_worker(analysis_id, protocol_source)
+        finally:
+            self._active_analysis_ids.remove(analysis_id)
+            self._cancelled_analysis_ids.discard(analysis_id)
+
+    def cancel(self, analysis_id: str) -> None:
+        """Cancel an analysis, whether it's running or waiting for a worker.
+
+        The analysis's `analyze` call will raise an `AnalysisCancelledError`.
+        If the analysis is not in progress, this method does nothing.
+        """
+        if analysis_id not in self._active_analysis_ids:
+            return
+
+        self._cancelled_analysis_ids.add(analysis_id)
+        worker = self._workers_by_analysis_id.get(analysis_id)
+
+        if worker is not None:
+            self._kill(worker)
+
+    def close(self) -> None:
+        """Stop all worker processes.
+
+        Intended to be called just once, when the server shuts down, after
+        any analyses in progress have been cancelled.
+        """
+        for worker in [*self._idle_workers, *self._workers_by_analysis_id.values()]:
+            self._kill(worker)
+
+        self._idle_workers.clear()
+        self._thread_pool.shutdown(wait=False)
+
+    async def _analyze_in_worker(
+        self,
+        analysis_id: str,
+        protocol_source: ProtocolSource,
+    ) -> ProtocolRunResult:
+        if analysis_id in self._cancelled_analysis_ids:
+            raise AnalysisCancelledError(analysis_id)
+
+        loop = asyncio.get_running_loop()
+        worker = self._idle_workers.pop() if self._idle_workers else _Worker()
+        self._workers_by_analysis_id[analysis_id] = worker
+
+        try:
+            # Don't count worker process startup against the analysis's timeout.
+            if not worker.is_ready():
+                await loop.run_in_executor(self._thread_pool, worker.wait_until_ready)
+
+            job = loop.run_in_executor(
+                self._thread_pool,
+                worker.run,
+                self._analyze_func,
+                protocol_source,
+            )
+            response = await asyncio.wait_for(asyncio.shield(job), self._timeout)
+
+        except asyncio.TimeoutError as e:
+            self._kill(worker)
+            assert self._timeout is not None
+            raise AnalysisTimeoutError(self._timeout) from e
+
+        except BaseException:
+            # Includes asyncio.CancelledError, for example on server shutdown.
+            self._kill(worker)
+            raise
+
+        finally:
+            del self._workers_by_analysis_id[analysis_id]
+
+        if analysis_id in self._cancelled_analysis_ids:
+            raise AnalysisCancelledError(analysis_id)
+
+        if worker.is_usable():
+            self._idle_workers.append(worker)
+        else:
+            self._kill(worker)
+
+        if isinstance(response, _WorkerError):
+            raise AnalysisFailedError(response.error_type, response.detail)
+
+        return response
+
+    def _kill(self, worker: "_Worker") -> None:
+        worker.kill()
+        # Reap the process in a thread, so waiting for it to exit
+        # doesn't block the event loop.
+        self._thread_pool.submit(worker.join)
+
+
+@dataclass(frozen=True)
+class _WorkerError:
+    """An error raised in a worker process, in a form that's safe to send back."""
+
+    error_type: str
+    detail: str
+
+
+_WorkerResponse = Union[ProtocolRunResult, _WorkerError]
+
+
+class _Worker:
+    """A worker process, and a connection to send it analysis jobs."""
+
+    def __init__(self) -> None:
+        # Spawn, rather than fork, so workers don't inherit the server's threads.
+        context = multiprocessing.get_context("spawn")
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(
+            target=_run_worker,
+            args=(child_connection,),
+            name="protocol-analysis-worker",
+            daemon=True,
+        )
+        self._process.start()
+        self._ready = False
+        # Held by whichever thread is using the connection,
+        # so it isn't closed out from under that thread.
+        self._connection_lock = threading.Lock()
+        child_connection.close()
+
+    def is_ready(self) -> bool:
+        """Get whether the worker process has started up and can take jobs."""
+        return self._ready
+
+    def wait_until_ready(self) -> None:
+        """Block until the worker process has started up, or has exited."""
+        with self._connection_lock:
+            try:
+                self._connection.recv()
+                self._ready = True
+            except (EOFError, OSError):
+                self._connection.close()
+
+    def run(
+        self, analyze_func: AnalyzeFunc, protocol_source: ProtocolSource
+    ) -> _WorkerResponse:
+        """Run a job in the worker process, blocking until it responds."""
+        with self._connection_lock:
+            try:
+                self._connection.send((analyze_func, protocol_source))
+                response: _WorkerResponse = self._connection.recv()
+                return response
+            except (EOFError, OSError):
+                self._connection.close()
+                return _WorkerError(
+                    error_type="AnalysisWorkerExitedError",
+                    detail="The protocol analysis worker process exited unexpectedly.",
+                )
+
+    def is_usable(self) -> bool:
+        """Get whether the worker can take another job.
+
+        A worker whose connection was closed can't, even if its process
+        hasn't finished exiting yet.
+        """
+        return self._process.is_alive() and not self._connection.closed
+
+    def kill(self) -> None:
+        """Kill the worker process, interrupting any job in progress.
+
+        This doesn't wait for the process to exit. Call `join()` for that.
+        """
+        if self._process.is_alive():
+            log.info(f"Killing protocol analysis worker process {self._process.pid}.")
+            self._process.kill()
+
+    def join(self) -> None:
+        """Block until the worker process has exited, then close its connection."""
+        self._process.join()
+
+        with self._connection_lock:
+            self._connection.close()
+
+
+def _run_worker(connection: Connection) -> None:
+    """Run analysis jobs sent over `connection` until it closes."""
+    # By the time this runs, this module and its imports have been loaded,
+    # so let the server know that jobs can start now.
+    connection.send(None)
+
+    while True:
+        try:
+            analyze_func, protocol_source = connection.recv()
+        except EOFError:
+            return
+
+        try:
+            response: _WorkerResponse = asyncio.run(analyze_func(protocol_source))
+            connection.send(response)
+        except Exception as e:
+            connection.send(_WorkerError(error_type=type(e).__name__, detail=str(e)))
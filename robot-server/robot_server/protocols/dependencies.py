@@ -2,6 +2,7 @@
 
 
 import logging
+from typing import Optional
 
 from fastapi import Depends
 from sqlalchemy.engine import Engine as SQLEngine
@@ -10,11 +11,12 @@ from pathlib import Path
 from anyio import Path as AsyncPath
 
 from opentrons.protocol_reader import ProtocolReader
-from opentrons.protocol_runner import create_simulating_runner
 
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.deletion_planner import ProtocolDeletionPlanner
 from robot_server.persistence import get_sql_engine, get_persistence_directory
+from robot_server.settings import get_settings
+from robot_server.service.task_runner import TaskRunner, get_task_runner
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
@@ -22,6 +24,8 @@ from .protocol_store import (
 )
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore
+from .analysis_worker_pool import AnalysisWorkerPool
+from .analysis_cache import AnalysisCache, AnalysisCacheStats
 
 
 _PROTOCOL_FILES_SUBDIRECTORY: Final = "protocols"
@@ -31,6 +35,10 @@ _log = logging.getLogger(__name__)
 _protocol_store_accessor = AppStateAccessor[ProtocolStore]("protocol_store")
 _analysis_store_accessor = AppStateAccessor[AnalysisStore]("analysis_store")
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
+_analysis_worker_pool_accessor = AppStateAccessor[AnalysisWorkerPool](
+    "analysis_worker_pool"
+)
+_analysis_cache_accessor = AppStateAccessor[AnalysisCache]("analysis_cache")
 
 
 def get_protocol_reader() -> ProtocolReader:
@@ -58,18 +66,24 @@ async def get_protocol_store(
     sql_engine: SQLEngine = Depends(get_sql_engine),
     protocol_directory: Path = Depends(get_protocol_directory),
     protocol_reader: ProtocolReader = Depends(get_protocol_reader),
+    task_runner: TaskRunner = Depends(get_task_runner),
 ) -> ProtocolStore:
     """Get a singleton ProtocolStore to keep track of created protocols."""
     protocol_store = _protocol_store_accessor.get_from(app_state)
 
     if protocol_store is None:
+        lazy = get_settings().lazy_protocol_rehydration
         protocol_store = await ProtocolStore.rehydrate(
             sql_engine=sql_engine,
             protocols_directory=protocol_directory,
             protocol_reader=protocol_reader,
+            lazy=lazy,
         )
         _protocol_store_accessor.set_on(app_state, protocol_store)
 
+        if lazy:
+            task_runner.run(protocol_store.warm_source_cache)
+
     return protocol_store
 
 
@@ -87,15 +101,74 @@ def get_analysis_store(
     return analysis_store
 
 
+async def get_analysis_cache(
+    app_state: AppState = Depends(get_app_state),
+    sql_engine: SQLEngine = Depends(get_sql_engine),
+) -> AnalysisCache:
+    """Get a singleton AnalysisCache to reuse analyses of identical protocols."""
+    analysis_cache = _analysis_cache_accessor.get_from(app_state)
+
+    if analysis_cache is None:
+        analysis_cache = await AnalysisCache.create(
+            sql_engine=sql_engine,
+            max_size=get_settings().protocol_analysis_cache_size,
+        )
+        _analysis_cache_accessor.set_on(app_state, analysis_cache)
+
+    return analysis_cache
+
+
+def get_analysis_cache_stats(
+    app_state: AppState = Depends(get_app_state),
+) -> Optional[AnalysisCacheStats]:
+    """Get the AnalysisCache's usage statistics, if the cache has been created.
+
+    Unlike `get_analysis_cache`, this does not open the database,
+    so it's safe to use in endpoints that must work before it's ready.
+    """
+    analysis_cache = _analysis_cache_accessor.get_from(app_state)
+    return analysis_cache.get_stats() if analysis_cache is not None else None
+
+
+async def get_analysis_worker_pool(
+    app_state: AppState = Depends(get_app_state),
+) -> AnalysisWorkerPool:
+    """Get a singleton AnalysisWorkerPool to run protocol analyses."""
+    analysis_worker_pool = _analysis_worker_pool_accessor.get_from(app_state)
+
+    if analysis_worker_pool is None:
+        settings = get_settings()
+        analysis_worker_pool = AnalysisWorkerPool(
+            max_workers=settings.protocol_analysis_workers,
+            timeout=settings.protocol_analysis_timeout,
+        )
+        _analysis_worker_pool_accessor.set_on(app_state, analysis_worker_pool)
+
+    return analysis_worker_pool
+
+
+async def clean_up_analysis_worker_pool(app_state: AppState) -> None:
+    """Stop the AnalysisWorkerPool's worker processes, if it was ever created.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    analysis_worker_pool = _analysis_worker_pool_accessor.get_from(app_state)
+    _analysis_worker_pool_accessor.set_on(app_state, None)
+
+    if analysis_worker_pool is not None:
+        analysis_worker_pool.close()
+
+
 async def get_protocol_analyzer(
+    analysis_worker_pool: AnalysisWorkerPool = Depends(get_analysis_worker_pool),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
+    analysis_cache: AnalysisCache = Depends(get_analysis_cache),
 ) -> ProtocolAnalyzer:
     """Construct a ProtocolAnalyzer for a single request."""
-    protocol_runner = await create_simulating_runner()
-
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_worker_pool=analysis_worker_pool,
         analysis_store=analysis_store,
+        analysis_cache=analysis_cache,
     )
 
 
@@ -1,10 +1,19 @@
 """Protocol analysis module."""
 import logging
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import uuid4
 
-from opentrons.protocol_runner import ProtocolRunner
+from opentrons.protocol_engine import ErrorOccurrence
 
 from .protocol_store import ProtocolResource
 from .analysis_store import AnalysisStore
+from .analysis_cache import AnalysisCache
+from .analysis_worker_pool import (
+    AnalysisWorkerPool,
+    AnalysisFailedError,
+    AnalysisCancelledError,
+)
 
 
 log = logging.getLogger(__name__)
@@ -15,27 +24,74 @@ class ProtocolAnalyzer:
 
     def __init__(
         self,
-        protocol_runner: ProtocolRunner,
+        analysis_worker_pool: AnalysisWorkerPool,
         analysis_store: AnalysisStore,
+        analysis_cache: AnalysisCache,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
-        self._protocol_runner = protocol_runner
+        self._analysis_worker_pool = analysis_worker_pool
         self._analysis_store = analysis_store
+        self._analysis_cache = analysis_cache
 
     async def analyze(
         self,
         protocol_resource: ProtocolResource,
         analysis_id: str,
+        cache_key: Optional[str] = None,
     ) -> None:
-        """Analyze a given protocol, storing the analysis when complete."""
-        result = await self._protocol_runner.run(protocol_resource.source)
+        """Analyze a given protocol, storing the analysis when complete.
+
+        If the analysis fails to complete, for example because it timed out,
+        the stored analysis will contain a single error describing the failure.
+        If the analysis is cancelled, its pending analysis is removed,
+        and nothing is stored.
+
+        Arguments:
+            protocol_resource: The protocol to analyze.
+            analysis_id: The ID of the pending analysis to complete.
+            cache_key: If provided, also add the completed analysis to the
+                analysis cache under this key. Analyses that fail to complete
+                are never cached.
+        """
+        try:
+            result = await self._analysis_worker_pool.analyze(
+                analysis_id=analysis_id,
+                protocol_source=protocol_resource.source,
+            )
+
+        except AnalysisCancelledError:
+            log.info(f'Cancelled analysis "{analysis_id}".')
+            self._analysis_store.remove_pending(analysis_id=analysis_id)
+            return
+
+        except AnalysisFailedError as e:
+            log.warning(f'Analysis "{analysis_id}" failed to complete.', exc_info=e)
+
+            await self._analysis_store.update(
+                analysis_id=analysis_id,
+                commands=[],
+                labware=[],
+                pipettes=[],
+                errors=[
+                    ErrorOccurrence.construct(
+                        id=str(uuid4()),
+                        createdAt=datetime.now(tz=timezone.utc),
+                        errorType=e.error_type,
+                        detail=e.detail,
+                    )
+                ],
+            )
+            return
 
         log.info(f'Completed analysis "{analysis_id}".')
 
-        await self._analysis_store.update(
+        completed_analysis = await self._analysis_store.update(
             analysis_id=analysis_id,
             commands=result.commands,
             labware=result.state_summary.labware,
             pipettes=result.state_summary.pipettes,
             errors=result.state_summary.errors,
         )
+
+        if cache_key is not None:
+            await self._analysis_cache.put(cache_key, completed_analysis)
@@ -19,8 +19,8 @@ class ProtocolAutoDeleter:  # noqa: D101
         self._protocol_store = protocol_store
         self._deletion_planner = deletion_planner
 
-    def make_room_for_new_protocol(self) -> None:  # noqa: D102
-        protocol_run_usage_info = self._protocol_store.get_usage_info()
+    async def make_room_for_new_protocol(self) -> None:  # noqa: D102
+        protocol_run_usage_info = await self._protocol_store.get_usage_info()
 
         protocol_ids_to_delete = self._deletion_planner.plan_for_new_protocol(
             existing_protocols=protocol_run_usage_info,
@@ -32,4 +32,4 @@ class ProtocolAutoDeleter:  # noqa: D101
                 f" {protocol_ids_to_delete}"
             )
         for protocol_id in protocol_ids_to_delete:
-            self._protocol_store.remove(protocol_id=protocol_id)
+            await self._protocol_store.remove(protocol_id=protocol_id)
@@ -1,14 +1,26 @@
 """Store and retrieve information about uploaded protocols."""
 from __future__ import annotations
 
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
+from functools import partial
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
 
-from anyio import Path as AsyncPath, create_task_group
+import anyio
+from anyio import Lock, Path as AsyncPath, create_task_group
 import sqlalchemy
 
 from opentrons.protocol_reader import ProtocolReader, ProtocolSource
@@ -18,10 +30,14 @@ from robot_server.persistence import (
     run_table,
     sqlite_rowid,
     ensure_utc_datetime,
+    run_in_thread,
 )
 
 
 _CACHE_ENTRIES = 32
+_SOURCE_CACHE_ENTRIES = 20
+
+_ResultT = TypeVar("_ResultT")
 
 
 _log = getLogger(__name__)
@@ -78,9 +94,6 @@ class SubdirectoryMissingError(Exception):
     """
 
 
-# TODO(mm, 2022-03-29): When we confirm we can use SQLAlchemy 1.4 on the OT-2,
-# convert all methods to use an async engine.
-# https://docs.sqlalchemy.org/en/14/orm/extensions/asyncio.html
 class ProtocolStore:
     """Store and retrieve information about uploaded protocols."""
 
@@ -89,6 +102,7 @@ class ProtocolStore:
         *,
         _sql_engine: sqlalchemy.engine.Engine,
         _sources_by_id: Dict[str, ProtocolSource],
+        _lazy_sources: Optional[_LazyProtocolSources] = None,
     ) -> None:
         """Do not call directly.
 
@@ -96,6 +110,9 @@ class ProtocolStore:
         """
         self._sql_engine = _sql_engine
         self._sources_by_id = _sources_by_id
+        self._lazy_sources = _lazy_sources
+        self._read_cache: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._generation = 0
 
     @classmethod
     def create_empty(
@@ -120,6 +137,8 @@ class ProtocolStore:
         sql_engine: sqlalchemy.engine.Engine,
         protocols_directory: Path,
         protocol_reader: ProtocolReader,
+        lazy: bool = False,
+        max_cached_sources: int = _SOURCE_CACHE_ENTRIES,
     ) -> ProtocolStore:
         """Return a new ProtocolStore, picking up where a former one left off.
 
@@ -128,6 +147,15 @@ class ProtocolStore:
         They are allowed to contain no data, in which case this is equivalent to
         `create_empty()`.
 
+        By default, this reads every stored protocol's files up front, so it takes
+        longer the more protocols are stored. If `lazy` is `True`, it only reads
+        protocol IDs from the database. Each protocol's files are read the first
+        time it's retrieved, and only the most recently used protocols are kept
+        in memory. Call `warm_source_cache()` to read them ahead of time.
+        Listing protocols with `get_all()` needs every protocol's files,
+        so the cache makes room for all of them while a listing is in progress,
+        and shrinks back to `max_cached_sources` when it's done.
+
         Params:
             sql_engine: A reference to the database that this ProtocolStore should
                 use as its backing storage.
@@ -138,11 +166,25 @@ class ProtocolStore:
                 named after its protocol ID.
             protocol_reader: An interface to compute `ProtocolSource`s from protocol
                 files while rehydrating.
+            lazy: Whether to defer computing `ProtocolSource`s until they're needed.
+            max_cached_sources: If `lazy`, how many `ProtocolSource`s to keep
+                in memory at once.
         """
+        if lazy:
+            return ProtocolStore(
+                _sql_engine=sql_engine,
+                _sources_by_id={},
+                _lazy_sources=_LazyProtocolSources(
+                    protocols_directory=AsyncPath(protocols_directory),
+                    protocol_reader=protocol_reader,
+                    max_entries=max_cached_sources,
+                ),
+            )
+
         # The SQL database is the canonical source of which protocols
         # have been added successfully.
         expected_ids = set(
-            r.protocol_id for r in cls._sql_get_all_from_engine(sql_engine=sql_engine)
+            r.protocol_id for r in await run_in_thread(sql_engine, _sql_select_all)
         )
 
         sources_by_id = await _compute_protocol_sources(
@@ -156,63 +198,123 @@ class ProtocolStore:
             _sources_by_id=sources_by_id,
         )
 
-    def insert(self, resource: ProtocolResource) -> None:
+    async def insert(self, resource: ProtocolResource) -> None:
         """Insert a protocol resource into the store.
 
         The resource must have a unique ID.
         """
-        self._sql_insert(
-            resource=_DBProtocolResource(
-                protocol_id=resource.protocol_id,
-                created_at=resource.created_at,
-                protocol_key=resource.protocol_key,
+        statement = sqlalchemy.insert(protocol_table).values(
+            _convert_dataclass_to_sql_values(
+                resource=_DBProtocolResource(
+                    protocol_id=resource.protocol_id,
+                    created_at=resource.created_at,
+                    protocol_key=resource.protocol_key,
+                )
             )
         )
-        self._sources_by_id[resource.protocol_id] = resource.source
-        self._clear_caches()
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get(self, protocol_id: str) -> ProtocolResource:
+        def insert(transaction: sqlalchemy.engine.Connection) -> None:
+            transaction.execute(statement)
+
+        try:
+            await run_in_thread(self._sql_engine, insert)
+        finally:
+            self._clear_caches()
+
+        if self._lazy_sources is not None:
+            self._lazy_sources.put(resource.protocol_id, resource.source)
+        else:
+            self._sources_by_id[resource.protocol_id] = resource.source
+
+    async def get(self, protocol_id: str) -> ProtocolResource:
         """Get a single protocol by ID.
 
         Raises:
             ProtocolNotFoundError
         """
-        sql_resource = self._sql_get(protocol_id=protocol_id)
+        sql_resource = await self._sql_get(protocol_id=protocol_id)
         return ProtocolResource(
             protocol_id=sql_resource.protocol_id,
             created_at=sql_resource.created_at,
             protocol_key=sql_resource.protocol_key,
-            source=self._sources_by_id[sql_resource.protocol_id],
+            source=await self._get_source(sql_resource.protocol_id),
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get_all(self) -> List[ProtocolResource]:
-        """Get all protocols currently saved in this store."""
-        all_sql_resources = self._sql_get_all()
+    async def get_all(self) -> List[ProtocolResource]:
+        """Get all protocols currently saved in this store.
+
+        Protocols whose `ProtocolSource` fails to compute are logged and left out.
+        """
+        all_sql_resources = await self._sql_get_all()
+        sources_by_id: Dict[str, ProtocolSource] = {}
+
+        async def get_source(protocol_id: str) -> None:
+            try:
+                sources_by_id[protocol_id] = await self._get_source(protocol_id)
+            except Exception as e:
+                _log.warning(
+                    f"Failed to compute source of protocol {protocol_id}.",
+                    exc_info=e,
+                )
+
+        # Don't let the sources read for this listing evict each other.
+        with (
+            self._lazy_sources.reserve(len(all_sql_resources))
+            if self._lazy_sources is not None
+            else nullcontext()
+        ):
+            async with create_task_group() as task_group:
+                for r in all_sql_resources:
+                    task_group.start_soon(get_source, r.protocol_id)
+
         return [
             ProtocolResource(
                 protocol_id=r.protocol_id,
                 created_at=r.created_at,
                 protocol_key=r.protocol_key,
-                source=self._sources_by_id[r.protocol_id],
+                source=sources_by_id[r.protocol_id],
             )
             for r in all_sql_resources
+            if r.protocol_id in sources_by_id
         ]
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def has(self, protocol_id: str) -> bool:
+    async def warm_source_cache(self) -> None:
+        """Compute the `ProtocolSource`s of the most recently added protocols.
+
+        This only does anything if this store was rehydrated with `lazy=True`.
+        It computes one `ProtocolSource` at a time, so it's meant to be run
+        as a background task after startup.
+        """
+        if self._lazy_sources is None:
+            return
+
+        newest_first = reversed(await self._sql_get_all())
+
+        for index, sql_resource in enumerate(newest_first):
+            if index >= self._lazy_sources.max_entries:
+                break
+
+            try:
+                await self._lazy_sources.get(sql_resource.protocol_id)
+            except Exception as e:
+                _log.warning(
+                    f"Failed to compute source of protocol"
+                    f" {sql_resource.protocol_id}.",
+                    exc_info=e,
+                )
+
+    async def has(self, protocol_id: str) -> bool:
         """Check for the presence of a protocol ID in the store."""
-        statement = sqlalchemy.select(protocol_table).where(
+        statement = sqlalchemy.select(protocol_table.c.id).where(
             protocol_table.c.id == protocol_id
         )
 
-        with self._sql_engine.begin() as transaction:
-            result = transaction.execute(statement).one_or_none()
+        def read(transaction: sqlalchemy.engine.Connection) -> bool:
+            return transaction.execute(statement).one_or_none() is not None
 
-        return result is not None
+        return await self._read(("has", protocol_id), read)
 
-    def remove(self, protocol_id: str) -> None:
+    async def remove(self, protocol_id: str) -> None:
         """Remove a `ProtocolResource` from the store.
 
         After removing it from the store, attempt to delete all files that it
@@ -227,22 +329,34 @@ class ProtocolStore:
             ProtocolUsedByRunError: the protocol could not be deleted because
                 there is a run currently referencing the protocol.
         """
-        self._sql_remove(protocol_id=protocol_id)
+        try:
+            await run_in_thread(
+                self._sql_engine, partial(_sql_remove, protocol_id=protocol_id)
+            )
+        finally:
+            self._clear_caches()
 
-        deleted_source = self._sources_by_id.pop(protocol_id)
-        protocol_dir = deleted_source.directory
+        protocol_dir: Optional[Path] = None
 
-        for source_file in deleted_source.files:
-            source_file.path.unlink()
-        if protocol_dir:
-            protocol_dir.rmdir()
+        if self._lazy_sources is not None:
+            deleted_source = self._lazy_sources.pop(protocol_id)
+            protocol_dir = self._lazy_sources.get_directory(protocol_id)
+        else:
+            deleted_source = self._sources_by_id.pop(protocol_id)
 
-        self._clear_caches()
+        await anyio.to_thread.run_sync(
+            partial(
+                _delete_protocol_files,
+                protocol_id=protocol_id,
+                source=deleted_source,
+                protocol_dir=protocol_dir,
+            )
+        )
 
     # Note that this is NOT cached like the other getters because we would need
     # to invalidate the cache whenever the runs table changes, which is not something
     # that this class can easily monitor.
-    def get_usage_info(self) -> List[ProtocolUsageInfo]:
+    async def get_usage_info(self) -> List[ProtocolUsageInfo]:
         """Return information about which protocols are currently being used by runs.
 
         See the `runs` module for information about runs.
@@ -256,7 +370,7 @@ class ProtocolStore:
             run_table.c.protocol_id.is_not(None)
         )
 
-        with self._sql_engine.begin() as transaction:
+        def read(transaction: sqlalchemy.engine.Connection) -> List[ProtocolUsageInfo]:
             all_protocol_ids: List[str] = (
                 transaction.execute(select_all_protocol_ids).scalars().all()
             )
@@ -264,80 +378,140 @@ class ProtocolStore:
                 transaction.execute(select_used_protocol_ids).scalars().all()
             )
 
-        # It's probably inefficient to do this processing in Python
-        # instead of as part of the SQL query.
-        # But the number of runs and protocols is on the order of 20, so it's fine.
-        usage_info = [
-            ProtocolUsageInfo(
-                protocol_id=protocol_id,
-                is_used_by_run=(protocol_id in used_protocol_ids),
-            )
-            for protocol_id in all_protocol_ids
-        ]
-
-        return usage_info
-
-    def _sql_insert(self, resource: _DBProtocolResource) -> None:
-        statement = sqlalchemy.insert(protocol_table).values(
-            _convert_dataclass_to_sql_values(resource=resource)
-        )
-        with self._sql_engine.begin() as transaction:
-            transaction.execute(statement)
-
-    def _sql_get(self, protocol_id: str) -> _DBProtocolResource:
+            # It's probably inefficient to do this processing in Python
+            # instead of as part of the SQL query. But the number of runs
+            # and protocols is on the order of 20, so it's fine.
+            return [
+                ProtocolUsageInfo(
+                    protocol_id=protocol_id,
+                    is_used_by_run=(protocol_id in used_protocol_ids),
+                )
+                for protocol_id in all_protocol_ids
+            ]
+
+        return await run_in_thread(self._sql_engine, read)
+
+    async def _get_source(self, protocol_id: str) -> ProtocolSource:
+        if self._lazy_sources is not None:
+            return await self._lazy_sources.get(protocol_id)
+        return self._sources_by_id[protocol_id]
+
+    async def _sql_get(self, protocol_id: str) -> _DBProtocolResource:
         statement = sqlalchemy.select(protocol_table).where(
             protocol_table.c.id == protocol_id
         )
-        with self._sql_engine.begin() as transaction:
+
+        def read(transaction: sqlalchemy.engine.Connection) -> _DBProtocolResource:
             try:
                 matching_row = transaction.execute(statement).one()
             except sqlalchemy.exc.NoResultFound as e:
                 raise ProtocolNotFoundError(protocol_id=protocol_id) from e
-        return _convert_sql_row_to_dataclass(sql_row=matching_row)
+            return _convert_sql_row_to_dataclass(sql_row=matching_row)
 
-    def _sql_get_all(self) -> List[_DBProtocolResource]:
-        return self._sql_get_all_from_engine(sql_engine=self._sql_engine)
+        return await self._read(("get", protocol_id), read)
 
-    @staticmethod
-    def _sql_get_all_from_engine(
-        sql_engine: sqlalchemy.engine.Engine,
-    ) -> List[_DBProtocolResource]:
-        statement = sqlalchemy.select(protocol_table)
-        with sql_engine.begin() as transaction:
-            all_rows = transaction.execute(statement).all()
-        return [_convert_sql_row_to_dataclass(sql_row=row) for row in all_rows]
-
-    def _sql_remove(self, protocol_id: str) -> None:
-        delete_analyses_statement = sqlalchemy.delete(analysis_table).where(
-            analysis_table.c.protocol_id == protocol_id
-        )
-        delete_protocol_statement = sqlalchemy.delete(protocol_table).where(
-            protocol_table.c.id == protocol_id
-        )
+    async def _sql_get_all(self) -> List[_DBProtocolResource]:
+        return await self._read(("get_all",), _sql_select_all)
 
-        with self._sql_engine.begin() as transaction:
-            # TODO(mm, 2022-04-28): Deleting analyses from the table is enough to
-            # avoid a SQL foreign key conflict. But, if this protocol had any *pending*
-            # analyses, they'll be left behind in the AnalysisStore, orphaned,
-            # since they're stored independently of this SQL table.
-            #
-            # To fix this, we'll need to either:
-            #
-            # * Merge the Store classes or otherwise give them access to each other.
-            # * Switch from SQLAlchemy Core to ORM and use cascade deletes.
-            try:
-                transaction.execute(delete_analyses_statement)
-                result = transaction.execute(delete_protocol_statement)
-            except sqlalchemy.exc.IntegrityError as e:
-                raise ProtocolUsedByRunError(protocol_id=protocol_id) from e
+    async def _read(
+        self,
+        key: Hashable,
+        read: Callable[[sqlalchemy.engine.Connection], _ResultT],
+    ) -> _ResultT:
+        """Run a read in a worker thread, caching its result.
+
+        A read may still be running in its worker thread when a write
+        clears the caches, so it only caches its result if no write
+        has happened since it started.
+        """
+        if key in self._read_cache:
+            self._read_cache.move_to_end(key)
+            return self._read_cache[key]  # type: ignore[return-value]
+
+        generation = self._generation
+        result = await run_in_thread(self._sql_engine, read)
+
+        if generation == self._generation:
+            self._read_cache[key] = result
+            if len(self._read_cache) > _CACHE_ENTRIES:
+                self._read_cache.popitem(last=False)
 
-        if result.rowcount < 1:
-            raise ProtocolNotFoundError(protocol_id=protocol_id)
+        return result
 
     def _clear_caches(self) -> None:
-        self.get.cache_clear()
-        self.get_all.cache_clear()
-        self.has.cache_clear()
+        self._generation += 1
+        self._read_cache.clear()
+
+
+class _LazyProtocolSources:
+    """Compute `ProtocolSource`s on demand, keeping the most recently used ones."""
+
+    def __init__(
+        self,
+        protocols_directory: AsyncPath,
+        protocol_reader: ProtocolReader,
+        max_entries: int,
+    ) -> None:
+        self._protocols_directory = protocols_directory
+        self._protocol_reader = protocol_reader
+        self._max_entries = max_entries
+        self._reserved_entries = 0
+        self._sources_by_id: OrderedDict[str, ProtocolSource] = OrderedDict()
+        self._locks_by_id: Dict[str, Lock] = {}
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def get_directory(self, protocol_id: str) -> Path:
+        return Path(self._protocols_directory / protocol_id)
+
+    async def get(self, protocol_id: str) -> ProtocolSource:
+        source = self._get_cached(protocol_id)
+        if source is not None:
+            return source
+
+        # Make concurrent requests for the same protocol share a single read.
+        lock = self._locks_by_id.setdefault(protocol_id, Lock())
+        async with lock:
+            source = self._get_cached(protocol_id)
+            if source is None:
+                source = await _compute_protocol_source(
+                    protocol_subdirectory=self._protocols_directory / protocol_id,
+                    protocol_reader=self._protocol_reader,
+                )
+                self.put(protocol_id, source)
+
+        self._locks_by_id.pop(protocol_id, None)
+        return source
+
+    @contextmanager
+    def reserve(self, entries: int) -> Iterator[None]:
+        """Make room to keep at least `entries` more sources, until exited."""
+        self._reserved_entries += entries
+        try:
+            yield
+        finally:
+            self._reserved_entries -= entries
+            self._trim()
+
+    def put(self, protocol_id: str, source: ProtocolSource) -> None:
+        self._sources_by_id[protocol_id] = source
+        self._sources_by_id.move_to_end(protocol_id)
+        self._trim()
+
+    def pop(self, protocol_id: str) -> Optional[ProtocolSource]:
+        return self._sources_by_id.pop(protocol_id, None)
+
+    def _get_cached(self, protocol_id: str) -> Optional[ProtocolSource]:
+        source = self._sources_by_id.get(protocol_id)
+        if source is not None:
+            self._sources_by_id.move_to_end(protocol_id)
+        return source
+
+    def _trim(self) -> None:
+        while len(self._sources_by_id) > self._max_entries + self._reserved_entries:
+            self._sources_by_id.popitem(last=False)
 
 
 # TODO(mm, 2022-04-18):
@@ -398,19 +572,10 @@ async def _compute_protocol_sources(
     async def compute_source(
         protocol_id: str, protocol_subdirectory: AsyncPath
     ) -> None:
-        # Given that the expected protocol subdirectory exists,
-        # we trust that the files in it are correct.
-        # No extra files, and no files missing.
-        #
-        # This is a safe assumption as long as:
-        #  * Nobody has tampered with file the storage.
-        #  * We don't try to compute the source of any protocol whose insertion
-        #    failed halfway through and left files behind.
-        protocol_files = [Path(f) async for f in protocol_subdirectory.iterdir()]
-        protocol_source = await protocol_reader.read_saved(
-            files=protocol_files, directory=Path(protocol_subdirectory)
+        sources_by_id[protocol_id] = await _compute_protocol_source(
+            protocol_subdirectory=protocol_subdirectory,
+            protocol_reader=protocol_reader,
         )
-        sources_by_id[protocol_id] = protocol_source
 
     async with create_task_group() as task_group:
         # Use a TaskGroup instead of asyncio.gather() so,
@@ -426,6 +591,99 @@ async def _compute_protocol_sources(
     return sources_by_id
 
 
+async def _compute_protocol_source(
+    protocol_subdirectory: AsyncPath,
+    protocol_reader: ProtocolReader,
+) -> ProtocolSource:
+    """Compute a single protocol's `ProtocolSource` from its subdirectory.
+
+    Raises:
+        SubdirectoryMissingError: The protocol's subdirectory does not exist.
+    """
+    if not await protocol_subdirectory.is_dir():
+        raise SubdirectoryMissingError(
+            f"Missing subdirectory for protocol: {protocol_subdirectory.name}"
+        )
+
+    # Given that the expected protocol subdirectory exists,
+    # we trust that the files in it are correct.
+    # No extra files, and no files missing.
+    #
+    # This is a safe assumption as long as:
+    #  * Nobody has tampered with file the storage.
+    #  * We don't try to compute the source of any protocol whose insertion
+    #    failed halfway through and left files behind.
+    protocol_files = [Path(f) async for f in protocol_subdirectory.iterdir()]
+    return await protocol_reader.read_saved(
+        files=protocol_files, directory=Path(protocol_subdirectory)
+    )
+
+
+def _sql_select_all(
+    transaction: sqlalchemy.engine.Connection,
+) -> List[_DBProtocolResource]:
+    statement = sqlalchemy.select(protocol_table)
+    all_rows = transaction.execute(statement).all()
+    return [_convert_sql_row_to_dataclass(sql_row=row) for row in all_rows]
+
+
+def _sql_remove(transaction: sqlalchemy.engine.Connection, protocol_id: str) -> None:
+    delete_analyses_statement = sqlalchemy.delete(analysis_table).where(
+        analysis_table.c.protocol_id == protocol_id
+    )
+    delete_protocol_statement = sqlalchemy.delete(protocol_table).where(
+        protocol_table.c.id == protocol_id
+    )
+
+    # TODO(mm, 2022-04-28): Deleting analyses from the table is enough to
+    # avoid a SQL foreign key conflict. But, if this protocol had any *pending*
+    # analyses, they'll be left behind in the AnalysisStore, orphaned,
+    # since they're stored independently of this SQL table.
+    #
+    # To fix this, we'll need to either:
+    #
+    # * Merge the Store classes or otherwise give them access to each other.
+    # * Switch from SQLAlchemy Core to ORM and use cascade deletes.
+    try:
+        transaction.execute(delete_analyses_statement)
+        result = transaction.execute(delete_protocol_statement)
+    except sqlalchemy.exc.IntegrityError as e:
+        raise ProtocolUsedByRunError(protocol_id=protocol_id) from e
+
+    if result.rowcount < 1:
+        raise ProtocolNotFoundError(protocol_id=protocol_id)
+
+
+def _delete_protocol_files(
+    protocol_id: str,
+    source: Optional[ProtocolSource],
+    protocol_dir: Optional[Path],
+) -> None:
+    """Delete a removed protocol's files and directory.
+
+    Params:
+        protocol_id: The removed protocol's ID.
+        source: The removed protocol's source, if it was in memory.
+        protocol_dir: The removed protocol's directory, if it was rehydrated
+            lazily. Used to find its files if `source` is `None`.
+    """
+    if source is not None:
+        protocol_dir = source.directory
+        for source_file in source.files:
+            source_file.path.unlink()
+    elif protocol_dir is not None and protocol_dir.is_dir():
+        # The lazily-rehydrated source was never computed, or was evicted,
+        # so the files to delete are whatever is in the protocol's directory.
+        for path in protocol_dir.iterdir():
+            path.unlink()
+    else:
+        _log.warning(f"Protocol {protocol_id} had no files to delete.")
+        protocol_dir = None
+
+    if protocol_dir:
+        protocol_dir.rmdir()
+
+
 @dataclass(frozen=True)
 class _DBProtocolResource:
     """The subset of a ProtocolResource that's stored in the SQL database."""
@@ -2,30 +2,43 @@
 import logging
 from textwrap import dedent
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, UploadFile, status, Form
+import anyio
+from fastapi import APIRouter, Depends, File, Header, UploadFile, status, Form
+from fastapi.responses import Response
 from typing import List, Optional, Union
-from typing_extensions import Literal
+from typing_extensions import Final, Literal
 
+from opentrons.hardware_control import HardwareControlAPI
 from opentrons.protocol_reader import ProtocolReader, ProtocolFilesInvalidError
 
 from robot_server.errors import ErrorDetails, ErrorBody
+from robot_server.hardware import get_hardware
 from robot_server.service.task_runner import TaskRunner, get_task_runner
-from robot_server.service.dependencies import get_unique_id, get_current_time
+from robot_server.service.dependencies import (
+    get_unique_id,
+    get_current_time,
+    get_response_cache,
+)
 from robot_server.service.json_api import (
     SimpleBody,
     SimpleMultiBody,
     SimpleEmptyBody,
     MultiBodyMeta,
     PydanticResponse,
+    PreSerializedMultiBodyResponse,
+    ResponseCache,
 )
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_models import Protocol, ProtocolFile, Metadata
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore, AnalysisNotFoundError
-from .analysis_models import ProtocolAnalysis
+from .analysis_models import ProtocolAnalysis, AnalysisStatus, AnalysisSummary
+from .analysis_cache import AnalysisCache, compute_analysis_cache_key
+from .analysis_worker_pool import AnalysisWorkerPool
 from .protocol_store import (
     ProtocolStore,
     ProtocolResource,
@@ -39,11 +52,15 @@ from .dependencies import (
     get_analysis_store,
     get_protocol_analyzer,
     get_protocol_directory,
+    get_analysis_worker_pool,
+    get_analysis_cache,
 )
 
 
 log = logging.getLogger(__name__)
 
+_ANALYSES_RESPONSE_KEY: Final = "analyses"
+
 
 class ProtocolNotFound(ErrorDetails):
     """An error returned when a given protocol cannot be found."""
@@ -110,6 +127,8 @@ async def create_protocol(
     analysis_store: AnalysisStore = Depends(get_analysis_store),
     protocol_reader: ProtocolReader = Depends(get_protocol_reader),
     protocol_analyzer: ProtocolAnalyzer = Depends(get_protocol_analyzer),
+    analysis_cache: AnalysisCache = Depends(get_analysis_cache),
+    hardware: HardwareControlAPI = Depends(get_hardware),
     task_runner: TaskRunner = Depends(get_task_runner),
     protocol_auto_deleter: ProtocolAutoDeleter = Depends(get_protocol_auto_deleter),
     protocol_id: str = Depends(get_unique_id, use_cache=False),
@@ -126,6 +145,9 @@ async def create_protocol(
         analysis_store: In-memory database of protocol analyses.
         protocol_reader: Protocol file reading interface.
         protocol_analyzer: Protocol analysis interface.
+        analysis_cache: Cache of previous analyses, to reuse for identical
+            protocols instead of analyzing them again.
+        hardware: Hardware control interface, to check attached instruments.
         task_runner: Background task runner.
         protocol_auto_deleter: An interface to delete old resources to make room for
             the new protocol.
@@ -150,25 +172,51 @@ async def create_protocol(
         protocol_key=key,
     )
 
-    protocol_auto_deleter.make_room_for_new_protocol()
-    protocol_store.insert(protocol_resource)
-
-    task_runner.run(
-        protocol_analyzer.analyze,
-        protocol_resource=protocol_resource,
-        analysis_id=analysis_id,
+    cache_key = await anyio.to_thread.run_sync(
+        partial(
+            compute_analysis_cache_key,
+            protocol_source=source,
+            protocol_key=key,
+            attached_instruments=hardware.get_attached_instruments(),
+        )
     )
-    pending_analysis = analysis_store.add_pending(
+
+    await protocol_auto_deleter.make_room_for_new_protocol()
+    await protocol_store.insert(protocol_resource)
+
+    cached_analysis = await analysis_cache.get(cache_key)
+    analysis_summary: AnalysisSummary = analysis_store.add_pending(
         protocol_id=protocol_id,
         analysis_id=analysis_id,
     )
 
+    if cached_analysis is not None:
+        log.info(f'Reusing cached analysis "{cached_analysis.id}" as "{analysis_id}".')
+        await analysis_store.update(
+            analysis_id=analysis_id,
+            commands=cached_analysis.commands,
+            labware=cached_analysis.labware,
+            pipettes=cached_analysis.pipettes,
+            errors=cached_analysis.errors,
+        )
+        analysis_summary = AnalysisSummary.construct(
+            id=analysis_id,
+            status=AnalysisStatus.COMPLETED,
+        )
+    else:
+        task_runner.run(
+            protocol_analyzer.analyze,
+            protocol_resource=protocol_resource,
+            analysis_id=analysis_id,
+            cache_key=cache_key,
+        )
+
     data = Protocol(
         id=protocol_id,
         createdAt=created_at,
         protocolType=source.config.protocol_type,
         metadata=Metadata.parse_obj(source.metadata),
-        analysisSummaries=[pending_analysis],
+        analysisSummaries=[analysis_summary],
         key=key,
         files=[ProtocolFile(name=f.path.name, role=f.role) for f in source.files],
     )
@@ -196,14 +244,16 @@ async def get_protocols(
         protocol_store: In-memory database of protocol resources.
         analysis_store: In-memory database of protocol analyses.
     """
-    protocol_resources = protocol_store.get_all()
+    protocol_resources = await protocol_store.get_all()
     data = [
         Protocol(
             id=r.protocol_id,
             createdAt=r.created_at,
             protocolType=r.source.config.protocol_type,
             metadata=Metadata.parse_obj(r.source.metadata),
-            analysisSummaries=analysis_store.get_summaries_by_protocol(r.protocol_id),
+            analysisSummaries=await analysis_store.get_summaries_by_protocol(
+                r.protocol_id
+            ),
             key=r.protocol_key,
             files=[ProtocolFile(name=f.path.name, role=f.role) for f in r.source.files],
         )
@@ -238,11 +288,11 @@ async def get_protocol_by_id(
         analysis_store: In-memory database of protocol analyses.
     """
     try:
-        resource = protocol_store.get(protocol_id=protocolId)
+        resource = await protocol_store.get(protocol_id=protocolId)
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
-    analyses = analysis_store.get_summaries_by_protocol(protocol_id=protocolId)
+    analyses = await analysis_store.get_summaries_by_protocol(protocol_id=protocolId)
 
     data = Protocol.construct(
         id=protocolId,
@@ -274,15 +324,31 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_store: AnalysisStore = Depends(get_analysis_store),
+    analysis_worker_pool: AnalysisWorkerPool = Depends(get_analysis_worker_pool),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete an uploaded protocol by ID.
 
+    Any of the protocol's analyses that are still pending are cancelled.
+
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_store: Database of protocol analyses.
+        analysis_worker_pool: Worker processes running protocol analyses.
+        response_cache: Cached responses of completed analyses.
     """
+    pending_analysis_ids = [
+        summary.id
+        for summary in await analysis_store.get_summaries_by_protocol(
+            protocol_id=protocolId
+        )
+        if summary.status == AnalysisStatus.PENDING
+    ]
+
     try:
-        protocol_store.remove(protocol_id=protocolId)
+        await protocol_store.remove(protocol_id=protocolId)
 
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
@@ -290,6 +356,11 @@ async def delete_protocol_by_id(
     except ProtocolUsedByRunError as e:
         raise ProtocolUsedByRun(detail=str(e)).as_error(status.HTTP_409_CONFLICT) from e
 
+    response_cache.invalidate(protocolId)
+
+    for analysis_id in pending_analysis_ids:
+        analysis_worker_pool.cancel(analysis_id)
+
     return await PydanticResponse.create(
         content=SimpleEmptyBody.construct(),
         status_code=status.HTTP_200_OK,
@@ -308,30 +379,49 @@ async def get_protocol_analyses(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleMultiBody[ProtocolAnalysis]]:
+    if_none_match: Optional[str] = Header(None),
+    response_cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
     """Get a protocol's full analyses list.
 
     Analyses are returned in order from least-recently started to most-recently started.
+    Stored analyses are sent as-is, without being parsed and re-rendered.
+    Once every analysis is completed, the list can't change, so it's cached,
+    and sent with an `ETag` for conditional requests.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: Database of protocol resources.
         analysis_store: Database of analysis resources.
+        if_none_match: Entity tags of responses the client already has.
+        response_cache: Cached responses of completed analyses.
     """
-    if not protocol_store.has(protocolId):
+    if not await protocol_store.has(protocolId):
         raise ProtocolNotFound(detail=f"Protocol {protocolId} not found").as_error(
             status.HTTP_404_NOT_FOUND
         )
 
-    analyses = await analysis_store.get_by_protocol(protocolId)
+    cached = response_cache.get(protocolId, _ANALYSES_RESPONSE_KEY)
+    if cached is not None:
+        return cached.to_response(if_none_match)
 
-    return await PydanticResponse.create(
-        content=SimpleMultiBody.construct(
-            data=analyses,
-            meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
-        )
+    generation = response_cache.generation
+    summaries = await analysis_store.get_summaries_by_protocol(protocol_id=protocolId)
+    is_completed = len(summaries) > 0 and all(
+        summary.status == AnalysisStatus.COMPLETED for summary in summaries
+    )
+
+    analyses = await analysis_store.get_by_protocol_as_document(protocolId)
+    response = PreSerializedMultiBodyResponse(
+        data=analyses,
+        meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
     )
 
+    if is_completed:
+        response_cache.put(protocolId, _ANALYSES_RESPONSE_KEY, response, generation)
+
+    return response
+
 
 @protocols_router.get(
     path="/protocols/{protocolId}/analyses/{analysisId}",
@@ -357,7 +447,7 @@ async def get_protocol_analysis_by_id(
         protocol_store: Protocol resource storage.
         analysis_store: Analysis resource storage.
     """
-    if not protocol_store.has(protocolId):
+    if not await protocol_store.has(protocolId):
         raise ProtocolNotFound(detail=f"Protocol {protocolId} not found").as_error(
             status.HTTP_404_NOT_FOUND
         )
@@ -1,4 +1,5 @@
 """In-memory storage of ProtocolEngine instances."""
+import asyncio
 from typing import List, NamedTuple, Optional
 
 from opentrons.hardware_control import HardwareControlAPI
@@ -43,6 +44,7 @@ class EngineStore:
         self._hardware_api = hardware_api
         self._default_engine: Optional[ProtocolEngine] = None
         self._runner_engine_pair: Optional[RunnerEnginePair] = None
+        self._run_change_waiters: List["asyncio.Future[None]"] = []
 
     @property
     def engine(self) -> ProtocolEngine:
@@ -65,6 +67,17 @@ class EngineStore:
             else None
         )
 
+    async def wait_for_run_change(self) -> None:
+        """Wait until the current run changes, to a new run or to no run at all."""
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._run_change_waiters.append(waiter)
+
+        try:
+            await waiter
+        finally:
+            if waiter in self._run_change_waiters:
+                self._run_change_waiters.remove(waiter)
+
     # TODO(mc, 2022-03-21): this resource locking is insufficient;
     # come up with something more sophisticated without race condition holes.
     async def get_default_engine(self) -> ProtocolEngine:
@@ -120,10 +133,8 @@ class EngineStore:
         for offset in labware_offsets:
             engine.add_labware_offset(offset)
 
-        self._runner_engine_pair = RunnerEnginePair(
-            run_id=run_id,
-            runner=runner,
-            engine=engine,
+        self._set_runner_engine_pair(
+            RunnerEnginePair(run_id=run_id, runner=runner, engine=engine)
         )
 
         return engine.state_view.get_summary()
@@ -145,6 +156,15 @@ class EngineStore:
 
         run_data = state_view.get_summary()
         commands = state_view.commands.get_all()
-        self._runner_engine_pair = None
+        self._set_runner_engine_pair(None)
 
         return ProtocolRunResult(state_summary=run_data, commands=commands)
+
+    def _set_runner_engine_pair(self, pair: Optional[RunnerEnginePair]) -> None:
+        self._runner_engine_pair = pair
+
+        for waiter in self._run_change_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        self._run_change_waiters.clear()
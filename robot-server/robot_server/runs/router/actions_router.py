@@ -41,7 +41,7 @@ async def get_run_controller(
     received. Dependents should not assume that condition will necessarily
     hold throughout the lifetime of the request handler.
     """
-    if not run_store.has(runId):
+    if not await run_store.has(runId):
         raise RunNotFound(detail=f"Run {runId} not found.").as_error(
             status.HTTP_404_NOT_FOUND
         )
@@ -89,7 +89,7 @@ async def create_run_action(
         created_at: Timestamp to attach to the control action.
     """
     try:
-        action = run_controller.create_action(
+        action = await run_controller.create_action(
             action_id=action_id,
             action_type=request_body.data.actionType,
             created_at=created_at,
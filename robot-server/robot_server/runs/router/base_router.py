@@ -6,13 +6,18 @@ import logging
 from datetime import datetime
 from textwrap import dedent
 from typing import Optional, Union
-from typing_extensions import Literal
+from typing_extensions import Final, Literal
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, status
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from robot_server.errors import ErrorDetails, ErrorBody
-from robot_server.service.dependencies import get_current_time, get_unique_id
+from robot_server.service.dependencies import (
+    get_current_time,
+    get_response_cache,
+    get_unique_id,
+)
 
 from robot_server.service.json_api import (
     RequestModel,
@@ -22,6 +27,7 @@ from robot_server.service.json_api import (
     MultiBodyMeta,
     ResourceLink,
     PydanticResponse,
+    ResponseCache,
 )
 
 from robot_server.protocols import (
@@ -42,6 +48,8 @@ from ..dependencies import get_run_data_manager, get_run_auto_deleter
 log = logging.getLogger(__name__)
 base_router = APIRouter()
 
+_RUN_RESPONSE_KEY: Final = "run"
+
 
 class RunNotFound(ErrorDetails):
     """An error if a given run is not found."""
@@ -95,7 +103,7 @@ async def get_run_data_from_url(
         run_data_manager: Current and historical run data management.
     """
     try:
-        run_data = run_data_manager.get(runId)
+        run_data = await run_data_manager.get(runId)
     except RunNotFoundError as e:
         raise RunNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
@@ -127,6 +135,7 @@ async def create_run(
     run_id: str = Depends(get_unique_id),
     created_at: datetime = Depends(get_current_time),
     run_auto_deleter: RunAutoDeleter = Depends(get_run_auto_deleter),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> PydanticResponse[SimpleBody[Run]]:
     """Create a new run.
 
@@ -138,6 +147,7 @@ async def create_run(
         created_at: Timestamp to attach to created run.
         run_auto_deleter: An interface to delete old resources to make room for
             the new run.
+        response_cache: Cached responses of historical runs.
     """
     protocol_id = request_body.data.protocolId if request_body is not None else None
     offsets = request_body.data.labwareOffsets if request_body is not None else []
@@ -147,14 +157,16 @@ async def create_run(
     #  Check if we can consolidate to one place.
     if protocol_id is not None:
         try:
-            protocol_resource = protocol_store.get(protocol_id=protocol_id)
+            protocol_resource = await protocol_store.get(protocol_id=protocol_id)
         except ProtocolNotFoundError as e:
             raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
     # TODO(mc, 2022-05-13): move inside `RunDataManager` or return data
     # to pass to `RunDataManager.create`. Right now, runs may be deleted
     # even if a new create is unable to succeed due to a conflict
-    run_auto_deleter.make_room_for_new_run()
+    await run_auto_deleter.make_room_for_new_run()
+
+    prev_run_id = run_data_manager.current_run_id
 
     try:
         run_data = await run_data_manager.create(
@@ -167,6 +179,10 @@ async def create_run(
         raise RunAlreadyActive(detail=str(e)).as_error(status.HTTP_409_CONFLICT) from e
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
+    finally:
+        # The previous run may have been read while it was being archived
+        if prev_run_id is not None:
+            response_cache.invalidate(prev_run_id)
 
     log.info(f'Created protocol run "{run_id}" from protocol "{protocol_id}".')
 
@@ -192,7 +208,7 @@ async def get_runs(
     Args:
         run_data_manager: Current and historical run data management.
     """
-    data = run_data_manager.get_all()
+    data = await run_data_manager.get_all()
     current_run_id = run_data_manager.current_run_id
     meta = MultiBodyMeta(cursor=0, totalLength=len(data))
     links = AllRunsLinks(
@@ -217,18 +233,43 @@ async def get_runs(
     },
 )
 async def get_run(
-    run_data: Run = Depends(get_run_data_from_url),
-) -> PydanticResponse[SimpleBody[Run]]:
+    runId: str,
+    if_none_match: Optional[str] = Header(None),
+    run_data_manager: RunDataManager = Depends(get_run_data_manager),
+    response_cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
     """Get a run by its ID.
 
+    Historical runs can't change, so their responses are cached,
+    and sent with an `ETag` for conditional requests.
+
     Args:
-        run_data: Data of the run specified in the runId url parameter.
+        runId: Run ID pulled from URL.
+        if_none_match: Entity tags of responses the client already has.
+        run_data_manager: Current and historical run data management.
+        response_cache: Cached responses of historical runs.
     """
-    return await PydanticResponse.create(
+    is_historical = (
+        runId != run_data_manager.current_run_id and await run_data_manager.has(runId)
+    )
+
+    if is_historical:
+        cached = response_cache.get(runId, _RUN_RESPONSE_KEY)
+        if cached is not None:
+            return cached.to_response(if_none_match)
+
+    generation = response_cache.generation
+    run_data = await get_run_data_from_url(runId, run_data_manager)
+    response = await PydanticResponse.create(
         content=SimpleBody.construct(data=run_data),
         status_code=status.HTTP_200_OK,
     )
 
+    if is_historical:
+        response_cache.put(runId, _RUN_RESPONSE_KEY, response, generation)
+
+    return response
+
 
 @base_router.delete(
     path="/runs/{runId}",
@@ -242,15 +283,18 @@ async def get_run(
 async def remove_run(
     runId: str,
     run_data_manager: RunDataManager = Depends(get_run_data_manager),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete a run by its ID.
 
     Arguments:
         runId: Run ID pulled from URL.
         run_data_manager: Current and historical run data management.
+        response_cache: Cached responses of historical runs.
     """
     try:
         await run_data_manager.delete(runId)
+        response_cache.invalidate(runId)
 
     except EngineConflictError as e:
         raise RunNotIdle().as_error(status.HTTP_409_CONFLICT) from e
@@ -278,6 +322,7 @@ async def update_run(
     runId: str,
     request_body: RequestModel[RunUpdate],
     run_data_manager: RunDataManager = Depends(get_run_data_manager),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> PydanticResponse[SimpleBody[Run]]:
     """Update a run by its ID.
 
@@ -285,6 +330,7 @@ async def update_run(
         runId: Run ID pulled from URL.
         request_body: Update data from request body.
         run_data_manager: Current and historical run data management.
+        response_cache: Cached responses of historical runs.
     """
     try:
         run_data = await run_data_manager.update(
@@ -296,6 +342,9 @@ async def update_run(
         raise RunStopped(detail=str(e)).as_error(status.HTTP_409_CONFLICT) from e
     except RunNotFoundError as e:
         raise RunNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
+    finally:
+        # The run may have been read while it was being archived
+        response_cache.invalidate(runId)
 
     return await PydanticResponse.create(
         content=SimpleBody.construct(data=run_data),
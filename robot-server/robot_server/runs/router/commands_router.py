@@ -1,26 +1,31 @@
 """Router for /runs commands endpoints."""
 import textwrap
 from datetime import datetime
-from typing import Optional, Union
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable, Optional, Union
 from typing_extensions import Final, Literal
 
-from anyio import move_on_after
-from fastapi import APIRouter, Depends, Query, status
+from anyio import create_task_group, move_on_after
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from opentrons.protocol_engine import (
+    CurrentCommand,
     ProtocolEngine,
     commands as pe_commands,
     errors as pe_errors,
 )
 
 from robot_server.errors import ErrorDetails, ErrorBody
+from robot_server.service.dependencies import get_response_cache
 from robot_server.service.json_api import (
     RequestModel,
     SimpleBody,
     MultiBody,
     MultiBodyMeta,
     PydanticResponse,
+    ResponseCache,
 )
 
 from ..run_models import RunCommandSummary
@@ -33,6 +38,7 @@ from .base_router import RunNotFound, RunStopped
 
 _DEFAULT_COMMAND_LIST_LENGTH: Final = 20
 _DEFAULT_COMMAND_WAIT_MS: Final = 30_000
+_COMMAND_UPDATES_KEEPALIVE_SEC: Final = 15.0
 
 commands_router = APIRouter()
 
@@ -80,6 +86,49 @@ class CommandCollectionLinks(BaseModel):
     )
 
 
+class CommandUpdate(BaseModel):
+    """A command that was added or changed, sent by the command updates stream."""
+
+    index: int = Field(..., description="Index of the command in the overall list.")
+    command: RunCommandSummary = Field(..., description="The command's new state.")
+
+
+def _summarize_command(command: pe_commands.Command) -> RunCommandSummary:
+    return RunCommandSummary.construct(
+        id=command.id,
+        key=command.key,
+        commandType=command.commandType,
+        intent=command.intent,
+        status=command.status,
+        createdAt=command.createdAt,
+        startedAt=command.startedAt,
+        completedAt=command.completedAt,
+        params=command.params,
+        error=command.error,
+    )
+
+
+def _get_collection_links(
+    run_id: str,
+    current_command: Optional[CurrentCommand],
+) -> CommandCollectionLinks:
+    links = CommandCollectionLinks()
+
+    if current_command is not None:
+        links.current = CommandLink(
+            href=f"/runs/{run_id}/commands/{current_command.command_id}",
+            meta=CommandLinkMeta(
+                runId=run_id,
+                commandId=current_command.command_id,
+                index=current_command.index,
+                key=current_command.command_key,
+                createdAt=current_command.created_at,
+            ),
+        )
+
+    return links
+
+
 async def get_current_run_engine_from_url(
     runId: str,
     engine_store: EngineStore = Depends(get_engine_store),
@@ -99,7 +148,7 @@ async def get_current_run_engine_from_url(
     # HTTP 409 instead of 404.
     # https://github.com/Opentrons/opentrons/issues/10333
 
-    # if not run_store.has(runId):
+    # if not await run_store.has(runId):
     #     raise RunNotFound(detail=f"Run {runId} not found.").as_error(
     #         status.HTTP_404_NOT_FOUND
     #     )
@@ -250,18 +299,37 @@ async def get_run_commands(
         _DEFAULT_COMMAND_LIST_LENGTH,
         description="The maximum number of commands in the list to return.",
     ),
+    if_none_match: Optional[str] = Header(None),
     run_data_manager: RunDataManager = Depends(get_run_data_manager),
-) -> PydanticResponse[MultiBody[RunCommandSummary, CommandCollectionLinks]]:
+    response_cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
     """Get a summary of a set of commands in a run.
 
+    A historical run's commands can't change, so slices of them are cached,
+    and sent with an `ETag` for conditional requests.
+
     Arguments:
         runId: Requested run ID, from the URL
         cursor: Cursor index for the collection response.
         pageLength: Maximum number of items to return.
+        if_none_match: Entity tags of responses the client already has.
         run_data_manager: Run data retrieval interface.
+        response_cache: Cached responses of historical runs.
     """
+    response_key = ("commands", cursor, pageLength)
+    is_historical = (
+        runId != run_data_manager.current_run_id and await run_data_manager.has(runId)
+    )
+
+    if is_historical:
+        cached = response_cache.get(runId, response_key)
+        if cached is not None:
+            return cached.to_response(if_none_match)
+
+    generation = response_cache.generation
+
     try:
-        command_slice = run_data_manager.get_commands_slice(
+        command_slice = await run_data_manager.get_commands_slice(
             run_id=runId,
             cursor=cursor,
             length=pageLength,
@@ -271,46 +339,25 @@ async def get_run_commands(
 
     current_command = run_data_manager.get_current_command(run_id=runId)
 
-    data = [
-        RunCommandSummary.construct(
-            id=c.id,
-            key=c.key,
-            commandType=c.commandType,
-            intent=c.intent,
-            status=c.status,
-            createdAt=c.createdAt,
-            startedAt=c.startedAt,
-            completedAt=c.completedAt,
-            params=c.params,
-            error=c.error,
-        )
-        for c in command_slice.commands
-    ]
+    data = [_summarize_command(c) for c in command_slice.commands]
 
     meta = MultiBodyMeta(
         cursor=command_slice.cursor,
         totalLength=command_slice.total_length,
     )
 
-    links = CommandCollectionLinks()
-
-    if current_command is not None:
-        links.current = CommandLink(
-            href=f"/runs/{runId}/commands/{current_command.command_id}",
-            meta=CommandLinkMeta(
-                runId=runId,
-                commandId=current_command.command_id,
-                index=current_command.index,
-                key=current_command.command_key,
-                createdAt=current_command.created_at,
-            ),
-        )
+    links = _get_collection_links(runId, current_command)
 
-    return await PydanticResponse.create(
+    response = await PydanticResponse.create(
         content=MultiBody.construct(data=data, meta=meta, links=links),
         status_code=status.HTTP_200_OK,
     )
 
+    if is_historical:
+        response_cache.put(runId, response_key, response, generation)
+
+    return response
+
 
 @commands_router.get(
     path="/runs/{runId}/commands/{commandId}",
@@ -339,7 +386,7 @@ async def get_run_command(
         run_data_manager: Run data retrieval.
     """
     try:
-        command = run_data_manager.get_command(run_id=runId, command_id=commandId)
+        command = await run_data_manager.get_command(run_id=runId, command_id=commandId)
     except RunNotFoundError as e:
         raise RunNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
     except CommandNotFoundError as e:
@@ -349,3 +396,131 @@ async def get_run_command(
         content=SimpleBody.construct(data=command),
         status_code=status.HTTP_200_OK,
     )
+
+
+async def _stream_command_updates(
+    run_id: str,
+    cursor: int,
+    protocol_engine: ProtocolEngine,
+    engine_store: EngineStore,
+    keepalive_interval: float = _COMMAND_UPDATES_KEEPALIVE_SEC,
+) -> AsyncIterator[str]:
+    """Yield server-sent events for every command change after `cursor`.
+
+    Each event's `id` is the change cursor to resume from,
+    so a reconnecting client may send it back as `Last-Event-ID`.
+    The stream ends once the engine has stopped and every change has been sent,
+    or once the run is no longer the current run.
+    """
+    commands = protocol_engine.state_view.commands
+
+    while engine_store.current_run_id == run_id:
+        changes = commands.get_changes_since(cursor)
+
+        if changes.commands:
+            cursor = changes.cursor
+            body = MultiBody.construct(
+                data=[
+                    CommandUpdate.construct(
+                        index=entry.index,
+                        command=_summarize_command(entry.command),
+                    )
+                    for entry in changes.commands
+                ],
+                meta=MultiBodyMeta(cursor=cursor, totalLength=changes.total_length),
+                links=_get_collection_links(run_id, commands.get_current()),
+            )
+            yield f"id: {cursor}\nevent: commands\ndata: {body.json()}\n\n"
+
+        elif commands.get_is_stopped():
+            return
+
+        else:
+            with move_on_after(keepalive_interval) as scope:
+                # Wake up as soon as commands change, the engine stops,
+                # or this run is no longer the current run.
+                await _wait_for_first(
+                    partial(protocol_engine.wait_for_command_changes, cursor),
+                    engine_store.wait_for_run_change,
+                )
+
+            if scope.cancel_called:
+                yield ": keepalive\n\n"
+
+
+async def _wait_for_first(*waits: Callable[[], Awaitable[None]]) -> None:
+    """Wait until any one of `waits` returns, cancelling the rest."""
+    async with create_task_group() as task_group:
+
+        async def wait_then_cancel_others(wait: Callable[[], Awaitable[None]]) -> None:
+            await wait()
+            task_group.cancel_scope.cancel()
+
+        for wait in waits:
+            task_group.start_soon(wait_then_cancel_others, wait)
+
+
+@commands_router.get(
+    path="/runs/{runId}/command_updates",
+    summary="Stream changes to the run's commands",
+    description=textwrap.dedent(
+        """
+        Open a [server-sent events](https://html.spec.whatwg.org/multipage/server-sent-events.html)
+        stream of the current run's commands, as they are added and as
+        their statuses change.
+
+        Each `commands` event's data has the same shape as the response of
+        `GET /runs/{runId}/commands`, except that each item of `data`
+        is a changed command along with its `index` in the overall list.
+        The event's `id` and `meta.cursor` are a change cursor. To resume
+        after a dropped connection, pass the last change cursor you received
+        as the `cursor` query parameter or the `Last-Event-ID` header.
+
+        The stream ends once the run has stopped and every change has been sent.
+        """
+    ),
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"text/event-stream": {}},
+            "model": MultiBody[CommandUpdate, CommandCollectionLinks],
+        },
+        status.HTTP_409_CONFLICT: {"model": ErrorBody[RunStopped]},
+    },
+)
+async def get_run_command_updates(
+    runId: str,
+    cursor: Optional[int] = Query(
+        None,
+        ge=0,
+        description=(
+            "The change cursor to stream changes after."
+            " If unspecified, falls back to the `Last-Event-ID` header,"
+            " or else streams every command in the run."
+        ),
+    ),
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID", ge=0),
+    protocol_engine: ProtocolEngine = Depends(get_current_run_engine_from_url),
+    engine_store: EngineStore = Depends(get_engine_store),
+) -> StreamingResponse:
+    """Stream changes to the current run's commands as server-sent events.
+
+    Arguments:
+        runId: Run identifier, pulled from route parameter.
+        cursor: Change cursor to resume from, pulled from a query parameter.
+        last_event_id: Change cursor to resume from, pulled from the
+            `Last-Event-ID` header that a reconnecting `EventSource` sends.
+        protocol_engine: The current run's `ProtocolEngine`.
+        engine_store: Engine store, to end the stream if the run changes.
+    """
+    start_cursor = cursor if cursor is not None else last_event_id
+
+    return StreamingResponse(
+        _stream_command_updates(
+            run_id=runId,
+            cursor=start_cursor or 0,
+            protocol_engine=protocol_engine,
+            engine_store=engine_store,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
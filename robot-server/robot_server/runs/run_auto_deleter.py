@@ -19,8 +19,8 @@ class RunAutoDeleter:  # noqa: D101
         self._run_store = run_store
         self._deletion_planner = deletion_planner
 
-    def make_room_for_new_run(self) -> None:  # noqa: D102
-        run_ids = [r.run_id for r in self._run_store.get_all()]
+    async def make_room_for_new_run(self) -> None:  # noqa: D102
+        run_ids = [r.run_id for r in await self._run_store.get_all()]
 
         run_ids_to_delete = self._deletion_planner.plan_for_new_run(
             existing_runs=run_ids,
@@ -31,4 +31,4 @@ class RunAutoDeleter:  # noqa: D101
             f" {run_ids_to_delete}"
         )
         for id in run_ids_to_delete:
-            self._run_store.remove(run_id=id)
+            await self._run_store.remove(run_id=id)
@@ -102,7 +102,7 @@ class RunDataManager:
         prev_run_id = self._engine_store.current_run_id
         if prev_run_id is not None:
             prev_run_result = await self._engine_store.clear()
-            self._run_store.update_run_state(
+            await self._run_store.update_run_state(
                 run_id=prev_run_id,
                 summary=prev_run_result.state_summary,
                 commands=prev_run_result.commands,
@@ -113,7 +113,7 @@ class RunDataManager:
             labware_offsets=labware_offsets,
             protocol=protocol,
         )
-        run_resource = self._run_store.insert(
+        run_resource = await self._run_store.insert(
             run_id=run_id,
             created_at=created_at,
             protocol_id=protocol.protocol_id if protocol is not None else None,
@@ -125,7 +125,7 @@ class RunDataManager:
             current=True,
         )
 
-    def get(self, run_id: str) -> Run:
+    async def get(self, run_id: str) -> Run:
         """Get a run resource.
 
         This method will pull from the current run or the historical runs,
@@ -140,13 +140,17 @@ class RunDataManager:
         Raises:
             RunNotFoundError: The given run identifier does not exist.
         """
-        run_resource = self._run_store.get(run_id=run_id)
-        state_summary = self._get_state_summary(run_id=run_id)
+        run_resource = await self._run_store.get(run_id=run_id)
+        state_summary = await self._get_state_summary(run_id=run_id)
         current = run_id == self._engine_store.current_run_id
 
         return _build_run(run_resource, state_summary, current)
 
-    def get_all(self) -> List[Run]:
+    async def has(self, run_id: str) -> bool:
+        """Whether a given run exists, current or historical."""
+        return await self._run_store.has(run_id)
+
+    async def get_all(self) -> List[Run]:
         """Get current and stored run resources.
 
         Returns:
@@ -155,10 +159,10 @@ class RunDataManager:
         return [
             _build_run(
                 run_resource=run_resource,
-                state_summary=self._get_state_summary(run_resource.run_id),
+                state_summary=await self._get_state_summary(run_resource.run_id),
                 current=run_resource.run_id == self._engine_store.current_run_id,
             )
-            for run_resource in self._run_store.get_all()
+            for run_resource in await self._run_store.get_all()
         ]
 
     async def delete(self, run_id: str) -> None:
@@ -175,7 +179,7 @@ class RunDataManager:
         if run_id == self._engine_store.current_run_id:
             await self._engine_store.clear()
         else:
-            self._run_store.remove(run_id=run_id)
+            await self._run_store.remove(run_id=run_id)
 
     async def update(self, run_id: str, current: Optional[bool]) -> Run:
         """Get and potentially archive a run.
@@ -200,14 +204,14 @@ class RunDataManager:
 
         if next_current is False:
             commands, state_summary = await self._engine_store.clear()
-            run_resource = self._run_store.update_run_state(
+            run_resource = await self._run_store.update_run_state(
                 run_id=run_id,
                 summary=state_summary,
                 commands=commands,
             )
         else:
             state_summary = self._engine_store.engine.state_view.get_summary()
-            run_resource = self._run_store.get(run_id=run_id)
+            run_resource = await self._run_store.get(run_id=run_id)
 
         return _build_run(
             run_resource=run_resource,
@@ -215,7 +219,7 @@ class RunDataManager:
             current=next_current,
         )
 
-    def get_commands_slice(
+    async def get_commands_slice(
         self,
         run_id: str,
         cursor: Optional[int],
@@ -238,7 +242,7 @@ class RunDataManager:
             return the_slice
 
         # Let exception propagate
-        return self._run_store.get_commands_slice(
+        return await self._run_store.get_commands_slice(
             run_id=run_id, cursor=cursor, length=length
         )
 
@@ -252,7 +256,7 @@ class RunDataManager:
             return self._engine_store.engine.state_view.commands.get_current()
         return None
 
-    def get_command(self, run_id: str, command_id: str) -> Command:
+    async def get_command(self, run_id: str, command_id: str) -> Command:
         """Get a run's command by ID.
 
         Args:
@@ -268,14 +272,14 @@ class RunDataManager:
                 command_id=command_id
             )
 
-        return self._run_store.get_command(run_id=run_id, command_id=command_id)
+        return await self._run_store.get_command(run_id=run_id, command_id=command_id)
 
-    def _get_state_summary(self, run_id: str) -> Optional[StateSummary]:
+    async def _get_state_summary(self, run_id: str) -> Optional[StateSummary]:
         result: Optional[StateSummary]
 
         if run_id == self._engine_store.current_run_id:
             result = self._engine_store.engine.state_view.get_summary()
         else:
-            result = self._run_store.get_state_summary(run_id=run_id)
+            result = await self._run_store.get_state_summary(run_id=run_id)
 
         return result
@@ -1,9 +1,9 @@
 """Runs' on-db store."""
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, cast
+from functools import partial
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, TypeVar
 
 import sqlalchemy
 from pydantic import parse_obj_as
@@ -12,7 +12,13 @@ from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice
 from opentrons.protocol_engine.commands import Command
 
-from robot_server.persistence import run_table, action_table, ensure_utc_datetime
+from robot_server.persistence import (
+    run_table,
+    run_command_table,
+    action_table,
+    ensure_utc_datetime,
+    run_in_thread,
+)
 from robot_server.protocols import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
@@ -20,6 +26,8 @@ from .action_models import RunAction, RunActionType
 
 _CACHE_ENTRIES = 32
 
+_ResultT = TypeVar("_ResultT")
+
 
 @dataclass(frozen=True)
 class RunResource:
@@ -57,15 +65,22 @@ class RunStore:
     def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
         """Initialize a RunStore with sql engine."""
         self._sql_engine = sql_engine
+        self._read_cache: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._generation = 0
 
-    def update_run_state(
+    async def update_run_state(
         self,
         run_id: str,
         summary: StateSummary,
-        commands: List[Command],
+        commands: Sequence[Command],
     ) -> RunResource:
         """Update the run's state summary and commands list.
 
+        Commands are stored one row apiece, and this method only appends
+        commands that are not yet stored for this run. Commands that have
+        already been stored are never rewritten, because an archived run's
+        command list cannot change.
+
         Args:
             run_id: The run to update
             summary: The run's equipment and status summary.
@@ -82,13 +97,14 @@ class RunStore:
             .where(run_table.c.id == run_id)
             .values(
                 _convert_state_to_sql_values(
-                    run_id=run_id,
-                    commands=commands,
                     state_summary=summary,
                     engine_status=summary.status,
                 )
             )
         )
+        select_stored_commands_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+            run_command_table.c.run_id == run_id
+        )
         select_run_resource = sqlalchemy.select(
             run_table.c.id,
             run_table.c.protocol_id,
@@ -99,7 +115,7 @@ class RunStore:
             action_table.c.run_id == run_id
         )
 
-        with self._sql_engine.begin() as transaction:
+        def update(transaction: sqlalchemy.engine.Connection) -> RunResource:
             transaction.execute(update_run)
 
             try:
@@ -107,12 +123,29 @@ class RunStore:
             except sqlalchemy.exc.NoResultFound:
                 raise RunNotFoundError(run_id=run_id)
 
+            stored_commands_count = transaction.execute(
+                select_stored_commands_count
+            ).scalar_one()
+            new_command_rows = _convert_commands_to_sql_values(
+                run_id=run_id,
+                commands=commands[stored_commands_count:],
+                start_index=stored_commands_count,
+            )
+
+            if len(new_command_rows) > 0:
+                transaction.execute(
+                    sqlalchemy.insert(run_command_table), new_command_rows
+                )
+
             action_rows = transaction.execute(select_actions).all()
+            return _convert_row_to_run(row=run_row, action_rows=action_rows)
 
-        self._clear_caches()
-        return _convert_row_to_run(row=run_row, action_rows=action_rows)
+        try:
+            return await run_in_thread(self._sql_engine, update)
+        finally:
+            self._clear_caches()
 
-    def insert_action(self, run_id: str, action: RunAction) -> None:
+    async def insert_action(self, run_id: str, action: RunAction) -> None:
         """Insert a run action into the store.
 
         Args:
@@ -126,15 +159,18 @@ class RunStore:
             _convert_action_to_sql_values(run_id=run_id, action=action),
         )
 
-        with self._sql_engine.begin() as transaction:
+        def write(transaction: sqlalchemy.engine.Connection) -> None:
             try:
                 transaction.execute(insert)
             except sqlalchemy.exc.IntegrityError as e:
                 raise RunNotFoundError(run_id=run_id) from e
 
-        self._clear_caches()
+        try:
+            await run_in_thread(self._sql_engine, write)
+        finally:
+            self._clear_caches()
 
-    def insert(
+    async def insert(
         self,
         run_id: str,
         created_at: datetime,
@@ -164,7 +200,7 @@ class RunStore:
             _convert_run_to_sql_values(run=run)
         )
 
-        with self._sql_engine.begin() as transaction:
+        def write(transaction: sqlalchemy.engine.Connection) -> None:
             try:
                 transaction.execute(insert)
             except sqlalchemy.exc.IntegrityError:
@@ -173,18 +209,18 @@ class RunStore:
                 ), "Insert run failed due to unexpected IntegrityError"
                 raise ProtocolNotFoundError(protocol_id=run.protocol_id)
 
-        self._clear_caches()
+        try:
+            await run_in_thread(self._sql_engine, write)
+        finally:
+            self._clear_caches()
+
         return run
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def has(self, run_id: str) -> bool:
+    async def has(self, run_id: str) -> bool:
         """Whether a given run exists in the store."""
-        statement = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
-        with self._sql_engine.begin() as transaction:
-            return transaction.execute(statement).first() is not None
+        return await self._read(("has", run_id), partial(_run_exists, run_id=run_id))
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get(self, run_id: str) -> RunResource:
+    async def get(self, run_id: str) -> RunResource:
         """Get a specific run entry by its identifier.
 
         Args:
@@ -206,17 +242,17 @@ class RunStore:
             action_table.c.run_id == run_id
         )
 
-        with self._sql_engine.begin() as transaction:
+        def read(transaction: sqlalchemy.engine.Connection) -> RunResource:
             try:
                 run_row = transaction.execute(select_run_resource).one()
             except sqlalchemy.exc.NoResultFound as e:
                 raise RunNotFoundError(run_id) from e
             action_rows = transaction.execute(select_actions).all()
+            return _convert_row_to_run(run_row, action_rows)
 
-        return _convert_row_to_run(run_row, action_rows)
+        return await self._read(("get", run_id), read)
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get_all(self) -> List[RunResource]:
+    async def get_all(self) -> List[RunResource]:
         """Get all known run resources.
 
         Returns:
@@ -224,25 +260,26 @@ class RunStore:
         """
         select_runs = sqlalchemy.select(run_table)
         select_actions = sqlalchemy.select(action_table)
-        actions_by_run_id = defaultdict(list)
 
-        with self._sql_engine.begin() as transaction:
+        def read(transaction: sqlalchemy.engine.Connection) -> List[RunResource]:
             runs = transaction.execute(select_runs).all()
             actions = transaction.execute(select_actions).all()
+            actions_by_run_id = defaultdict(list)
 
-        for action_row in actions:
-            actions_by_run_id[action_row.run_id].append(action_row)
+            for action_row in actions:
+                actions_by_run_id[action_row.run_id].append(action_row)
 
-        return [
-            _convert_row_to_run(
-                row=run_row,
-                action_rows=actions_by_run_id[run_row.id],
-            )
-            for run_row in runs
-        ]
+            return [
+                _convert_row_to_run(
+                    row=run_row,
+                    action_rows=actions_by_run_id[run_row.id],
+                )
+                for run_row in runs
+            ]
+
+        return await self._read(("get_all",), read)
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get_state_summary(self, run_id: str) -> Optional[StateSummary]:
+    async def get_state_summary(self, run_id: str) -> Optional[StateSummary]:
         """Get the archived run state summary.
 
         This is a summary of run's ProtocolEngine state,
@@ -253,32 +290,17 @@ class RunStore:
             run_table.c.id == run_id
         )
 
-        with self._sql_engine.begin() as transaction:
+        def read(transaction: sqlalchemy.engine.Connection) -> Optional[StateSummary]:
             row = transaction.execute(select_run_data).one()
+            return (
+                StateSummary.parse_obj(row.state_summary)
+                if row.state_summary is not None
+                else None
+            )
 
-        return (
-            StateSummary.parse_obj(row.state_summary)
-            if row.state_summary is not None
-            else None
-        )
-
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def _get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound:
-                raise RunNotFoundError(run_id=run_id)
-
-        return (
-            cast(List[Dict[str, Any]], row.commands) if row.commands is not None else []
-        )
+        return await self._read(("get_state_summary", run_id), read)
 
-    def get_commands_slice(
+    async def get_commands_slice(
         self,
         run_id: str,
         length: int,
@@ -286,6 +308,8 @@ class RunStore:
     ) -> CommandSlice:
         """Get a slice of run commands from the store.
 
+        Only the commands in the returned slice are read from the database.
+
         Args:
             run_id: Run ID to pull commands from.
             length: Number of commands to return.
@@ -298,27 +322,47 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        command_intent_dicts = self._get_all_unparsed_commands(run_id)
-        commands_length = len(command_intent_dicts)
-        if cursor is None:
-            cursor = commands_length - length
-
-        # start is inclusive, stop is exclusive
-        actual_cursor = max(0, min(cursor, commands_length - 1))
-        stop = min(commands_length, actual_cursor + length)
-        sliced_commands: List[Command] = [
-            parse_obj_as(Command, command)  # type: ignore[arg-type]
-            for command in command_intent_dicts[actual_cursor:stop]
-        ]
-
-        return CommandSlice(
-            cursor=actual_cursor,
-            total_length=commands_length,
-            commands=sliced_commands,
+        select_commands_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+            run_command_table.c.run_id == run_id
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get_command(self, run_id: str, command_id: str) -> Command:
+        def read(transaction: sqlalchemy.engine.Connection) -> CommandSlice:
+            commands_length = transaction.execute(select_commands_count).scalar_one()
+
+            if commands_length == 0 and not _run_exists(transaction, run_id):
+                raise RunNotFoundError(run_id=run_id)
+
+            requested_cursor = commands_length - length if cursor is None else cursor
+
+            # start is inclusive, stop is exclusive
+            actual_cursor = max(0, min(requested_cursor, commands_length - 1))
+            stop = min(commands_length, actual_cursor + length)
+
+            select_slice = (
+                sqlalchemy.select(run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= actual_cursor,
+                    run_command_table.c.index_in_run < stop,
+                )
+                .order_by(run_command_table.c.index_in_run)
+            )
+            slice_rows = transaction.execute(select_slice).all()
+
+            sliced_commands: List[Command] = [
+                parse_obj_as(Command, row.command)  # type: ignore[arg-type]
+                for row in slice_rows
+            ]
+
+            return CommandSlice(
+                cursor=actual_cursor,
+                total_length=commands_length,
+                commands=sliced_commands,
+            )
+
+        return await self._read(("get_commands_slice", run_id, length, cursor), read)
+
+    async def get_command(self, run_id: str, command_id: str) -> Command:
         """Get run command by id.
 
         Args:
@@ -332,23 +376,24 @@ class RunStore:
             RunNotFoundError: The given run ID was not found in the store.
             CommandNotFoundError: The given command ID was not found in the store.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
+        select_command = sqlalchemy.select(run_command_table.c.command).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.command_id == command_id,
         )
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id=run_id) from e
 
-        try:
-            command = next(c for c in row.commands if c["id"] == command_id)
-        except StopIteration as e:
-            raise CommandNotFoundError(command_id=command_id) from e
+        def read(transaction: sqlalchemy.engine.Connection) -> Command:
+            row = transaction.execute(select_command).first()
+
+            if row is None:
+                if not _run_exists(transaction, run_id):
+                    raise RunNotFoundError(run_id=run_id)
+                raise CommandNotFoundError(command_id=command_id)
+
+            return parse_obj_as(Command, row.command)  # type: ignore[arg-type]
 
-        return parse_obj_as(Command, command)  # type: ignore[arg-type]
+        return await self._read(("get_command", run_id, command_id), read)
 
-    def remove(self, run_id: str) -> None:
+    async def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
 
         Arguments:
@@ -361,22 +406,56 @@ class RunStore:
         delete_actions = sqlalchemy.delete(action_table).where(
             action_table.c.run_id == run_id
         )
-        with self._sql_engine.begin() as transaction:
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
+
+        def write(transaction: sqlalchemy.engine.Connection) -> None:
             transaction.execute(delete_actions)
+            transaction.execute(delete_commands)
             result = transaction.execute(delete_run)
 
-        if result.rowcount < 1:
-            raise RunNotFoundError(run_id)
+            if result.rowcount < 1:
+                raise RunNotFoundError(run_id)
+
+        try:
+            await run_in_thread(self._sql_engine, write)
+        finally:
+            self._clear_caches()
+
+    async def _read(
+        self,
+        key: Hashable,
+        read: Callable[[sqlalchemy.engine.Connection], _ResultT],
+    ) -> _ResultT:
+        """Run a read in a worker thread, caching its result.
+
+        A read may still be running in its worker thread when a write
+        clears the caches, so it only caches its result if no write
+        has happened since it started.
+        """
+        if key in self._read_cache:
+            self._read_cache.move_to_end(key)
+            return self._read_cache[key]  # type: ignore[return-value]
+
+        generation = self._generation
+        result = await run_in_thread(self._sql_engine, read)
 
-        self._clear_caches()
+        if generation == self._generation:
+            self._read_cache[key] = result
+            if len(self._read_cache) > _CACHE_ENTRIES:
+                self._read_cache.popitem(last=False)
+
+        return result
 
     def _clear_caches(self) -> None:
-        self.has.cache_clear()
-        self.get.cache_clear()
-        self.get_all.cache_clear()
-        self.get_state_summary.cache_clear()
-        self.get_command.cache_clear()
-        self._get_all_unparsed_commands.cache_clear()
+        self._generation += 1
+        self._read_cache.clear()
+
+
+def _run_exists(transaction: sqlalchemy.engine.Connection, run_id: str) -> bool:
+    select_run_id = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+    return transaction.execute(select_run_id).first() is not None
 
 
 def _convert_row_to_run(
@@ -425,14 +504,27 @@ def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, o
 
 
 def _convert_state_to_sql_values(
-    run_id: str,
     state_summary: StateSummary,
-    commands: List[Command],
     engine_status: str,
 ) -> Dict[str, object]:
     return {
         "state_summary": state_summary.dict(),
         "engine_status": engine_status,
-        "commands": [command.dict() for command in commands],
         "_updated_at": utc_now(),
     }
+
+
+def _convert_commands_to_sql_values(
+    run_id: str,
+    commands: Sequence[Command],
+    start_index: int,
+) -> List[Dict[str, object]]:
+    return [
+        {
+            "run_id": run_id,
+            "index_in_run": index,
+            "command_id": command.id,
+            "command": command.dict(),
+        }
+        for index, command in enumerate(commands, start=start_index)
+    ]
@@ -4,11 +4,17 @@ from fastapi import Depends
 
 from opentrons.hardware_control import HardwareControlAPI, ThreadedAsyncLock
 
+from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.util import call_once
 from robot_server.hardware import get_hardware
+from robot_server.settings import get_settings
+from robot_server.service.json_api import ResponseCache
 from robot_server.service.session.manager import SessionManager
 
 
+_response_cache_accessor = AppStateAccessor[ResponseCache]("response_cache")
+
+
 @call_once
 async def get_motion_lock() -> ThreadedAsyncLock:
     """
@@ -39,3 +45,16 @@ async def get_unique_id() -> str:
 async def get_current_time() -> datetime:
     """Get the current time in UTC to use as a resource timestamp."""
     return datetime.now(tz=timezone.utc)
+
+
+async def get_response_cache(
+    app_state: AppState = Depends(get_app_state),
+) -> ResponseCache:
+    """Get a singleton ResponseCache of responses for resources that can't change."""
+    response_cache = _response_cache_accessor.get_from(app_state)
+
+    if response_cache is None:
+        response_cache = ResponseCache(max_size=get_settings().response_cache_size)
+        _response_cache_accessor.set_on(app_state, response_cache)
+
+    return response_cache
@@ -14,7 +14,9 @@ from .response import (
     DeprecatedResponseDataModel,
     ResourceModel,
     PydanticResponse,
+    PreSerializedMultiBodyResponse,
 )
+from .response_cache import CachedResponse, ResponseCache
 
 
 __all__ = [
@@ -22,6 +24,10 @@ __all__ = [
     "RequestModel",
     # response models
     "PydanticResponse",
+    "PreSerializedMultiBodyResponse",
+    # response caching
+    "CachedResponse",
+    "ResponseCache",
     # response body models
     "BaseResponseBody",
     "Body",
@@ -1,9 +1,9 @@
 from __future__ import annotations
 from anyio import to_thread
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar
 from pydantic import Field, BaseModel
 from pydantic.generics import GenericModel
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from .resource_links import ResourceLinks as DeprecatedResourceLinks
 
 
@@ -140,6 +140,31 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         return content.json().encode(self.charset)
 
 
+class PreSerializedMultiBodyResponse(Response):
+    """A `SimpleMultiBody` JSON response whose data items are already JSON text.
+
+    Use this instead of `PydanticResponse` when each item of the response's
+    `data` was stored as JSON that already matches its response model,
+    to avoid parsing, validating, and re-rendering that JSON.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        data: Sequence[str],
+        meta: MultiBodyMeta,
+        status_code: int = 200,
+    ) -> None:
+        """Initialize the response object and assemble the response body."""
+        super().__init__(
+            content="".join(
+                ['{"data": [', ", ".join(data), '], "meta": ', meta.json(), "}"]
+            ),
+            status_code=status_code,
+        )
+
+
 # TODO(mc, 2021-12-09): remove this model
 class DeprecatedResponseDataModel(BaseModel):
     """A model representing an identifiable resource of the server.
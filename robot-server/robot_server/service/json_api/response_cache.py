@@ -0,0 +1,144 @@
+"""A cache of rendered responses for resources that can no longer change."""
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from fastapi import status
+from fastapi.responses import Response
+
+
+_CacheKey = Tuple[str, Hashable]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A rendered JSON response body and the entity tag that identifies it."""
+
+    body: bytes
+    etag: str
+
+    def to_response(self, if_none_match: Optional[str] = None) -> Response:
+        """Build a response from the cached body.
+
+        Arguments:
+            if_none_match: The request's `If-None-Match` header, if any.
+                If it names this response's entity tag, the client already
+                has the response, so send 304 Not Modified without a body.
+        """
+        headers = {"ETag": self.etag}
+
+        if if_none_match is not None and etag_matches(if_none_match, self.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(
+            content=self.body,
+            media_type="application/json",
+            headers=headers,
+        )
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an `If-None-Match` header value names a given entity tag."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """An in-memory cache of rendered JSON responses.
+
+    Only responses for resources that can no longer change, like historical
+    runs and completed protocol analyses, should be cached, because entries
+    are only removed by eviction or by `invalidate`.
+
+    Responses are cached by the ID of the resource they describe and
+    a key identifying the request, like its path and query parameters.
+    The least-recently used responses are evicted first to keep the
+    total size of cached response bodies under `max_size` bytes.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._size = 0
+        self._entries: "OrderedDict[_CacheKey, CachedResponse]" = OrderedDict()
+        self._keys_by_resource: Dict[str, Set[_CacheKey]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """A counter that increases every time the cache is invalidated.
+
+        Read it before reading a resource to render, and pass it to `put`,
+        so a response rendered from data that was changed or deleted
+        while it was being read isn't cached.
+        """
+        return self._generation
+
+    def get(self, resource_id: str, key: Hashable) -> Optional[CachedResponse]:
+        """Get a cached response, if there is one."""
+        cache_key = (resource_id, key)
+        cached = self._entries.get(cache_key)
+
+        if cached is not None:
+            self._entries.move_to_end(cache_key)
+
+        return cached
+
+    def put(
+        self,
+        resource_id: str,
+        key: Hashable,
+        response: Response,
+        generation: int,
+    ) -> None:
+        """Cache a rendered response, and set its `ETag` header.
+
+        Arguments:
+            resource_id: The ID of the resource the response describes.
+            key: Identifies the request among others for the same resource.
+            response: The rendered response.
+            generation: The cache's `generation` from before the resource
+                was read. If the cache was invalidated since, the response
+                gets its `ETag` header, but it isn't cached.
+        """
+        body = response.body
+        cached = CachedResponse(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()}"',
+        )
+        response.headers["ETag"] = cached.etag
+
+        if generation != self._generation or len(body) > self._max_size:
+            return
+
+        cache_key = (resource_id, key)
+        self._remove(cache_key)
+        self._entries[cache_key] = cached
+        self._keys_by_resource.setdefault(resource_id, set()).add(cache_key)
+        self._size += len(body)
+
+        while self._size > self._max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, resource_id: str) -> None:
+        """Remove every cached response for a resource that changed or was deleted."""
+        self._generation += 1
+
+        for cache_key in list(self._keys_by_resource.get(resource_id, ())):
+            self._remove(cache_key)
+
+    def _remove(self, cache_key: _CacheKey) -> None:
+        cached = self._entries.pop(cache_key, None)
+
+        if cached is not None:
+            self._size -= len(cached.body)
+            resource_id = cache_key[0]
+            resource_keys = self._keys_by_resource[resource_id]
+            resource_keys.discard(cache_key)
+            if not resource_keys:
+                del self._keys_by_resource[resource_id]
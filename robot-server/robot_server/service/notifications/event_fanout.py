@@ -0,0 +1,210 @@
+"""Share notify-server subscriptions between websocket connections."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Dict, Iterator, Optional, Sequence, Set
+
+from fastapi import Depends
+from notify_server.clients.serdes import MalformedFrames
+from notify_server.clients.subscriber import Subscriber, create
+
+from robot_server.app_state import AppState, AppStateAccessor, get_app_state
+from robot_server.settings import get_settings
+
+log = logging.getLogger(__name__)
+
+_MAX_PENDING_MESSAGES = 100
+_RESUBSCRIBE_DELAY_SECONDS = 1.0
+
+_event_fanout_accessor = AppStateAccessor["EventFanout"]("event_fanout")
+
+CreateSubscriber = Callable[[str, Sequence[str]], Subscriber]
+
+
+class EventListener:
+    """The serialized events for one websocket connection.
+
+    Events are serialized once by the shared subscription and every listener
+    gets the same string. A listener that falls behind drops its oldest
+    messages instead of holding up the others.
+    """
+
+    def __init__(self, max_pending_messages: int) -> None:
+        self._messages: "asyncio.Queue[str]" = asyncio.Queue(
+            maxsize=max_pending_messages
+        )
+        self.dropped_count = 0
+
+    def put_nowait(self, message: str) -> None:
+        """Queue a message, dropping the oldest one if the queue is full."""
+        if self._messages.full():
+            self._messages.get_nowait()
+            self.dropped_count += 1
+        self._messages.put_nowait(message)
+
+    async def next_message(self) -> str:
+        """Wait for the next serialized event."""
+        return await self._messages.get()
+
+    def __aiter__(self) -> EventListener:
+        return self
+
+    async def __anext__(self) -> str:
+        return await self.next_message()
+
+
+class _TopicSubscription:
+    """One notify-server subscription, fanned out to all listeners of a topic.
+
+    If the subscriber fails, it's replaced with a new one, so that the
+    listeners keep getting events.
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        create_subscriber: Callable[[], Subscriber],
+        resubscribe_delay: float,
+    ) -> None:
+        self.listeners: Set[EventListener] = set()
+        self._topic = topic
+        self._create_subscriber = create_subscriber
+        self._resubscribe_delay = resubscribe_delay
+        self._task = asyncio.create_task(self._fan_out(create_subscriber()))
+
+    def close(self) -> None:
+        self._task.cancel()
+
+    async def _fan_out(self, subscriber: Optional[Subscriber]) -> None:
+        while True:
+            try:
+                if subscriber is None:
+                    subscriber = self._create_subscriber()
+                await self._forward_events(subscriber)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception(
+                    f"Subscription to topic {self._topic} failed."
+                    f" Resubscribing in {self._resubscribe_delay} seconds."
+                )
+            finally:
+                if subscriber is not None:
+                    subscriber.close()
+                    subscriber = None
+
+            await asyncio.sleep(self._resubscribe_delay)
+
+    async def _forward_events(self, subscriber: Subscriber) -> None:
+        while True:
+            try:
+                entry = await subscriber.next_event()
+            except MalformedFrames:
+                log.warning(f"Dropped malformed event on topic {self._topic}.")
+                continue
+
+            # ZMQ subscriptions match topic prefixes, so skip other topics
+            # that happen to start with this one. Their own subscription
+            # delivers them.
+            if entry.topic != self._topic:
+                continue
+
+            message = entry.json()
+            for listener in self.listeners:
+                listener.put_nowait(message)
+
+
+class EventFanout:
+    """Notify-server subscriptions shared by every websocket connection.
+
+    Each topic gets one upstream subscriber, opened with its first listener and
+    closed with its last one, no matter how many websockets listen to it.
+    """
+
+    def __init__(
+        self,
+        subscriber_address: str,
+        create_subscriber: CreateSubscriber = create,
+        max_pending_messages: int = _MAX_PENDING_MESSAGES,
+        resubscribe_delay: float = _RESUBSCRIBE_DELAY_SECONDS,
+    ) -> None:
+        """Initialize the fan-out.
+
+        Arguments:
+            subscriber_address: The notify-server address to subscribe to.
+            create_subscriber: Creates a subscriber for an address and topics.
+            max_pending_messages: How many unsent messages each listener holds
+                before it starts dropping the oldest ones.
+            resubscribe_delay: How many seconds to wait before replacing
+                a subscriber that failed.
+        """
+        self._subscriber_address = subscriber_address
+        self._create_subscriber = create_subscriber
+        self._max_pending_messages = max_pending_messages
+        self._resubscribe_delay = resubscribe_delay
+        self._subscriptions: Dict[str, _TopicSubscription] = {}
+
+    @contextmanager
+    def listen(self, topics: Sequence[str]) -> Iterator[EventListener]:
+        """Listen to events on `topics` for as long as the context is open."""
+        listener = EventListener(self._max_pending_messages)
+        unique_topics = set(topics)
+
+        for topic in unique_topics:
+            subscription = self._subscriptions.get(topic)
+            if subscription is None:
+                subscription = _TopicSubscription(
+                    topic=topic,
+                    create_subscriber=partial(
+                        self._create_subscriber, self._subscriber_address, [topic]
+                    ),
+                    resubscribe_delay=self._resubscribe_delay,
+                )
+                self._subscriptions[topic] = subscription
+            subscription.listeners.add(listener)
+
+        try:
+            yield listener
+        finally:
+            for topic in unique_topics:
+                subscription = self._subscriptions.get(topic)
+                if subscription is None:
+                    # The fan-out was closed while this listener was open.
+                    continue
+                subscription.listeners.discard(listener)
+                if not subscription.listeners:
+                    subscription.close()
+                    del self._subscriptions[topic]
+
+    def close(self) -> None:
+        """Close every upstream subscription."""
+        for subscription in self._subscriptions.values():
+            subscription.close()
+        self._subscriptions.clear()
+
+
+def get_event_fanout(app_state: AppState = Depends(get_app_state)) -> EventFanout:
+    """Get the event fan-out shared by all notification websockets."""
+    event_fanout = _event_fanout_accessor.get_from(app_state)
+
+    if event_fanout is None:
+        event_fanout = EventFanout(
+            subscriber_address=get_settings().notification_server_subscriber_address
+        )
+        _event_fanout_accessor.set_on(app_state, event_fanout)
+
+    return event_fanout
+
+
+async def clean_up_event_fanout(app_state: AppState) -> None:
+    """Close the event fan-out's subscriptions, if it was ever created.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    event_fanout = _event_fanout_accessor.get_from(app_state)
+
+    if event_fanout is not None:
+        event_fanout.close()
@@ -6,41 +6,38 @@ from typing import List
 
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
-from notify_server.clients.serdes import TopicEvent
-from notify_server.clients.subscriber import Subscriber, create
-
-from robot_server.settings import get_settings
+from .event_fanout import EventFanout, EventListener
 
 log = logging.getLogger(__name__)
 
 
-async def handle_socket(websocket: WebSocket, topics: List[str]) -> None:
+async def handle_socket(
+    websocket: WebSocket, topics: List[str], event_fanout: EventFanout
+) -> None:
     """Handle a websocket connection."""
-    subscriber = create(get_settings().notification_server_subscriber_address, topics)
-    await asyncio.gather(
-        receive(websocket, subscriber), route_events(websocket, subscriber)
-    )
+    with event_fanout.listen(topics) as listener:
+        route_task = asyncio.create_task(route_events(websocket, listener))
+        try:
+            await receive(websocket)
+        finally:
+            route_task.cancel()
+            await asyncio.gather(route_task, return_exceptions=True)
 
 
-async def receive(websocket: WebSocket, subscriber: Subscriber) -> None:
+async def receive(websocket: WebSocket) -> None:
     """Read data from websocket. Will exit on websocket disconnect."""
     try:
         while True:
             await websocket.receive_json()
     except WebSocketDisconnect:
         log.info("Websocket subscriber disconnected.")
-        subscriber.close()
-
-
-async def send(websocket: WebSocket, entry: TopicEvent) -> None:
-    """Send entry to web socket."""
-    await websocket.send_text(entry.json())
 
 
-async def route_events(websocket: WebSocket, subscriber: Subscriber) -> None:
-    """Route events from subscriber to websocket."""
+async def route_events(websocket: WebSocket, listener: EventListener) -> None:
+    """Route already-serialized events from the listener to the websocket."""
     try:
-        async for entry in subscriber:
-            await send(websocket, entry)
+        async for message in listener:
+            await websocket.send_text(message)
     except CancelledError:
-        log.exception("Connection to notify-server closed.")
+        log.debug("Stopped routing events to websocket.")
+        raise
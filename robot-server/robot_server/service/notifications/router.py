@@ -1,14 +1,22 @@
 from typing import List
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from starlette.websockets import WebSocket
 from robot_server.service.notifications import handle_subscriber
+from robot_server.service.notifications.event_fanout import (
+    EventFanout,
+    get_event_fanout,
+)
 
 router = APIRouter()
 
 
 @router.websocket("/notifications/subscribe")
-async def handle_subscribe(websocket: WebSocket, topic: List[str] = Query(...)):
+async def handle_subscribe(
+    websocket: WebSocket,
+    topic: List[str] = Query(...),
+    event_fanout: EventFanout = Depends(get_event_fanout),
+):
     """Accept a websocket connection."""
     await websocket.accept()
-    await handle_subscriber.handle_socket(websocket, topic)
+    await handle_subscriber.handle_socket(websocket, topic, event_fanout)
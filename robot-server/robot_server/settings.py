@@ -75,5 +75,57 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    protocol_analysis_workers: int = Field(
+        1,
+        ge=1,
+        description=(
+            "The maximum number of protocol analyses to run at once."
+            " Each analysis runs in its own worker process, so raising this"
+            " uses more memory."
+        ),
+    )
+
+    protocol_analysis_timeout: typing.Optional[float] = Field(
+        900,
+        gt=0,
+        description=(
+            "The maximum number of seconds a single protocol analysis may take"
+            " before it's stopped and recorded as failed."
+            " If null, analyses may take as long as they need."
+        ),
+    )
+
+    protocol_analysis_cache_size: int = Field(
+        50 * 1024 * 1024,
+        ge=0,
+        description=(
+            "The maximum total size, in bytes, of completed protocol analyses"
+            " to keep for reuse when identical protocol files are uploaded again."
+            " The least-recently used analyses are evicted first."
+            " If 0, no analyses are kept for reuse."
+        ),
+    )
+
+    response_cache_size: int = Field(
+        16 * 1024 * 1024,
+        ge=0,
+        description=(
+            "The maximum total size, in bytes, of rendered responses to keep"
+            " for historical runs and completed protocol analyses, which can"
+            " no longer change. The least-recently used responses are evicted"
+            " first. If 0, no responses are kept."
+        ),
+    )
+
+    lazy_protocol_rehydration: bool = Field(
+        False,
+        description=(
+            "If true, don't read every stored protocol's files when the server"
+            " starts. Instead, read each protocol's files the first time it's"
+            " needed, and in a background task shortly after startup."
+            " This makes the server ready sooner when many protocols are stored."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -21,6 +21,7 @@ def test_get_health(api_client: TestClient, hardware: MagicMock) -> None:
         "minimum_protocol_api_version": list(MIN_SUPPORTED_VERSION),
         "maximum_protocol_api_version": list(MAX_SUPPORTED_VERSION),
         "robot_model": "OT-2 Standard",
+        "protocol_analysis_cache": None,
         "links": {
             "apiLog": "/logs/api.log",
             "serialLog": "/logs/serial.log",
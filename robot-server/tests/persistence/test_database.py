@@ -0,0 +1,68 @@
+"""Test SQL database setup and access helpers."""
+import threading
+
+import pytest
+import sqlalchemy
+from sqlalchemy.engine import Engine as SQLEngine
+
+from robot_server.persistence import protocol_table, run_in_thread
+
+
+@pytest.mark.parametrize(
+    ("pragma", "expected"),
+    [
+        ("foreign_keys", 1),
+        ("journal_mode", "wal"),
+        # 2 is FULL.
+        ("synchronous", 2),
+        # 2 is MEMORY.
+        ("temp_store", 2),
+    ],
+)
+def test_pragmas(sql_engine: SQLEngine, pragma: str, expected: object) -> None:
+    """It should configure every connection for concurrent access."""
+    with sql_engine.begin() as transaction:
+        assert transaction.execute(f"PRAGMA {pragma}").scalar_one() == expected
+
+
+async def test_run_in_thread(sql_engine: SQLEngine) -> None:
+    """It should run the function in a committed transaction off the event loop."""
+    main_thread = threading.get_ident()
+
+    def insert(transaction: sqlalchemy.engine.Connection) -> int:
+        transaction.execute(
+            sqlalchemy.insert(protocol_table).values(
+                id="protocol-id",
+                created_at=sqlalchemy.func.now(),
+            )
+        )
+        return threading.get_ident()
+
+    insert_thread = await run_in_thread(sql_engine, insert)
+
+    assert insert_thread != main_thread
+    with sql_engine.begin() as transaction:
+        assert transaction.execute(
+            sqlalchemy.select(protocol_table.c.id)
+        ).scalars().all() == ["protocol-id"]
+
+
+async def test_run_in_thread_rolls_back(sql_engine: SQLEngine) -> None:
+    """It should roll back the transaction and re-raise if the function raises."""
+
+    def insert_and_raise(transaction: sqlalchemy.engine.Connection) -> None:
+        transaction.execute(
+            sqlalchemy.insert(protocol_table).values(
+                id="protocol-id",
+                created_at=sqlalchemy.func.now(),
+            )
+        )
+        raise RuntimeError("oh no")
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        await run_in_thread(sql_engine, insert_and_raise)
+
+    with sql_engine.begin() as transaction:
+        assert (
+            transaction.execute(sqlalchemy.select(protocol_table.c.id)).first() is None
+        )
@@ -0,0 +1,25 @@
+"""Tests for stored JSON document encoding."""
+import pytest
+
+from robot_server.persistence.documents import (
+    encode_json_document,
+    decode_json_document,
+    UnknownDocumentFormatError,
+)
+
+
+def test_round_trip() -> None:
+    """It should decode an encoded document to the same JSON text."""
+    json_text = '{"hello": "world", "unicode": "\\u00b5L", "raw": "µL"}'
+
+    encoded = encode_json_document(json_text)
+
+    assert encoded[0] == 1
+    assert decode_json_document(encoded) == json_text
+
+
+@pytest.mark.parametrize("document", [b"", b"\x80\x04pickled"])
+def test_unknown_format(document: bytes) -> None:
+    """It should raise if the document's format header is not recognized."""
+    with pytest.raises(UnknownDocumentFormatError):
+        decode_json_document(document)
@@ -1,22 +1,27 @@
 """Test SQL database migrations."""
+import json
+import pickle
+from datetime import datetime
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List
 
 import pytest
 import sqlalchemy
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import]
 
 from robot_server.persistence.database import create_sql_engine
+from robot_server.persistence.documents import decode_json_document
 from robot_server.persistence.tables import (
     migration_table,
     run_table,
+    run_command_table,
     action_table,
     protocol_table,
     analysis_table,
 )
 
 
-TABLES = [run_table, action_table, protocol_table, analysis_table]
+TABLES = [run_table, run_command_table, action_table, protocol_table, analysis_table]
 
 
 @pytest.fixture
@@ -25,6 +30,7 @@ def database_v0(tmp_path: Path) -> Path:
     db_path = tmp_path / "migration-test-v0.db"
     sql_engine = create_sql_engine(db_path)
     sql_engine.execute("DROP TABLE migration")
+    sql_engine.execute("DROP TABLE run_command")
     sql_engine.execute("DROP TABLE run")
     sql_engine.execute(
         """
@@ -46,6 +52,27 @@ def database_v1(tmp_path: Path) -> Path:
     """Create a database matching schema version 1."""
     db_path = tmp_path / "migration-test-v1.db"
     sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP TABLE run_command")
+    sql_engine.execute("UPDATE migration SET version = 1")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v2(tmp_path: Path) -> Path:
+    """Create a database matching schema version 2."""
+    db_path = tmp_path / "migration-test-v2.db"
+    sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("UPDATE migration SET version = 2")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v3(tmp_path: Path) -> Path:
+    """Create a database matching schema version 3."""
+    db_path = tmp_path / "migration-test-v3.db"
+    sql_engine = create_sql_engine(db_path)
     sql_engine.dispose()
     return db_path
 
@@ -64,19 +91,149 @@ def subject(database_path: Path) -> Generator[sqlalchemy.engine.Engine, None, No
 
 
 @pytest.mark.parametrize(
-    "database_path",
+    ("database_path", "expected_versions"),
     [
-        lazy_fixture("database_v0"),
-        lazy_fixture("database_v1"),
+        (lazy_fixture("database_v0"), [3]),
+        (lazy_fixture("database_v1"), [1, 3]),
+        (lazy_fixture("database_v2"), [2, 3]),
+        (lazy_fixture("database_v3"), [3]),
     ],
 )
-def test_migration(subject: sqlalchemy.engine.Engine) -> None:
+def test_migration(
+    subject: sqlalchemy.engine.Engine,
+    expected_versions: List[int],
+) -> None:
     """It should migrate a table."""
     migrations = subject.execute(sqlalchemy.select(migration_table)).all()
 
-    assert [m.version for m in migrations] == [1]
+    assert [m.version for m in migrations] == expected_versions
 
     # all table queries work without raising
     for table in TABLES:
         values = subject.execute(sqlalchemy.select(table)).all()
         assert values == []
+
+
+def test_migrate_1_to_2_moves_commands(database_v1: Path) -> None:
+    """It should move each run's stored commands into the run command table."""
+    sql_engine = sqlalchemy.create_engine(f"sqlite:///{database_v1}")
+    sql_engine.execute(
+        sqlalchemy.insert(run_table).values(
+            id="run-id",
+            created_at=datetime(year=2021, month=1, day=1),
+            commands=[{"id": "command-1"}, {"id": "command-2"}],
+        )
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v1)
+    select_command_rows = sqlalchemy.select(run_command_table).order_by(
+        run_command_table.c.index_in_run
+    )
+    command_rows = subject.execute(select_command_rows).all()
+    run_row = subject.execute(sqlalchemy.select(run_table)).one()
+    subject.dispose()
+
+    assert [(r.run_id, r.index_in_run, r.command_id) for r in command_rows] == [
+        ("run-id", 0, "command-1"),
+        ("run-id", 1, "command-2"),
+    ]
+    assert command_rows[1].command == {"id": "command-2"}
+    assert run_row.commands is None
+
+
+def test_migrate_2_to_3_encodes_analyses(database_v2: Path) -> None:
+    """It should re-encode pickled analyses as JSON documents."""
+    sql_engine = sqlalchemy.create_engine(f"sqlite:///{database_v2}")
+    sql_engine.execute(
+        sqlalchemy.insert(protocol_table).values(
+            id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1),
+        )
+    )
+    sql_engine.execute(
+        sqlalchemy.insert(analysis_table).values(
+            id="analysis-id",
+            protocol_id="protocol-id",
+            analyzer_version="initial",
+            completed_analysis=pickle.dumps(
+                {
+                    "id": "analysis-id",
+                    "status": "completed",
+                    "result": "ok",
+                    "pipettes": [],
+                    "labware": [],
+                    "commands": [],
+                    "errors": [],
+                }
+            ),
+        )
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v2)
+    analysis_row = subject.execute(sqlalchemy.select(analysis_table)).one()
+    subject.dispose()
+
+    assert json.loads(decode_json_document(analysis_row.completed_analysis)) == {
+        "id": "analysis-id",
+        "status": "completed",
+        "result": "ok",
+        "pipettes": [],
+        "labware": [],
+        "commands": [],
+        "errors": [],
+    }
+
+
+def test_migrate_2_to_3_deletes_invalid_analyses(database_v2: Path) -> None:
+    """It should delete analyses that can't be migrated and keep the rest."""
+    sql_engine = sqlalchemy.create_engine(f"sqlite:///{database_v2}")
+    sql_engine.execute(
+        sqlalchemy.insert(protocol_table).values(
+            id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1),
+        )
+    )
+    sql_engine.execute(
+        sqlalchemy.insert(analysis_table),
+        [
+            {
+                "id": "invalid-analysis-id",
+                "protocol_id": "protocol-id",
+                "analyzer_version": "initial",
+                "completed_analysis": pickle.dumps({"id": "invalid-analysis-id"}),
+            },
+            {
+                "id": "unpicklable-analysis-id",
+                "protocol_id": "protocol-id",
+                "analyzer_version": "initial",
+                "completed_analysis": b"not a pickle",
+            },
+            {
+                "id": "valid-analysis-id",
+                "protocol_id": "protocol-id",
+                "analyzer_version": "initial",
+                "completed_analysis": pickle.dumps(
+                    {
+                        "id": "valid-analysis-id",
+                        "status": "completed",
+                        "result": "ok",
+                        "pipettes": [],
+                        "labware": [],
+                        "commands": [],
+                        "errors": [],
+                    }
+                ),
+            },
+        ],
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v2)
+    analysis_rows = subject.execute(sqlalchemy.select(analysis_table)).all()
+    migrations = subject.execute(sqlalchemy.select(migration_table)).all()
+    subject.dispose()
+
+    assert [r.id for r in analysis_rows] == ["valid-analysis-id"]
+    assert [m.version for m in migrations] == [2, 3]
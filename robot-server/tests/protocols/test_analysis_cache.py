@@ -0,0 +1,192 @@
+"""Tests for the AnalysisCache and its cache keys."""
+import pytest
+from pathlib import Path
+from typing import Dict, Optional, cast
+
+from sqlalchemy.engine import Engine as SQLEngine
+
+from opentrons.hardware_control.dev_types import PipetteDict
+from opentrons.protocol_reader import (
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolFileRole,
+    JsonProtocolConfig,
+)
+from opentrons.types import Mount
+
+from robot_server.persistence import encode_json_document
+from robot_server.protocols.analysis_models import AnalysisResult, CompletedAnalysis
+from robot_server.protocols.analysis_cache import (
+    AnalysisCache,
+    AnalysisCacheStats,
+    compute_analysis_cache_key,
+)
+
+
+def _make_analysis(analysis_id: str) -> CompletedAnalysis:
+    return CompletedAnalysis(
+        id=analysis_id,
+        result=AnalysisResult.OK,
+        commands=[],
+        labware=[],
+        pipettes=[],
+        errors=[],
+    )
+
+
+def _make_source(directory: Path, contents: str) -> ProtocolSource:
+    main_file = directory / "protocol.json"
+    main_file.write_text(contents)
+
+    return ProtocolSource(
+        directory=directory,
+        main_file=main_file,
+        files=[ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN)],
+        metadata={},
+        config=JsonProtocolConfig(schema_version=6),
+        labware_definitions=[],
+    )
+
+
+def _make_instruments(left_model: Optional[str]) -> Dict[Mount, PipetteDict]:
+    left = {} if left_model is None else {"model": left_model}
+    return {Mount.LEFT: cast(PipetteDict, left), Mount.RIGHT: cast(PipetteDict, {})}
+
+
+async def test_get_and_put(sql_engine: SQLEngine) -> None:
+    """It should return cached analyses and count hits and misses."""
+    subject = await AnalysisCache.create(sql_engine=sql_engine, max_size=1024 * 1024)
+    analysis = _make_analysis("analysis-id")
+
+    assert await subject.get("key") is None
+
+    await subject.put("key", analysis)
+
+    assert await subject.get("key") == analysis
+    assert await subject.get("other-key") is None
+
+    stats = subject.get_stats()
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.entries == 1
+    assert 0 < stats.size <= 1024 * 1024
+    assert stats.max_size == 1024 * 1024
+
+
+async def test_put_replaces_existing(sql_engine: SQLEngine) -> None:
+    """It should replace an analysis previously cached with the same key."""
+    subject = await AnalysisCache.create(sql_engine=sql_engine, max_size=1024 * 1024)
+
+    await subject.put("key", _make_analysis("analysis-1"))
+    await subject.put("key", _make_analysis("analysis-2"))
+
+    assert await subject.get("key") == _make_analysis("analysis-2")
+    assert subject.get_stats().entries == 1
+
+
+async def test_evicts_least_recently_used(sql_engine: SQLEngine) -> None:
+    """It should evict the least recently used analyses once it's too big."""
+    entry_size = len(
+        encode_json_document(_make_analysis("analysis-1").json(exclude_none=True))
+    )
+    subject = await AnalysisCache.create(sql_engine=sql_engine, max_size=2 * entry_size)
+
+    await subject.put("key-1", _make_analysis("analysis-1"))
+    await subject.put("key-2", _make_analysis("analysis-2"))
+
+    # Using key-1 makes key-2 the least recently used.
+    assert await subject.get("key-1") is not None
+
+    await subject.put("key-3", _make_analysis("analysis-3"))
+
+    assert await subject.get("key-2") is None
+    assert await subject.get("key-1") is not None
+    assert await subject.get("key-3") is not None
+    assert subject.get_stats() == AnalysisCacheStats(
+        hits=3,
+        misses=1,
+        entries=2,
+        size=2 * entry_size,
+        max_size=2 * entry_size,
+    )
+
+
+async def test_create_with_cached_analyses(sql_engine: SQLEngine) -> None:
+    """It should pick up analyses that were already cached in the database."""
+    entry_size = len(
+        encode_json_document(_make_analysis("analysis-1").json(exclude_none=True))
+    )
+    previous = await AnalysisCache.create(sql_engine=sql_engine, max_size=1024 * 1024)
+    await previous.put("key-1", _make_analysis("analysis-1"))
+    await previous.put("key-2", _make_analysis("analysis-2"))
+
+    subject = await AnalysisCache.create(sql_engine=sql_engine, max_size=1024 * 1024)
+
+    assert subject.get_stats() == AnalysisCacheStats(
+        hits=0,
+        misses=0,
+        entries=2,
+        size=2 * entry_size,
+        max_size=1024 * 1024,
+    )
+    assert await subject.get("key-1") == _make_analysis("analysis-1")
+
+
+async def test_put_too_big(sql_engine: SQLEngine) -> None:
+    """It should not cache an analysis that is bigger than the whole cache."""
+    subject = await AnalysisCache.create(sql_engine=sql_engine, max_size=1)
+
+    await subject.put("key", _make_analysis("analysis-id"))
+
+    assert await subject.get("key") is None
+    assert subject.get_stats().entries == 0
+
+
+def test_cache_key(tmp_path: Path) -> None:
+    """It should compute keys that change with everything affecting an analysis."""
+    source = _make_source(tmp_path, '{"hello": "world"}')
+    key = compute_analysis_cache_key(
+        protocol_source=source,
+        protocol_key=None,
+        attached_instruments=_make_instruments(None),
+    )
+
+    assert key == compute_analysis_cache_key(
+        protocol_source=source,
+        protocol_key=None,
+        attached_instruments=_make_instruments(None),
+    )
+
+    assert key != compute_analysis_cache_key(
+        protocol_source=source,
+        protocol_key="protocol-key",
+        attached_instruments=_make_instruments(None),
+    )
+
+    assert key != compute_analysis_cache_key(
+        protocol_source=source,
+        protocol_key=None,
+        attached_instruments=_make_instruments("p300_single_v2.0"),
+    )
+
+    changed_source = _make_source(tmp_path, '{"hello": "there"}')
+
+    assert key != compute_analysis_cache_key(
+        protocol_source=changed_source,
+        protocol_key=None,
+        attached_instruments=_make_instruments(None),
+    )
+
+
+@pytest.mark.parametrize("max_size", [0, 1])
+async def test_get_stats_empty(sql_engine: SQLEngine, max_size: int) -> None:
+    """It should report an empty cache."""
+    subject = await AnalysisCache.create(sql_engine=sql_engine, max_size=max_size)
+
+    assert subject.get_stats() == AnalysisCacheStats(
+        hits=0,
+        misses=0,
+        entries=0,
+        size=0,
+        max_size=max_size,
+    )
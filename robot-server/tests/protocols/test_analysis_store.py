@@ -1,4 +1,5 @@
 """Tests for the AnalysisStore interface."""
+import json
 import pytest
 
 from datetime import datetime
@@ -75,10 +76,10 @@ def make_dummy_protocol_resource(protocol_id: str) -> ProtocolResource:
 
 async def test_get_empty(subject: AnalysisStore, protocol_store: ProtocolStore) -> None:
     """It should return an empty list if no analysis saved."""
-    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
 
     full_result = await subject.get_by_protocol("protocol-id")
-    summaries_result = subject.get_summaries_by_protocol("protocol-id")
+    summaries_result = await subject.get_summaries_by_protocol("protocol-id")
 
     assert full_result == []
     assert summaries_result == []
@@ -91,7 +92,7 @@ async def test_add_pending(
     subject: AnalysisStore, protocol_store: ProtocolStore
 ) -> None:
     """It should add a pending analysis to the store."""
-    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    await protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     expected_analysis = PendingAnalysis(id="analysis-id")
     expected_summary = AnalysisSummary(
@@ -104,14 +105,31 @@ async def test_add_pending(
     assert result == expected_summary
     assert await subject.get("analysis-id") == expected_analysis
     assert await subject.get_by_protocol("protocol-id") == [expected_analysis]
-    assert subject.get_summaries_by_protocol("protocol-id") == [expected_summary]
+    assert await subject.get_summaries_by_protocol("protocol-id") == [expected_summary]
+
+
+async def test_remove_pending(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should remove a pending analysis that won't complete."""
+    await protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+
+    subject.remove_pending(analysis_id="analysis-id")
+
+    assert await subject.get_summaries_by_protocol("protocol-id") == []
+    with pytest.raises(AnalysisNotFoundError, match="analysis-id"):
+        await subject.get("analysis-id")
+
+    # The protocol can get a new pending analysis.
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-2")
 
 
 async def test_returned_in_order_added(
     subject: AnalysisStore, protocol_store: ProtocolStore
 ) -> None:
     """It should return analyses from least-recently-added to most-recently-added."""
-    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    await protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-1")
     await subject.update(
@@ -150,7 +168,7 @@ async def test_returned_in_order_added(
         "analysis-id-3",
         "analysis-id-4",
     ]
-    summaries = subject.get_summaries_by_protocol(protocol_id="protocol-id")
+    summaries = await subject.get_summaries_by_protocol(protocol_id="protocol-id")
     full_analyses = await subject.get_by_protocol(protocol_id="protocol-id")
     assert [s.id for s in summaries] == expected_order
     assert [a.id for a in full_analyses] == expected_order
@@ -160,7 +178,7 @@ async def test_add_analysis_equipment(
     subject: AnalysisStore, protocol_store: ProtocolStore
 ) -> None:
     """It should add labware and pipettes to the stored analysis."""
-    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    await protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     labware = pe_types.LoadedLabware(
         id="labware-id",
@@ -198,6 +216,53 @@ async def test_add_analysis_equipment(
     assert await subject.get_by_protocol("protocol-id") == [result]
 
 
+async def test_get_by_protocol_as_document(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should return stored analyses as JSON text, without None values."""
+    await protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    labware = pe_types.LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="namespace/load-name/42",
+        location=pe_types.DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        offsetId=None,
+    )
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-1")
+    await subject.update(
+        analysis_id="analysis-id-1",
+        labware=[labware],
+        pipettes=[],
+        commands=[],
+        errors=[],
+    )
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-2")
+
+    result = await subject.get_by_protocol_as_document("protocol-id")
+
+    assert [json.loads(document) for document in result] == [
+        {
+            "id": "analysis-id-1",
+            "status": "completed",
+            "result": "ok",
+            "labware": [
+                {
+                    "id": "labware-id",
+                    "loadName": "load-name",
+                    "definitionUri": "namespace/load-name/42",
+                    "location": {"slotName": "1"},
+                }
+            ],
+            "pipettes": [],
+            "commands": [],
+            "errors": [],
+        },
+        {"id": "analysis-id-2", "status": "pending"},
+    ]
+
+
 class AnalysisResultSpec(NamedTuple):
     """Spec data for analysis result tests."""
 
@@ -245,7 +310,7 @@ async def test_update_infers_status_from_errors(
     expected_result: AnalysisResult,
 ) -> None:
     """It should decide the analysis result based on whether there are errors."""
-    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    await protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
     subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
     await subject.update(
         analysis_id="analysis-id",
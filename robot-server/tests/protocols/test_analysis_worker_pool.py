@@ -0,0 +1,147 @@
+"""Tests for the AnalysisWorkerPool.
+
+These tests run real worker processes, with stand-in analysis functions
+that are controlled by the protocol source's metadata.
+"""
+import asyncio
+import os
+import time
+import pytest
+from pathlib import Path
+from typing import AsyncIterator
+
+from opentrons.protocol_engine import StateSummary, EngineStatus
+from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
+from opentrons.protocol_runner import ProtocolRunResult
+
+from robot_server.protocols.analysis_worker_pool import (
+    AnalysisWorkerPool,
+    AnalysisFailedError,
+    AnalysisTimeoutError,
+    AnalysisCancelledError,
+)
+
+
+async def _fake_analyze(protocol_source: ProtocolSource) -> ProtocolRunResult:
+    """Stand in for a real analysis, as told by the protocol's metadata."""
+    await asyncio.sleep(float(protocol_source.metadata.get("sleep", 0)))
+
+    if protocol_source.metadata.get("raise_pid"):
+        raise RuntimeError(str(os.getpid()))
+
+    if protocol_source.metadata.get("crash"):
+        # Drop the connection to the server, like a crashing worker would,
+        # but linger for a while before exiting.
+        os.closerange(3, 1024)
+        time.sleep(60)
+        os._exit(1)
+
+    return ProtocolRunResult(
+        commands=[],
+        state_summary=StateSummary(
+            status=EngineStatus.SUCCEEDED,
+            errors=[],
+            labware=[],
+            pipettes=[],
+            modules=[],
+            labwareOffsets=[],
+        ),
+    )
+
+
+def _make_source(**metadata: object) -> ProtocolSource:
+    return ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.json"),
+        config=JsonProtocolConfig(schema_version=6),
+        files=[],
+        metadata=metadata,
+        labware_definitions=[],
+    )
+
+
+@pytest.fixture
+async def subject() -> AsyncIterator[AnalysisWorkerPool]:
+    """Get an AnalysisWorkerPool test subject with one worker."""
+    pool = AnalysisWorkerPool(max_workers=1, timeout=5, analyze_func=_fake_analyze)
+    yield pool
+    pool.close()
+
+
+async def test_analyze(subject: AnalysisWorkerPool) -> None:
+    """It should return the result of the analysis from the worker."""
+    # Cancelling an analysis that isn't in progress should have no effect.
+    subject.cancel("analysis-id")
+
+    result = await subject.analyze("analysis-id", _make_source())
+
+    assert result.state_summary.status == EngineStatus.SUCCEEDED
+
+
+async def test_analyze_error_reuses_worker(subject: AnalysisWorkerPool) -> None:
+    """It should raise errors from the worker, and keep the worker for reuse."""
+    with pytest.raises(AnalysisFailedError) as exc_info_1:
+        await subject.analyze("analysis-id-1", _make_source(raise_pid=True))
+
+    with pytest.raises(AnalysisFailedError) as exc_info_2:
+        await subject.analyze("analysis-id-2", _make_source(raise_pid=True))
+
+    assert exc_info_1.value.error_type == "RuntimeError"
+    assert exc_info_1.value.detail != str(os.getpid())
+    assert exc_info_1.value.detail == exc_info_2.value.detail
+
+
+async def test_analyze_timeout() -> None:
+    """It should stop an analysis that runs for too long."""
+    subject = AnalysisWorkerPool(
+        max_workers=1,
+        timeout=0.5,
+        analyze_func=_fake_analyze,
+    )
+
+    try:
+        with pytest.raises(AnalysisTimeoutError):
+            await subject.analyze("analysis-id-1", _make_source(sleep=60))
+
+        # A new worker should replace the one that timed out.
+        result = await subject.analyze("analysis-id-2", _make_source())
+        assert result.state_summary.status == EngineStatus.SUCCEEDED
+    finally:
+        subject.close()
+
+
+async def test_cancel(subject: AnalysisWorkerPool) -> None:
+    """It should cancel running and waiting analyses, letting others proceed."""
+    running = asyncio.create_task(
+        subject.analyze("analysis-id-1", _make_source(sleep=60))
+    )
+    waiting = asyncio.create_task(subject.analyze("analysis-id-2", _make_source()))
+    next_up = asyncio.create_task(subject.analyze("analysis-id-3", _make_source()))
+    await asyncio.sleep(0.1)
+
+    # Only one worker is allowed, so the other analyses must wait.
+    assert not waiting.done()
+    assert not next_up.done()
+
+    subject.cancel("analysis-id-2")
+    subject.cancel("analysis-id-1")
+
+    with pytest.raises(AnalysisCancelledError):
+        await running
+
+    with pytest.raises(AnalysisCancelledError):
+        await waiting
+
+    result = await next_up
+    assert result.state_summary.status == EngineStatus.SUCCEEDED
+
+
+async def test_analyze_crash_replaces_worker(subject: AnalysisWorkerPool) -> None:
+    """It should not reuse a worker that lost its connection, even if still running."""
+    with pytest.raises(AnalysisFailedError) as exc_info:
+        await subject.analyze("analysis-id-1", _make_source(crash=True))
+
+    assert exc_info.value.error_type == "AnalysisWorkerExitedError"
+
+    result = await subject.analyze("analysis-id-2", _make_source())
+    assert result.state_summary.status == EngineStatus.SUCCEEDED
@@ -1,6 +1,6 @@
 """Tests for the ProtocolAnalyzer."""
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
 from pathlib import Path
 
@@ -11,18 +11,25 @@ from opentrons.protocol_engine import (
     types as pe_types,
 )
 from opentrons.protocol_engine import StateSummary, EngineStatus
-from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
+from opentrons.protocol_runner import ProtocolRunResult
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 
+from robot_server.protocols.analysis_cache import AnalysisCache
+from robot_server.protocols.analysis_models import CompletedAnalysis, AnalysisResult
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_worker_pool import (
+    AnalysisWorkerPool,
+    AnalysisFailedError,
+    AnalysisCancelledError,
+)
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 
 
 @pytest.fixture
-def protocol_runner(decoy: Decoy) -> ProtocolRunner:
-    """Get a mocked out ProtocolRunner."""
-    return decoy.mock(cls=ProtocolRunner)
+def analysis_worker_pool(decoy: Decoy) -> AnalysisWorkerPool:
+    """Get a mocked out AnalysisWorkerPool."""
+    return decoy.mock(cls=AnalysisWorkerPool)
 
 
 @pytest.fixture
@@ -31,26 +38,30 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
     return decoy.mock(cls=AnalysisStore)
 
 
+@pytest.fixture
+def analysis_cache(decoy: Decoy) -> AnalysisCache:
+    """Get a mocked out AnalysisCache."""
+    return decoy.mock(cls=AnalysisCache)
+
+
 @pytest.fixture
 def subject(
-    protocol_runner: ProtocolRunner,
+    analysis_worker_pool: AnalysisWorkerPool,
     analysis_store: AnalysisStore,
+    analysis_cache: AnalysisCache,
 ) -> ProtocolAnalyzer:
     """Get a ProtocolAnalyzer test subject."""
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_worker_pool=analysis_worker_pool,
         analysis_store=analysis_store,
+        analysis_cache=analysis_cache,
     )
 
 
-async def test_analyze(
-    decoy: Decoy,
-    protocol_runner: ProtocolRunner,
-    analysis_store: AnalysisStore,
-    subject: ProtocolAnalyzer,
-) -> None:
-    """It should be able to analyze a protocol."""
-    protocol_resource = ProtocolResource(
+@pytest.fixture
+def protocol_resource() -> ProtocolResource:
+    """Get a ProtocolResource to analyze."""
+    return ProtocolResource(
         protocol_id="protocol-id",
         created_at=datetime(year=2021, month=1, day=1),
         source=ProtocolSource(
@@ -64,6 +75,15 @@ async def test_analyze(
         protocol_key="dummy-data-111",
     )
 
+
+async def test_analyze(
+    decoy: Decoy,
+    analysis_worker_pool: AnalysisWorkerPool,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should be able to analyze a protocol."""
     analysis_command = pe_commands.WaitForResume(
         id="command-id",
         key="command-key",
@@ -93,7 +113,12 @@ async def test_analyze(
         mount=MountType.LEFT,
     )
 
-    decoy.when(await protocol_runner.run(protocol_resource.source)).then_return(
+    decoy.when(
+        await analysis_worker_pool.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_resource.source,
+        )
+    ).then_return(
         ProtocolRunResult(
             commands=[analysis_command],
             state_summary=StateSummary(
@@ -122,3 +147,130 @@ async def test_analyze(
             errors=[analysis_error],
         ),
     )
+
+
+async def test_analyze_failed(
+    decoy: Decoy,
+    analysis_worker_pool: AnalysisWorkerPool,
+    analysis_store: AnalysisStore,
+    analysis_cache: AnalysisCache,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should store an analysis with an error if analysis fails to complete."""
+    decoy.when(
+        await analysis_worker_pool.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_resource.source,
+        )
+    ).then_raise(AnalysisFailedError(error_type="BadError", detail="oh no"))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+        cache_key="cache-key",
+    )
+
+    errors_captor = matchers.Captor()
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=errors_captor,
+        ),
+    )
+
+    assert len(errors_captor.value) == 1
+    assert errors_captor.value[0].errorType == "BadError"
+    assert errors_captor.value[0].detail == "oh no"
+    decoy.verify(
+        await analysis_cache.put(matchers.Anything(), matchers.Anything()),
+        times=0,
+    )
+
+
+async def test_analyze_cancelled(
+    decoy: Decoy,
+    analysis_worker_pool: AnalysisWorkerPool,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should remove the pending analysis and store nothing if cancelled."""
+    decoy.when(
+        await analysis_worker_pool.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_resource.source,
+        )
+    ).then_raise(AnalysisCancelledError("analysis-id"))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(analysis_store.remove_pending(analysis_id="analysis-id"))
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id=matchers.Anything(),
+            commands=matchers.Anything(),
+            labware=matchers.Anything(),
+            pipettes=matchers.Anything(),
+            errors=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
+async def test_analyze_adds_to_cache(
+    decoy: Decoy,
+    analysis_worker_pool: AnalysisWorkerPool,
+    analysis_store: AnalysisStore,
+    analysis_cache: AnalysisCache,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should add the completed analysis to the cache, if given a key."""
+    state_summary = StateSummary(
+        status=EngineStatus.SUCCEEDED,
+        errors=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        labwareOffsets=[],
+    )
+    completed_analysis = CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        commands=[],
+        labware=[],
+        pipettes=[],
+        errors=[],
+    )
+
+    decoy.when(
+        await analysis_worker_pool.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_resource.source,
+        )
+    ).then_return(ProtocolRunResult(commands=[], state_summary=state_summary))
+
+    decoy.when(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+    ).then_return(completed_analysis)
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+        cache_key="cache-key",
+    )
+
+    decoy.verify(await analysis_cache.put("cache-key", completed_analysis))
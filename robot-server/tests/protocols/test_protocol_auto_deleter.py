@@ -14,7 +14,7 @@ from robot_server.protocols.protocol_store import (
 )
 
 
-def test_make_room_for_new_protocol(
+async def test_make_room_for_new_protocol(
     decoy: Decoy, caplog: pytest.LogCaptureFixture
 ) -> None:
     """It should get a deletion plan and enact it on the store."""
@@ -34,17 +34,17 @@ def test_make_room_for_new_protocol(
 
     deletion_plan = set(["protocol-id-4", "protocol-id-5"])
 
-    decoy.when(mock_protocol_store.get_usage_info()).then_return(usage_info)
+    decoy.when(await mock_protocol_store.get_usage_info()).then_return(usage_info)
     decoy.when(
         mock_deletion_planner.plan_for_new_protocol(existing_protocols=usage_info)
     ).then_return(deletion_plan)
 
     # Run the subject, capturing log messages at least as severe as INFO.
     with caplog.at_level(logging.INFO):
-        subject.make_room_for_new_protocol()
+        await subject.make_room_for_new_protocol()
 
-    decoy.verify(mock_protocol_store.remove(protocol_id="protocol-id-4"))
-    decoy.verify(mock_protocol_store.remove(protocol_id="protocol-id-5"))
+    decoy.verify(await mock_protocol_store.remove(protocol_id="protocol-id-4"))
+    decoy.verify(await mock_protocol_store.remove(protocol_id="protocol-id-5"))
 
     # It should log the protocols that it deleted.
     assert "protocol-id-4" in caplog.text
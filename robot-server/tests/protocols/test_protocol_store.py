@@ -1,10 +1,13 @@
 """Tests for the ProtocolStore interface."""
 import pytest
 from datetime import datetime, timezone
+from decoy import Decoy
 from pathlib import Path
+from typing import List
 
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocol_reader import (
+    ProtocolReader,
     ProtocolSource,
     ProtocolSourceFile,
     ProtocolFileRole,
@@ -45,6 +48,38 @@ def run_store(sql_engine: SQLEngine) -> RunStore:
     return RunStore(sql_engine=sql_engine)
 
 
+@pytest.fixture
+def protocol_reader(decoy: Decoy) -> ProtocolReader:
+    """Get a mock ProtocolReader for rehydrating stores."""
+    return decoy.mock(cls=ProtocolReader)
+
+
+async def _insert_saved_protocol(
+    subject: ProtocolStore, protocols_directory: Path, protocol_id: str
+) -> ProtocolResource:
+    """Insert a protocol whose files are saved in its own subdirectory."""
+    directory = protocols_directory / protocol_id
+    directory.mkdir()
+    main_file = directory / "protocol.json"
+    main_file.touch()
+
+    resource = ProtocolResource(
+        protocol_id=protocol_id,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        source=ProtocolSource(
+            directory=directory,
+            main_file=main_file,
+            config=JsonProtocolConfig(schema_version=6),
+            files=[ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN)],
+            metadata={},
+            labware_definitions=[],
+        ),
+        protocol_key=None,
+    )
+    await subject.insert(resource)
+    return resource
+
+
 async def test_insert_and_get_protocol(
     protocol_file_directory: Path, subject: ProtocolStore
 ) -> None:
@@ -63,13 +98,13 @@ async def test_insert_and_get_protocol(
         protocol_key="dummy-data-111",
     )
 
-    assert subject.has("protocol-id") is False
+    assert await subject.has("protocol-id") is False
 
-    subject.insert(protocol_resource)
-    result = subject.get("protocol-id")
+    await subject.insert(protocol_resource)
+    result = await subject.get("protocol-id")
 
     assert result == protocol_resource
-    assert subject.has("protocol-id") is True
+    assert await subject.has("protocol-id") is True
 
 
 async def test_insert_with_duplicate_key_raises(
@@ -102,20 +137,21 @@ async def test_insert_with_duplicate_key_raises(
         ),
         protocol_key="dummy-data-222",
     )
-    subject.insert(protocol_resource_1)
+    await subject.insert(protocol_resource_1)
 
     # Don't care what it raises. Exception type is not part of the public interface.
     # We just care that it doesn't corrupt the database.
     with pytest.raises(Exception):
-        subject.insert(protocol_resource_2)
+        await subject.insert(protocol_resource_2)
 
-    assert subject.get_all() == [protocol_resource_1]  # No traces of the failed insert.
+    # No traces of the failed insert.
+    assert await subject.get_all() == [protocol_resource_1]
 
 
 async def test_get_missing_protocol_raises(subject: ProtocolStore) -> None:
     """It should raise an error when protocol not found."""
     with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
-        subject.get("protocol-id")
+        await subject.get("protocol-id")
 
 
 async def test_get_all_protocols(
@@ -152,9 +188,9 @@ async def test_get_all_protocols(
         protocol_key="dummy-data-222",
     )
 
-    subject.insert(resource_1)
-    subject.insert(resource_2)
-    result = subject.get_all()
+    await subject.insert(resource_1)
+    await subject.insert(resource_2)
+    result = await subject.get_all()
 
     assert result == [resource_1, resource_2]
 
@@ -187,26 +223,26 @@ async def test_remove_protocol(
         protocol_key="dummy-data-111",
     )
 
-    subject.insert(protocol_resource)
-    subject.remove("protocol-id")
+    await subject.insert(protocol_resource)
+    await subject.remove("protocol-id")
 
     assert directory.exists() is False
     assert main_file.exists() is False
     assert other_file.exists() is False
 
     with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
-        subject.get("protocol-id")
+        await subject.get("protocol-id")
 
 
-def test_remove_missing_protocol_raises(
+async def test_remove_missing_protocol_raises(
     subject: ProtocolStore,
 ) -> None:
     """It should raise an error when trying to remove missing protocol."""
     with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
-        subject.remove("protocol-id")
+        await subject.remove("protocol-id")
 
 
-def test_remove_protocol_conflict(
+async def test_remove_protocol_conflict(
     run_store: RunStore,
     subject: ProtocolStore,
 ) -> None:
@@ -225,24 +261,24 @@ def test_remove_protocol_conflict(
         protocol_key=None,
     )
 
-    subject.insert(protocol_resource)
-    run_store.insert(
+    await subject.insert(protocol_resource)
+    await run_store.insert(
         run_id="run-id",
         protocol_id="protocol-id",
         created_at=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
     )
 
     with pytest.raises(ProtocolUsedByRunError, match="protocol-id"):
-        subject.remove("protocol-id")
+        await subject.remove("protocol-id")
 
 
-def test_get_usage_info(
+async def test_get_usage_info(
     subject: ProtocolStore,
     run_store: RunStore,
 ) -> None:
     """It should return which protocols are used by runs."""
     # get_usage_info() should return an empty list when no protocols have been added.
-    assert subject.get_usage_info() == []
+    assert await subject.get_usage_info() == []
 
     protocol_resource_1 = ProtocolResource(
         protocol_id="protocol-id-1",
@@ -271,12 +307,12 @@ def test_get_usage_info(
         protocol_key=None,
     )
 
-    subject.insert(protocol_resource_1)
-    subject.insert(protocol_resource_2)
+    await subject.insert(protocol_resource_1)
+    await subject.insert(protocol_resource_2)
 
     # get_usage_info() should return results in insertion order.
     # Protocols not used by any runs should have is_used_by_run=False.
-    assert subject.get_usage_info() == [
+    assert await subject.get_usage_info() == [
         ProtocolUsageInfo(
             protocol_id="protocol-id-1",
             is_used_by_run=False,
@@ -289,12 +325,12 @@ def test_get_usage_info(
 
     # When a run is added that uses a protocol,
     # that protocol's is_used_by_run should become True.
-    run_store.insert(
+    await run_store.insert(
         run_id="run-id-1",
         protocol_id="protocol-id-1",
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    assert subject.get_usage_info() == [
+    assert await subject.get_usage_info() == [
         ProtocolUsageInfo(
             protocol_id="protocol-id-1",
             is_used_by_run=True,
@@ -307,8 +343,8 @@ def test_get_usage_info(
 
     # When no more runs use a protocol,
     # that protocol's is_used_by_run should go back to being False.
-    run_store.remove(run_id="run-id-1")
-    assert subject.get_usage_info() == [
+    await run_store.remove(run_id="run-id-1")
+    assert await subject.get_usage_info() == [
         ProtocolUsageInfo(
             protocol_id="protocol-id-1",
             is_used_by_run=False,
@@ -318,3 +354,209 @@ def test_get_usage_info(
             is_used_by_run=False,
         ),
     ]
+
+
+async def _stub_read_saved(
+    decoy: Decoy,
+    protocol_reader: ProtocolReader,
+    resource: ProtocolResource,
+    reads: List[str],
+) -> None:
+    """Stub reading a protocol saved by `_insert_saved_protocol`, recording reads."""
+    directory = resource.source.directory
+    assert directory is not None
+
+    def _read(*_a: object, **_k: object) -> ProtocolSource:
+        reads.append(resource.protocol_id)
+        return resource.source
+
+    decoy.when(
+        await protocol_reader.read_saved(
+            files=[directory / "protocol.json"], directory=directory
+        )
+    ).then_do(_read)
+
+
+async def _rehydrate_lazy(
+    sql_engine: SQLEngine,
+    protocols_directory: Path,
+    protocol_reader: ProtocolReader,
+    max_cached_sources: int = 20,
+) -> ProtocolStore:
+    return await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocols_directory,
+        protocol_reader=protocol_reader,
+        lazy=True,
+        max_cached_sources=max_cached_sources,
+    )
+
+
+async def test_rehydrate_lazy(
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+    protocol_reader: ProtocolReader,
+    subject: ProtocolStore,
+) -> None:
+    """It should only read a protocol's files once it's retrieved."""
+    reads: List[str] = []
+    resource = await _insert_saved_protocol(
+        subject, protocol_file_directory, "protocol-id"
+    )
+    await _stub_read_saved(decoy, protocol_reader, resource, reads)
+
+    rehydrated = await _rehydrate_lazy(
+        sql_engine, protocol_file_directory, protocol_reader
+    )
+    assert reads == []
+
+    assert await rehydrated.get("protocol-id") == resource
+    assert await rehydrated.get_all() == [resource]
+    assert reads == ["protocol-id"]
+
+
+async def test_rehydrate_lazy_evicts_least_recently_used(
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+    protocol_reader: ProtocolReader,
+    subject: ProtocolStore,
+) -> None:
+    """It should keep only the most recently used sources in memory."""
+    reads: List[str] = []
+    resource_1 = await _insert_saved_protocol(subject, protocol_file_directory, "id-1")
+    resource_2 = await _insert_saved_protocol(subject, protocol_file_directory, "id-2")
+    await _stub_read_saved(decoy, protocol_reader, resource_1, reads)
+    await _stub_read_saved(decoy, protocol_reader, resource_2, reads)
+
+    rehydrated = await _rehydrate_lazy(
+        sql_engine, protocol_file_directory, protocol_reader, max_cached_sources=1
+    )
+
+    assert await rehydrated.get("id-1") == resource_1
+    assert await rehydrated.get("id-1") == resource_1
+    assert await rehydrated.get("id-2") == resource_2
+    assert await rehydrated.get("id-1") == resource_1
+    assert reads == ["id-1", "id-2", "id-1"]
+
+
+async def test_warm_source_cache(
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+    protocol_reader: ProtocolReader,
+    subject: ProtocolStore,
+) -> None:
+    """It should compute the sources of the newest protocols ahead of time."""
+    reads: List[str] = []
+    resource_1 = await _insert_saved_protocol(subject, protocol_file_directory, "id-1")
+    resource_2 = await _insert_saved_protocol(subject, protocol_file_directory, "id-2")
+    await _stub_read_saved(decoy, protocol_reader, resource_1, reads)
+    await _stub_read_saved(decoy, protocol_reader, resource_2, reads)
+
+    rehydrated = await _rehydrate_lazy(
+        sql_engine, protocol_file_directory, protocol_reader, max_cached_sources=1
+    )
+
+    await rehydrated.warm_source_cache()
+    assert reads == ["id-2"]
+
+    assert await rehydrated.get("id-2") == resource_2
+    assert reads == ["id-2"]
+
+
+async def test_remove_lazy_protocol_never_retrieved(
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+    protocol_reader: ProtocolReader,
+    subject: ProtocolStore,
+) -> None:
+    """It should delete the files of a protocol whose source was never computed."""
+    await _insert_saved_protocol(subject, protocol_file_directory, "protocol-id")
+
+    rehydrated = await _rehydrate_lazy(
+        sql_engine, protocol_file_directory, protocol_reader
+    )
+    await rehydrated.remove("protocol-id")
+
+    assert (protocol_file_directory / "protocol-id").exists() is False
+    assert await rehydrated.has("protocol-id") is False
+
+
+async def test_get_all_lazy_reads_each_source_once(
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+    protocol_reader: ProtocolReader,
+    subject: ProtocolStore,
+) -> None:
+    """It should read each listed source once, then go back to the cache size."""
+    reads: List[str] = []
+    resource_1 = await _insert_saved_protocol(subject, protocol_file_directory, "id-1")
+    resource_2 = await _insert_saved_protocol(subject, protocol_file_directory, "id-2")
+    await _stub_read_saved(decoy, protocol_reader, resource_1, reads)
+    await _stub_read_saved(decoy, protocol_reader, resource_2, reads)
+
+    rehydrated = await _rehydrate_lazy(
+        sql_engine, protocol_file_directory, protocol_reader, max_cached_sources=1
+    )
+
+    assert await rehydrated.get_all() == [resource_1, resource_2]
+    assert sorted(reads) == ["id-1", "id-2"]
+
+    # Only one source should be kept after the listing.
+    await rehydrated.get("id-1")
+    reads.clear()
+    assert await rehydrated.get("id-2") == resource_2
+    assert await rehydrated.get("id-1") == resource_1
+    assert reads == ["id-2", "id-1"]
+
+
+async def test_get_all_lazy_skips_unreadable_protocols(
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+    protocol_reader: ProtocolReader,
+    subject: ProtocolStore,
+) -> None:
+    """It should leave out protocols whose source fails to compute."""
+    reads: List[str] = []
+    await _insert_saved_protocol(subject, protocol_file_directory, "id-1")
+    resource_2 = await _insert_saved_protocol(subject, protocol_file_directory, "id-2")
+    await _stub_read_saved(decoy, protocol_reader, resource_2, reads)
+    decoy.when(
+        await protocol_reader.read_saved(
+            files=[protocol_file_directory / "id-1" / "protocol.json"],
+            directory=protocol_file_directory / "id-1",
+        )
+    ).then_raise(RuntimeError("oh no"))
+
+    rehydrated = await _rehydrate_lazy(
+        sql_engine, protocol_file_directory, protocol_reader
+    )
+
+    assert await rehydrated.get_all() == [resource_2]
+    with pytest.raises(RuntimeError, match="oh no"):
+        await rehydrated.get("id-1")
+
+
+async def test_remove_lazy_protocol_missing_directory(
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+    protocol_reader: ProtocolReader,
+    subject: ProtocolStore,
+) -> None:
+    """It should remove a protocol whose directory is already gone."""
+    resource = await _insert_saved_protocol(
+        subject, protocol_file_directory, "protocol-id"
+    )
+    resource.source.main_file.unlink()
+    (protocol_file_directory / "protocol-id").rmdir()
+
+    rehydrated = await _rehydrate_lazy(
+        sql_engine, protocol_file_directory, protocol_reader
+    )
+    await rehydrated.remove("protocol-id")
+
+    assert await rehydrated.has("protocol-id") is False
@@ -1,10 +1,12 @@
 """Tests for the /protocols router."""
+import json
 import pytest
 from datetime import datetime
 from decoy import Decoy, matchers
 from fastapi import UploadFile
 from pathlib import Path
 
+from opentrons.hardware_control import HardwareControlAPI
 from opentrons.protocols.api_support.types import APIVersion
 
 from opentrons.protocol_reader import (
@@ -18,10 +20,17 @@ from opentrons.protocol_reader import (
 )
 
 from robot_server.errors import ApiError
-from robot_server.service.json_api import SimpleEmptyBody, MultiBodyMeta
+from robot_server.service.json_api import (
+    CachedResponse,
+    MultiBodyMeta,
+    ResponseCache,
+    SimpleEmptyBody,
+)
 from robot_server.service.task_runner import TaskRunner
 from robot_server.protocols.analysis_store import AnalysisStore, AnalysisNotFoundError
+from robot_server.protocols.analysis_cache import AnalysisCache
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.analysis_worker_pool import AnalysisWorkerPool
 from robot_server.protocols.protocol_auto_deleter import ProtocolAutoDeleter
 from robot_server.protocols.analysis_models import (
     AnalysisStatus,
@@ -78,6 +87,32 @@ def protocol_analyzer(decoy: Decoy) -> ProtocolAnalyzer:
     return decoy.mock(cls=ProtocolAnalyzer)
 
 
+@pytest.fixture
+def analysis_worker_pool(decoy: Decoy) -> AnalysisWorkerPool:
+    """Get a mocked out AnalysisWorkerPool."""
+    return decoy.mock(cls=AnalysisWorkerPool)
+
+
+@pytest.fixture
+def analysis_cache(decoy: Decoy) -> AnalysisCache:
+    """Get a mocked out AnalysisCache."""
+    return decoy.mock(cls=AnalysisCache)
+
+
+@pytest.fixture
+def response_cache(decoy: Decoy) -> ResponseCache:
+    """Get a mocked out ResponseCache."""
+    return decoy.mock(cls=ResponseCache)
+
+
+@pytest.fixture
+def hardware(decoy: Decoy) -> HardwareControlAPI:
+    """Get a mocked out HardwareControlAPI with no attached instruments."""
+    hardware = decoy.mock(cls=HardwareControlAPI)
+    decoy.when(hardware.get_attached_instruments()).then_return({})
+    return hardware
+
+
 @pytest.fixture
 def task_runner(decoy: Decoy) -> TaskRunner:
     """Get a mocked out TaskRunner."""
@@ -95,7 +130,7 @@ async def test_get_protocols_no_protocols(
     protocol_store: ProtocolStore,
 ) -> None:
     """It should return an empty collection response with no protocols loaded."""
-    decoy.when(protocol_store.get_all()).then_return([])
+    decoy.when(await protocol_store.get_all()).then_return([])
 
     result = await get_protocols(protocol_store=protocol_store)
 
@@ -162,11 +197,11 @@ async def test_get_protocols(
         key="dummy-key-222",
     )
 
-    decoy.when(protocol_store.get_all()).then_return([resource_1, resource_2])
-    decoy.when(analysis_store.get_summaries_by_protocol("abc")).then_return(
+    decoy.when(await protocol_store.get_all()).then_return([resource_1, resource_2])
+    decoy.when(await analysis_store.get_summaries_by_protocol("abc")).then_return(
         [analysis_1]
     )
-    decoy.when(analysis_store.get_summaries_by_protocol("123")).then_return(
+    decoy.when(await analysis_store.get_summaries_by_protocol("123")).then_return(
         [analysis_2]
     )
 
@@ -205,9 +240,11 @@ async def test_get_protocol_by_id(
         status=AnalysisStatus.COMPLETED,
     )
 
-    decoy.when(protocol_store.get(protocol_id="protocol-id")).then_return(resource)
+    decoy.when(await protocol_store.get(protocol_id="protocol-id")).then_return(
+        resource
+    )
     decoy.when(
-        analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
+        await analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
     ).then_return([analysis_summary])
 
     result = await get_protocol_by_id(
@@ -235,7 +272,7 @@ async def test_get_protocol_not_found(
     """It should return a 404 error when requesting a non-existent protocol."""
     not_found_error = ProtocolNotFoundError("protocol-id")
 
-    decoy.when(protocol_store.get(protocol_id="protocol-id")).then_raise(
+    decoy.when(await protocol_store.get(protocol_id="protocol-id")).then_raise(
         not_found_error
     )
 
@@ -250,24 +287,28 @@ async def test_get_protocol_not_found(
 
 async def test_create_protocol(
     decoy: Decoy,
+    tmp_path: Path,
     protocol_store: ProtocolStore,
     analysis_store: AnalysisStore,
+    analysis_cache: AnalysisCache,
+    hardware: HardwareControlAPI,
     protocol_reader: ProtocolReader,
     protocol_analyzer: ProtocolAnalyzer,
     task_runner: TaskRunner,
     protocol_auto_deleter: ProtocolAutoDeleter,
 ) -> None:
     """It should store an uploaded protocol file."""
-    protocol_directory = Path("/dev/null")
+    protocol_directory = tmp_path
+    (protocol_directory / "foo.json").write_text("{}")
 
     protocol_file = UploadFile(filename="foo.json")
 
     protocol_source = ProtocolSource(
-        directory=Path("/dev/null"),
-        main_file=Path("/dev/null/foo.json"),
+        directory=protocol_directory,
+        main_file=protocol_directory / "foo.json",
         files=[
             ProtocolSourceFile(
-                path=Path("/dev/null/foo.json"),
+                path=protocol_directory / "foo.json",
                 role=ProtocolFileRole.MAIN,
             )
         ],
@@ -295,6 +336,8 @@ async def test_create_protocol(
         )
     ).then_return(protocol_source)
 
+    decoy.when(await analysis_cache.get(matchers.IsA(str))).then_return(None)
+
     decoy.when(
         analysis_store.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
     ).then_return(pending_analysis)
@@ -309,6 +352,8 @@ async def test_create_protocol(
         protocol_analyzer=protocol_analyzer,
         task_runner=task_runner,
         protocol_auto_deleter=protocol_auto_deleter,
+        analysis_cache=analysis_cache,
+        hardware=hardware,
         protocol_id="protocol-id",
         analysis_id="analysis-id",
         created_at=datetime(year=2021, month=1, day=1),
@@ -326,16 +371,112 @@ async def test_create_protocol(
     assert result.status_code == 201
 
     decoy.verify(
-        protocol_auto_deleter.make_room_for_new_protocol(),
-        protocol_store.insert(protocol_resource),
+        await protocol_auto_deleter.make_room_for_new_protocol(),
+        await protocol_store.insert(protocol_resource),
         task_runner.run(
             protocol_analyzer.analyze,
             analysis_id="analysis-id",
             protocol_resource=protocol_resource,
+            cache_key=matchers.IsA(str),
         ),
     )
 
 
+async def test_create_protocol_cached_analysis(
+    decoy: Decoy,
+    tmp_path: Path,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    analysis_cache: AnalysisCache,
+    hardware: HardwareControlAPI,
+    protocol_reader: ProtocolReader,
+    protocol_analyzer: ProtocolAnalyzer,
+    task_runner: TaskRunner,
+    protocol_auto_deleter: ProtocolAutoDeleter,
+) -> None:
+    """It should reuse a cached analysis of an identical protocol."""
+    protocol_directory = tmp_path
+    (protocol_directory / "foo.json").write_text("{}")
+
+    protocol_file = UploadFile(filename="foo.json")
+
+    protocol_source = ProtocolSource(
+        directory=protocol_directory,
+        main_file=protocol_directory / "foo.json",
+        files=[
+            ProtocolSourceFile(
+                path=protocol_directory / "foo.json",
+                role=ProtocolFileRole.MAIN,
+            )
+        ],
+        metadata={},
+        config=JsonProtocolConfig(schema_version=123),
+        labware_definitions=[],
+    )
+
+    cached_analysis = CompletedAnalysis(
+        id="cached-analysis-id",
+        result=AnalysisResult.OK,
+        commands=[],
+        labware=[],
+        pipettes=[],
+        errors=[],
+    )
+
+    decoy.when(
+        await protocol_reader.read_and_save(
+            files=[protocol_file],
+            directory=protocol_directory / "protocol-id",
+        )
+    ).then_return(protocol_source)
+
+    decoy.when(await analysis_cache.get(matchers.IsA(str))).then_return(cached_analysis)
+
+    decoy.when(
+        analysis_store.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    ).then_return(AnalysisSummary(id="analysis-id", status=AnalysisStatus.PENDING))
+
+    result = await create_protocol(
+        files=[protocol_file],
+        key=None,
+        protocol_directory=protocol_directory,
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+        protocol_reader=protocol_reader,
+        protocol_analyzer=protocol_analyzer,
+        task_runner=task_runner,
+        protocol_auto_deleter=protocol_auto_deleter,
+        analysis_cache=analysis_cache,
+        hardware=hardware,
+        protocol_id="protocol-id",
+        analysis_id="analysis-id",
+        created_at=datetime(year=2021, month=1, day=1),
+    )
+
+    assert result.content.data.analysisSummaries == [
+        AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED)
+    ]
+
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+    )
+    decoy.verify(
+        task_runner.run(
+            protocol_analyzer.analyze,
+            analysis_id=matchers.Anything(),
+            protocol_resource=matchers.Anything(),
+            cache_key=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
 async def test_create_protocol_not_readable(
     decoy: Decoy,
     protocol_reader: ProtocolReader,
@@ -363,11 +504,34 @@ async def test_create_protocol_not_readable(
 async def test_delete_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    analysis_worker_pool: AnalysisWorkerPool,
+    response_cache: ResponseCache,
 ) -> None:
-    """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    """It should remove a single protocol file and cancel its pending analysis."""
+    decoy.when(
+        await analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
+    ).then_return(
+        [
+            AnalysisSummary(id="analysis-id-1", status=AnalysisStatus.COMPLETED),
+            AnalysisSummary(id="analysis-id-2", status=AnalysisStatus.PENDING),
+        ]
+    )
 
-    decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
+    result = await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+        analysis_worker_pool=analysis_worker_pool,
+        response_cache=response_cache,
+    )
+
+    decoy.verify(
+        await protocol_store.remove(protocol_id="protocol-id"),
+        response_cache.invalidate("protocol-id"),
+        analysis_worker_pool.cancel("analysis-id-2"),
+    )
+    decoy.verify(analysis_worker_pool.cancel("analysis-id-1"), times=0)
 
     assert result.content == SimpleEmptyBody()
     assert result.status_code == 200
@@ -376,16 +540,28 @@ async def test_delete_protocol_by_id(
 async def test_delete_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    analysis_worker_pool: AnalysisWorkerPool,
+    response_cache: ResponseCache,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     not_found_error = ProtocolNotFoundError("protocol-id")
 
-    decoy.when(protocol_store.remove(protocol_id="protocol-id")).then_raise(
+    decoy.when(
+        await analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
+    ).then_return([])
+    decoy.when(await protocol_store.remove(protocol_id="protocol-id")).then_raise(
         not_found_error
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+            analysis_worker_pool=analysis_worker_pool,
+            response_cache=response_cache,
+        )
 
     assert exc_info.value.status_code == 404
 
@@ -393,16 +569,28 @@ async def test_delete_protocol_not_found(
 async def test_delete_protocol_run_exists(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    analysis_worker_pool: AnalysisWorkerPool,
+    response_cache: ResponseCache,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     run_exists_error = ProtocolUsedByRunError("protocol-id")
 
-    decoy.when(protocol_store.remove(protocol_id="protocol-id")).then_raise(
+    decoy.when(
+        await analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
+    ).then_return([])
+    decoy.when(await protocol_store.remove(protocol_id="protocol-id")).then_raise(
         run_exists_error
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+            analysis_worker_pool=analysis_worker_pool,
+            response_cache=response_cache,
+        )
 
     assert exc_info.value.status_code == 409
 
@@ -411,8 +599,9 @@ async def test_get_protocol_analyses(
     decoy: Decoy,
     protocol_store: ProtocolStore,
     analysis_store: AnalysisStore,
+    response_cache: ResponseCache,
 ) -> None:
-    """It should get all analyses of a protocol."""
+    """It should get all analyses of a protocol, and cache them once completed."""
     analysis = CompletedAnalysis(
         id="analysis-id",
         result=AnalysisResult.OK,
@@ -422,34 +611,119 @@ async def test_get_protocol_analyses(
         errors=[],
     )
 
-    decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get_by_protocol("protocol-id")).then_return(
-        [analysis]
+    decoy.when(await protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(response_cache.get("protocol-id", "analyses")).then_return(None)
+    decoy.when(response_cache.generation).then_return(42)
+    decoy.when(
+        await analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
+    ).then_return([AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED)])
+    decoy.when(
+        await analysis_store.get_by_protocol_as_document("protocol-id")
+    ).then_return([analysis.json()])
+
+    result = await get_protocol_analyses(
+        protocolId="protocol-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+        if_none_match=None,
+        response_cache=response_cache,
+    )
+
+    assert result.status_code == 200
+    assert json.loads(result.body) == {
+        "data": [json.loads(analysis.json())],
+        "meta": {"cursor": 0, "totalLength": 1},
+    }
+    decoy.verify(response_cache.put("protocol-id", "analyses", result, 42))
+
+
+async def test_get_protocol_analyses_pending(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    response_cache: ResponseCache,
+) -> None:
+    """It should not cache a protocol's analyses while one is pending."""
+    analysis = PendingAnalysis(id="analysis-id")
+
+    decoy.when(await protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(response_cache.get("protocol-id", "analyses")).then_return(None)
+    decoy.when(
+        await analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
+    ).then_return([AnalysisSummary(id="analysis-id", status=AnalysisStatus.PENDING)])
+    decoy.when(
+        await analysis_store.get_by_protocol_as_document("protocol-id")
+    ).then_return([analysis.json()])
+
+    result = await get_protocol_analyses(
+        protocolId="protocol-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+        if_none_match=None,
+        response_cache=response_cache,
+    )
+
+    assert json.loads(result.body)["data"] == [json.loads(analysis.json())]
+    decoy.verify(
+        response_cache.put(
+            matchers.Anything(), matchers.Anything(), result, matchers.Anything()
+        ),
+        times=0,
     )
 
+
+async def test_get_protocol_analyses_cached(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+    response_cache: ResponseCache,
+) -> None:
+    """It should send cached analyses, or 304 if the client has them."""
+    cached = CachedResponse(body=b'{"data": [], "meta": {}}', etag='"etag"')
+
+    decoy.when(await protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(response_cache.get("protocol-id", "analyses")).then_return(cached)
+
     result = await get_protocol_analyses(
         protocolId="protocol-id",
         protocol_store=protocol_store,
         analysis_store=analysis_store,
+        if_none_match=None,
+        response_cache=response_cache,
     )
 
     assert result.status_code == 200
-    assert result.content.data == [analysis]
+    assert result.body == cached.body
+    assert result.headers["ETag"] == '"etag"'
+
+    result = await get_protocol_analyses(
+        protocolId="protocol-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+        if_none_match='"etag"',
+        response_cache=response_cache,
+    )
+
+    assert result.status_code == 304
+    assert result.body == b""
 
 
 async def test_get_protocol_analyses_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
     analysis_store: AnalysisStore,
+    response_cache: ResponseCache,
 ) -> None:
     """It should 404 if protocol does not exist."""
-    decoy.when(protocol_store.has("protocol-id")).then_return(False)
+    decoy.when(await protocol_store.has("protocol-id")).then_return(False)
 
     with pytest.raises(ApiError) as exc_info:
         await get_protocol_analyses(
             protocolId="protocol-id",
             protocol_store=protocol_store,
             analysis_store=analysis_store,
+            if_none_match=None,
+            response_cache=response_cache,
         )
 
     assert exc_info.value.status_code == 404
@@ -464,7 +738,7 @@ async def test_get_protocol_analysis_by_id(
     """It should get a single full analysis by ID."""
     analysis = PendingAnalysis(id="analysis-id")
 
-    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(await protocol_store.has("protocol-id")).then_return(True)
     decoy.when(await analysis_store.get("analysis-id")).then_return(analysis)
 
     result = await get_protocol_analysis_by_id(
@@ -484,7 +758,7 @@ async def test_get_protocol_analysis_by_id_protocol_not_found(
     analysis_store: AnalysisStore,
 ) -> None:
     """It should 404 if the protocol does not exist."""
-    decoy.when(protocol_store.has("protocol-id")).then_return(False)
+    decoy.when(await protocol_store.has("protocol-id")).then_return(False)
 
     with pytest.raises(ApiError) as exc_info:
         await get_protocol_analysis_by_id(
@@ -504,7 +778,7 @@ async def test_get_protocol_analysis_by_id_analysis_not_found(
     analysis_store: AnalysisStore,
 ) -> None:
     """It should get a single full analysis by ID."""
-    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(await protocol_store.has("protocol-id")).then_return(True)
     decoy.when(await analysis_store.get("analysis-id")).then_raise(
         AnalysisNotFoundError("oh no")
     )
@@ -3,6 +3,7 @@ import pytest
 from decoy import Decoy
 
 from robot_server.protocols import ProtocolStore
+from robot_server.service.json_api import ResponseCache
 from robot_server.runs.run_auto_deleter import RunAutoDeleter
 from robot_server.runs.run_store import RunStore
 from robot_server.runs.engine_store import EngineStore
@@ -44,3 +45,9 @@ def mock_run_data_manager(decoy: Decoy) -> RunDataManager:
 def mock_run_auto_deleter(decoy: Decoy) -> RunAutoDeleter:
     """Get a mock RunAutoDeleter interface."""
     return decoy.mock(cls=RunAutoDeleter)
+
+
+@pytest.fixture()
+def mock_response_cache(decoy: Decoy) -> ResponseCache:
+    """Get a mock ResponseCache interface."""
+    return decoy.mock(cls=ResponseCache)
@@ -40,7 +40,7 @@ async def test_create_run_action(
     )
 
     decoy.when(
-        mock_run_controller.create_action(
+        await mock_run_controller.create_action(
             action_id=action_id,
             action_type=action_type,
             created_at=created_at,
@@ -81,7 +81,7 @@ async def test_create_play_action_not_allowed(
     request_body = RequestModel(data=RunActionCreate(actionType=action_type))
 
     decoy.when(
-        mock_run_controller.create_action(
+        await mock_run_controller.create_action(
             action_id=action_id,
             action_type=action_type,
             created_at=created_at,
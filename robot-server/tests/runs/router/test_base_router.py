@@ -1,7 +1,7 @@
 """Tests for base /runs routes."""
 import pytest
 from datetime import datetime
-from decoy import Decoy
+from decoy import Decoy, matchers
 from pathlib import Path
 
 from opentrons.types import DeckSlotName
@@ -10,11 +10,14 @@ from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 
 from robot_server.errors import ApiError
 from robot_server.service.json_api import (
+    CachedResponse,
     RequestModel,
     SimpleBody,
     SimpleEmptyBody,
     MultiBodyMeta,
+    PydanticResponse,
     ResourceLink,
+    ResponseCache,
 )
 
 from robot_server.protocols import (
@@ -53,6 +56,7 @@ def labware_offset_create() -> LabwareOffsetCreate:
 async def test_create_run(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
     mock_run_auto_deleter: RunAutoDeleter,
     labware_offset_create: pe_types.LabwareOffsetCreate,
 ) -> None:
@@ -74,6 +78,7 @@ async def test_create_run(
         status=pe_types.EngineStatus.IDLE,
     )
 
+    decoy.when(mock_run_data_manager.current_run_id).then_return("prev-run-id")
     decoy.when(
         await mock_run_data_manager.create(
             run_id=run_id,
@@ -91,18 +96,21 @@ async def test_create_run(
         run_id=run_id,
         created_at=run_created_at,
         run_auto_deleter=mock_run_auto_deleter,
+        response_cache=mock_response_cache,
     )
 
     assert result.content.data == expected_response
     assert result.status_code == 201
 
-    decoy.verify(mock_run_auto_deleter.make_room_for_new_run(), times=1)
+    decoy.verify(await mock_run_auto_deleter.make_room_for_new_run(), times=1)
+    decoy.verify(mock_response_cache.invalidate("prev-run-id"), times=1)
 
 
 async def test_create_protocol_run(
     decoy: Decoy,
     mock_protocol_store: ProtocolStore,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
     mock_run_auto_deleter: RunAutoDeleter,
 ) -> None:
     """It should be able to create a protocol run."""
@@ -138,7 +146,7 @@ async def test_create_protocol_run(
         status=pe_types.EngineStatus.IDLE,
     )
 
-    decoy.when(mock_protocol_store.get(protocol_id=protocol_id)).then_return(
+    decoy.when(await mock_protocol_store.get(protocol_id=protocol_id)).then_return(
         protocol_resource
     )
 
@@ -158,12 +166,13 @@ async def test_create_protocol_run(
         run_id=run_id,
         created_at=run_created_at,
         run_auto_deleter=mock_run_auto_deleter,
+        response_cache=mock_response_cache,
     )
 
     assert result.content.data == expected_response
     assert result.status_code == 201
 
-    decoy.verify(mock_run_auto_deleter.make_room_for_new_run(), times=1)
+    decoy.verify(await mock_run_auto_deleter.make_room_for_new_run(), times=1)
 
 
 async def test_create_protocol_run_bad_protocol_id(
@@ -173,7 +182,9 @@ async def test_create_protocol_run_bad_protocol_id(
     """It should 404 if a protocol for a run does not exist."""
     error = ProtocolNotFoundError("protocol-id")
 
-    decoy.when(mock_protocol_store.get(protocol_id="protocol-id")).then_raise(error)
+    decoy.when(await mock_protocol_store.get(protocol_id="protocol-id")).then_raise(
+        error
+    )
 
     with pytest.raises(ApiError) as exc_info:
         await create_run(
@@ -188,6 +199,7 @@ async def test_create_protocol_run_bad_protocol_id(
 async def test_create_run_conflict(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
     mock_run_auto_deleter: RunAutoDeleter,
 ) -> None:
     """It should respond with a conflict error if multiple engines are created."""
@@ -209,6 +221,7 @@ async def test_create_run_conflict(
             request_body=None,
             run_data_manager=mock_run_data_manager,
             run_auto_deleter=mock_run_auto_deleter,
+            response_cache=mock_response_cache,
         )
 
     assert exc_info.value.status_code == 409
@@ -234,7 +247,7 @@ async def test_get_run_data_from_url(
         labwareOffsets=[],
     )
 
-    decoy.when(mock_run_data_manager.get("run-id")).then_return(expected_response)
+    decoy.when(await mock_run_data_manager.get("run-id")).then_return(expected_response)
 
     result = await get_run_data_from_url(
         runId="run-id",
@@ -251,7 +264,9 @@ async def test_get_run_with_missing_id(
     """It should 404 if the run ID does not exist."""
     not_found_error = RunNotFoundError(run_id="run-id")
 
-    decoy.when(mock_run_data_manager.get(run_id="run-id")).then_raise(not_found_error)
+    decoy.when(await mock_run_data_manager.get(run_id="run-id")).then_raise(
+        not_found_error
+    )
 
     with pytest.raises(ApiError) as exc_info:
         await get_run_data_from_url(
@@ -263,13 +278,58 @@ async def test_get_run_with_missing_id(
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
 
 
-async def test_get_run() -> None:
-    """It should wrap the run data in a response."""
+async def test_get_run(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
+) -> None:
+    """It should wrap the current run's data in a response, without caching it."""
     run_data = Run(
         id="run-id",
         protocolId=None,
         createdAt=datetime(year=2021, month=1, day=1),
         status=pe_types.EngineStatus.IDLE,
+        current=True,
+        actions=[],
+        errors=[],
+        pipettes=[],
+        modules=[],
+        labware=[],
+        labwareOffsets=[],
+    )
+
+    decoy.when(mock_run_data_manager.current_run_id).then_return("run-id")
+    decoy.when(await mock_run_data_manager.get("run-id")).then_return(run_data)
+
+    result = await get_run(
+        runId="run-id",
+        if_none_match=None,
+        run_data_manager=mock_run_data_manager,
+        response_cache=mock_response_cache,
+    )
+
+    assert isinstance(result, PydanticResponse)
+    assert result.content.data == run_data
+    assert result.status_code == 200
+    decoy.verify(
+        mock_response_cache.put(
+            matchers.Anything(), matchers.Anything(), result, matchers.Anything()
+        ),
+        times=0,
+    )
+
+
+async def test_get_historical_run(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
+) -> None:
+    """It should cache the response of a run that isn't current."""
+    run_data = Run(
+        id="run-id",
+        protocolId=None,
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=pe_types.EngineStatus.SUCCEEDED,
         current=False,
         actions=[],
         errors=[],
@@ -279,10 +339,56 @@ async def test_get_run() -> None:
         labwareOffsets=[],
     )
 
-    result = await get_run(run_data=run_data)
+    decoy.when(mock_run_data_manager.current_run_id).then_return(None)
+    decoy.when(await mock_run_data_manager.has("run-id")).then_return(True)
+    decoy.when(mock_response_cache.get("run-id", "run")).then_return(None)
+    decoy.when(mock_response_cache.generation).then_return(42)
+    decoy.when(await mock_run_data_manager.get("run-id")).then_return(run_data)
+
+    result = await get_run(
+        runId="run-id",
+        if_none_match=None,
+        run_data_manager=mock_run_data_manager,
+        response_cache=mock_response_cache,
+    )
 
+    assert isinstance(result, PydanticResponse)
     assert result.content.data == run_data
+    decoy.verify(mock_response_cache.put("run-id", "run", result, 42))
+
+
+async def test_get_historical_run_cached(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
+) -> None:
+    """It should send a historical run's cached response, or 304 if it's current."""
+    cached = CachedResponse(body=b'{"data": {}}', etag='"etag"')
+
+    decoy.when(mock_run_data_manager.current_run_id).then_return(None)
+    decoy.when(await mock_run_data_manager.has("run-id")).then_return(True)
+    decoy.when(mock_response_cache.get("run-id", "run")).then_return(cached)
+
+    result = await get_run(
+        runId="run-id",
+        if_none_match=None,
+        run_data_manager=mock_run_data_manager,
+        response_cache=mock_response_cache,
+    )
+
     assert result.status_code == 200
+    assert result.body == cached.body
+    assert result.headers["ETag"] == '"etag"'
+
+    result = await get_run(
+        runId="run-id",
+        if_none_match='W/"other", "etag"',
+        run_data_manager=mock_run_data_manager,
+        response_cache=mock_response_cache,
+    )
+
+    assert result.status_code == 304
+    decoy.verify(await mock_run_data_manager.get("run-id"), times=0)
 
 
 async def test_get_runs_empty(
@@ -290,7 +396,7 @@ async def test_get_runs_empty(
     mock_run_data_manager: RunDataManager,
 ) -> None:
     """It should return an empty collection response when no runs exist."""
-    decoy.when(mock_run_data_manager.get_all()).then_return([])
+    decoy.when(await mock_run_data_manager.get_all()).then_return([])
     decoy.when(mock_run_data_manager.current_run_id).then_return(None)
 
     result = await get_runs(run_data_manager=mock_run_data_manager)
@@ -337,7 +443,9 @@ async def test_get_runs_not_empty(
         labwareOffsets=[],
     )
 
-    decoy.when(mock_run_data_manager.get_all()).then_return([response_1, response_2])
+    decoy.when(await mock_run_data_manager.get_all()).then_return(
+        [response_1, response_2]
+    )
     decoy.when(mock_run_data_manager.current_run_id).then_return("unique-id-2")
 
     result = await get_runs(run_data_manager=mock_run_data_manager)
@@ -353,11 +461,19 @@ async def test_get_runs_not_empty(
 async def test_delete_run_by_id(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should be able to remove a run by ID."""
-    result = await remove_run(runId="run-id", run_data_manager=mock_run_data_manager)
+    result = await remove_run(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        response_cache=mock_response_cache,
+    )
 
-    decoy.verify(await mock_run_data_manager.delete("run-id"), times=1)
+    decoy.verify(
+        await mock_run_data_manager.delete("run-id"),
+        mock_response_cache.invalidate("run-id"),
+    )
 
     assert result.content == SimpleEmptyBody()
     assert result.status_code == 200
@@ -366,6 +482,7 @@ async def test_delete_run_by_id(
 async def test_delete_run_with_bad_id(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should 404 if the run ID does not exist."""
     key_error = RunNotFoundError(run_id="run-id")
@@ -373,7 +490,11 @@ async def test_delete_run_with_bad_id(
     decoy.when(await mock_run_data_manager.delete("run-id")).then_raise(key_error)
 
     with pytest.raises(ApiError) as exc_info:
-        await remove_run(runId="run-id", run_data_manager=mock_run_data_manager)
+        await remove_run(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+            response_cache=mock_response_cache,
+        )
 
     assert exc_info.value.status_code == 404
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
@@ -382,6 +503,7 @@ async def test_delete_run_with_bad_id(
 async def test_delete_active_run(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should 409 if the run is not finished."""
     decoy.when(await mock_run_data_manager.delete("run-id")).then_raise(
@@ -389,7 +511,11 @@ async def test_delete_active_run(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await remove_run(runId="run-id", run_data_manager=mock_run_data_manager)
+        await remove_run(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+            response_cache=mock_response_cache,
+        )
 
     assert exc_info.value.status_code == 409
     assert exc_info.value.content["errors"][0]["id"] == "RunNotIdle"
@@ -398,6 +524,7 @@ async def test_delete_active_run(
 async def test_update_run_to_not_current(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should update a run to no longer be current."""
     expected_response = Run(
@@ -422,15 +549,18 @@ async def test_update_run_to_not_current(
         runId="run-id",
         request_body=RequestModel(data=RunUpdate(current=False)),
         run_data_manager=mock_run_data_manager,
+        response_cache=mock_response_cache,
     )
 
     assert result.content == SimpleBody(data=expected_response)
     assert result.status_code == 200
+    decoy.verify(mock_response_cache.invalidate("run-id"), times=1)
 
 
 async def test_update_current_none_noop(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should noop if the update does not request any change to current."""
     expected_response = Run(
@@ -455,6 +585,7 @@ async def test_update_current_none_noop(
         runId="run-id",
         request_body=RequestModel(data=RunUpdate()),
         run_data_manager=mock_run_data_manager,
+        response_cache=mock_response_cache,
     )
 
     assert result.content == SimpleBody(data=expected_response)
@@ -464,6 +595,7 @@ async def test_update_current_none_noop(
 async def test_update_to_current_not_current(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should 409 if attempting to update a not current run."""
     decoy.when(
@@ -475,6 +607,7 @@ async def test_update_to_current_not_current(
             runId="run-id",
             request_body=RequestModel(data=RunUpdate(current=False)),
             run_data_manager=mock_run_data_manager,
+            response_cache=mock_response_cache,
         )
 
     assert exc_info.value.status_code == 409
@@ -484,6 +617,7 @@ async def test_update_to_current_not_current(
 async def test_update_to_current_conflict(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should 409 if attempting to un-current a run that is not idle."""
     decoy.when(
@@ -495,6 +629,7 @@ async def test_update_to_current_conflict(
             runId="run-id",
             request_body=RequestModel(data=RunUpdate(current=False)),
             run_data_manager=mock_run_data_manager,
+            response_cache=mock_response_cache,
         )
 
     assert exc_info.value.status_code == 409
@@ -504,6 +639,7 @@ async def test_update_to_current_conflict(
 async def test_update_to_current_missing(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should 404 if attempting to update a missing run."""
     decoy.when(
@@ -515,6 +651,7 @@ async def test_update_to_current_missing(
             runId="run-id",
             request_body=RequestModel(data=RunUpdate(current=False)),
             run_data_manager=mock_run_data_manager,
+            response_cache=mock_response_cache,
         )
 
     assert exc_info.value.status_code == 404
@@ -1,21 +1,30 @@
 """Tests for the /runs/.../commands routes."""
+import anyio
+import json
 import pytest
 
 from datetime import datetime
+from typing import List
 from decoy import Decoy, matchers
+from fastapi.responses import StreamingResponse
 
 from opentrons.protocol_engine import (
+    CommandChanges,
     CommandSlice,
     CurrentCommand,
     ProtocolEngine,
     commands as pe_commands,
     errors as pe_errors,
 )
+from opentrons.protocol_engine.state import CommandEntry
 
 from robot_server.errors import ApiError
 from robot_server.service.json_api import (
+    CachedResponse,
     RequestModel,
     MultiBodyMeta,
+    PydanticResponse,
+    ResponseCache,
 )
 
 from robot_server.runs.run_store import RunStore, RunNotFoundError, CommandNotFoundError
@@ -28,6 +37,7 @@ from robot_server.runs.router.commands_router import (
     CommandLinkMeta,
     create_run_command,
     get_run_command,
+    get_run_command_updates,
     get_run_commands,
     get_current_run_engine_from_url,
 )
@@ -39,7 +49,7 @@ async def test_get_current_run_engine_from_url(
     mock_run_store: RunStore,
 ) -> None:
     """Should get an instance of a run protocol engine."""
-    decoy.when(mock_run_store.has("run-id")).then_return(True)
+    decoy.when(await mock_run_store.has("run-id")).then_return(True)
     decoy.when(mock_engine_store.current_run_id).then_return("run-id")
 
     result = await get_current_run_engine_from_url(
@@ -62,7 +72,7 @@ async def test_get_current_run_engine_no_run(
     mock_run_store: RunStore,
 ) -> None:
     """It should 404 if the run is not in the store."""
-    decoy.when(mock_run_store.has("run-id")).then_return(False)
+    decoy.when(await mock_run_store.has("run-id")).then_return(False)
 
     with pytest.raises(ApiError) as exc_info:
         await get_current_run_engine_from_url(
@@ -81,7 +91,7 @@ async def test_get_current_run_engine_from_url_not_current(
     mock_run_store: RunStore,
 ) -> None:
     """It should 409 if you try to add commands to non-current run."""
-    decoy.when(mock_run_store.has("run-id")).then_return(True)
+    decoy.when(await mock_run_store.has("run-id")).then_return(True)
     decoy.when(mock_engine_store.current_run_id).then_return("some-other-run-id")
 
     with pytest.raises(ApiError) as exc_info:
@@ -247,7 +257,9 @@ async def test_add_command_to_stopped_engine(
 
 
 async def test_get_run_commands(
-    decoy: Decoy, mock_run_data_manager: RunDataManager
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should return a list of all commands in a run."""
     command = pe_commands.WaitForResume(
@@ -276,7 +288,7 @@ async def test_get_run_commands(
         )
     )
     decoy.when(
-        mock_run_data_manager.get_commands_slice(
+        await mock_run_data_manager.get_commands_slice(
             run_id="run-id",
             cursor=None,
             length=42,
@@ -288,8 +300,11 @@ async def test_get_run_commands(
         run_data_manager=mock_run_data_manager,
         cursor=None,
         pageLength=42,
+        if_none_match=None,
+        response_cache=mock_response_cache,
     )
 
+    assert isinstance(result, PydanticResponse)
     assert result.content.data == [
         RunCommandSummary(
             id="command-id",
@@ -328,11 +343,14 @@ async def test_get_run_commands(
 async def test_get_run_commands_empty(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should return an empty commands list if no commands."""
     decoy.when(mock_run_data_manager.get_current_command("run-id")).then_return(None)
     decoy.when(
-        mock_run_data_manager.get_commands_slice(run_id="run-id", cursor=21, length=42)
+        await mock_run_data_manager.get_commands_slice(
+            run_id="run-id", cursor=21, length=42
+        )
     ).then_return(CommandSlice(commands=[], cursor=0, total_length=0))
 
     result = await get_run_commands(
@@ -340,23 +358,96 @@ async def test_get_run_commands_empty(
         run_data_manager=mock_run_data_manager,
         cursor=21,
         pageLength=42,
+        if_none_match=None,
+        response_cache=mock_response_cache,
     )
 
+    assert isinstance(result, PydanticResponse)
     assert result.content.data == []
     assert result.content.meta == MultiBodyMeta(cursor=0, totalLength=0)
     assert result.content.links == CommandCollectionLinks(current=None)
     assert result.status_code == 200
 
 
+async def test_get_historical_run_commands(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
+) -> None:
+    """It should cache slices of a historical run's commands."""
+    decoy.when(mock_run_data_manager.current_run_id).then_return(None)
+    decoy.when(await mock_run_data_manager.has("run-id")).then_return(True)
+    decoy.when(mock_run_data_manager.get_current_command("run-id")).then_return(None)
+    decoy.when(mock_response_cache.get("run-id", ("commands", 21, 42))).then_return(
+        None
+    )
+    decoy.when(mock_response_cache.generation).then_return(42)
+    decoy.when(
+        await mock_run_data_manager.get_commands_slice(
+            run_id="run-id", cursor=21, length=42
+        )
+    ).then_return(CommandSlice(commands=[], cursor=0, total_length=0))
+
+    result = await get_run_commands(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        cursor=21,
+        pageLength=42,
+        if_none_match=None,
+        response_cache=mock_response_cache,
+    )
+
+    assert result.status_code == 200
+    decoy.verify(
+        mock_response_cache.put("run-id", ("commands", 21, 42), result, 42), times=1
+    )
+
+
+async def test_get_historical_run_commands_cached(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
+) -> None:
+    """It should send a cached slice of a historical run's commands."""
+    cached = CachedResponse(body=b'{"data": []}', etag='"etag"')
+
+    decoy.when(mock_run_data_manager.current_run_id).then_return("other-run-id")
+    decoy.when(await mock_run_data_manager.has("run-id")).then_return(True)
+    decoy.when(mock_response_cache.get("run-id", ("commands", None, 20))).then_return(
+        cached
+    )
+
+    result = await get_run_commands(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        cursor=None,
+        pageLength=20,
+        if_none_match='"etag"',
+        response_cache=mock_response_cache,
+    )
+
+    assert result.status_code == 304
+    assert result.headers["ETag"] == '"etag"'
+    decoy.verify(
+        await mock_run_data_manager.get_commands_slice(
+            run_id="run-id", cursor=None, length=20
+        ),
+        times=0,
+    )
+
+
 async def test_get_run_commands_not_found(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
+    mock_response_cache: ResponseCache,
 ) -> None:
     """It should 404 if the run is not found."""
     not_found_error = RunNotFoundError("oh no")
 
     decoy.when(
-        mock_run_data_manager.get_commands_slice(run_id="run-id", cursor=21, length=42)
+        await mock_run_data_manager.get_commands_slice(
+            run_id="run-id", cursor=21, length=42
+        )
     ).then_raise(not_found_error)
     decoy.when(mock_run_data_manager.get_current_command(run_id="run-id")).then_raise(
         not_found_error
@@ -368,6 +459,8 @@ async def test_get_run_commands_not_found(
             run_data_manager=mock_run_data_manager,
             cursor=21,
             pageLength=42,
+            if_none_match=None,
+            response_cache=mock_response_cache,
         )
 
     assert exc_info.value.status_code == 404
@@ -386,9 +479,9 @@ async def test_get_run_command_by_id(
         params=pe_commands.MoveToWellParams(pipetteId="a", labwareId="b", wellName="c"),
     )
 
-    decoy.when(mock_run_data_manager.get_command("run-id", "command-id")).then_return(
-        command
-    )
+    decoy.when(
+        await mock_run_data_manager.get_command("run-id", "command-id")
+    ).then_return(command)
 
     result = await get_run_command(
         runId="run-id",
@@ -414,7 +507,9 @@ async def test_get_run_command_missing(
 ) -> None:
     """It should 404 if you attempt to get a non-existent command."""
     decoy.when(
-        mock_run_data_manager.get_command(run_id="run-id", command_id="command-id")
+        await mock_run_data_manager.get_command(
+            run_id="run-id", command_id="command-id"
+        )
     ).then_raise(exception)
 
     with pytest.raises(ApiError) as exc_info:
@@ -428,3 +523,208 @@ async def test_get_run_command_missing(
     assert exc_info.value.content["errors"][0]["detail"] == matchers.StringMatching(
         "oh no"
     )
+
+
+async def _collect_events(response: StreamingResponse) -> List[str]:
+    return [event async for event in response.body_iterator]
+
+
+async def test_get_run_command_updates(
+    decoy: Decoy,
+    mock_engine_store: EngineStore,
+    mock_protocol_engine: ProtocolEngine,
+) -> None:
+    """It should stream changed commands until the engine stops."""
+    command = pe_commands.MoveToWell(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.MoveToWellParams(pipetteId="a", labwareId="b", wellName="c"),
+    )
+
+    decoy.when(mock_engine_store.current_run_id).then_return("run-id")
+    decoy.when(
+        mock_protocol_engine.state_view.commands.get_changes_since(0)
+    ).then_return(
+        CommandChanges(
+            commands=[CommandEntry(index=0, command=command)],
+            cursor=2,
+            total_length=1,
+        )
+    )
+    decoy.when(
+        mock_protocol_engine.state_view.commands.get_changes_since(2)
+    ).then_return(CommandChanges(commands=[], cursor=2, total_length=1))
+    decoy.when(mock_protocol_engine.state_view.commands.get_current()).then_return(None)
+    decoy.when(mock_protocol_engine.state_view.commands.get_is_stopped()).then_return(
+        True
+    )
+
+    result = await get_run_command_updates(
+        runId="run-id",
+        cursor=None,
+        last_event_id=None,
+        protocol_engine=mock_protocol_engine,
+        engine_store=mock_engine_store,
+    )
+    events = await _collect_events(result)
+
+    assert result.media_type == "text/event-stream"
+    assert len(events) == 1
+
+    event_id, event_type, event_data = events[0].rstrip("\n").split("\n")
+    assert event_id == "id: 2"
+    assert event_type == "event: commands"
+    assert json.loads(event_data[len("data: ") :]) == {
+        "data": [
+            {
+                "index": 0,
+                "command": {
+                    "id": "command-id",
+                    "key": "command-key",
+                    "commandType": "moveToWell",
+                    "status": "succeeded",
+                    "createdAt": "2022-02-02T00:00:00",
+                    "params": json.loads(command.params.json()),
+                },
+            }
+        ],
+        "meta": {"cursor": 2, "totalLength": 1},
+        "links": {},
+    }
+
+
+async def test_get_run_command_updates_waits_for_changes(
+    decoy: Decoy,
+    mock_engine_store: EngineStore,
+    mock_protocol_engine: ProtocolEngine,
+) -> None:
+    """It should resume from Last-Event-ID and wait for new changes."""
+    command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=pe_commands.CommandStatus.RUNNING,
+        params=pe_commands.WaitForResumeParams(message="Hello"),
+    )
+    current_command = CurrentCommand(
+        command_id="command-id",
+        command_key="command-key",
+        created_at=datetime(year=2021, month=1, day=1),
+        index=3,
+    )
+
+    def _stub_new_changes(*_a: object, **_k: object) -> None:
+        decoy.when(
+            mock_protocol_engine.state_view.commands.get_changes_since(5)
+        ).then_return(
+            CommandChanges(
+                commands=[CommandEntry(index=3, command=command)],
+                cursor=6,
+                total_length=4,
+            )
+        )
+        decoy.when(
+            mock_protocol_engine.state_view.commands.get_changes_since(6)
+        ).then_return(CommandChanges(commands=[], cursor=6, total_length=4))
+        decoy.when(
+            mock_protocol_engine.state_view.commands.get_is_stopped()
+        ).then_return(True)
+
+    decoy.when(mock_engine_store.current_run_id).then_return("run-id")
+    decoy.when(
+        mock_protocol_engine.state_view.commands.get_changes_since(5)
+    ).then_return(CommandChanges(commands=[], cursor=5, total_length=4))
+    decoy.when(mock_protocol_engine.state_view.commands.get_is_stopped()).then_return(
+        False
+    )
+    decoy.when(mock_protocol_engine.state_view.commands.get_current()).then_return(
+        current_command
+    )
+    decoy.when(await mock_protocol_engine.wait_for_command_changes(5)).then_do(
+        _stub_new_changes
+    )
+
+    result = await get_run_command_updates(
+        runId="run-id",
+        cursor=None,
+        last_event_id=5,
+        protocol_engine=mock_protocol_engine,
+        engine_store=mock_engine_store,
+    )
+
+    events = await _collect_events(result)
+
+    assert len(events) == 1
+    assert events[0].startswith("id: 6\nevent: commands\n")
+
+    event_data = json.loads(events[0].split("data: ", 1)[1])
+    assert event_data["data"][0]["index"] == 3
+    assert event_data["data"][0]["command"]["id"] == "command-id"
+    assert event_data["links"]["current"] == {
+        "href": "/runs/run-id/commands/command-id",
+        "meta": {
+            "runId": "run-id",
+            "commandId": "command-id",
+            "index": 3,
+            "key": "command-key",
+            "createdAt": "2021-01-01T00:00:00",
+        },
+    }
+
+
+async def test_get_run_command_updates_run_changes(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_engine_store: EngineStore,
+    mock_protocol_engine: ProtocolEngine,
+) -> None:
+    """It should end the stream as soon as the run is no longer current."""
+
+    async def _wait_forever(*_a: object, **_k: object) -> None:
+        await anyio.sleep_forever()
+
+    def _stub_run_changed() -> None:
+        decoy.when(mock_engine_store.current_run_id).then_return("other-run-id")
+
+    decoy.when(mock_engine_store.current_run_id).then_return("run-id")
+    decoy.when(
+        mock_protocol_engine.state_view.commands.get_changes_since(3)
+    ).then_return(CommandChanges(commands=[], cursor=3, total_length=2))
+    decoy.when(mock_protocol_engine.state_view.commands.get_is_stopped()).then_return(
+        False
+    )
+    # Commands never change, so only the run change can end the wait.
+    monkeypatch.setattr(mock_protocol_engine, "wait_for_command_changes", _wait_forever)
+    decoy.when(await mock_engine_store.wait_for_run_change()).then_do(_stub_run_changed)
+
+    result = await get_run_command_updates(
+        runId="run-id",
+        cursor=3,
+        last_event_id=None,
+        protocol_engine=mock_protocol_engine,
+        engine_store=mock_engine_store,
+    )
+
+    with anyio.fail_after(1):
+        assert await _collect_events(result) == []
+
+
+async def test_get_run_command_updates_run_not_current(
+    decoy: Decoy,
+    mock_engine_store: EngineStore,
+    mock_protocol_engine: ProtocolEngine,
+) -> None:
+    """It should end the stream once the run is no longer current."""
+    decoy.when(mock_engine_store.current_run_id).then_return("other-run-id")
+
+    result = await get_run_command_updates(
+        runId="run-id",
+        cursor=3,
+        last_event_id=None,
+        protocol_engine=mock_protocol_engine,
+        engine_store=mock_engine_store,
+    )
+
+    assert await _collect_events(result) == []
@@ -1,4 +1,5 @@
 """Tests for the EngineStore interface."""
+import asyncio
 from datetime import datetime
 from pathlib import Path
 
@@ -143,6 +144,23 @@ async def test_clear_idle_engine(subject: EngineStore) -> None:
         subject.runner
 
 
+async def test_wait_for_run_change(subject: EngineStore) -> None:
+    """It should wake waiters when a run is created and when it's cleared."""
+    created = asyncio.create_task(subject.wait_for_run_change())
+    await asyncio.sleep(0)
+    assert not created.done()
+
+    await subject.create(run_id="run-id", labware_offsets=[], protocol=None)
+    await asyncio.wait_for(created, timeout=1)
+
+    cleared = asyncio.create_task(subject.wait_for_run_change())
+    await asyncio.sleep(0)
+    assert not cleared.done()
+
+    await subject.clear()
+    await asyncio.wait_for(cleared, timeout=1)
+
+
 async def test_get_default_engine(subject: EngineStore) -> None:
     """It should create and retrieve a default ProtocolEngine."""
     result = await subject.get_default_engine()
@@ -25,7 +25,9 @@ def _make_dummy_run_resource(run_id: str) -> RunResource:
     )
 
 
-def test_make_room_for_new_run(decoy: Decoy, caplog: pytest.LogCaptureFixture) -> None:
+async def test_make_room_for_new_run(
+    decoy: Decoy, caplog: pytest.LogCaptureFixture
+) -> None:
     """It should get a deletion plan and enact it on the store."""
     mock_run_store = decoy.mock(cls=RunStore)
     mock_deletion_planner = decoy.mock(cls=RunDeletionPlanner)
@@ -43,7 +45,7 @@ def test_make_room_for_new_run(decoy: Decoy, caplog: pytest.LogCaptureFixture) -
 
     deletion_plan = set(["run-id-4", "run-id-5"])
 
-    decoy.when(mock_run_store.get_all()).then_return(run_resources)
+    decoy.when(await mock_run_store.get_all()).then_return(run_resources)
     decoy.when(
         mock_deletion_planner.plan_for_new_run(
             existing_runs=["run-id-1", "run-id-2", "run-id-3"]
@@ -52,10 +54,10 @@ def test_make_room_for_new_run(decoy: Decoy, caplog: pytest.LogCaptureFixture) -
 
     # Run the subject, capturing log messages at least as severe as INFO.
     with caplog.at_level(logging.INFO):
-        subject.make_room_for_new_run()
+        await subject.make_room_for_new_run()
 
-    decoy.verify(mock_run_store.remove(run_id="run-id-4"))
-    decoy.verify(mock_run_store.remove(run_id="run-id-5"))
+    decoy.verify(await mock_run_store.remove(run_id="run-id-4"))
+    decoy.verify(await mock_run_store.remove(run_id="run-id-5"))
 
     # It should log the runs that it deleted.
     assert "run-id-4" in caplog.text
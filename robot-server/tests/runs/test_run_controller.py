@@ -95,7 +95,7 @@ async def test_create_play_action_to_resume(
     """It should resume a run."""
     decoy.when(mock_engine_store.runner.was_started()).then_return(True)
 
-    result = subject.create_action(
+    result = await subject.create_action(
         action_id="some-action-id",
         action_type=RunActionType.PLAY,
         created_at=datetime(year=2021, month=1, day=1),
@@ -107,7 +107,7 @@ async def test_create_play_action_to_resume(
         createdAt=datetime(year=2021, month=1, day=1),
     )
 
-    decoy.verify(mock_run_store.insert_action(run_id, result), times=1)
+    decoy.verify(await mock_run_store.insert_action(run_id, result), times=1)
     decoy.verify(mock_engine_store.runner.play(), times=1)
     decoy.verify(await mock_engine_store.runner.run(), times=0)
 
@@ -125,7 +125,7 @@ async def test_create_play_action_to_start(
     """It should start a run."""
     decoy.when(mock_engine_store.runner.was_started()).then_return(False)
 
-    result = subject.create_action(
+    result = await subject.create_action(
         action_id="some-action-id",
         action_type=RunActionType.PLAY,
         created_at=datetime(year=2021, month=1, day=1),
@@ -137,7 +137,7 @@ async def test_create_play_action_to_start(
         createdAt=datetime(year=2021, month=1, day=1),
     )
 
-    decoy.verify(mock_run_store.insert_action(run_id, result), times=1)
+    decoy.verify(await mock_run_store.insert_action(run_id, result), times=1)
 
     background_task_captor = matchers.Captor()
     decoy.verify(mock_task_runner.run(background_task_captor))
@@ -152,7 +152,7 @@ async def test_create_play_action_to_start(
     await background_task_captor.value()
 
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state(
             run_id=run_id,
             summary=engine_state_summary,
             commands=protocol_commands,
@@ -169,7 +169,7 @@ async def test_create_pause_action(
     subject: RunController,
 ) -> None:
     """It should resume a run."""
-    result = subject.create_action(
+    result = await subject.create_action(
         action_id="some-action-id",
         action_type=RunActionType.PAUSE,
         created_at=datetime(year=2021, month=1, day=1),
@@ -181,7 +181,7 @@ async def test_create_pause_action(
         createdAt=datetime(year=2021, month=1, day=1),
     )
 
-    decoy.verify(mock_run_store.insert_action(run_id, result), times=1)
+    decoy.verify(await mock_run_store.insert_action(run_id, result), times=1)
     decoy.verify(mock_engine_store.runner.pause(), times=1)
 
 
@@ -194,7 +194,7 @@ async def test_create_stop_action(
     subject: RunController,
 ) -> None:
     """It should resume a run."""
-    result = subject.create_action(
+    result = await subject.create_action(
         action_id="some-action-id",
         action_type=RunActionType.STOP,
         created_at=datetime(year=2021, month=1, day=1),
@@ -206,7 +206,7 @@ async def test_create_stop_action(
         createdAt=datetime(year=2021, month=1, day=1),
     )
 
-    decoy.verify(mock_run_store.insert_action(run_id, result), times=1)
+    decoy.verify(await mock_run_store.insert_action(run_id, result), times=1)
     decoy.verify(mock_task_runner.run(mock_engine_store.runner.stop), times=1)
 
 
@@ -234,7 +234,7 @@ async def test_action_not_allowed(
     decoy.when(mock_engine_store.runner.pause()).then_raise(exception)
 
     with pytest.raises(RunActionNotAllowedError, match="oh no"):
-        subject.create_action(
+        await subject.create_action(
             action_id="whatever",
             action_type=action_type,
             created_at=datetime(year=2021, month=1, day=1),
@@ -120,7 +120,7 @@ async def test_create(
         await mock_engine_store.create(run_id=run_id, labware_offsets=[], protocol=None)
     ).then_return(engine_state_summary)
     decoy.when(
-        mock_run_store.insert(
+        await mock_run_store.insert(
             run_id=run_id,
             protocol_id=None,
             created_at=created_at,
@@ -183,7 +183,7 @@ async def test_create_with_options(
     ).then_return(engine_state_summary)
 
     decoy.when(
-        mock_run_store.insert(
+        await mock_run_store.insert(
             run_id=run_id,
             protocol_id="protocol-id",
             created_at=created_at,
@@ -235,7 +235,7 @@ async def test_create_engine_error(
         )
 
     decoy.verify(
-        mock_run_store.insert(
+        await mock_run_store.insert(
             run_id=run_id,
             created_at=matchers.Anything(),
             protocol_id=matchers.Anything(),
@@ -244,6 +244,19 @@ async def test_create_engine_error(
     )
 
 
+async def test_has(
+    decoy: Decoy,
+    mock_run_store: RunStore,
+    subject: RunDataManager,
+) -> None:
+    """It should check whether a run exists in the store."""
+    decoy.when(await mock_run_store.has("run-id")).then_return(True)
+    decoy.when(await mock_run_store.has("other-run-id")).then_return(False)
+
+    assert await subject.has("run-id") is True
+    assert await subject.has("other-run-id") is False
+
+
 async def test_get_current_run(
     decoy: Decoy,
     mock_engine_store: EngineStore,
@@ -255,13 +268,13 @@ async def test_get_current_run(
     """It should get the current run from the engine."""
     run_id = "hello world"
 
-    decoy.when(mock_run_store.get(run_id=run_id)).then_return(run_resource)
+    decoy.when(await mock_run_store.get(run_id=run_id)).then_return(run_resource)
     decoy.when(mock_engine_store.current_run_id).then_return(run_id)
     decoy.when(mock_engine_store.engine.state_view.get_summary()).then_return(
         engine_state_summary
     )
 
-    result = subject.get(run_id=run_id)
+    result = await subject.get(run_id=run_id)
 
     assert result == Run(
         current=True,
@@ -290,13 +303,13 @@ async def test_get_historical_run(
     """It should get a historical run from the store."""
     run_id = "hello world"
 
-    decoy.when(mock_run_store.get(run_id=run_id)).then_return(run_resource)
-    decoy.when(mock_run_store.get_state_summary(run_id=run_id)).then_return(
+    decoy.when(await mock_run_store.get(run_id=run_id)).then_return(run_resource)
+    decoy.when(await mock_run_store.get_state_summary(run_id=run_id)).then_return(
         engine_state_summary
     )
     decoy.when(mock_engine_store.current_run_id).then_return("some other id")
 
-    result = subject.get(run_id=run_id)
+    result = await subject.get(run_id=run_id)
 
     assert result == Run(
         current=False,
@@ -323,11 +336,11 @@ async def test_get_historical_run_no_data(
     """It should get a historical run from the store."""
     run_id = "hello world"
 
-    decoy.when(mock_run_store.get(run_id=run_id)).then_return(run_resource)
-    decoy.when(mock_run_store.get_state_summary(run_id=run_id)).then_return(None)
+    decoy.when(await mock_run_store.get(run_id=run_id)).then_return(run_resource)
+    decoy.when(await mock_run_store.get_state_summary(run_id=run_id)).then_return(None)
     decoy.when(mock_engine_store.current_run_id).then_return("some other id")
 
-    result = subject.get(run_id=run_id)
+    result = await subject.get(run_id=run_id)
 
     assert result == Run(
         current=False,
@@ -387,14 +400,14 @@ async def test_get_all_runs(
     decoy.when(mock_engine_store.engine.state_view.get_summary()).then_return(
         current_run_data
     )
-    decoy.when(mock_run_store.get_state_summary("historical-run")).then_return(
+    decoy.when(await mock_run_store.get_state_summary("historical-run")).then_return(
         historical_run_data
     )
-    decoy.when(mock_run_store.get_all()).then_return(
+    decoy.when(await mock_run_store.get_all()).then_return(
         [historical_run_resource, current_run_resource]
     )
 
-    result = subject.get_all()
+    result = await subject.get_all()
 
     assert result == [
         Run(
@@ -439,7 +452,7 @@ async def test_delete_current_run(
     await subject.delete(run_id=run_id)
 
     decoy.verify(await mock_engine_store.clear(), times=1)
-    decoy.verify(mock_run_store.remove(run_id=run_id), times=0)
+    decoy.verify(await mock_run_store.remove(run_id=run_id), times=0)
 
 
 async def test_delete_historical_run(
@@ -455,7 +468,7 @@ async def test_delete_historical_run(
     await subject.delete(run_id=run_id)
 
     decoy.verify(await mock_engine_store.clear(), times=0)
-    decoy.verify(mock_run_store.remove(run_id=run_id), times=1)
+    decoy.verify(await mock_run_store.remove(run_id=run_id), times=1)
 
 
 async def test_update_current(
@@ -475,7 +488,7 @@ async def test_update_current(
     )
 
     decoy.when(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state(
             run_id=run_id,
             summary=engine_state_summary,
             commands=[run_command],
@@ -516,13 +529,13 @@ async def test_update_current_noop(
     decoy.when(mock_engine_store.engine.state_view.get_summary()).then_return(
         engine_state_summary
     )
-    decoy.when(mock_run_store.get(run_id=run_id)).then_return(run_resource)
+    decoy.when(await mock_run_store.get(run_id=run_id)).then_return(run_resource)
 
     result = await subject.update(run_id=run_id, current=current)
 
     decoy.verify(await mock_engine_store.clear(), times=0)
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state(
             run_id=run_id,
             summary=matchers.Anything(),
             commands=matchers.Anything(),
@@ -589,7 +602,7 @@ async def test_create_archives_existing(
     ).then_return(engine_state_summary)
 
     decoy.when(
-        mock_run_store.insert(
+        await mock_run_store.insert(
             run_id=run_id_new,
             created_at=datetime(year=2021, month=1, day=1),
             protocol_id=None,
@@ -604,7 +617,7 @@ async def test_create_archives_existing(
     )
 
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state(
             run_id=run_id_old,
             summary=engine_state_summary,
             commands=[run_command],
@@ -612,7 +625,7 @@ async def test_create_archives_existing(
     )
 
 
-def test_get_commands_slice_from_db(
+async def test_get_commands_slice_from_db(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
@@ -635,14 +648,14 @@ def test_get_commands_slice_from_db(
     )
 
     decoy.when(
-        mock_run_store.get_commands_slice(run_id="run_id", cursor=1, length=2)
+        await mock_run_store.get_commands_slice(run_id="run_id", cursor=1, length=2)
     ).then_return(expected_command_slice)
-    result = subject.get_commands_slice(run_id="run_id", cursor=1, length=2)
+    result = await subject.get_commands_slice(run_id="run_id", cursor=1, length=2)
 
     assert expected_command_slice == result
 
 
-def test_get_commands_slice_current_run(
+async def test_get_commands_slice_current_run(
     decoy: Decoy,
     subject: RunDataManager,
     mock_engine_store: EngineStore,
@@ -668,20 +681,20 @@ def test_get_commands_slice_current_run(
         mock_engine_store.engine.state_view.commands.get_slice(1, 2)
     ).then_return(expected_command_slice)
 
-    result = subject.get_commands_slice("run-id", 1, 2)
+    result = await subject.get_commands_slice("run-id", 1, 2)
 
     assert expected_command_slice == result
 
 
-def test_get_commands_slice_from_db_run_not_found(
+async def test_get_commands_slice_from_db_run_not_found(
     decoy: Decoy, subject: RunDataManager, mock_run_store: RunStore
 ) -> None:
     """Should get a sliced command list from run store."""
     decoy.when(
-        mock_run_store.get_commands_slice(run_id="run-id", cursor=1, length=2)
+        await mock_run_store.get_commands_slice(run_id="run-id", cursor=1, length=2)
     ).then_raise(RunNotFoundError(run_id="run-id"))
     with pytest.raises(RunNotFoundError):
-        subject.get_commands_slice(run_id="run-id", cursor=1, length=2)
+        await subject.get_commands_slice(run_id="run-id", cursor=1, length=2)
 
 
 def test_get_current_command(
@@ -720,7 +733,7 @@ def test_get_current_command_not_current_run(
     assert result is None
 
 
-def test_get_command_from_engine(
+async def test_get_command_from_engine(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
@@ -732,12 +745,12 @@ def test_get_command_from_engine(
     decoy.when(
         mock_engine_store.engine.state_view.commands.get("command-id")
     ).then_return(run_command)
-    result = subject.get_command("run-id", "command-id")
+    result = await subject.get_command("run-id", "command-id")
 
     assert result == run_command
 
 
-def test_get_command_from_db(
+async def test_get_command_from_db(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
@@ -747,14 +760,14 @@ def test_get_command_from_db(
     """Should get command by id from engine store."""
     decoy.when(mock_engine_store.current_run_id).then_return("not-run-id")
     decoy.when(
-        mock_run_store.get_command(run_id="run-id", command_id="command-id")
+        await mock_run_store.get_command(run_id="run-id", command_id="command-id")
     ).then_return(run_command)
-    result = subject.get_command("run-id", "command-id")
+    result = await subject.get_command("run-id", "command-id")
 
     assert result == run_command
 
 
-def test_get_command_from_db_run_not_found(
+async def test_get_command_from_db_run_not_found(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
@@ -764,14 +777,14 @@ def test_get_command_from_db_run_not_found(
     """Should get command by id from engine store."""
     decoy.when(mock_engine_store.current_run_id).then_return("not-run-id")
     decoy.when(
-        mock_run_store.get_command(run_id="run-id", command_id="command-id")
+        await mock_run_store.get_command(run_id="run-id", command_id="command-id")
     ).then_raise(RunNotFoundError("run-id"))
 
     with pytest.raises(RunNotFoundError):
-        subject.get_command("run-id", "command-id")
+        await subject.get_command("run-id", "command-id")
 
 
-def test_get_command_from_db_command_not_found(
+async def test_get_command_from_db_command_not_found(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
@@ -781,8 +794,8 @@ def test_get_command_from_db_command_not_found(
     """Should get command by id from engine store."""
     decoy.when(mock_engine_store.current_run_id).then_return("not-run-id")
     decoy.when(
-        mock_run_store.get_command(run_id="run-id", command_id="command-id")
+        await mock_run_store.get_command(run_id="run-id", command_id="command-id")
     ).then_raise(CommandNotFoundError(command_id="command-id"))
 
     with pytest.raises(CommandNotFoundError):
-        subject.get_command("run-id", "command-id")
+        await subject.get_command("run-id", "command-id")
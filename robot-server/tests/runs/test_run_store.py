@@ -98,7 +98,7 @@ def state_summary() -> StateSummary:
     )
 
 
-def test_update_run_state(
+async def test_update_run_state(
     subject: RunStore,
     state_summary: StateSummary,
     protocol_commands: List[pe_commands.Command],
@@ -110,20 +110,20 @@ def test_update_run_state(
         id="action-id",
     )
 
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    subject.insert_action(run_id="run-id", action=action)
+    await subject.insert_action(run_id="run-id", action=action)
 
-    result = subject.update_run_state(
+    result = await subject.update_run_state(
         run_id="run-id",
         summary=state_summary,
         commands=protocol_commands,
     )
-    run_summary_result = subject.get_state_summary(run_id="run-id")
-    commands_result = subject.get_commands_slice(
+    run_summary_result = await subject.get_state_summary(run_id="run-id")
+    commands_result = await subject.get_commands_slice(
         run_id="run-id",
         length=len(protocol_commands),
         cursor=0,
@@ -139,23 +139,54 @@ def test_update_run_state(
     assert commands_result.commands == protocol_commands
 
 
-def test_update_state_run_not_found(
+async def test_update_run_state_appends_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should only insert commands that are not already stored."""
+    await subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    await subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[:1],
+    )
+    await subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+
+    result = await subject.get_commands_slice(run_id="run-id", length=999, cursor=0)
+
+    assert result == CommandSlice(
+        cursor=0,
+        total_length=len(protocol_commands),
+        commands=protocol_commands,
+    )
+
+
+async def test_update_state_run_not_found(
     subject: RunStore,
     state_summary: StateSummary,
     protocol_commands: List[pe_commands.Command],
 ) -> None:
     """It should be able to catch the exception raised by insert."""
     with pytest.raises(RunNotFoundError, match="run-not-found"):
-        subject.update_run_state(
+        await subject.update_run_state(
             run_id="run-not-found",
             summary=state_summary,
             commands=protocol_commands,
         )
 
 
-def test_add_run(subject: RunStore) -> None:
+async def test_add_run(subject: RunStore) -> None:
     """It should be able to add a new run to the store."""
-    result = subject.insert(
+    result = await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
@@ -169,7 +200,7 @@ def test_add_run(subject: RunStore) -> None:
     )
 
 
-def test_insert_actions_missing_run_id(subject: RunStore) -> None:
+async def test_insert_actions_missing_run_id(subject: RunStore) -> None:
     """Should not be able to insert an action with a run id that does not exist."""
     action = RunAction(
         actionType=RunActionType.PLAY,
@@ -178,28 +209,28 @@ def test_insert_actions_missing_run_id(subject: RunStore) -> None:
     )
 
     with pytest.raises(RunNotFoundError, match="missing-run-id"):
-        subject.insert_action(run_id="missing-run-id", action=action)
+        await subject.insert_action(run_id="missing-run-id", action=action)
 
 
-def test_insert_run_missing_protocol_id(subject: RunStore) -> None:
+async def test_insert_run_missing_protocol_id(subject: RunStore) -> None:
     """Should not be able to insert an action with a run id that does not exist."""
     with pytest.raises(ProtocolNotFoundError, match="missing-protocol-id"):
-        subject.insert(
+        await subject.insert(
             run_id="run-id",
             protocol_id="missing-protocol-id",
             created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
         )
 
 
-def test_get_run_no_actions(subject: RunStore) -> None:
+async def test_get_run_no_actions(subject: RunStore) -> None:
     """It can get a previously stored run entry."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
 
-    result = subject.get("run-id")
+    result = await subject.get("run-id")
 
     assert result == RunResource(
         run_id="run-id",
@@ -209,7 +240,7 @@ def test_get_run_no_actions(subject: RunStore) -> None:
     )
 
 
-def test_get_run(subject: RunStore) -> None:
+async def test_get_run(subject: RunStore) -> None:
     """It can get a previously stored run entry."""
     action = RunAction(
         actionType=RunActionType.PLAY,
@@ -217,15 +248,15 @@ def test_get_run(subject: RunStore) -> None:
         id="action-id",
     )
 
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
 
-    subject.insert_action("run-id", action)
+    await subject.insert_action("run-id", action)
 
-    result = subject.get(run_id="run-id")
+    result = await subject.get(run_id="run-id")
 
     assert result == RunResource(
         run_id="run-id",
@@ -235,26 +266,26 @@ def test_get_run(subject: RunStore) -> None:
     )
 
 
-def test_get_run_missing(subject: RunStore) -> None:
+async def test_get_run_missing(subject: RunStore) -> None:
     """It raises if the run does not exist."""
     with pytest.raises(RunNotFoundError, match="run-id"):
-        subject.get(run_id="run-id")
+        await subject.get(run_id="run-id")
 
 
-def test_get_all_runs(subject: RunStore) -> None:
+async def test_get_all_runs(subject: RunStore) -> None:
     """It can get all created runs."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id-1",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    subject.insert(
+    await subject.insert(
         run_id="run-id-2",
         protocol_id=None,
         created_at=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
     )
 
-    result = subject.get_all()
+    result = await subject.get_all()
 
     assert result == [
         RunResource(
@@ -272,7 +303,7 @@ def test_get_all_runs(subject: RunStore) -> None:
     ]
 
 
-def test_remove_run(subject: RunStore) -> None:
+async def test_remove_run(subject: RunStore) -> None:
     """It can remove a previously stored run entry."""
     action = RunAction(
         actionType=RunActionType.PLAY,
@@ -280,24 +311,46 @@ def test_remove_run(subject: RunStore) -> None:
         id="action-id",
     )
 
-    subject.insert(
+    await subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    await subject.insert_action(run_id="run-id", action=action)
+    await subject.remove(run_id="run-id")
+
+    assert await subject.get_all() == []
+
+
+async def test_remove_run_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should remove a run's commands along with the run."""
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    subject.insert_action(run_id="run-id", action=action)
-    subject.remove(run_id="run-id")
+    await subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+    await subject.remove(run_id="run-id")
 
-    assert subject.get_all() == []
+    with pytest.raises(RunNotFoundError):
+        await subject.get_command(run_id="run-id", command_id="pause-1")
 
 
-def test_remove_run_missing_id(subject: RunStore) -> None:
+async def test_remove_run_missing_id(subject: RunStore) -> None:
     """It raises if the run does not exist."""
     with pytest.raises(RunNotFoundError, match="run-id"):
-        subject.remove(run_id="run-id")
+        await subject.remove(run_id="run-id")
 
 
-def test_insert_actions_no_run(subject: RunStore) -> None:
+async def test_insert_actions_no_run(subject: RunStore) -> None:
     """Insert actions with a run that doesn't exist should raise an exception."""
     action = RunAction(
         actionType=RunActionType.PLAY,
@@ -306,64 +359,66 @@ def test_insert_actions_no_run(subject: RunStore) -> None:
     )
 
     with pytest.raises(Exception):
-        subject.insert_action(run_id="run-id-996", action=action)
+        await subject.insert_action(run_id="run-id-996", action=action)
 
 
-def test_get_state_summary(subject: RunStore, state_summary: StateSummary) -> None:
+async def test_get_state_summary(
+    subject: RunStore, state_summary: StateSummary
+) -> None:
     """It should be able to get store run data."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    subject.update_run_state(run_id="run-id", summary=state_summary, commands=[])
-    result = subject.get_state_summary(run_id="run-id")
+    await subject.update_run_state(run_id="run-id", summary=state_summary, commands=[])
+    result = await subject.get_state_summary(run_id="run-id")
     assert result == state_summary
 
 
-def test_get_state_summary_none(subject: RunStore) -> None:
+async def test_get_state_summary_none(subject: RunStore) -> None:
     """It should return None if no state data stored."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    result = subject.get_state_summary(run_id="run-id")
+    result = await subject.get_state_summary(run_id="run-id")
     assert result is None
 
 
-def test_has_run_id(subject: RunStore) -> None:
+async def test_has_run_id(subject: RunStore) -> None:
     """It should tell us if a given ID is in the store."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    result = subject.has("run-id")
+    result = await subject.has("run-id")
     assert result is True
 
 
-def test_has_no_run_id(subject: RunStore) -> None:
+async def test_has_no_run_id(subject: RunStore) -> None:
     """It should tell us if a given ID is not in the store."""
-    result = subject.has("no-run-id")
+    result = await subject.has("no-run-id")
     assert result is False
 
 
-def test_get_command(
+async def test_get_command(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
     state_summary: StateSummary,
 ) -> None:
     """Should return a run command from the db."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
     )
-    subject.update_run_state(
+    await subject.update_run_state(
         run_id="run-id",
         summary=state_summary,
         commands=protocol_commands,
     )
-    result = subject.get_command(run_id="run-id", command_id="pause-2")
+    result = await subject.get_command(run_id="run-id", command_id="pause-2")
 
     assert result == protocol_commands[1]
 
@@ -375,7 +430,7 @@ def test_get_command(
         ("run-id", "not-command-id", CommandNotFoundError),
     ],
 )
-def test_get_command_raise_exception(
+async def test_get_command_raise_exception(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
     state_summary: StateSummary,
@@ -384,35 +439,35 @@ def test_get_command_raise_exception(
     expected_exception: Type[Exception],
 ) -> None:
     """Should raise exception."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
     )
-    subject.update_run_state(
+    await subject.update_run_state(
         run_id="run-id",
         summary=state_summary,
         commands=protocol_commands,
     )
     with pytest.raises(expected_exception):
-        subject.get_command(run_id=input_run_id, command_id=input_command_id)
+        await subject.get_command(run_id=input_run_id, command_id=input_command_id)
 
 
-def test_get_command_slice(
+async def test_get_command_slice(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
     state_summary: StateSummary,
 ) -> None:
     """It should return slices of commands."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    subject.update_run_state(
+    await subject.update_run_state(
         run_id="run-id",
         summary=state_summary,
         commands=protocol_commands,
     )
-    result = subject.get_commands_slice(
+    result = await subject.get_commands_slice(
         run_id="run-id", cursor=0, length=len(protocol_commands)
     )
 
@@ -436,7 +491,7 @@ def test_get_command_slice(
         (999, 2, 2, ["pause-3"]),
     ],
 )
-def test_get_commands_slice_clamping(
+async def test_get_commands_slice_clamping(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
     state_summary: StateSummary,
@@ -446,17 +501,17 @@ def test_get_commands_slice_clamping(
     expected_command_ids: List[str],
 ) -> None:
     """It should clamp slice cursor and page length."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
-    subject.update_run_state(
+    await subject.update_run_state(
         run_id="run-id",
         summary=state_summary,
         commands=protocol_commands,
     )
-    result = subject.get_commands_slice(
+    result = await subject.get_commands_slice(
         run_id="run-id", cursor=input_cursor, length=input_length
     )
 
@@ -467,22 +522,22 @@ def test_get_commands_slice_clamping(
     ] == expected_command_ids
 
 
-def test_get_run_command_slice_none(subject: RunStore) -> None:
+async def test_get_run_command_slice_none(subject: RunStore) -> None:
     """It should return None if no commands stored."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id",
         protocol_id=None,
         created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
     )
 
-    result = subject.get_commands_slice(run_id="run-id", length=999, cursor=None)
+    result = await subject.get_commands_slice(run_id="run-id", length=999, cursor=None)
     assert result == CommandSlice(commands=[], cursor=0, total_length=0)
 
 
-def test_get_commands_slice_run_not_found(subject: RunStore) -> None:
+async def test_get_commands_slice_run_not_found(subject: RunStore) -> None:
     """Should raise an error RunNotFoundError."""
-    subject.insert(
+    await subject.insert(
         run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
     )
     with pytest.raises(RunNotFoundError):
-        subject.get_commands_slice(run_id="not-run-id", cursor=1, length=3)
+        await subject.get_commands_slice(run_id="not-run-id", cursor=1, length=3)
@@ -0,0 +1,119 @@
+"""Tests for the cache of rendered responses."""
+from fastapi.responses import Response
+
+from robot_server.service.json_api.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    etag_matches,
+)
+
+
+def _response(body: str) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def test_put_and_get() -> None:
+    """It should cache a response's body, and tag the response with an ETag."""
+    subject = ResponseCache(max_size=1024)
+    response = _response('{"data": 1}')
+
+    subject.put("resource-id", "key", response, subject.generation)
+    result = subject.get("resource-id", "key")
+
+    assert result is not None
+    assert result.body == b'{"data": 1}'
+    assert response.headers["ETag"] == result.etag
+    assert subject.get("resource-id", "other-key") is None
+    assert subject.get("other-resource-id", "key") is None
+
+
+def test_etag_identifies_body() -> None:
+    """It should give equal bodies equal ETags, and different bodies different ones."""
+    subject = ResponseCache(max_size=1024)
+
+    subject.put("resource-1", "key", _response('{"data": 1}'), subject.generation)
+    subject.put("resource-2", "key", _response('{"data": 1}'), subject.generation)
+    subject.put("resource-3", "key", _response('{"data": 3}'), subject.generation)
+
+    results = [subject.get(f"resource-{i}", "key") for i in (1, 2, 3)]
+    etags = [result.etag for result in results if result is not None]
+
+    assert len(etags) == 3
+    assert etags[0] == etags[1]
+    assert etags[0] != etags[2]
+
+
+def test_invalidate() -> None:
+    """It should remove every cached response for an invalidated resource."""
+    subject = ResponseCache(max_size=1024)
+
+    subject.put("resource-1", "key-1", _response("{}"), subject.generation)
+    subject.put("resource-1", "key-2", _response("{}"), subject.generation)
+    subject.put("resource-2", "key-1", _response("{}"), subject.generation)
+    subject.invalidate("resource-1")
+
+    assert subject.get("resource-1", "key-1") is None
+    assert subject.get("resource-1", "key-2") is None
+    assert subject.get("resource-2", "key-1") is not None
+
+
+def test_skip_put_after_invalidate() -> None:
+    """It should not cache a response read before the cache was invalidated."""
+    subject = ResponseCache(max_size=1024)
+    response = _response("{}")
+
+    generation = subject.generation
+    subject.invalidate("resource-id")
+    subject.put("resource-id", "key", response, generation)
+
+    assert subject.get("resource-id", "key") is None
+    assert "ETag" in response.headers
+
+
+def test_evict_least_recently_used() -> None:
+    """It should evict the least-recently used responses to stay under its size."""
+    subject = ResponseCache(max_size=30)
+
+    subject.put("resource-1", "key", _response("1" * 10), subject.generation)
+    subject.put("resource-2", "key", _response("2" * 10), subject.generation)
+    subject.put("resource-3", "key", _response("3" * 10), subject.generation)
+    subject.get("resource-1", "key")
+    subject.put("resource-4", "key", _response("4" * 10), subject.generation)
+
+    assert subject.get("resource-1", "key") is not None
+    assert subject.get("resource-2", "key") is None
+    assert subject.get("resource-3", "key") is not None
+    assert subject.get("resource-4", "key") is not None
+
+    subject.put("resource-5", "key", _response("5" * 31), subject.generation)
+
+    assert subject.get("resource-5", "key") is None
+
+
+def test_to_response() -> None:
+    """It should build a full response, or 304 if the client's copy is current."""
+    subject = CachedResponse(body=b'{"data": 1}', etag='"abc"')
+
+    response = subject.to_response()
+    assert response.status_code == 200
+    assert response.body == b'{"data": 1}'
+    assert response.headers["ETag"] == '"abc"'
+    assert response.headers["Content-Type"] == "application/json"
+
+    response = subject.to_response(if_none_match='"abc"')
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == '"abc"'
+
+    response = subject.to_response(if_none_match='"def"')
+    assert response.status_code == 200
+
+
+def test_etag_matches() -> None:
+    """It should match entity tags like an If-None-Match header does."""
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"def", "abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"def"', '"abc"')
+    assert not etag_matches('"abcd"', '"abc"')
@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime
-from typing import AsyncIterator
+from typing import List, Optional, Sequence
 
 import pytest
 from notify_server.clients.serdes import TopicEvent
@@ -7,6 +8,25 @@ from notify_server.models.event import Event
 from notify_server.models.payload_type import UserData
 
 
+class FakeSubscriber:
+    """A notify-server subscriber that returns events pushed to it."""
+
+    def __init__(self, events: Sequence[TopicEvent] = ()) -> None:
+        self.events: List[TopicEvent] = list(events)
+        self.error: Optional[Exception] = None
+        self.closed = False
+
+    async def next_event(self) -> TopicEvent:
+        while not self.events:
+            if self.error is not None:
+                raise self.error
+            await asyncio.sleep(0.001)
+        return self.events.pop(0)
+
+    def close(self) -> None:
+        self.closed = True
+
+
 @pytest.fixture
 def topic_event() -> TopicEvent:
     return TopicEvent(
@@ -20,10 +40,6 @@ def topic_event() -> TopicEvent:
 
 
 @pytest.fixture
-def mock_subscriber(topic_event: TopicEvent) -> AsyncIterator[TopicEvent]:
+def mock_subscriber(topic_event: TopicEvent) -> FakeSubscriber:
     """A mock subscriber."""
-
-    async def _f() -> AsyncIterator[TopicEvent]:
-        yield topic_event
-
-    return _f()
+    return FakeSubscriber([topic_event])
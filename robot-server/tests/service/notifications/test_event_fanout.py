@@ -0,0 +1,123 @@
+"""Tests for sharing notify-server subscriptions between websockets."""
+import asyncio
+from typing import Dict, List, Sequence
+
+from notify_server.clients.serdes import TopicEvent
+
+from robot_server.service.notifications.event_fanout import EventFanout
+
+from .conftest import FakeSubscriber
+
+
+class _SubscriberFactory:
+    def __init__(self) -> None:
+        self.subscribers: Dict[str, FakeSubscriber] = {}
+        self.created: List[Sequence[str]] = []
+
+    def __call__(self, address: str, topics: Sequence[str]) -> FakeSubscriber:
+        self.created.append(topics)
+        subscriber = FakeSubscriber()
+        (topic,) = topics
+        self.subscribers[topic] = subscriber
+        return subscriber
+
+
+def _event_on(topic: str, topic_event: TopicEvent) -> TopicEvent:
+    return topic_event.copy(update={"topic": topic})
+
+
+async def test_share_subscription(topic_event: TopicEvent) -> None:
+    """It should open one subscriber per topic and send every listener its events."""
+    factory = _SubscriberFactory()
+    subject = EventFanout("address", create_subscriber=factory)
+
+    with subject.listen(["a", "b"]) as listener_1, subject.listen(["a"]) as listener_2:
+        assert sorted(factory.created) == [["a"], ["b"]]
+
+        factory.subscribers["a"].events.append(_event_on("a", topic_event))
+        factory.subscribers["b"].events.append(_event_on("b", topic_event))
+
+        message_a = _event_on("a", topic_event).json()
+        message_b = _event_on("b", topic_event).json()
+        assert {
+            await listener_1.next_message(),
+            await listener_1.next_message(),
+        } == {message_a, message_b}
+        assert await listener_2.next_message() == message_a
+
+    await asyncio.sleep(0)
+    assert factory.subscribers["a"].closed
+    assert factory.subscribers["b"].closed
+
+
+async def test_close_with_last_listener(topic_event: TopicEvent) -> None:
+    """It should keep a topic's subscriber open until its last listener leaves."""
+    factory = _SubscriberFactory()
+    subject = EventFanout("address", create_subscriber=factory)
+
+    with subject.listen(["a"]):
+        with subject.listen(["a"]):
+            pass
+        await asyncio.sleep(0)
+        assert not factory.subscribers["a"].closed
+
+    await asyncio.sleep(0)
+    assert factory.subscribers["a"].closed
+
+    with subject.listen(["a"]):
+        assert len(factory.created) == 2
+
+
+async def test_skip_prefixed_topics(topic_event: TopicEvent) -> None:
+    """It should not deliver events on topics that only share a prefix."""
+    factory = _SubscriberFactory()
+    subject = EventFanout("address", create_subscriber=factory)
+
+    with subject.listen(["a"]) as listener:
+        factory.subscribers["a"].events.extend(
+            [_event_on("ab", topic_event), _event_on("a", topic_event)]
+        )
+        assert await listener.next_message() == _event_on("a", topic_event).json()
+
+
+async def test_drop_oldest_for_slow_listener(topic_event: TopicEvent) -> None:
+    """It should drop a slow listener's oldest messages instead of waiting."""
+    factory = _SubscriberFactory()
+    subject = EventFanout("address", create_subscriber=factory, max_pending_messages=2)
+    events = [
+        topic_event.copy(
+            update={
+                "topic": "a",
+                "event": topic_event.event.copy(update={"publisher": str(i)}),
+            }
+        )
+        for i in range(3)
+    ]
+
+    with subject.listen(["a"]) as listener:
+        factory.subscribers["a"].events.extend(events)
+        while listener.dropped_count == 0:
+            await asyncio.sleep(0.001)
+
+        assert await listener.next_message() == events[1].json()
+        assert await listener.next_message() == events[2].json()
+
+
+async def test_resubscribe_after_error(topic_event: TopicEvent) -> None:
+    """It should replace a subscriber that fails unexpectedly."""
+    factory = _SubscriberFactory()
+    subject = EventFanout("address", create_subscriber=factory, resubscribe_delay=0)
+
+    with subject.listen(["a"]) as listener:
+        failed = factory.subscribers["a"]
+        failed.error = RuntimeError("oh no")
+
+        while factory.subscribers["a"] is failed:
+            await asyncio.sleep(0.001)
+        assert failed.closed
+
+        factory.subscribers["a"].events.append(_event_on("a", topic_event))
+        assert await listener.next_message() == _event_on("a", topic_event).json()
+
+    await asyncio.sleep(0)
+    assert factory.subscribers["a"].closed
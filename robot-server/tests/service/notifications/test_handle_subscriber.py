@@ -1,11 +1,14 @@
-from typing import AsyncIterator
+import asyncio
 
 import pytest
-from mock import MagicMock, patch, DEFAULT
+from mock import MagicMock
 from notify_server.clients.serdes import TopicEvent
-from starlette.websockets import WebSocket
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
 from robot_server.service.notifications import handle_subscriber
-from robot_server.settings import get_settings
+from robot_server.service.notifications.event_fanout import EventFanout, EventListener
+
+from .conftest import FakeSubscriber
 
 
 @pytest.fixture
@@ -14,35 +17,43 @@ def mock_socket() -> MagicMock:
     return MagicMock(spec=WebSocket)
 
 
-async def test_create_subscriber(mock_socket: MagicMock) -> None:
-    """Test that a subscriber is created correctly."""
-    # Why two patch calls? `create` is the name of an arg to `patch.multiple`.
-    with patch(
-        "robot_server.service.notifications.handle_subscriber.create"
-    ) as mock_create:
-        with patch.multiple(
-            handle_subscriber, route_events=DEFAULT, receive=DEFAULT
-        ) as values:
-            await handle_subscriber.handle_socket(mock_socket, ["a", "b"])
-            mock_create.assert_called_once_with(
-                get_settings().notification_server_subscriber_address, ["a", "b"]
-            )
-            values["route_events"].assert_called_once()
-            values["receive"].assert_called_once()
-
-
-async def test_route_events(
+async def test_handle_socket(
     mock_socket: MagicMock,
-    mock_subscriber: AsyncIterator[TopicEvent],
+    mock_subscriber: FakeSubscriber,
     topic_event: TopicEvent,
 ) -> None:
-    """Test that an event is read from subscriber and sent to websocket."""
-    with patch.object(handle_subscriber, "send") as mock_send:
-        await handle_subscriber.route_events(mock_socket, mock_subscriber)
-        mock_send.assert_called_once_with(mock_socket, topic_event)
+    """Test that events are routed to the websocket until it disconnects."""
+    fanout = EventFanout("address", create_subscriber=lambda a, t: mock_subscriber)
+    sent = asyncio.Event()
+
+    async def receive_json() -> None:
+        await sent.wait()
+        raise WebSocketDisconnect()
 
+    mock_socket.send_text.side_effect = lambda message: sent.set()
+    mock_socket.receive_json.side_effect = receive_json
+
+    await handle_subscriber.handle_socket(mock_socket, ["some_topic"], fanout)
+    await asyncio.sleep(0)
 
-async def test_send_entry(topic_event: TopicEvent, mock_socket: MagicMock) -> None:
-    """Test that entry is sent as json."""
-    await handle_subscriber.send(mock_socket, topic_event)
     mock_socket.send_text.assert_called_once_with(topic_event.json())
+    assert mock_subscriber.closed
+
+
+async def test_route_events(mock_socket: MagicMock) -> None:
+    """Test that serialized events are sent to the websocket as they arrive."""
+    listener = EventListener(max_pending_messages=10)
+    listener.put_nowait("message-1")
+    listener.put_nowait("message-2")
+
+    task = asyncio.create_task(handle_subscriber.route_events(mock_socket, listener))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert [c.args[0] for c in mock_socket.send_text.call_args_list] == [
+        "message-1",
+        "message-2",
+    ]
@@ -1,5 +1,3 @@
-from typing import AsyncIterator
-
 from mock import patch
 
 import pytest
@@ -8,6 +6,12 @@ from starlette.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
 from robot_server.service.notifications import handle_subscriber
+from robot_server.service.notifications.event_fanout import (
+    EventFanout,
+    get_event_fanout,
+)
+
+from .conftest import FakeSubscriber
 
 
 def test_subscribe(api_client: TestClient):
@@ -26,13 +30,20 @@ def test_subscribe_no_topic(api_client: TestClient):
 
 def test_integration(
     api_client: TestClient,
-    mock_subscriber: AsyncIterator[TopicEvent],
+    mock_subscriber: FakeSubscriber,
     topic_event: TopicEvent,
 ) -> None:
     """Test receiving a single event."""
-    with patch.object(handle_subscriber, "create", return_value=mock_subscriber):
-        sock = api_client.websocket_connect("/notifications/subscribe?topic=t")
+
+    async def get() -> EventFanout:
+        return EventFanout("address", create_subscriber=lambda a, t: mock_subscriber)
+
+    api_client.app.dependency_overrides[get_event_fanout] = get
+    try:
+        sock = api_client.websocket_connect("/notifications/subscribe?topic=some_topic")
         event = sock.receive()
         assert event["text"] == topic_event.json()
         assert event["type"] == "websocket.send"
         sock.close()
+    finally:
+        del api_client.app.dependency_overrides[get_event_fanout]
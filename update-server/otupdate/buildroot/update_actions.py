@@ -14,18 +14,12 @@ import subprocess
 import tempfile
 from typing import Callable, Generator, Optional
 
-from otupdate.common.file_actions import (
-    unzip_update,
-    hash_file,
-    HashMismatch,
-    verify_signature,
-)
+from otupdate.common.file_actions import CHUNK_SIZE, unzip_and_check_update
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
 
 ROOTFS_SIG_NAME = "rootfs.ext4.hash.sig"
 ROOTFS_HASH_NAME = "rootfs.ext4.hash"
 ROOTFS_NAME = "rootfs.ext4"
-UPDATE_FILES = [ROOTFS_NAME, ROOTFS_SIG_NAME, ROOTFS_HASH_NAME]
 LOG = logging.getLogger(__name__)
 
 
@@ -43,9 +37,9 @@ class OT2UpdateActions(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
-        - If requested, checks the signature of the hash
+        - Unzips filepath to its directory, hashing the rootfs inside as it
+          goes
+        - If requested, checks the signature of the hash at the same time
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
                                   and 1.0. May never reach precisely 1.0, best
@@ -58,43 +52,20 @@ class OT2UpdateActions(UpdateActionsInterface):
         Will also raise an exception if validation fails
         """
 
-        def zip_callback(progress):
-            progress_callback(progress / 2.0)
-
-        required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
-        if cert_path:
-            required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress):
-            progress_callback(progress / 2.0 + 0.5)
-
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
-        hashfile = files.get(ROOTFS_HASH_NAME)
-        assert hashfile
-        packaged_hash = open(hashfile, "rb").read().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
-
-        if cert_path:
-            sigfile = files.get(ROOTFS_SIG_NAME)
-            assert sigfile
-            verify_signature(hashfile, sigfile, cert_path)
-
-        return rootfs
+        return unzip_and_check_update(
+            filepath,
+            progress_callback,
+            cert_path,
+            ROOTFS_NAME,
+            ROOTFS_HASH_NAME,
+            ROOTFS_SIG_NAME,
+        )
 
     def write_update(
         self,
         rootfs_filepath: str,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = CHUNK_SIZE,
         file_size: Optional[int] = None,
     ) -> Partition:
         """
@@ -168,7 +139,7 @@ def write_file(
     infile: str,
     outfile: str,
     progress_callback: Callable[[float], None],
-    chunk_size: int = 1024,
+    chunk_size: int = CHUNK_SIZE,
     file_size: Optional[int] = None,
 ) -> None:
     """Write a file to another file with progress callbacks.
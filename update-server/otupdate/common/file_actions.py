@@ -4,16 +4,22 @@ handling hash and sig checking
 """
 
 import binascii
+import concurrent.futures
 import hashlib
 import logging
 import os
 import subprocess
-from typing import Callable, Sequence, Mapping, Optional, Tuple, List, Dict
+from typing import Callable, Sequence, Optional, List
 import tempfile
 import zipfile
 
 LOG = logging.getLogger(__name__)
 
+# Read and write update files in chunks this big. A multiple of the
+# partitions' block size, so writes to them stay aligned, and big enough
+# that the per-chunk overhead of the Python loop is lost in the copy.
+CHUNK_SIZE = 1024 * 1024
+
 
 class FileMissing(ValueError):
     def __init__(self, message: str) -> None:
@@ -51,30 +57,26 @@ class HashMismatch(ValueError):
         return self.message
 
 
-def unzip_update(
+def unzip_and_check_update(
     filepath: str,
     progress_callback: Callable[[float], None],
-    acceptable_files: Sequence[str],
-    mandatory_files: Sequence[str],
-    chunk_size: int = 1024,
-) -> Tuple[Mapping[str, Optional[str]], Mapping[str, int]]:
-    """Unzip an update file
-
-    The update file must contain
-
-    - a file called rootfs.ext4
-    - a file called rootfs.ext4.hash
-
-    It may contain
-
-    - a file called rootfs.ext4.hash.sig
+    cert_path: Optional[str],
+    rootfs_name: str,
+    hash_name: str,
+    sig_name: str,
+    chunk_size: int = CHUNK_SIZE,
+    algo: str = "sha256",
+) -> str:
+    """Unzip an update file and check its rootfs in a single pass
 
-    These will all be unzipped (discarding their leading directories) to
-    the same file as the zipfile.
+    The rootfs is hashed as it is unzipped rather than read back from disk
+    afterwards. The hash file and signature are unzipped first, so that if
+    ``cert_path`` is specified the signature of the hash can be checked in
+    another thread while the rootfs unzips.
 
     This function is blocking and takes a while. It calls ``progress_callback``
-    to indicate update progress with a number between 0 and 1 indicating
-    overall archive unzip progress.
+    with a number between 0 and 1 indicating how much of the rootfs has been
+    unzipped and hashed.
 
     :param filepath: The path zipfile to unzip. The contents will be in its
                      directory
@@ -82,102 +84,115 @@ def unzip_update(
                               will be called periodically to check progress.
                               This is for user display; it may not reach 1.0
                               exactly.
-    :param acceptable_files: A list of files to unzip if found. Others will be
-                             ignored.
-    :param mandatory_files: A list of files to raise an error about if they're
-                            not in the zip. Should probably be a subset of
-                            ``acceptable_files``.
-    :param chunk_size: If specified, the size of the chunk to read and write.
-                       If not specified, will default to 1024
-    :return: Two dictionaries, the first mapping file names to paths and the
-             second mapping file names to sizes
-
-    :raises FileMissing: If a mandatory file is missing
-    """
-    assert chunk_size
-    total_size = 0
-    written_size = 0
-    to_unzip: List[zipfile.ZipInfo] = []
-    file_paths: Dict[str, Optional[str]] = {fn: None for fn in acceptable_files}
-    file_sizes: Dict[str, int] = {fn: 0 for fn in acceptable_files}
-    LOG.info(f"Unzipping {filepath}")
-    with zipfile.ZipFile(filepath, "r") as zf:
-        files = zf.infolist()
-        remaining_filenames = [fn for fn in acceptable_files]
-        for fi in files:
-            if fi.filename in acceptable_files:
-                to_unzip.append(fi)
-                total_size += fi.file_size
-                remaining_filenames.remove(fi.filename)
-                LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
-            else:
-                LOG.debug(f"Ignoring {fi.filename}")
-
-        for name in remaining_filenames:
-            if name in mandatory_files:
-                raise FileMissing(f"File {name} missing from zip")
-
-        for fi in to_unzip:
-            uncomp_path = os.path.join(os.path.dirname(filepath), fi.filename)
-            with zf.open(fi) as zipped, open(uncomp_path, "wb") as unzipped:
-                LOG.debug(f"Beginning unzip of {fi.filename} to {uncomp_path}")
-                while True:
-                    chunk = zipped.read(chunk_size)
-                    unzipped.write(chunk)
-                    written_size += len(chunk)
-                    progress_callback(written_size / total_size)
-                    if len(chunk) != chunk_size:
-                        break
-                file_paths[fi.filename] = uncomp_path
-                file_sizes[fi.filename] = fi.file_size
-                LOG.debug(f"Unzipped {fi.filename} to {uncomp_path}")
-    LOG.info(
-        f"Unzipped {filepath}, results: \n\t"
-        + "\n\t".join(
-            [f"{k}: {file_paths[k]} ({file_sizes[k]}B)" for k in file_paths.keys()]
-        )
-    )
-    return file_paths, file_sizes
-
-
-def hash_file(
-    path: str,
-    progress_callback: Callable[[float], None],
-    chunk_size: int = 1024,
-    file_size: Optional[int] = None,
-    algo: str = "sha256",
-) -> bytes:
-    """
-    Hash a file and return the hash, providing progress callbacks
-
-    :param path: The file to hash
-    :param progress_callback: The callback to call with progress between 0 and
-                              1. May not ever be precisely 1.0.
-    :param chunk_size: If specified, the size of the chunks to hash in one call
-                       If not specified, defaults to 1024
-    :param file_size: If specified, the size of the file to hash (used for
-                      progress callback generation). If not specified,
-                      calculated internally.
-    :param algo: The algorithm to use. Can be anything used by
+    :param cert_path: Path to an x.509 certificate to check the signature
+                      against. If ``None``, signature checking is disabled
+    :param rootfs_name: The name of the rootfs in the zip
+    :param hash_name: The name of the file in the zip holding the hash of the
+                      rootfs as ascii hex
+    :param sig_name: The name of the signature of the hash file in the zip
+    :param chunk_size: If specified, the size of the chunk to read, hash and
+                       write. If not specified, will default to ``CHUNK_SIZE``
+    :param algo: The algorithm the hash file uses. Can be anything used by
                  :py:mod:`hashlib`
-    :returns: The output has ascii hex
+    :returns: The path to the unzipped rootfs
+
+    :raises FileMissing: If the rootfs, the hash file or (if ``cert_path`` is
+                         specified) the signature is missing
+    :raises HashMismatch: If the rootfs does not match the hash file
+    :raises SignatureMismatch: If the signature does not verify
     """
+    required = [rootfs_name, hash_name]
+    if cert_path:
+        required.append(sig_name)
+    directory = os.path.dirname(filepath)
     hasher = hashlib.new(algo)
     have_read = 0
-    if not chunk_size:
-        chunk_size = 1024
-    with open(path, "rb") as to_hash:
-        if not file_size:
-            file_size = to_hash.seek(0, 2)
-            to_hash.seek(0)
-        while True:
-            chunk = to_hash.read(chunk_size)
+    LOG.info(f"Unzipping and checking {filepath}")
+    with zipfile.ZipFile(filepath, "r") as zf, concurrent.futures.ThreadPoolExecutor(
+        max_workers=1
+    ) as executor:
+        infos = {
+            fi.filename: fi
+            for fi in _find_files(zf, [rootfs_name, hash_name, sig_name], required)
+        }
+        hashfile = _unzip_file(zf, infos[hash_name], directory, chunk_size)
+        signature_check: Optional["concurrent.futures.Future[None]"] = None
+        if cert_path:
+            sigfile = _unzip_file(zf, infos[sig_name], directory, chunk_size)
+            signature_check = executor.submit(
+                verify_signature, hashfile, sigfile, cert_path
+            )
+
+        rootfs_size = infos[rootfs_name].file_size
+
+        def chunk_callback(chunk: bytes) -> None:
+            nonlocal have_read
             hasher.update(chunk)
             have_read += len(chunk)
-            progress_callback(have_read / file_size)
+            progress_callback(have_read / rootfs_size)
+
+        rootfs = _unzip_file(
+            zf, infos[rootfs_name], directory, chunk_size, chunk_callback
+        )
+
+        rootfs_hash = binascii.hexlify(hasher.digest())
+        with open(hashfile, "rb") as hf:
+            packaged_hash = hf.read().strip()
+        if packaged_hash != rootfs_hash:
+            msg = (
+                f"Hash mismatch: calculated {rootfs_hash!r} != "
+                f"packaged {packaged_hash!r}"
+            )
+            LOG.error(msg)
+            raise HashMismatch(msg)
+
+        if signature_check:
+            signature_check.result()
+
+    return rootfs
+
+
+def _find_files(
+    zf: zipfile.ZipFile,
+    acceptable_files: Sequence[str],
+    mandatory_files: Sequence[str],
+) -> List[zipfile.ZipInfo]:
+    to_unzip: List[zipfile.ZipInfo] = []
+    remaining_filenames = [fn for fn in acceptable_files]
+    for fi in zf.infolist():
+        if fi.filename in acceptable_files:
+            to_unzip.append(fi)
+            remaining_filenames.remove(fi.filename)
+            LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
+        else:
+            LOG.debug(f"Ignoring {fi.filename}")
+
+    for name in remaining_filenames:
+        if name in mandatory_files:
+            raise FileMissing(f"File {name} missing from zip")
+
+    return to_unzip
+
+
+def _unzip_file(
+    zf: zipfile.ZipFile,
+    fi: zipfile.ZipInfo,
+    directory: str,
+    chunk_size: int,
+    chunk_callback: Optional[Callable[[bytes], None]] = None,
+) -> str:
+    uncomp_path = os.path.join(directory, fi.filename)
+    with zf.open(fi) as zipped, open(uncomp_path, "wb") as unzipped:
+        LOG.debug(f"Beginning unzip of {fi.filename} to {uncomp_path}")
+        while True:
+            chunk = zipped.read(chunk_size)
+            unzipped.write(chunk)
+            if chunk_callback:
+                chunk_callback(chunk)
             if len(chunk) != chunk_size:
                 break
-    return binascii.hexlify(hasher.digest())
+    LOG.debug(f"Unzipped {fi.filename} to {uncomp_path}")
+    return uncomp_path
 
 
 def verify_signature(message_path: str, sigfile_path: str, cert_path: str) -> None:
@@ -17,6 +17,7 @@ from typing_extensions import Protocol
 from aiohttp import web, BodyPartReader
 
 from . import config, update_actions
+from .file_actions import CHUNK_SIZE
 from .constants import APP_VARIABLE_PREFIX, RESTART_LOCK_NAME
 from .handler_type import Handler
 from .session import UpdateSession, Stages
@@ -96,7 +97,7 @@ async def _save_file(part: BodyPartReader, path: str) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
     with open(os.path.join(path, part.name), "wb") as write:
         while not part.at_eof():
-            chunk = await part.read_chunk()
+            chunk = await part.read_chunk(CHUNK_SIZE)
             decoded = part.decode(chunk)
             write.write(decoded)
     try:
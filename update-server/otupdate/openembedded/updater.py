@@ -3,12 +3,7 @@ import contextlib
 import lzma
 import tempfile
 
-from otupdate.common.file_actions import (
-    unzip_update,
-    hash_file,
-    HashMismatch,
-    verify_signature,
-)
+from otupdate.common.file_actions import CHUNK_SIZE, unzip_and_check_update
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
 from typing import Callable, Optional
 import enum
@@ -20,7 +15,6 @@ UPDATE_PKG = "ot3-system.zip"
 ROOTFS_SIG_NAME = "rootfs.xz.hash.sig"
 ROOTFS_HASH_NAME = "rootfs.xz.sha256"
 ROOTFS_NAME = "rootfs.xz"
-UPDATE_FILES = [ROOTFS_NAME, ROOTFS_SIG_NAME, ROOTFS_HASH_NAME]
 
 LOG = logging.getLogger(__name__)
 
@@ -97,29 +91,24 @@ class RootFSInterface:
         rootfs_filepath: str,
         part: Partition,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = CHUNK_SIZE,
     ) -> None:
-        total_size = 0
-        written_size = 0
         try:
-            # the double pass here is
-            # temporary until we have
-            # xz size decoding working
-            with lzma.open(rootfs_filepath, "rb") as fsrc:
+            # Decompress straight to the partition in one pass. The
+            # decompressed size isn't known up front, so report progress
+            # through the compressed file instead.
+            with open(rootfs_filepath, "rb") as compressed, lzma.open(
+                compressed, "rb"
+            ) as fsrc, open(part.path, "wb") as fdst:
+                total_size = compressed.seek(0, 2)
+                compressed.seek(0)
+                buf = bytearray(chunk_size)
+                view = memoryview(buf)
                 while True:
-                    chunk = fsrc.read(chunk_size)
-                    total_size += len(chunk)
-                    if len(chunk) != chunk_size:
-                        break
-            with lzma.open(rootfs_filepath, "rb") as fsrc, open(
-                part.path, "wb"
-            ) as fdst:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    fdst.write(chunk)
-                    written_size += chunk_size
-                    progress_callback(written_size / total_size)
-                    if len(chunk) != chunk_size:
+                    read = fsrc.readinto(buf)
+                    fdst.write(view[:read])
+                    progress_callback(compressed.tell() / total_size)
+                    if read != chunk_size:
                         break
         except Exception:
             LOG.exception("RootFSInterface::write_update exception reading")
@@ -140,9 +129,9 @@ class Updater(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
-        - If requested, checks the signature of the hash
+        - Unzips filepath to its directory, hashing the rootfs inside as it
+          goes
+        - If requested, checks the signature of the hash at the same time
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
                                   and 1.0. May never reach precisely 1.0, best
@@ -155,37 +144,14 @@ class Updater(UpdateActionsInterface):
         Will also raise an exception if validation fails
         """
 
-        def zip_callback(progress):
-            progress_callback(progress / 2.0)
-
-        required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
-        if cert_path:
-            required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress):
-            progress_callback(progress / 2.0 + 0.5)
-
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
-        hashfile = files.get(ROOTFS_HASH_NAME)
-        assert hashfile
-        packaged_hash = open(hashfile, "rb").read().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
-
-        if cert_path:
-            sigfile = files.get(ROOTFS_SIG_NAME)
-            assert sigfile
-            verify_signature(hashfile, sigfile, cert_path)
-
-        return rootfs
+        return unzip_and_check_update(
+            filepath,
+            progress_callback,
+            cert_path,
+            ROOTFS_NAME,
+            ROOTFS_HASH_NAME,
+            ROOTFS_SIG_NAME,
+        )
 
     def commit_update(self) -> None:
         """Switch the target boot partition."""
@@ -232,7 +198,7 @@ class Updater(UpdateActionsInterface):
         self,
         rootfs_filepath: str,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = CHUNK_SIZE,
         file_size: Optional[int] = None,
     ) -> Partition:
         self.decomp_and_write(rootfs_filepath, progress_callback)
@@ -9,74 +9,113 @@ from otupdate.common import file_actions
 UPDATE_FILES = ["rootfs.ext4", "rootfs.ext4.hash", "rootfs.ext4.hash.sig"]
 
 
-def test_unzip(downloaded_update_file):
-    cb = mock.Mock()
-    paths, sizes = file_actions.unzip_update(
-        downloaded_update_file, cb, UPDATE_FILES, UPDATE_FILES
-    )
-    assert sorted(list(paths.keys())) == sorted(UPDATE_FILES)
-    for filename, path in paths.items():
-        assert os.path.dirname(path) == os.path.dirname(downloaded_update_file)
-    with zipfile.ZipFile(downloaded_update_file) as zf:
-        for filename, size in sizes.items():
-            assert zf.getinfo(filename).file_size == size
-        for filename, path in paths.items():
-            assert zf.read(filename) == open(path, "rb").read()
-    # We should have callback calls for
-    # - every chunk (including the fractional one at the end) of rootfs
-    calls = sizes["rootfs.ext4"] // 1024
-    if calls * 1024 != sizes["rootfs.ext4"]:
-        calls += 1
-    # - the two files that are less than a chunk
-    calls += 2
-    assert cb.call_count == calls
-
-
 @pytest.mark.exclude_rootfs_ext4
-def test_unzip_requires_rootfs(downloaded_update_file):
+def test_unzip_and_check_requires_rootfs(downloaded_update_file):
     cb = mock.Mock()
     with pytest.raises(file_actions.FileMissing):
-        file_actions.unzip_update(
-            downloaded_update_file, cb, UPDATE_FILES, UPDATE_FILES
+        file_actions.unzip_and_check_update(
+            downloaded_update_file,
+            cb,
+            cert_path=None,
+            rootfs_name="rootfs.ext4",
+            hash_name="rootfs.ext4.hash",
+            sig_name="rootfs.ext4.hash.sig",
         )
 
 
 @pytest.mark.exclude_rootfs_ext4_hash
-def test_unzip_requires_hash(downloaded_update_file):
+def test_unzip_and_check_requires_hash(downloaded_update_file):
     cb = mock.Mock()
     with pytest.raises(file_actions.FileMissing):
-        file_actions.unzip_update(
-            downloaded_update_file, cb, UPDATE_FILES, UPDATE_FILES
+        file_actions.unzip_and_check_update(
+            downloaded_update_file,
+            cb,
+            cert_path=None,
+            rootfs_name="rootfs.ext4",
+            hash_name="rootfs.ext4.hash",
+            sig_name="rootfs.ext4.hash.sig",
         )
 
 
+def test_unzip_and_check(downloaded_update_file, testing_cert):
+    cb = mock.Mock()
+    rootfs = file_actions.unzip_and_check_update(
+        downloaded_update_file,
+        cb,
+        cert_path=testing_cert,
+        rootfs_name="rootfs.ext4",
+        hash_name="rootfs.ext4.hash",
+        sig_name="rootfs.ext4.hash.sig",
+        chunk_size=1024,
+    )
+    assert os.path.dirname(rootfs) == os.path.dirname(downloaded_update_file)
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        for filename in UPDATE_FILES:
+            path = os.path.join(os.path.dirname(rootfs), filename)
+            assert zf.read(filename) == open(path, "rb").read()
+        rootfs_size = zf.getinfo("rootfs.ext4").file_size
+    # We should have callback calls for every chunk (including the fractional
+    # one at the end) of rootfs, which is hashed as it's unzipped
+    calls = rootfs_size // 1024
+    if calls * 1024 != rootfs_size:
+        calls += 1
+    assert cb.call_count == calls
+    cb.assert_called_with(1.0)
+
+
 @pytest.mark.exclude_rootfs_ext4_hash_sig
-def test_unzip_does_not_require_sig(downloaded_update_file):
+def test_unzip_and_check_does_not_require_sig(downloaded_update_file):
     cb = mock.Mock()
-    file_actions.unzip_update(
-        downloaded_update_file, cb, UPDATE_FILES, UPDATE_FILES[:-1]
+    file_actions.unzip_and_check_update(
+        downloaded_update_file,
+        cb,
+        cert_path=None,
+        rootfs_name="rootfs.ext4",
+        hash_name="rootfs.ext4.hash",
+        sig_name="rootfs.ext4.hash.sig",
     )
 
 
 @pytest.mark.exclude_rootfs_ext4_hash_sig
-def test_unzip_requires_sig(downloaded_update_file):
+def test_unzip_and_check_requires_sig(downloaded_update_file, testing_cert):
     cb = mock.Mock()
     with pytest.raises(file_actions.FileMissing):
-        file_actions.unzip_update(
-            downloaded_update_file, cb, UPDATE_FILES, UPDATE_FILES
+        file_actions.unzip_and_check_update(
+            downloaded_update_file,
+            cb,
+            cert_path=testing_cert,
+            rootfs_name="rootfs.ext4",
+            hash_name="rootfs.ext4.hash",
+            sig_name="rootfs.ext4.hash.sig",
         )
 
 
-def test_hash(extracted_update_file):
+@pytest.mark.bad_hash
+def test_unzip_and_check_catches_bad_hash(downloaded_update_file, testing_cert):
     cb = mock.Mock()
-    hash_output = file_actions.hash_file(
-        os.path.join(extracted_update_file, "rootfs.ext4"), cb
-    )
-    assert (
-        hash_output
-        == open(os.path.join(extracted_update_file, "rootfs.ext4.hash"), "rb").read()
-    )
-    cb.assert_called()
+    with pytest.raises(file_actions.HashMismatch):
+        file_actions.unzip_and_check_update(
+            downloaded_update_file,
+            cb,
+            cert_path=testing_cert,
+            rootfs_name="rootfs.ext4",
+            hash_name="rootfs.ext4.hash",
+            sig_name="rootfs.ext4.hash.sig",
+        )
+
+
+@pytest.mark.bad_sig
+def test_unzip_and_check_catches_bad_sig(downloaded_update_file, testing_cert):
+    cb = mock.Mock()
+    with pytest.raises(file_actions.SignatureMismatch):
+        file_actions.unzip_and_check_update(
+            downloaded_update_file,
+            cb,
+            cert_path=testing_cert,
+            rootfs_name="rootfs.ext4",
+            hash_name="rootfs.ext4.hash",
+            sig_name="rootfs.ext4.hash.sig",
+        )
 
 
 def test_verify_signature_ok(extracted_update_file, testing_cert):